@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Aktif ARP Tarama Hızı Ölçümü
+Bu betik, ARPSweeper'ın farklı büyüklükteki alt ağları tarama süresini ve
+keşif oranını, gerçek ağ yerine MockResponder ile ölçer. Adreslerin %5'i
+cevap verir, cevapların %1'i kaybolur; bir adres iki farklı MAC ile cevap
+vererek (ARP spoofing) tespit kurallarının tetiklendiği doğrulanır.
+
+Kullanım:
+    python benchmarks/bench_arp_sweep.py [hız_paket_sn] [önek_uzunluğu ...]
+"""
+
+import os
+import sys
+import random
+import ipaddress
+
+# Modüller için path ayarlaması
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+from modules.arp_sweep import ARPSweeper, MockResponder, SWEEP_RATE
+from modules.arp_detector import detect_arp_spoofing
+
+# Cevap veren adres oranı ve cevap kaybı
+ALIVE_RATIO = 0.05
+REPLY_LOSS = 0.01
+
+# Son istekten sonra cevap bekleme süresi (sahte cevaplar anında gelir)
+BENCH_TIMEOUT = 0.2
+
+
+def simulate_network(network):
+    """Ağ geçidi sahte bir MAC ile de cevap veren sentetik cihaz listesi üretir"""
+    rng = random.Random(42)
+    hosts = {}
+    addresses = list(network.hosts())
+    gateway = str(addresses[0])
+    hosts[gateway] = ["02:00:00:00:00:01", "de:ad:be:ef:00:01"]
+    for index, address in enumerate(rng.sample(addresses[1:-1], int(len(addresses) * ALIVE_RATIO))):
+        hosts[str(address)] = "02:%02x:%02x:%02x:%02x:%02x" % (1, (index >> 24) & 0xff, (index >> 16) & 0xff,
+                                                                 (index >> 8) & 0xff, index & 0xff)
+    source_ip = str(addresses[-1])
+    return hosts, gateway, source_ip
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    rate = int(argv[0]) if argv else SWEEP_RATE
+    prefixes = [int(arg) for arg in argv[1:]] or [24, 20, 16]
+
+    print(f"Gönderim hızı: {rate} paket/sn, cevap oranı %{ALIVE_RATIO * 100:.0f}, kayıp %{REPLY_LOSS * 100:.0f}")
+    print(f"{'ağ':>16}{'hedef':>8}{'cihaz':>8}{'bulunan':>9}{'süre (sn)':>11}{'paket/sn':>10}{'tespit':>24}")
+    for prefix in prefixes:
+        network = ipaddress.IPv4Network(f"10.64.0.0/{prefix}")
+        hosts, gateway, source_ip = simulate_network(network)
+        responder = MockResponder(hosts, loss=REPLY_LOSS, seed=7)
+        sweeper = ARPSweeper("bench0", network=network, rate=rate, timeout=BENCH_TIMEOUT, transport=responder,
+                             source=(source_ip, "02:ff:ff:ff:ff:fe"))
+        try:
+            entries = sweeper.run()
+        finally:
+            responder.close()
+
+        stats = sweeper.stats
+        suspicious = detect_arp_spoofing(entries, {"ip": gateway, "mac": "02:00:00:00:00:01"})
+        detected = ",".join(sorted({entry["type"] for entry in suspicious if entry["threat_level"] == "high"}))
+        sending = stats["duration"] - BENCH_TIMEOUT
+        print(f"{str(network):>16}{stats['targets']:>8}{len(hosts):>8}{stats['hosts']:>9}"
+              f"{stats['duration']:>11.2f}{stats['sent'] / sending:>10.0f}{detected or '-':>24}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
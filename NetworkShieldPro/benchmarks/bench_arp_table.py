@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ARP Tablosu Okuma Karşılaştırması
+Bu betik, /proc/net/arp okuyucusunu eski metin yolu ile karşılaştırır:
+sentetik 10.000 kayıtlık tablolarda ayrıştırma süreleri, canlı tabloda ise
+gerçek 'arp -n' alt süreci ile uçtan uca okuma süresi ölçülür. 'arp'
+PATH üzerinde yoksa alt süreç yolu sentetik tablo üzerinde 'cat' ile
+taklit edilir ve bu durum çıktıda belirtilir.
+
+Kullanım:
+    python benchmarks/bench_arp_table.py [kayıt_sayısı] [tekrar]
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+import tracemalloc
+
+# Modüller için path ayarlaması
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+from modules.arp_detector import PROC_NET_ARP, read_proc_net_arp, _parse_arp_n_output, detect_arp_spoofing
+from modules.arp_table import ArpTable
+
+
+def _synthetic_rows(count):
+    """Sentetik (ip, mac, arayüz) satırları üretir"""
+    for i in range(count):
+        ip = f"10.{(i >> 16) & 0xff}.{(i >> 8) & 0xff}.{i & 0xff}"
+        mac = "02:00:%02x:%02x:%02x:%02x" % ((i >> 24) & 0xff, (i >> 16) & 0xff, (i >> 8) & 0xff, i & 0xff)
+        yield ip, mac, f"eth{i % 4}"
+
+
+def write_proc_format(path, count):
+    """/proc/net/arp formatında sentetik tablo yazar"""
+    with open(path, 'w') as f:
+        f.write("IP address       HW type     Flags       HW address            Mask     Device\n")
+        for ip, mac, dev in _synthetic_rows(count):
+            f.write(f"{ip:<16} 0x1         0x2         {mac}     *        {dev}\n")
+
+
+def write_arp_n_format(path, count):
+    """'arp -n' çıktı formatında sentetik tablo yazar"""
+    with open(path, 'w') as f:
+        f.write("Address                  HWtype  HWaddress           Flags Mask            Iface\n")
+        for ip, mac, dev in _synthetic_rows(count):
+            f.write(f"{ip:<24} ether   {mac}   C                     {dev}\n")
+
+
+def _best_of(func, repeat):
+    """Fonksiyonu tekrar tekrar çalıştırıp en iyi süreyi döndürür"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _traced_size(func):
+    """Fonksiyonun döndürdüğü nesnenin canlı kalan bellek miktarını ölçer"""
+    tracemalloc.start()
+    result = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, result
+
+
+def _subprocess_reader(arp_n_path):
+    """
+    Alt süreç okuyucusunu seçer: varsa gerçek 'arp -n' (canlı tablo),
+    yoksa sentetik tablo için 'cat'.
+    
+    Returns:
+        tuple: (okuyucu, /proc karşılığı, açıklama)
+    """
+    if shutil.which('arp') and os.path.exists(PROC_NET_ARP):
+        return (lambda: _parse_arp_n_output(subprocess.check_output(['arp', '-n'], text=True)),
+                lambda: read_proc_net_arp(PROC_NET_ARP), "'arp -n' (canlı tablo)")
+    print("Not: 'arp' PATH üzerinde bulunamadı; alt süreç yolu sentetik tablo üzerinde 'cat' ile ölçülüyor")
+    return (lambda: _parse_arp_n_output(subprocess.check_output(['cat', arp_n_path], text=True)),
+            None, "'cat' + ayrıştırma (sentetik)")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if len(argv) > 0 else 10000
+    repeat = int(argv[1]) if len(argv) > 1 else 20
+
+    with tempfile.TemporaryDirectory() as tmp:
+        proc_path = os.path.join(tmp, "arp")
+        arp_n_path = os.path.join(tmp, "arp_n.txt")
+        write_proc_format(proc_path, count)
+        write_arp_n_format(arp_n_path, count)
+
+        # Yerel okuyucu: tek okuma + doğrudan sütunlu tablo
+        native_time, table = _best_of(lambda: read_proc_net_arp(proc_path), repeat)
+        compat_time, entries = _best_of(lambda: read_proc_net_arp(proc_path).to_entries(), repeat)
+
+        # Eski metin yolu: 'arp -n' çıktısının satır satır ayrıştırılması (alt süreç hariç)
+        def text_path():
+            with open(arp_n_path) as f:
+                return ArpTable.from_entries(_parse_arp_n_output(f.read()))
+        text_time, text_table = _best_of(text_path, repeat)
+
+        # Uçtan uca: alt süreç + ayrıştırma ile doğrudan okuma
+        subprocess_reader, proc_reader, subprocess_label = _subprocess_reader(arp_n_path)
+        subprocess_time, sp_entries = _best_of(subprocess_reader, repeat)
+        if proc_reader is None:
+            proc_time = native_time
+        else:
+            proc_time, _ = _best_of(proc_reader, repeat)
+
+        # Bellek: sözlük listesi ile sütunlu ArpTable
+        dict_bytes, entries = _traced_size(lambda: table.to_entries())
+        table_bytes, table = _traced_size(lambda: read_proc_net_arp(proc_path))
+
+    gateway = {"ip": "10.0.0.1", "mac": "02:00:00:00:00:01"}
+    detect_dict_time, _ = _best_of(lambda: detect_arp_spoofing(entries, gateway), repeat)
+    detect_table_time, _ = _best_of(lambda: detect_arp_spoofing(table, gateway), repeat)
+
+    assert len(entries) == len(table) == count
+    assert text_table.to_entries() == entries
+    if proc_reader is None:
+        assert len(sp_entries) == count
+
+    print(f"Kayıt sayısı: {count}, tekrar: {repeat} (en iyi süre)")
+    print(f"  /proc/net/arp (ArpTable)    : {native_time * 1000:8.2f} ms")
+    print(f"  /proc/net/arp (sözlük)      : {compat_time * 1000:8.2f} ms")
+    print(f"  metin ayrıştırma (eski yol) : {text_time * 1000:8.2f} ms")
+    print(f"  hızlanma (eski/yeni)        : {text_time / native_time:8.2f}x")
+    print(f"Alt süreç karşılaştırması: {subprocess_label}")
+    print(f"  /proc/net/arp               : {proc_time * 1000:8.2f} ms")
+    print(f"  alt süreç + ayrıştırma      : {subprocess_time * 1000:8.2f} ms")
+    print(f"  hızlanma (alt süreç/proc)   : {subprocess_time / proc_time:8.2f}x")
+    print(f"  bellek/kayıt (sözlük)       : {dict_bytes / count:8.1f} bayt")
+    print(f"  bellek/kayıt (ArpTable)     : {table_bytes / count:8.1f} bayt")
+    print(f"  tespit (sözlük listesi)     : {detect_dict_time * 1000:8.2f} ms")
+    print(f"  tespit (ArpTable)           : {detect_table_time * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tarama Geçmişi Tekilleştirme Karşılaştırması
+Bu betik, simüle edilmiş taramalarda (varsayılan 10000 tarama) geçmişin
+bellek kullanımını içerik adresli tekilleştirmeyle ve tekilleştirmesiz
+karşılaştırır. Ağ çoğu taramada değişmez; arada bir cihaz IP değiştirir,
+ağa katılır veya ayrılır ve ağ önceki durumlarından birine geri döner.
+
+Kullanım:
+    python benchmarks/bench_history_dedup.py [tarama_sayısı] [cihaz_sayısı] [değişim_oranı]
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+import tracemalloc
+
+# Modüller için path ayarlaması
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+from modules.arp_table import ArpTable, SnapshotPool, intern_interface
+from modules.history_store import HistoryStore
+from modules.scan_history import ScanHistoryBuffer
+
+
+def simulate_tables(scans, hosts, churn, seed=42):
+    """Her tarama için (yeni nesne olarak) ARP tablosu üretir"""
+    rng = random.Random(seed)
+    interface = intern_interface("eth0")
+    network = {0xC0A80000 + i + 1: 0x020000000000 + i for i in range(hosts)}
+    states = [dict(network)]
+
+    for _ in range(scans):
+        roll = rng.random()
+        if roll < churn:
+            network = dict(network)
+            host = rng.randrange(hosts * 2)
+            ip = 0xC0A80000 + host + 1
+            if ip in network and rng.random() < 0.5:
+                del network[ip]
+            else:
+                network[ip] = 0x020000000000 + rng.randrange(hosts * 2)
+            states.append(network)
+        elif roll < churn * 2:
+            # Ağ daha önce görülmüş bir duruma döner (örn. cihaz yeniden bağlanır)
+            network = rng.choice(states)
+
+        table = ArpTable()
+        for ip, mac in network.items():
+            table.append_packed(ip, mac, interface)
+        yield table
+
+
+def _result(index, table):
+    return {
+        "timestamp": 1700000000 + index * 60,
+        "arp_table": table,
+        "gateway": {"ip": "192.168.0.1", "mac": "02:00:00:00:00:00"},
+        "suspicious_entries": [],
+        "threat_level": "none",
+        "duration": 0.01,
+    }
+
+
+def measure(label, scans, hosts, churn, store_factory):
+    """Geçmişi doldurup tutulan Python belleğini (tracemalloc) ve ekleme süresini yazdırır"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    history = store_factory()
+    for index, table in enumerate(simulate_tables(scans, hosts, churn)):
+        history(_result(index, table))
+    elapsed = time.perf_counter() - start
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<32}: {current / (1024 * 1024):8.2f} MiB  ({elapsed * 1000 / scans:6.3f} ms/tarama)")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    scans = int(argv[0]) if len(argv) > 0 else 10000
+    hosts = int(argv[1]) if len(argv) > 1 else 254
+    churn = float(argv[2]) if len(argv) > 2 else 0.02
+
+    print(f"{scans} tarama, {hosts} cihaz, değişim oranı {churn:.1%}")
+
+    def plain_list():
+        results = []
+        return results.append
+
+    def pooled_list():
+        results = []
+        pool = SnapshotPool()
+
+        def add(result):
+            result["arp_snapshot"], result["arp_table"] = pool.intern(result["arp_table"])
+            results.append(result)
+        return add
+
+    def ring_buffer(pool):
+        return lambda: ScanHistoryBuffer(max_scans=scans, pool=pool).add_scan
+
+    measure("sonuç listesi (tekilleştirmesiz)", scans, hosts, churn, plain_list)
+    measure("sonuç listesi + SnapshotPool", scans, hosts, churn, pooled_list)
+    measure("ScanHistoryBuffer", scans, hosts, churn, ring_buffer(SnapshotPool()))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = HistoryStore(os.path.join(tmp, "history.db"), max_scans=scans)
+        start = time.perf_counter()
+        total_entries = 0
+        for index, table in enumerate(simulate_tables(scans, hosts, churn)):
+            total_entries += len(table)
+            store.add_scan(_result(index, table))
+        elapsed = time.perf_counter() - start
+        snapshots, stored_entries = store.conn.execute(
+            "SELECT (SELECT COUNT(*) FROM snapshots), (SELECT COUNT(*) FROM snapshot_entries)").fetchone()
+        store.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        size = os.path.getsize(store.path)
+        store.close()
+
+    print(f"  {'SQLite (içerik adresli)':<32}: {size / (1024 * 1024):8.2f} MiB disk  "
+          f"({elapsed * 1000 / scans:6.3f} ms/tarama)")
+    print(f"    {snapshots} farklı tablo, {stored_entries} saklanan kayıt "
+          f"(tekilleştirmesiz {total_entries} kayıt, {total_entries / max(1, stored_entries):.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
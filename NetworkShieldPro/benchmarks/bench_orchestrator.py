@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Çok Arayüzlü Tarama Süresi Karşılaştırması
+Bu betik, arayüz başına toplama gecikmesi olan (ör. aktif ARP taraması)
+sentetik bir sistemde tarama süresini sıralı yürütme (tek iş parçacığı,
+eski tek tablolu taramanın davranışı) ve ScanOrchestrator'ın paralel
+yürütmesiyle karşılaştırır. Arayüz gecikmeleri 20 ms ile 200 ms arasında
+dağıtılır; paralel süre en yavaş arayüze yakın olmalıdır.
+
+Kullanım:
+    python benchmarks/bench_orchestrator.py [arayüz_sayısı ...]
+"""
+
+import os
+import sys
+import time
+import threading
+
+# Modüller için path ayarlaması
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+from modules.arp_table import ArpTable
+from modules.scan_orchestrator import ScanOrchestrator
+
+# Arayüz başına cihaz sayısı
+HOSTS_PER_INTERFACE = 250
+
+
+def simulate_system(count):
+    """Sentetik tablo, rota ve toplayıcı gecikmeleri üretir"""
+    entries = []
+    routes = {}
+    delays = {}
+    for n in range(count):
+        name = f"eth0.{100 + n}"
+        routes[name] = (f"10.{n}.0.1", 100 + n)
+        delays[name] = 0.02 + 0.18 * n / max(1, count - 1)
+        for host in range(1, HOSTS_PER_INTERFACE + 1):
+            entries.append({"ip": f"10.{n}.{host >> 8}.{host & 0xff}",
+                            "mac": f"02:00:00:{n:02x}:{host >> 8:02x}:{host & 0xff:02x}", "interface": name})
+    table = ArpTable.from_entries(entries)
+
+    def collector(interface, gateway_ip, stop_event):
+        stop_event.wait(delays[interface])
+        return []
+
+    return table, routes, delays, collector
+
+
+def run(workers, table, routes, collector, repeat=3):
+    """Verilen havuz boyutuyla en iyi tarama süresini (saniye) ölçer"""
+    orchestrator = ScanOrchestrator(max_workers=workers, collectors=[collector],
+                                    table_reader=lambda: table, route_reader=lambda: routes)
+    best = float("inf")
+    result = None
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = orchestrator.scan(threading.Event())
+            best = min(best, time.perf_counter() - start)
+    finally:
+        orchestrator.close()
+    return best, result
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    counts = [int(arg) for arg in argv] or [1, 4, 16]
+
+    print(f"{'arayüz':>8}{'toplam gecikme':>16}{'en yavaş':>10}{'sıralı (ms)':>14}{'paralel (ms)':>14}{'hızlanma':>10}")
+    for count in counts:
+        table, routes, delays, collector = simulate_system(count)
+        sequential, _ = run(1, table, routes, collector)
+        parallel, result = run(count, table, routes, collector)
+        assert len(result["arp_table"]) == len(table) and len(result["interfaces"]) == count
+
+        print(f"{count:>8}{sum(delays.values()) * 1000:>15.0f} {max(delays.values()) * 1000:>9.0f}"
+              f"{sequential * 1000:>14.1f}{parallel * 1000:>14.1f}{sequential / parallel:>9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Parçacık Animasyonu Kare Süresi Karşılaştırması
+Bu betik, arka plan parçacık animasyonunun kare süresini eski yöntemle (her
+karede delete("all") ve tüm parçacıkların yeniden oluşturulması) ve kalıcı
+canvas öğelerinin taşınmasıyla karşılaştırır. Kare süresine Tk'nin yeniden
+çizimi (update_idletasks) dahildir. Bir grafik ekran (DISPLAY) gerekir.
+
+Kullanım:
+    python benchmarks/bench_particles.py [kare_sayısı] [parçacık_sayısı ...]
+"""
+
+import os
+import sys
+import math
+import time
+import random
+import statistics
+
+# Modüller için path ayarlaması
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+
+def legacy_frame(canvas):
+    """Eski _animate gövdesi: tüm öğeler silinir ve yeniden oluşturulur"""
+    canvas.delete("all")
+    width, height = canvas.winfo_width(), canvas.winfo_height()
+
+    for particle in canvas.particles:
+        particle['x'] += particle['speed'] * math.cos(particle['direction'])
+        particle['y'] += particle['speed'] * math.sin(particle['direction'])
+
+        if particle['x'] < -10 or particle['x'] > width + 10 or \
+           particle['y'] < -10 or particle['y'] > height + 10:
+            particle['x'] = random.randint(0, width)
+            particle['y'] = random.randint(0, height)
+            particle['direction'] = random.uniform(0, 2 * math.pi)
+
+        size = particle['size']
+        x, y = particle['x'], particle['y']
+        r, g, b = int(particle['color'][1:3], 16), int(particle['color'][3:5], 16), int(particle['color'][5:7], 16)
+        color = f'#{r:02x}{g:02x}{b:02x}'
+        canvas.create_oval(x-size, y-size, x+size, y+size, fill=color, outline='',
+                           stipple='gray50' if particle['opacity'] < 0.5 else '')
+
+
+def measure(root, count, frames, frame):
+    """Verilen kare fonksiyonunun kare sürelerini (ms) ölçer"""
+    from ui.custom_widgets import ParticleAnimationCanvas
+
+    random.seed(42)
+    canvas = ParticleAnimationCanvas(root, width=1000, height=700, num_particles=count)
+    canvas.pack(fill="both", expand=True)
+    root.update()
+
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        frame(canvas)
+        canvas.update_idletasks()
+        times.append((time.perf_counter() - start) * 1000)
+
+    canvas.destroy()
+    return times
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    frames = int(argv[0]) if argv else 300
+    counts = [int(arg) for arg in argv[1:]] or [30, 300, 3000]
+
+    if not os.environ.get("DISPLAY") and sys.platform.startswith("linux"):
+        print("Grafik ekran bulunamadı (DISPLAY); örn. xvfb-run ile çalıştırın.")
+        return 2
+
+    import tkinter as tk
+    root = tk.Tk()
+    root.geometry("1000x700")
+
+    print(f"{frames} kare, kare süresi (ms): medyan / p95")
+    print(f"{'parçacık':>10}{'eski':>20}{'kalıcı öğeler':>20}{'hızlanma':>12}")
+    for count in counts:
+        legacy = measure(root, count, frames, legacy_frame)
+        retained = measure(root, count, frames, lambda canvas: canvas.update_particles())
+        p95 = lambda times: sorted(times)[int(len(times) * 0.95)]
+        print(f"{count:>10}{statistics.median(legacy):>11.3f} / {p95(legacy):<6.3f}"
+              f"{statistics.median(retained):>11.3f} / {p95(retained):<6.3f}"
+              f"{statistics.median(legacy) / statistics.median(retained):>11.1f}x")
+
+    root.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
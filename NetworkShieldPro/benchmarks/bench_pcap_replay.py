@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Yakalama Dosyası Oynatma Karşılaştırması
+Bu betik, pcap/pcapng oynatma motorunun saniyede işlediği ARP olayı sayısını
+ve tepe bellek kullanımını ölçer. Dosya verilmezse sentetik bir yakalama
+üretilir (ARP ve ARP olmayan çerçeveler karışık, arada IP-MAC değişimleri).
+
+Kullanım:
+    python benchmarks/bench_pcap_replay.py [dosya.pcap|dosya.pcapng]
+    python benchmarks/bench_pcap_replay.py --synthetic [paket_sayısı] [pcap|pcapng]
+"""
+
+import os
+import sys
+import time
+import struct
+import socket
+import resource
+import tempfile
+import tracemalloc
+
+# Modüller için path ayarlaması
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+from modules.pcap_replay import replay_capture, PCAP_MAGIC_US, PCAPNG_SHB, PCAPNG_IDB, PCAPNG_EPB, \
+    PCAPNG_BYTE_ORDER_MAGIC, IF_NAME, LINKTYPE_ETHERNET
+
+
+def _arp_frame(sender_mac, sender_ip, target_ip, op=1):
+    """Ethernet + ARP çerçevesi oluşturur"""
+    return (b"\xff" * 6 + sender_mac + struct.pack("!HHHBBH", 0x0806, 1, 0x0800, 6, 4, op)
+            + sender_mac + socket.inet_aton(sender_ip) + b"\x00" * 6 + socket.inet_aton(target_ip))
+
+
+def _ipv4_frame(index):
+    """ARP olmayan (IPv4) dolgu çerçevesi oluşturur"""
+    return b"\x02" * 6 + b"\x04" * 6 + b"\x08\x00" + bytes([index & 0xff]) * 46
+
+
+def _synthetic_frames(count):
+    """Sentetik çerçeveler üretir: dörtte üçü ARP, her 1000 pakette bir MAC değişimi"""
+    for i in range(count):
+        if i % 4 == 3:
+            yield i, _ipv4_frame(i)
+            continue
+        host = i % 250
+        mac = bytes([0x02, 0, 0, 0, (i // 1000) & 0xff if i % 1000 == 0 else 0, host])
+        yield i, _arp_frame(mac, f"192.168.1.{host + 1}", "192.168.1.254")
+
+
+def write_pcap(path, count):
+    """Klasik pcap formatında sentetik yakalama yazar"""
+    with open(path, 'wb') as f:
+        f.write(struct.pack("<IHHiIII", PCAP_MAGIC_US, 2, 4, 0, 0, 65535, LINKTYPE_ETHERNET))
+        for i, frame in _synthetic_frames(count):
+            f.write(struct.pack("<IIII", 1700000000 + i // 1000, (i % 1000) * 1000, len(frame), len(frame)))
+            f.write(frame)
+
+
+def _pcapng_block(block_type, body):
+    """Gövdeyi 4 bayta hizalayıp pcapng bloğu olarak paketler"""
+    body += b"\x00" * (-len(body) % 4)
+    length = len(body) + 12
+    return struct.pack("<II", block_type, length) + body + struct.pack("<I", length)
+
+
+def write_pcapng(path, count):
+    """pcapng formatında sentetik yakalama yazar (tek arayüz: eth0)"""
+    with open(path, 'wb') as f:
+        f.write(_pcapng_block(PCAPNG_SHB, struct.pack("<IHHq", PCAPNG_BYTE_ORDER_MAGIC, 1, 0, -1)))
+        name = b"eth0"
+        options = struct.pack("<HH", IF_NAME, len(name)) + name + b"\x00" * (-len(name) % 4) + b"\x00" * 4
+        f.write(_pcapng_block(PCAPNG_IDB, struct.pack("<HHI", LINKTYPE_ETHERNET, 0, 65535) + options))
+        for i, frame in _synthetic_frames(count):
+            ts = (1700000000 + i // 1000) * 1000000 + (i % 1000) * 1000
+            header = struct.pack("<IIIII", 0, ts >> 32, ts & 0xffffffff, len(frame), len(frame))
+            f.write(_pcapng_block(PCAPNG_EPB, header + frame))
+
+
+def run(path):
+    """Dosyayı oynatıp olay/sn ve bellek ölçümlerini yazdırır"""
+    size = os.path.getsize(path)
+
+    # Hız ölçümü: tracemalloc her ayırmayı izlediği için ayrı bir geçişte çalışır
+    start = time.perf_counter()
+    result = replay_capture(path)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    replay_capture(path)
+    _current, peak_heap = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # ru_maxrss Linux'ta KiB cinsindendir; mmap sayfaları da dahildir
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(f"Dosya: {path} ({size / (1024 * 1024):.1f} MiB)")
+    print(f"  ARP olayı           : {result['events']}")
+    print(f"  şüpheli durum       : {len(result['alerts'])}")
+    print(f"  süre                : {elapsed:8.3f} s")
+    print(f"  olay/sn             : {result['events'] / elapsed if elapsed else 0:12.0f}")
+    print(f"  MiB/sn              : {size / (1024 * 1024) / elapsed if elapsed else 0:12.1f}")
+    print(f"  tepe Python belleği : {peak_heap / 1024:8.1f} KiB (tracemalloc)")
+    print(f"  tepe RSS            : {max_rss / 1024:8.1f} MiB")
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] != "--synthetic":
+        run(sys.argv[1])
+        return
+
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+    fmt = sys.argv[3] if len(sys.argv) > 3 else "pcapng"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f"synthetic.{fmt}")
+        (write_pcap if fmt == "pcap" else write_pcapng)(path, count)
+        run(path)
+
+
+if __name__ == "__main__":
+    main()
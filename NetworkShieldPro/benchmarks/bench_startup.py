@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Açılış Süresi Karşılaştırması
+Bu betik, arayüzün ilk kareye kadar geçen süresini (süreç başlangıcından
+itibaren) ölçer ve ekranların tembel oluşturulmasının kazancını, tüm
+ekranların açılışta oluşturulduğu eski davranışla karşılaştırır. Her ölçüm
+yeni bir Python sürecinde yapılır; bir grafik ekran (DISPLAY) gerekir.
+
+Kullanım:
+    python benchmarks/bench_startup.py [tekrar_sayısı]
+"""
+
+import os
+import sys
+import json
+import time
+import statistics
+import subprocess
+import tempfile
+
+# Modüller için path ayarlaması
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Alt süreçte çalışan ölçüm kodu: main.py modül olarak yüklenir (main() çağrılmaz)
+CHILD = r"""
+import sys, time, json
+sys.path.insert(0, sys.argv[1])
+from modules.startup_profiler import profiler
+profiler.enable()
+import main
+root = main.tk.Tk()
+app = main.VARPApp(root)
+root.update()
+first_frame = time.perf_counter() - profiler.start_time
+start = time.perf_counter()
+for screen_id in app.app.screen_classes:
+    app.app._get_screen(screen_id)
+root.update()
+remaining = time.perf_counter() - start
+app.app.scanner.stop()
+print(json.dumps({"first_frame": first_frame, "remaining_screens": remaining,
+                  "profile": profiler.as_dict()}))
+root.destroy()
+"""
+
+
+def run_once(workdir):
+    """Yeni bir süreçte açılışı ölçer"""
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", CHILD, APP_DIR], cwd=workdir,
+                          capture_output=True, text=True, timeout=120)
+    wall = time.perf_counter() - start
+    lines = [line for line in proc.stdout.splitlines() if line.startswith("{")]
+    if proc.returncode != 0 or not lines:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "ölçüm başarısız")
+    result = json.loads(lines[-1])
+    result["wall"] = wall
+    return result
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    repeats = int(argv[0]) if argv else 5
+
+    if not os.environ.get("DISPLAY") and sys.platform.startswith("linux"):
+        print("Grafik ekran bulunamadı (DISPLAY); örn. xvfb-run ile çalıştırın.")
+        return 2
+
+    # Log ve geçmiş dosyaları geçici dizine yazılsın
+    with tempfile.TemporaryDirectory() as workdir:
+        try:
+            results = [run_once(workdir) for _ in range(repeats)]
+        except (RuntimeError, subprocess.TimeoutExpired) as e:
+            print(f"Ölçüm başarısız: {e}")
+            return 1
+
+    first = statistics.median(r["first_frame"] for r in results)
+    rest = statistics.median(r["remaining_screens"] for r in results)
+    wall = statistics.median(r["wall"] for r in results)
+
+    print(f"{repeats} tekrar, medyan değerler")
+    print(f"  ilk kare (tembel ekranlar)          : {first * 1000:8.1f} ms")
+    print(f"  kalan ekranların oluşturulması      : {rest * 1000:8.1f} ms")
+    print(f"  ilk kare (tüm ekranlar, eski)       : {(first + rest) * 1000:8.1f} ms")
+    print(f"  kazanç                              : {rest / (first + rest) * 100 if first + rest else 0:8.1f} %")
+    print(f"  süreç toplam (yorumlayıcı dahil)    : {wall * 1000:8.1f} ms")
+    print()
+    print("Son çalıştırmanın adım dökümü (ms / yüklenen modül):")
+    for phase in results[-1]["profile"]["phases"]:
+        print(f"  {'  ' * phase['depth'] + phase['name']:<40}{phase['ms']:>10.1f}{phase['modules']:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
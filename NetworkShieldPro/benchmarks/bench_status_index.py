@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Cihaz Durumu Sorgu Karşılaştırması
+Bu betik, tarama ekranındaki satır başına durum belirleme maliyetini eski
+yöntemle (her satırda tüm şüpheli durumların taranması) ve tarayıcının
+hazırladığı MAC/IP durum indeksiyle karşılaştırır. Cihazların %5'i şüpheli
+durumlarda yer alır. Eski yöntem büyük tablolarda bir örneklem üzerinde
+ölçülüp tüm tabloya oranlanır.
+
+Kullanım:
+    python benchmarks/bench_status_index.py [cihaz_sayısı ...]
+"""
+
+import os
+import sys
+import time
+
+# Modüller için path ayarlaması
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+from modules.arp_detector import build_status_index, device_status
+
+# Eski yöntemin doğrudan ölçüleceği en fazla satır
+LEGACY_SAMPLE_ROWS = 2000
+
+
+def simulate_result(count):
+    """Sentetik tarama sonucu üretir"""
+    devices = []
+    for i in range(count):
+        ip = f"10.{(i >> 16) & 0xff}.{(i >> 8) & 0xff}.{i & 0xff}"
+        mac = "02:00:%02x:%02x:%02x:%02x" % ((i >> 24) & 0xff, (i >> 16) & 0xff, (i >> 8) & 0xff, i & 0xff)
+        devices.append({"ip": ip, "mac": mac, "interface": "eth0"})
+
+    suspicious = []
+    for i in range(0, count, 20):
+        device = devices[i]
+        suspicious.append({"type": "multiple_ips", "mac": device["mac"], "ips": [device["ip"]],
+                           "threat_level": "medium" if i % 40 else "high"})
+    suspicious.append({"type": "info_broadcast", "ip": devices[-1]["ip"], "mac": "ff:ff:ff:ff:ff:ff",
+                       "threat_level": "none"})
+
+    return {"arp_table": devices, "gateway": {"ip": devices[0]["ip"], "mac": devices[0]["mac"]},
+            "suspicious_entries": suspicious}
+
+
+def legacy_statuses(devices, get_last_scan_result):
+    """Eski ScanScreen davranışı: satır başına iki sonuç okuması ve tam tarama"""
+    statuses = []
+    for device in devices:
+        is_gateway = (device.get("ip") == get_last_scan_result().get("gateway", {}).get("ip"))
+        is_suspicious = any(entry.get("mac") == device.get("mac")
+                            for entry in get_last_scan_result().get("suspicious_entries", [])
+                            if entry.get("threat_level") in ["high", "medium"])
+        statuses.append("gateway" if is_gateway else "suspicious" if is_suspicious else None)
+    return statuses
+
+
+def indexed_statuses(devices, result):
+    """Yeni yöntem: indeks bir kez oluşturulur, satır başına O(1) sorgu"""
+    index = build_status_index(result["suspicious_entries"], result["gateway"])
+    return [device_status(index, device.get("ip"), device.get("mac")) for device in devices]
+
+
+def _best_of(func, repeat=3):
+    """Fonksiyonu tekrar tekrar çalıştırıp en iyi süreyi döndürür"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    sizes = [int(arg) for arg in argv] or [1000, 10000, 100000]
+
+    print(f"{'cihaz':>8}{'şüpheli':>10}{'eski (ms)':>16}{'indeks (ms)':>14}{'hızlanma':>12}")
+    for count in sizes:
+        result = simulate_result(count)
+        devices = result["arp_table"]
+        sample = devices[:LEGACY_SAMPLE_ROWS]
+
+        legacy_time, legacy = _best_of(lambda: legacy_statuses(sample, lambda: result))
+        legacy_time *= count / len(sample)
+        indexed_time, indexed = _best_of(lambda: indexed_statuses(devices, result))
+
+        # İki yöntem aynı durumları vermeli (bilgi durumu eski yöntemde normal sayılırdı)
+        assert legacy == [status if status != "info" else None for status in indexed[:len(sample)]]
+
+        estimated = "*" if len(sample) < count else " "
+        print(f"{count:>8}{len(result['suspicious_entries']):>10}{legacy_time * 1000:>15.1f}{estimated}"
+              f"{indexed_time * 1000:>14.2f}{legacy_time / indexed_time:>11.0f}x")
+
+    print(f"\n* {LEGACY_SAMPLE_ROWS} satırlık örneklemden oranlanmıştır")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,31 +11,48 @@ Bu uygulama, ağda meydana gelen ARP spoofing saldırılarını tespit eder.
 - Periyodik tarama özelliği
 - Sistem tepsisi desteği
 - Türkçe arayüz
+- Arayüzsüz servis modu (--headless, JSON satırları ve UNIX soketi)
+- Başlangıç profili (--profile-startup, import ve oluşturma süreleri)
 """
 
 import os
 import sys
-import tkinter as tk
-from tkinter import messagebox
+
+# Modüller için path ayarlaması
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+# Arayüzsüz servis modu: tkinter, PIL, pystray ve ui.* yüklenmeden başlatılır
+if __name__ == "__main__" and "--headless" in sys.argv[1:]:
+    from modules.daemon import main as headless_main
+    sys.exit(headless_main(sys.argv[1:]))
+
+# Başlangıç profili (--profile-startup veya --profile-startup=json)
+from modules.startup_profiler import profiler
+PROFILE_STARTUP = next((arg for arg in sys.argv[1:] if arg.startswith("--profile-startup")), None)
+if PROFILE_STARTUP:
+    profiler.enable()
+
+with profiler.phase("import tkinter"):
+    import tkinter as tk
+    from tkinter import messagebox
+import base64
 import threading
 import traceback
 import logging
 import json
 import atexit
+from importlib.util import find_spec
 
-# Pystray için PIL kütüphanesini import et
-try:
-    import PIL.Image
-    from pystray import Icon, Menu, MenuItem
-    SYSTEM_TRAY_AVAILABLE = True
-except ImportError:
-    SYSTEM_TRAY_AVAILABLE = False
+# Sistem tepsisi için PIL ve pystray gerekir; yalnızca varlıkları kontrol edilir,
+# kütüphaneler ilk kare çizildikten sonra yüklenir
+SYSTEM_TRAY_AVAILABLE = find_spec("PIL") is not None and find_spec("pystray") is not None
+if not SYSTEM_TRAY_AVAILABLE:
     print("Sistem tepsisi desteği için PIL ve pystray kütüphaneleri gereklidir.")
 
-# Modüller için path ayarlaması
-current_dir = os.path.dirname(os.path.abspath(__file__))
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
+# Başlık çubuğu ikonu
+APP_ICON_SVG = os.path.join(current_dir, "assets", "app_icon.svg")
 
 # Loglama konfigürasyonu
 logging.basicConfig(
@@ -71,15 +88,20 @@ class VARPApp:
             self.root.configure(bg=THEME["background"])
             
             # Özel başlık çubuğunu oluştur
-            self._create_custom_titlebar()
+            with profiler.phase("başlık çubuğu"):
+                self._create_custom_titlebar()
             
             # Uygulamayı başlat
-            from ui.screens import VARPApp
-            self.app = VARPApp(self.root)
+            with profiler.phase("import ui.screens"):
+                from ui.screens import VARPApp
+            with profiler.phase("ui.screens.VARPApp"):
+                self.app = VARPApp(self.root)
             
-            # Sistem tepsisi ikonunu oluştur
+            # İlk kare çizildikten sonra yapılacak işler: ikon ve sistem tepsisi
+            self.after_first_frame(lambda: profiler.mark("ilk kare"))
+            self.after_first_frame(self._load_titlebar_icon)
             if SYSTEM_TRAY_AVAILABLE:
-                self.setup_system_tray()
+                self.after_first_frame(self.setup_system_tray)
                 
             # Auto tarama ayarını kontrol et
             self.check_auto_scan_setting()
@@ -90,52 +112,68 @@ class VARPApp:
             messagebox.showerror("Başlatma Hatası", 
                 f"Uygulama başlatılırken bir hata oluştu:\n{str(e)}")
     
+    def after_first_frame(self, callback):
+        """
+        Fonksiyonu ilk kare çizildikten sonra çalıştırır.
+        
+        Bekleyen yeniden çizimler boşta (idle) işlenir; after_idle içinden
+        kurulan zamanlayıcı bu çizimlerden sonra tetiklenir.
+        """
+        self.root.after_idle(self.root.after, 0, callback)
+    
     def setup_system_tray(self):
         """Sistem tepsisi ikonunu hazırlar"""
         try:
-            # SVG ikon dosyası yerine kod ile oluşturulmuş basit bir ikon kullan
-            width = 64
-            height = 64
-            image = PIL.Image.new('RGBA', (width, height), (0, 0, 0, 0))
-            
-            # Kalkan şekli çiz
-            from PIL import ImageDraw
-            draw = ImageDraw.Draw(image)
-            
-            # Kalkan şekli (yeşil tonda)
-            shield_color = (0, 180, 120, 255)  # Yeşil tonu
-            draw.polygon([(width//2, 5), (width-5, height//3), 
-                         (width-15, height-10), (width//2, height-5),
-                         (15, height-10), (5, height//3)], 
-                         fill=shield_color)
-            
-            # Kalkan içine kilit ikonu ekle
-            lock_color = (40, 40, 40, 255)  # Koyu gri
-            draw.rectangle([width//3, height//2, 2*width//3, 3*height//4], fill=lock_color)
-            draw.rectangle([width//4, height//3, 3*width//4, height//2], fill=lock_color)
-            
-            # Menü öğelerini oluştur
-            menu = Menu(
-                MenuItem("Göster", self.show_app),
-                MenuItem("Ağı Tara", self.start_scan),
-                MenuItem("Periyodik Tarama", Menu(
-                    MenuItem("Başlat", self.start_periodic_scan, checked=lambda _: self.is_periodic_active()),
-                    MenuItem("Durdur", self.stop_periodic_scan)
-                )),
-                MenuItem("Çıkış", self.quit_app)
-            )
-            
-            # Sistem tepsisi ikonunu oluştur
-            self.system_tray_icon = Icon("varp", image, "V-ARP", menu)
-            
-            # Arka planda sistem tepsisi ikonunu göster
-            threading.Thread(target=self.system_tray_icon.run, daemon=True).start()
-            
+            with profiler.phase("sistem tepsisi (PIL, pystray)"):
+                self._create_system_tray()
             logger.info("Sistem tepsisi ikonu başarıyla oluşturuldu")
         except Exception as e:
             logger.error(f"Sistem tepsisi ikonu oluşturulurken hata: {e}")
             traceback.print_exc()
     
+    def _create_system_tray(self):
+        """PIL ve pystray'i yükleyip tepsi ikonunu oluşturur"""
+        import PIL.Image
+        from PIL import ImageDraw
+        from pystray import Icon, Menu, MenuItem
+        
+        # SVG ikon dosyası yerine kod ile oluşturulmuş basit bir ikon kullan
+        width = 64
+        height = 64
+        image = PIL.Image.new('RGBA', (width, height), (0, 0, 0, 0))
+        
+        # Kalkan şekli çiz
+        draw = ImageDraw.Draw(image)
+        
+        # Kalkan şekli (yeşil tonda)
+        shield_color = (0, 180, 120, 255)  # Yeşil tonu
+        draw.polygon([(width//2, 5), (width-5, height//3), 
+                     (width-15, height-10), (width//2, height-5),
+                     (15, height-10), (5, height//3)], 
+                     fill=shield_color)
+        
+        # Kalkan içine kilit ikonu ekle
+        lock_color = (40, 40, 40, 255)  # Koyu gri
+        draw.rectangle([width//3, height//2, 2*width//3, 3*height//4], fill=lock_color)
+        draw.rectangle([width//4, height//3, 3*width//4, height//2], fill=lock_color)
+        
+        # Menü öğelerini oluştur
+        menu = Menu(
+            MenuItem("Göster", self.show_app),
+            MenuItem("Ağı Tara", self.start_scan),
+            MenuItem("Periyodik Tarama", Menu(
+                MenuItem("Başlat", self.start_periodic_scan, checked=lambda _: self.is_periodic_active()),
+                MenuItem("Durdur", self.stop_periodic_scan)
+            )),
+            MenuItem("Çıkış", self.quit_app)
+        )
+        
+        # Sistem tepsisi ikonunu oluştur
+        self.system_tray_icon = Icon("varp", image, "V-ARP", menu)
+        
+        # Arka planda sistem tepsisi ikonunu göster
+        threading.Thread(target=self.system_tray_icon.run, daemon=True).start()
+    
     def _create_custom_titlebar(self):
         """Özel siyah başlık çubuğu oluşturur"""
         from ui.colors import THEME
@@ -144,30 +182,10 @@ class VARPApp:
         self.titlebar = tk.Frame(self.root, bg=THEME["card_background"], height=30)
         self.titlebar.pack(side=tk.TOP, fill=tk.X)
         
-        # SVG ikon
-        try:
-            import cairosvg
-            import io
-            from PIL import Image, ImageTk
-            
-            # SVG dosyasını oku ve PNG'ye dönüştür
-            svg_data = open("assets/icons/app_icon.svg", "rb").read()
-            png_data = cairosvg.svg2png(bytestring=svg_data, output_width=20, output_height=20)
-            
-            # PNG verisini PIL Image'e dönüştür
-            icon_image = Image.open(io.BytesIO(png_data))
-            icon_photo = ImageTk.PhotoImage(icon_image)
-            
-            # İkon etiketi
-            self.icon_label = tk.Label(self.titlebar, image=icon_photo, bg=THEME["card_background"])
-            self.icon_label.image = icon_photo  # Referansı koru
-            self.icon_label.pack(side=tk.LEFT, padx=10)
-        except Exception as e:
-            logger.error(f"İkon yüklenirken hata: {e}")
-            # İkon yükleme başarısız olursa basit bir etiket göster
-            self.icon_label = tk.Label(self.titlebar, text="🛡️", bg=THEME["card_background"], 
-                                      fg=THEME["primary"], font=("Arial", 12, "bold"))
-            self.icon_label.pack(side=tk.LEFT, padx=10)
+        # İkon etiketi: SVG ikon ilk kareden sonra yüklenene kadar (veya yüklenemezse) basit bir etiket
+        self.icon_label = tk.Label(self.titlebar, text="🛡️", bg=THEME["card_background"], 
+                                  fg=THEME["primary"], font=("Arial", 12, "bold"))
+        self.icon_label.pack(side=tk.LEFT, padx=10)
         
         # Başlık metni
         self.title_label = tk.Label(self.titlebar, text="V-ARP - ARP Spoofing Koruması", 
@@ -218,6 +236,27 @@ class VARPApp:
         self.icon_label.bind("<ButtonRelease-1>", self._stop_drag)
         self.icon_label.bind("<B1-Motion>", self._on_motion)
     
+    def _load_titlebar_icon(self):
+        """SVG ikonu PNG'ye çevirip başlık çubuğuna yerleştirir (cairosvg gerekir)"""
+        if find_spec("cairosvg") is None:
+            logger.debug("cairosvg bulunamadı, başlık çubuğunda metin ikonu kullanılıyor")
+            return
+        try:
+            with profiler.phase("başlık ikonu (cairosvg)"):
+                import cairosvg
+                
+                # SVG dosyasını oku ve PNG'ye dönüştür
+                with open(APP_ICON_SVG, "rb") as f:
+                    svg_data = f.read()
+                png_data = cairosvg.svg2png(bytestring=svg_data, output_width=20, output_height=20)
+                
+                # Tk 8.6 PNG'yi doğrudan okur; PIL gerekmez
+                icon_photo = tk.PhotoImage(data=base64.b64encode(png_data))
+                self.icon_label.config(image=icon_photo, text="")
+                self.icon_label.image = icon_photo  # Referansı koru
+        except Exception as e:
+            logger.error(f"İkon yüklenirken hata: {e}")
+    
     def _start_drag(self, event):
         """Pencere sürükleme başlatma"""
         self._x = event.x
@@ -291,12 +330,22 @@ class VARPApp:
     def check_auto_scan_setting(self):
         """Auto scan ayarını kontrol eder ve gerekirse otomatik başlatır"""
         try:
-            from modules.settings import get_setting
-            auto_scan = get_setting("auto_scan", False)
+            from modules.settings import get_settings_store
+            settings = get_settings_store()
+            auto_scan = settings.get_bool("auto_scan", False)
             
             if auto_scan and hasattr(self.app, 'start_periodic_scan'):
                 logger.info("Otomatik tarama ayarı aktif, periyodik tarama başlatılıyor")
                 self.app.start_periodic_scan()
+            
+            # Olay tabanlı (netlink) veya paket tabanlı (AF_PACKET) izleme modu
+            monitor_mode = settings.get_str("monitor_mode", "periodic", ("periodic", "event", "packet"))
+            if monitor_mode == "event" and hasattr(self.app, 'scanner'):
+                logger.info("Olay tabanlı izleme modu aktif, komşu bildirimleri dinleniyor")
+                self.app.scanner.start_event_monitor()
+            elif monitor_mode == "packet" and hasattr(self.app, 'scanner'):
+                logger.info("Paket izleme modu aktif, ARP paketleri dinleniyor")
+                self.app.scanner.start_packet_monitor()
         except Exception as e:
             logger.error(f"Auto scan ayarı kontrol edilirken hata: {e}")
     
@@ -326,6 +375,10 @@ class VARPApp:
                 if hasattr(self.app.scanner, 'stop_periodic_scan') and callable(self.app.scanner.stop_periodic_scan):
                     self.app.scanner.stop_periodic_scan()
             
+            # Ertelenmiş ayar yazmalarını diske aktar
+            from modules.settings import flush_settings
+            flush_settings()
+            
             logger.info("Uygulama temizlik işlemleri tamamlandı")
         except Exception as e:
             logger.error(f"Temizlik işlemleri sırasında hata: {e}")
@@ -345,7 +398,8 @@ class VARPApp:
 def main():
     try:
         # Ana pencereyi oluştur
-        root = tk.Tk()
+        with profiler.phase("tk.Tk()"):
+            root = tk.Tk()
         
         # Pencereyi ekranın ortasında konumlandır
         window_width = 1024
@@ -359,11 +413,19 @@ def main():
         # Pencereyi merkeze konumlandır
         root.geometry(f"{window_width}x{window_height}+{center_x}+{center_y}")
         
-        app = VARPApp(root)
+        with profiler.phase("VARPApp"):
+            app = VARPApp(root)
         
         # Çıkışta temizlik yap
         atexit.register(app.cleanup)
         
+        # Profil modunda ilk kare ve ertelenen işler bitince rapor yazılıp çıkılır
+        if PROFILE_STARTUP:
+            def report_startup():
+                print(profiler.report(as_json=PROFILE_STARTUP.endswith("=json")), file=sys.stderr, flush=True)
+                app.quit_app()
+            app.after_first_frame(report_startup)
+        
         # Ana döngüyü başlat
         root.mainloop()
     except Exception as e:
@@ -13,9 +13,16 @@ import struct
 import time
 import re
 import os
+import sqlite3
 import threading
 import logging
 from collections import defaultdict
+from itertools import repeat
+
+from modules.arp_table import (ArpTable, SnapshotPool, MAC_MULTICAST_BIT, pack_ip, unpack_ip, pack_mac, unpack_mac,
+                               is_broadcast_mac, intern_interface, interface_name, report_skipped_macs)
+from modules.history_store import HistoryStore, HISTORY_PAGE_SIZE
+from modules.scan_history import ScanHistoryBuffer
 
 # Loglama
 logger = logging.getLogger("V-ARP.arp_detector")
@@ -34,17 +41,204 @@ def format_ip(ip_bytes):
         return socket.inet_ntoa(ip_bytes)
     return ip_bytes
 
+# Linux çekirdeğinin komşu (ARP) tablosu
+PROC_NET_ARP = "/proc/net/arp"
+
+# Yönlendirme tablosu (ağ geçidi önbelleğinin geçersiz kılınması için izlenir)
+PROC_NET_ROUTE = "/proc/net/route"
+
+# Ağ geçidi önbelleğinin en uzun geçerlilik süresi (saniye)
+GATEWAY_CACHE_TTL = 60.0
+
+# Olay/paket izlemede iki sonuç yayını arasındaki en kısa süre (saniye)
+MONITOR_PUBLISH_INTERVAL = 1.0
+
+# /proc/net/arp bayrakları (include/uapi/linux/if_arp.h)
+ATF_COM = 0x02  # Tamamlanmış kayıt (MAC adresi çözülmüş)
+
+# /proc/net/arp başlık satırındaki sözcük sayısı ve satır başına alan sayısı
+PROC_NET_ARP_HEADER_FIELDS = 9
+PROC_NET_ARP_FIELDS = 6
+
+# Tamamlanmış kayıtların olağan bayrak değeri (ATF_COM)
+_ATF_COM_TEXT = b"0x2"
+
+def _proc_columns_by_line(data):
+    """
+    Düzensiz içerikte (eksik alanlı satırlar) sütunları satır satır toplar.
+    
+    Returns:
+        tuple: (ip'ler, bayraklar, MAC'ler, arayüzler) bayt listeleri
+    """
+    ips, flags, macs, devices = [], [], [], []
+    for line in data.split(b"\n")[1:]:
+        parts = line.split()
+        if len(parts) < PROC_NET_ARP_FIELDS:
+            continue
+        ips.append(parts[0])
+        flags.append(parts[2])
+        macs.append(parts[3])
+        devices.append(parts[5])
+    return ips, flags, macs, devices
+
+def parse_proc_net_arp(data):
+    """
+    /proc/net/arp içeriğini doğrudan sütunlu ArpTable'a çevirir.
+    
+    Çekirdeğin yazdığı tablo düzenlidir (satır başına altı alan); bu
+    durumda tüm tampon tek bir split() ile bölünür ve sütunlar dilimlerle
+    alınır. Satır başına nesne veya metin çözümlemesi yapılmaz; IP'ler
+    inet_aton ile toplu olarak paketlenir.
+    
+    Args:
+        data (bytes | str): /proc/net/arp dosyasının tam içeriği
+        
+    Returns:
+        ArpTable: Tamamlanmış kayıtlar (eksik ve Ethernet olmayan kayıtlar atlanır)
+    """
+    if isinstance(data, str):
+        data = data.encode('ascii', errors='replace')
+    
+    fields = data.split()
+    rows = (len(fields) - PROC_NET_ARP_HEADER_FIELDS) // PROC_NET_ARP_FIELDS
+    if rows <= 0:
+        return ArpTable()
+    
+    # Sondaki satır sonu hariç her satır sonu bir kayıt satırı başlatır
+    if (len(fields) - PROC_NET_ARP_HEADER_FIELDS == rows * PROC_NET_ARP_FIELDS
+            and data.count(b"\n", 0, len(data) - 1) == rows):
+        body = fields[PROC_NET_ARP_HEADER_FIELDS:]
+        ips, flags = body[0::PROC_NET_ARP_FIELDS], body[2::PROC_NET_ARP_FIELDS]
+        macs, devices = body[3::PROC_NET_ARP_FIELDS], body[5::PROC_NET_ARP_FIELDS]
+    else:
+        ips, flags, macs, devices = _proc_columns_by_line(data)
+    
+    # Eksik kayıtlar ("(incomplete)") ve Ethernet olmayan adresler ayıklanır;
+    # olağan durumda tüm satırlar geçerli olduğundan liste kopyalanmaz
+    mac_text = b" ".join(macs)
+    if flags.count(_ATF_COM_TEXT) != len(flags) or len(mac_text) != 18 * len(macs) - 1:
+        keep = []
+        foreign = []
+        for index, (flag, mac) in enumerate(zip(flags, macs)):
+            if flag != _ATF_COM_TEXT and not int(flag, 16) & ATF_COM:
+                continue
+            if len(mac) == 17:
+                keep.append(index)
+            else:
+                foreign.append(mac.decode('ascii', 'replace'))
+        if foreign:
+            report_skipped_macs(foreign)
+        ips = [ips[index] for index in keep]
+        macs = [macs[index] for index in keep]
+        devices = [devices[index] for index in keep]
+        mac_text = b" ".join(macs)
+    
+    table = ArpTable()
+    try:
+        packed_ips = b"".join(map(socket.inet_aton, b" ".join(ips).decode('ascii').split()))
+        # Her MAC 16 onaltılık haneye tamamlanarak 64 bitlik büyük uçlu sözcüklere çevrilir
+        packed_macs = bytes.fromhex((b"0000" + b"0000".join(mac_text.replace(b":", b"").split())).decode('ascii'))
+    except (OSError, ValueError, UnicodeDecodeError):
+        # Bozuk alanlı tablo: satırlar tek tek eklenir, çözülemeyenler atlanır
+        for ip, mac, device in zip(ips, macs, devices):
+            try:
+                table.append(ip.decode('ascii'), mac.decode('ascii'), device.decode('utf-8', 'replace'))
+            except (OSError, ValueError, UnicodeDecodeError):
+                logger.debug(f"/proc/net/arp: çözümlenemeyen kayıt atlandı: {ip!r} {mac!r}")
+        return table
+    
+    table.ips.frombytes(packed_ips)
+    table.macs.frombytes(packed_macs)
+    if sys.byteorder == 'little':
+        table.ips.byteswap()
+        table.macs.byteswap()
+    interface_ids = {device: intern_interface(device.decode('utf-8', 'replace')) for device in set(devices)}
+    table.ifaces.extend(map(interface_ids.__getitem__, devices))
+    return table
+
+def read_proc_net_arp(path=PROC_NET_ARP):
+    """
+    /proc/net/arp dosyasını tek bir tamponlu okuma ile okur.
+    
+    Args:
+        path (str): Okunacak dosya yolu
+        
+    Returns:
+        ArpTable: ARP tablosu kayıtları
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    return parse_proc_net_arp(data)
+
+def _parse_arp_n_output(output):
+    """Linux 'arp -n' çıktısını ARP kayıtlarına ayrıştırır"""
+    arp_entries = []
+    for line in output.split('\n')[1:]:  # Başlık satırını atla
+        if line.strip():
+            parts = line.split()
+            if len(parts) >= 3:
+                ip = parts[0]
+                mac = parts[2]
+                interface = parts[-1] if len(parts) > 3 else "unknown"
+                if mac != "(incomplete)":  # Eksik kayıtları atla
+                    arp_entries.append({"ip": ip, "mac": mac, "interface": interface})
+    return arp_entries
+
+# Tablo okuma arka uçları ("auto": netlink -> /proc/net/arp -> komut)
+ARP_BACKENDS = ("auto", "netlink", "proc", "command")
+
+def _resolve_backend(backend):
+    """Arka uç seçimini doğrular, verilmemişse ayarlardan okur"""
+    if backend is None:
+        try:
+            from modules.settings import get_setting
+            backend = get_setting("arp_backend", "auto")
+        except Exception as e:
+            logger.error(f"Arka uç ayarı okunurken hata: {e}")
+            backend = "auto"
+    
+    if backend not in ARP_BACKENDS:
+        logger.warning(f"Bilinmeyen ARP arka ucu '{backend}', 'auto' kullanılıyor")
+        backend = "auto"
+    return backend
+
+def _read_unix_arp_table(backend):
+    """Linux/Unix sistemlerde ARP tablosunu seçilen arka uç ile okur"""
+    from modules import netlink
+    
+    if backend in ("auto", "netlink") and netlink.is_available():
+        try:
+            return netlink.get_neighbor_table()
+        except OSError as e:
+            if backend == "netlink":
+                raise
+            logger.debug(f"Netlink ile okunamadı, /proc/net/arp deneniyor: {e}")
+    
+    if backend in ("auto", "proc") and os.path.exists(PROC_NET_ARP):
+        # Çekirdek tablosunu doğrudan oku (fork/exec ve ara sözlük gerektirmez)
+        return read_proc_net_arp()
+    
+    # arp komutunu çalıştır ve çıktısını ayrıştır
+    output = subprocess.check_output(['arp', '-n'], text=True)
+    return _parse_arp_n_output(output)
+
 # ARP tablosunu alma
-def get_arp_table():
+def get_arp_table(backend=None):
     """
     Sistemin ARP tablosunu alır.
     
+    Args:
+        backend (str): "auto", "netlink", "proc" veya "command";
+            verilmezse "arp_backend" ayarı kullanılır
+    
     Returns:
-        list: ARP tablosundaki kayıtlar listesi
+        ArpTable: ARP tablosundaki kayıtlar ({"ip", "mac", "interface"} görünümleri)
     """
     arp_entries = []
     
     try:
+        backend = _resolve_backend(backend)
+        
         # Platforma göre uygun komutu belirle
         if os.name == 'nt':  # Windows
             # Windows'ta arp komutunu çalıştır
@@ -58,21 +252,10 @@ def get_arp_table():
                     mac = mac.replace('-', ':')  # Standart formata çevir
                     arp_entries.append({"ip": ip, "mac": mac, "interface": interface_type})
         else:  # Linux/Unix
-            # Linux'ta arp komutunu çalıştır
-            output = subprocess.check_output(['arp', '-n'], text=True)
-            # Linux ARP çıktısını ayrıştır
-            for line in output.split('\n')[1:]:  # Başlık satırını atla
-                if line.strip():
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        ip = parts[0]
-                        mac = parts[2]
-                        interface = parts[-1] if len(parts) > 3 else "unknown"
-                        if mac != "(incomplete)":  # Eksik kayıtları atla
-                            arp_entries.append({"ip": ip, "mac": mac, "interface": interface})
+            arp_entries = _read_unix_arp_table(backend)
         
         logger.debug(f"ARP tablosu alındı: {len(arp_entries)} kayıt")
-        return arp_entries
+        return ArpTable.from_entries(arp_entries)
         
     except Exception as e:
         logger.error(f"ARP tablosu alınırken hata oluştu: {e}")
@@ -92,17 +275,23 @@ def get_arp_table():
             {"ip": "192.168.1.100", "mac": "de:ad:be:ef:12:34", "interface": "eth0"} # Normal cihaz
         ]
         
-        return test_entries
+        return ArpTable.from_entries(test_entries)
 
 # Varsayılan ağ geçidini bulma
-def get_default_gateway():
+def get_default_gateway(backend=None):
     """
     Varsayılan ağ geçidini (default gateway) bulur.
     
+    Args:
+        backend (str): "auto", "netlink", "proc" veya "command";
+            verilmezse "arp_backend" ayarı kullanılır
+    
     Returns:
         dict: Ağ geçidi IP ve MAC adresi
     """
     try:
+        backend = _resolve_backend(backend)
+        
         if sys.platform == 'win32':
             # Windows üzerinde çalışılıyorsa
             result = subprocess.check_output('ipconfig', encoding='cp1254', errors='replace')
@@ -141,6 +330,19 @@ def get_default_gateway():
                 logger.warning("Gateway IP adresi bulunamadı")
                 return {"ip": "Bilinmiyor", "mac": "Bilinmiyor"}
         else:
+            # Linux üzerinde netlink varsa alt süreç çalıştırmadan çöz
+            from modules import netlink
+            if backend in ("auto", "netlink") and netlink.is_available():
+                try:
+                    gateway = netlink.get_default_gateway()
+                    logger.debug(f"Gateway bulundu (netlink): IP={gateway['ip']}, MAC={gateway['mac']}")
+                    return gateway
+                except OSError as e:
+                    if backend == "netlink":
+                        logger.error(f"Netlink ile gateway bilgisi alınırken hata: {e}")
+                        return {"ip": "Bilinmiyor", "mac": "Bilinmiyor"}
+                    logger.debug(f"Netlink ile gateway bulunamadı, ip komutu deneniyor: {e}")
+            
             # Linux üzerinde çalışılıyorsa
             try:
                 result = subprocess.check_output('ip route show default', shell=True, encoding='utf-8')
@@ -163,88 +365,597 @@ def get_default_gateway():
     logger.warning("Test ağ geçidi verisi kullanılıyor.")
     return {"ip": "192.168.1.1", "mac": "aa:bb:cc:dd:ee:ff"}
 
+class GatewayResolver:
+    """
+    Varsayılan ağ geçidi bilgisini önbellekte tutar.
+    
+    Önbellek TTL dolduğunda veya yönlendirme/komşu değişikliği görüldüğünde
+    geçersiz olur. Linux'ta değişiklikler netlink bildirimleriyle, netlink yoksa
+    /proc/net/route içeriğiyle izlenir; kararlı durumda çözümleme O(1)'dir.
+    
+    Alt sınıflar _resolve() ile önbelleğe alınan değeri değiştirebilir.
+    """
+    def __init__(self, ttl=GATEWAY_CACHE_TTL, backend=None, route_path=PROC_NET_ROUTE):
+        self.ttl = ttl
+        self.backend = backend
+        self.route_path = route_path
+        self._lock = threading.Lock()
+        self._value = None  # Önbellekteki çözümleme sonucu
+        self._expires = 0.0
+        self._route_snapshot = None
+        self._listener = None
+        self._listener_failed = False
+    
+    def _open_listener(self):
+        """Netlink değişiklik dinleyicisini bir kez açmayı dener"""
+        if self._listener is not None or self._listener_failed or os.name == 'nt':
+            return
+        try:
+            from modules import netlink
+            if netlink.is_available():
+                self._listener = netlink.RouteChangeListener()
+                return
+        except OSError as e:
+            logger.debug(f"Netlink değişiklik dinleyicisi açılamadı, {self.route_path} izlenecek: {e}")
+        self._listener_failed = True
+    
+    def _read_route_table(self):
+        """Yönlendirme tablosunu okur (procfs dosyalarının mtime değeri değişmediği için içerik karşılaştırılır)"""
+        try:
+            with open(self.route_path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def _drain(self):
+        """Bekleyen netlink bildirimlerini okur; (rota değişti mi, komşu IP'leri) döndürür"""
+        from modules import netlink
+        try:
+            return self._listener.drain()
+        except netlink.NetlinkError:
+            # Bildirimler kaçırıldı, her şey değişmiş kabul edilir
+            return True, set()
+    
+    def _changed(self):
+        """Son çözümlemeden bu yana rota veya ağ geçidi komşu kaydı değişti mi"""
+        if self._listener is not None:
+            route_changed, neighbor_ips = self._drain()
+            return route_changed or self._value["ip"] in neighbor_ips
+        
+        return self._read_route_table() != self._route_snapshot
+    
+    def get(self):
+        """
+        Ağ geçidini önbellekten veya yeniden çözümleyerek döndürür.
+        
+        Returns:
+            dict: Ağ geçidi IP ve MAC adresi
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._value is not None and now < self._expires and not self._changed():
+                return dict(self._value)
+            
+            # Çözümlemeden önce bekleyen bildirimler temizlenir; sonrakiler yeni değişikliktir
+            self._open_listener()
+            if self._listener is not None:
+                self._drain()
+            else:
+                self._route_snapshot = self._read_route_table()
+            
+            self._value = self._resolve()
+            self._expires = now + self.ttl
+            return dict(self._value)
+    
+    def _resolve(self):
+        """Önbelleğe alınacak değeri çözümler"""
+        return get_default_gateway(self.backend)
+    
+    def invalidate(self):
+        """Önbelleği temizler; sonraki get() yeniden çözümler"""
+        with self._lock:
+            self._value = None
+    
+    def close(self):
+        """Netlink dinleyicisini kapatır"""
+        with self._lock:
+            if self._listener is not None:
+                self._listener.close()
+                self._listener = None
+            self._value = None
+
 # ARP spoofing tespiti
-def detect_arp_spoofing(arp_table):
+def detect_arp_spoofing(arp_table, gateway=None):
     """
     ARP tablosunu inceleyerek olası ARP spoofing saldırılarını tespit eder.
     
     Args:
-        arp_table (list): ARP tablosu kayıtları
+        arp_table (ArpTable | list): ARP tablosu kayıtları
+        gateway (dict): Önceden çözümlenmiş ağ geçidi; verilmezse sorgulanır
         
     Returns:
         list: Tespit edilen şüpheli durumlar
     """
+    table = ArpTable.from_entries(arp_table)
     suspicious_entries = []
-    mac_to_ips = defaultdict(list)
     
-    # Her MAC adresine bağlı IP'leri topla
-    for entry in arp_table:
-        mac = entry["mac"].lower()  # Büyük/küçük harf duyarlılığını kaldır
-        ip = entry["ip"]
+    # Bir MAC'in birden fazla IP'si varsa (1'den çok cihaz olabilir)
+    # Broadcast/multicast MAC'ler normal ağ özelliğidir, gruplamaya dahil edilmez
+    for mac_value, indices in table.duplicate_macs().items():
+        mac = unpack_mac(mac_value)
+        ips = [unpack_ip(table.ips[index]) for index in indices]
+        suspicious_entries.append({
+            "type": "multiple_ips",
+            "mac": mac,
+            "ips": ips,
+            "threat_level": "medium",
+            "message": f"⚠️ Şüpheli: {mac} MAC adresine sahip {len(ips)} farklı IP adresi var: {', '.join(ips)}"
+        })
+    
+    # Ağ geçidinin MAC adresi değişmiş mi kontrol et
+    if gateway is None:
+        gateway = get_default_gateway()
+    if gateway["ip"] != "Bilinmiyor" and gateway["mac"] != "Bilinmiyor":
+        gateway_indices = table.indices_for_ip(pack_ip(gateway["ip"]))
+        if len(gateway_indices) > 1:
+            suspicious_entries.append({
+                "type": "gateway_multiple_macs",
+                "ip": gateway["ip"],
+                "macs": [unpack_mac(table.macs[index]) for index in gateway_indices],
+                "threat_level": "high",
+                "message": f"❌ TEHLİKE: Ağ geçidi {gateway['ip']} için birden fazla MAC adresi var!"
+            })
+    
+    # Bilgi amaçlı özel MAC adreslerini ekle (saldırı değil, listenin sonuna)
+    for index in table.special_indices():
+        suspicious_entries.append(_special_mac_info(unpack_ip(table.ips[index]), table.macs[index]))
+    
+    return suspicious_entries
+
+def _special_mac_info(ip, mac_value):
+    """Broadcast/multicast MAC için bilgi amaçlı kayıt oluşturur"""
+    mac = unpack_mac(mac_value)
+    # Broadcast MAC (ff:ff:ff:ff:ff:ff)
+    if is_broadcast_mac(mac_value):
+        return {
+            "type": "info_broadcast",
+            "ip": ip,
+            "mac": mac,
+            "threat_level": "none",
+            "message": f"📌 Bilgi: Broadcast MAC adresi: IP={ip}, MAC={mac}"
+        }
+    # Multicast MAC (ilk byte'ın en düşük biti 1)
+    return {
+        "type": "info_multicast",
+        "ip": ip,
+        "mac": mac,
+        "threat_level": "none",
+        "message": f"📌 Bilgi: Multicast MAC adresi: IP={ip}, MAC={mac}"
+    }
+
+def _threat_level_of(suspicious):
+    """Şüpheli durum listesinden genel tehdit seviyesini belirler"""
+    if any(entry.get("threat_level") == "high" for entry in suspicious):
+        return "high"
+    if any(entry.get("threat_level") == "medium" for entry in suspicious):
+        return "medium"
+    return "none"
+
+# Cihaz durumları (öncelik sırasıyla: ağ geçidi > şüpheli > bilgi)
+STATUS_GATEWAY = "gateway"
+STATUS_SUSPICIOUS = "suspicious"
+STATUS_INFO = "info"
+
+def build_status_index(suspicious, gateway=None):
+    """
+    Şüpheli durum listesinden MAC ve IP başına cihaz durumu indeksi oluşturur.
+    
+    Arayüz her satır için tüm şüpheli durumları taramak yerine bu indekse
+    O(1) sorgu yapar. Durumu olmayan cihazlar indekste yer almaz (normal).
+    
+    Args:
+        suspicious (list): Şüpheli durumlar
+        gateway (dict): Varsayılan ağ geçidi
         
-        # Broadcast MAC adresini atla (normal bir ağ özelliği, saldırı değil)
-        if mac == "ff:ff:ff:ff:ff:ff":
+    Returns:
+        dict: {"by_mac": {mac: durum}, "by_ip": {ip: durum}}
+    """
+    by_mac = {}
+    by_ip = {}
+    
+    # Bilgi kayıtları önce yazılır; şüpheli kayıtlar aynı adresin üzerine yazar
+    for entry in suspicious:
+        if entry.get("threat_level") in ("high", "medium"):
             continue
-            
-        # Multicast MAC adresini atla (normal bir ağ özelliği, saldırı değil)
-        if mac.startswith(("01:", "03:", "05:", "07:", "09:", "0b:", "0d:", "0f:")):
+        if entry.get("mac"):
+            by_mac.setdefault(entry["mac"], STATUS_INFO)
+        if entry.get("ip"):
+            by_ip.setdefault(entry["ip"], STATUS_INFO)
+    
+    for entry in suspicious:
+        if entry.get("threat_level") not in ("high", "medium"):
             continue
+        if entry.get("mac"):
+            by_mac[entry["mac"]] = STATUS_SUSPICIOUS
+        if entry.get("ip"):
+            by_ip[entry["ip"]] = STATUS_SUSPICIOUS
+    
+    if gateway and gateway.get("ip") not in (None, "Bilinmiyor"):
+        by_ip[gateway["ip"]] = STATUS_GATEWAY
+    
+    return {"by_mac": by_mac, "by_ip": by_ip}
+
+def status_index_of(result):
+    """
+    Sonucun durum indeksini döndürür.
+    
+    Geçmişten yüklenen (indekssiz) sonuçlar için indeks bir kez oluşturulup
+    sonuca eklenir.
+    """
+    index = result.get("status_index")
+    if index is None:
+        index = build_status_index(result.get("suspicious_entries", []), result.get("gateway"))
+        result["status_index"] = index
+    return index
+
+def device_status(index, ip, mac):
+    """
+    Cihazın durumunu indeksten belirler.
+    
+    IP'ye göre ağ geçidi önceliklidir; şüpheli durum MAC'e göre belirlenir.
+    
+    Returns:
+        str | None: STATUS_GATEWAY, STATUS_SUSPICIOUS, STATUS_INFO veya None (normal)
+    """
+    status = index["by_ip"].get(ip)
+    if status == STATUS_GATEWAY:
+        return status
+    return index["by_mac"].get(mac) or status
+
+class ARPStateTracker:
+    """
+    Ardışık ARP tablosu görüntülerini yalnızca farkları üzerinden işleyen takipçi.
+    
+    IP ve MAC indeksleri taramalar arasında korunur; her taramada yalnızca eklenen,
+    değişen ve silinen kayıtlar kurallardan geçirilir. Tek bir görüntüde görülemeyen
+    MAC değişimleri (IP'nin başka bir MAC'e taşınması) bu sayede yakalanır.
+    
+    Anahtarlar ve MAC adresleri ArpTable ile aynı tamsayı gösterimiyle tutulur;
+    metin yalnızca olay ve uyarı üretilirken oluşturulur.
+    """
+    def __init__(self, gateway=None):
+        self.gateway = gateway or {"ip": "Bilinmiyor", "mac": "Bilinmiyor"}
+        self.entries = {}                     # (ip, arayüz indeksi, sıra) -> MAC
+        self.ip_to_keys = defaultdict(set)    # IP -> anahtarlar
+        self.mac_to_keys = defaultdict(dict)  # MAC -> anahtarlar (sıralı küme)
+        self.shared_macs = {}                 # Birden fazla kayda sahip MAC'ler (sıralı küme)
+        self.special = {}                     # Broadcast/multicast kayıtlar: anahtar -> MAC
+        self.stacked = 0                      # Sırası 0 olmayan (aynı IP ve arayüzde tekrarlanan) anahtar sayısı
+        self.initialized = False
+    
+    def _snapshot(self, arp_table):
+        """Tabloyu anahtar -> MAC sözlüğüne çevirir"""
+        table = ArpTable.from_entries(arp_table)
+        if not self.stacked:
+            snapshot = dict(zip(zip(table.ips, table.ifaces, repeat(0)), table.macs))
+            if len(snapshot) == len(table):
+                return snapshot
+        
+        # Aynı IP aynı arayüzde birden çok kez görünebilir (Windows 'arp -a'). Tekrarlanan
+        # kayıtlar çoklu küme olarak eşlenir: önceki durumda bulunan MAC'ler kendi sıralarını
+        # korur, böylece tablonun yeniden sıralanması değişim olayı üretmez
+        groups = defaultdict(list)
+        for ip, interface, mac in zip(table.ips, table.ifaces, table.macs):
+            groups[(ip, interface)].append(mac)
+        
+        snapshot = {}
+        for (ip, interface), macs in groups.items():
+            old = {key: self.entries[key] for key in self.ip_to_keys.get(ip, ()) if key[1] == interface}
             
-        mac_to_ips[mac].append(ip)
+            remaining = []
+            for mac in macs:
+                key = next((key for key in sorted(old) if old[key] == mac and key not in snapshot), None)
+                if key is None:
+                    remaining.append(mac)
+                else:
+                    snapshot[key] = mac
+            
+            # Yeni MAC'ler önce boşalan sıralara (MAC değişimi), sonra yeni sıralara yerleşir
+            free = [key for key in sorted(old) if key not in snapshot]
+            order = 0
+            for mac in remaining:
+                if free:
+                    key = free.pop(0)
+                else:
+                    while (ip, interface, order) in old or (ip, interface, order) in snapshot:
+                        order += 1
+                    key = (ip, interface, order)
+                snapshot[key] = mac
+        return snapshot
     
-    # Bir MAC'in birden fazla IP'si varsa (1'den çok cihaz olabilir)
-    for mac, ips in mac_to_ips.items():
-        if len(ips) > 1:
-            suspicious_entries.append({
-                "type": "multiple_ips",
-                "mac": mac,
-                "ips": ips,
+    def _gateway_ip(self):
+        """Ağ geçidi IP'sinin tamsayı karşılığı (bilinmiyorsa None)"""
+        try:
+            return pack_ip(self.gateway.get("ip"))
+        except (OSError, TypeError):
+            return None
+    
+    def _index(self, key, mac):
+        """Kaydı indekslere ekler"""
+        self.entries[key] = mac
+        self.ip_to_keys[key[0]].add(key)
+        if key[2]:
+            self.stacked += 1
+        
+        # Broadcast ve multicast MAC'ler IP eşleme kurallarına dahil edilmez
+        if mac & MAC_MULTICAST_BIT:
+            self.special[key] = mac
+            return
+        
+        keys = self.mac_to_keys[mac]
+        keys[key] = None
+        if len(keys) > 1:
+            self.shared_macs[mac] = None
+    
+    def _unindex(self, key, mac):
+        """Kaydı indekslerden çıkarır"""
+        del self.entries[key]
+        if key[2]:
+            self.stacked -= 1
+        keys = self.ip_to_keys[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self.ip_to_keys[key[0]]
+        
+        if self.special.pop(key, None) is not None:
+            return
+        
+        keys = self.mac_to_keys[mac]
+        keys.pop(key, None)
+        if not keys:
+            del self.mac_to_keys[mac]
+        if len(keys) <= 1:
+            self.shared_macs.pop(mac, None)
+    
+    def _set(self, key, mac):
+        """
+        Kaydı ekler veya günceller.
+        
+        Returns:
+            tuple: (değişim olayı veya None, MAC değişimi uyarıları)
+        """
+        old_value = self.entries.get(key)
+        if old_value == mac:
+            return None, []
+        
+        if old_value is not None:
+            self._unindex(key, old_value)
+        self._index(key, mac)
+        
+        ip, interface, new_mac = unpack_ip(key[0]), interface_name(key[1]), unpack_mac(mac)
+        if old_value is None:
+            return {
+                "type": "added",
+                "ip": ip,
+                "interface": interface,
+                "mac": new_mac,
+                "old_mac": None,
+                "message": f"Yeni kayıt: IP {ip} -> MAC {new_mac} ({interface})"
+            }, []
+        
+        old_mac = unpack_mac(old_value)
+        change = {
+            "type": "changed",
+            "ip": ip,
+            "interface": interface,
+            "mac": new_mac,
+            "old_mac": old_mac,
+            "message": f"IP {ip}, MAC {old_mac} adresinden MAC {new_mac} adresine taşındı"
+        }
+        if key[0] == self._gateway_ip():
+            alert = {
+                "type": "gateway_mac_changed",
+                "ip": ip,
+                "mac": new_mac,
+                "macs": [old_mac, new_mac],
+                "threat_level": "high",
+                "message": f"❌ TEHLİKE: Ağ geçidi {ip} MAC adresi değişti: {old_mac} -> {new_mac}"
+            }
+        else:
+            alert = {
+                "type": "ip_mac_changed",
+                "ip": ip,
+                "mac": new_mac,
+                "macs": [old_mac, new_mac],
                 "threat_level": "medium",
-                "message": f"⚠️ Şüpheli: {mac} MAC adresine sahip {len(ips)} farklı IP adresi var: {', '.join(ips)}"
-            })
+                "message": f"⚠️ Şüpheli: {ip} IP adresinin MAC adresi değişti: {old_mac} -> {new_mac}"
+            }
+        return change, [alert]
     
-    # Ağ geçidinin MAC adresi değişmiş mi kontrol et
-    gateway = get_default_gateway()
-    if gateway["ip"] != "Bilinmiyor" and gateway["mac"] != "Bilinmiyor":
-        gateway_entries = [entry for entry in arp_table if entry["ip"] == gateway["ip"]]
-        if len(gateway_entries) > 0:
-            if len(gateway_entries) > 1:
+    def _remove(self, key):
+        """Kaydı siler ve değişim olayını döndürür (kayıt yoksa None)"""
+        mac = self.entries.get(key)
+        if mac is None:
+            return None
+        
+        self._unindex(key, mac)
+        ip, interface, old_mac = unpack_ip(key[0]), interface_name(key[1]), unpack_mac(mac)
+        return {
+            "type": "removed",
+            "ip": ip,
+            "interface": interface,
+            "mac": None,
+            "old_mac": old_mac,
+            "message": f"Kayıt silindi: IP {ip} -> MAC {old_mac} ({interface})"
+        }
+    
+    def _multiple_ips_alert(self, mac_value):
+        """Birden fazla IP'ye sahip MAC için şüpheli durum oluşturur"""
+        mac = unpack_mac(mac_value)
+        ips = [unpack_ip(key[0]) for key in self.mac_to_keys[mac_value]]
+        return {
+            "type": "multiple_ips",
+            "mac": mac,
+            "ips": ips,
+            "threat_level": "medium",
+            "message": f"⚠️ Şüpheli: {mac} MAC adresine sahip {len(ips)} farklı IP adresi var: {', '.join(ips)}"
+        }
+    
+    def update(self, arp_table, gateway=None):
+        """
+        Yeni ARP tablosu görüntüsünü önceki durumla karşılaştırarak işler.
+        
+        İlk çağrı başlangıç durumunu oluşturur ve değişim olayı üretmez.
+        
+        Args:
+            arp_table (ArpTable | list): get_arp_table() formatındaki kayıtlar
+            gateway (dict): Güncel ağ geçidi; verilmezse öncekisi kullanılır
+            
+        Returns:
+            tuple: (değişim olayları, şüpheli durumlar) - şüpheli durumlar
+                detect_arp_spoofing() ile aynı formattadır, MAC değişimi
+                uyarıları başa eklenir
+        """
+        if gateway is not None:
+            self.gateway = gateway
+        
+        snapshot = self._snapshot(arp_table)
+        changes = []
+        alerts = []
+        
+        if not self.initialized:
+            # Başlangıç görüntüsü tablo sırasıyla indekslenir
+            for key, mac in snapshot.items():
+                self._index(key, mac)
+        elif snapshot != self.entries:
+            # Yalnızca farklar işlenir; sıralama sonucu belirli kılar
+            appeared = sorted(snapshot.items() - self.entries.items())
+            disappeared = sorted(self.entries.items() - snapshot.items())
+            
+            for key, _mac in disappeared:
+                if key not in snapshot:
+                    changes.append(self._remove(key))
+            
+            for key, mac in appeared:
+                change, found = self._set(key, mac)
+                changes.append(change)
+                alerts.extend(found)
+        
+        # Başlangıç görüntüsü değişim sayılmaz
+        self.initialized = True
+        
+        return changes, alerts + self.suspicious_entries()
+    
+    def suspicious_entries(self):
+        """Güncel durumdaki şüpheli ve bilgi amaçlı kayıtları döndürür"""
+        suspicious_entries = [self._multiple_ips_alert(mac) for mac in self.shared_macs]
+        
+        gateway = self.gateway
+        if gateway["ip"] != "Bilinmiyor" and gateway["mac"] != "Bilinmiyor":
+            gateway_keys = self.ip_to_keys.get(self._gateway_ip(), ())
+            if len(gateway_keys) > 1:
                 suspicious_entries.append({
                     "type": "gateway_multiple_macs",
                     "ip": gateway["ip"],
-                    "macs": [entry["mac"] for entry in gateway_entries],
+                    "macs": [unpack_mac(self.entries[key]) for key in sorted(gateway_keys)],
                     "threat_level": "high",
                     "message": f"❌ TEHLİKE: Ağ geçidi {gateway['ip']} için birden fazla MAC adresi var!"
                 })
+        
+        # Bilgi amaçlı özel MAC adresleri (saldırı değil)
+        for key, mac in self.special.items():
+            suspicious_entries.append(_special_mac_info(unpack_ip(key[0]), mac))
+        
+        return suspicious_entries
     
-    # Bilgi amaçlı özel MAC adreslerini ekle (saldırı değil)
-    info_entries = []
-    for entry in arp_table:
-        mac = entry["mac"].lower()
-        # Broadcast MAC (ff:ff:ff:ff:ff:ff)
-        if mac == "ff:ff:ff:ff:ff:ff":
-            info_entries.append({
-                "type": "info_broadcast",
-                "ip": entry["ip"],
-                "mac": mac,
-                "threat_level": "none",
-                "message": f"📌 Bilgi: Broadcast MAC adresi: IP={entry['ip']}, MAC={mac}"
-            })
-        # Multicast MAC (ilk byte'ın en düşük biti 1)
-        elif mac.startswith(("01:", "03:", "05:", "07:", "09:", "0b:", "0d:", "0f:")):
-            info_entries.append({
-                "type": "info_multicast",
-                "ip": entry["ip"],
-                "mac": mac,
-                "threat_level": "none",
-                "message": f"📌 Bilgi: Multicast MAC adresi: IP={entry['ip']}, MAC={mac}"
-            })
+    def arp_table(self):
+        """Güncel tablonun ArpTable kopyasını döndürür"""
+        table = ArpTable()
+        for (ip, interface, _order), mac in self.entries.items():
+            table.append_packed(ip, mac, interface)
+        return table
+
+class NeighborEventDetector(ARPStateTracker):
+    """Çekirdek komşu olaylarını tabloyu yeniden okumadan tespit kurallarından geçirir"""
+    def __init__(self, arp_table, gateway):
+        super().__init__(gateway)
+        self.update(arp_table)
+    
+    def apply(self, event):
+        """
+        Tek bir komşu olayını işler.
+        
+        Args:
+            event (dict): netlink.NeighborEventListener olayı
+            
+        Returns:
+            list: Bu olayla ortaya çıkan şüpheli durumlar
+        """
+        from modules import netlink
+        
+        try:
+            key = (pack_ip(event["ip"]), intern_interface(event["interface"]), 0)
+        except OSError:
+            return []
+        mac = pack_mac(event["mac"]) if event["mac"] else None
+        
+        # Silinen veya çözülemeyen kayıtlar tablodan çıkar
+        if (event["event"] == netlink.RTM_DELNEIGH or mac is None
+                or not event["state"] & netlink.NUD_VALID):
+            self._remove(key)
+            return []
+        
+        was_shared = mac in self.shared_macs
+        change, alerts = self._set(key, mac)
+        if change is None:
+            return []
+        
+        if not was_shared and mac in self.shared_macs:
+            alerts.append(self._multiple_ips_alert(mac))
+        
+        return alerts
+
+class AlertThrottle:
+    """
+    İzleme uyarılarını biriktirip zaman penceresi başına en fazla bir kez yayınlar.
     
-    # Bilgi amaçlı girdileri listeye ekle (şüpheli durumlar listesinin sonuna)
-    for entry in info_entries:
-        suspicious_entries.append(entry)
+    Saldırı sırasında her paket veya olay uyarı üretebilir; sonuç oluşturma (tablo
+    kopyası, geçmişe yazma) pencere başına bir kez yapılır. Aynı türdeki uyarılar
+    (tür, IP, MAC) pencere içinde tek kayda indirgenir, en sonuncusu korunur.
+    """
+    def __init__(self, publish, interval=MONITOR_PUBLISH_INTERVAL, clock=time.monotonic):
+        self.publish = publish
+        self.interval = interval
+        self.clock = clock
+        self.pending = {}  # (tür, IP, MAC) -> uyarı
+        self.last_publish = None
     
-    return suspicious_entries
+    def add(self, alerts):
+        """Uyarıları bir sonraki yayına ekler"""
+        pending = self.pending
+        for alert in alerts:
+            key = (alert["type"], alert.get("ip"), alert.get("mac"))
+            pending.pop(key, None)
+            pending[key] = alert
+    
+    def flush(self, force=False):
+        """
+        Bekleyen uyarılar varsa ve pencere dolduysa publish() fonksiyonunu çağırır.
+        
+        Returns:
+            bool: Yayın yapıldı mı
+        """
+        if not self.pending:
+            return False
+        now = self.clock()
+        if not force and self.last_publish is not None and now - self.last_publish < self.interval:
+            return False
+        
+        alerts = list(self.pending.values())
+        self.pending.clear()
+        self.last_publish = now
+        self.publish(alerts)
+        return True
 
 class ARPScanner:
     def __init__(self, callback=None):
@@ -267,13 +978,24 @@ class ARPScanner:
             self.logger.error(f"Ayarlar yüklenirken hata, varsayılan değer kullanılıyor: {e}")
             self.scan_interval = 24  # saat
         
-        self.scan_history = []  # Tarama geçmişi
+        self.snapshot_pool = SnapshotPool()  # Aynı içerikli ARP tabloları tek nesne
+        self.history_store = self._open_history_store()  # Kalıcı tarama geçmişi
+        self.last_result = None  # Bu oturumdaki son sonuç (sık erişim için bellekte)
+        self.state_tracker = ARPStateTracker()  # Taramalar arası IP/MAC durumu
+        self.gateway_resolver = GatewayResolver()  # Önbellekli ağ geçidi çözümleyici
+        self.orchestrator = None  # Arayüz başına paralel tarama (ilk taramada oluşturulur)
         self.stop_event = threading.Event()  # Durdurma sinyali için
         
+        # Olay tabanlı izleme (netlink komşu bildirimleri)
+        self.monitor_running = False
+        self.monitor_thread = None
+        self.monitor_stop_event = threading.Event()
+        self.sniffer = None  # Paket izleme modunda aktif yakalayıcı
+        
         # Önceki oturumdan periyodik tarama durumunu yüklemeyi dene
         try:
-            from modules.settings import get_setting
-            if get_setting("periodic_scan_active", False):
+            from modules.settings import get_settings_store
+            if get_settings_store().get_bool("periodic_scan_active", False):
                 self.logger.info("Önceki oturumdan periyodik tarama aktif ayarı bulundu.")
         except Exception as e:
             self.logger.error(f"Periyodik tarama durumu yüklenirken hata: {e}")
@@ -368,8 +1090,81 @@ class ARPScanner:
         self.logger.info("Periyodik tarama durduruldu")
         return True
     
+    def start_event_monitor(self):
+        """Çekirdek komşu tablosu bildirimleriyle olay tabanlı izlemeyi başlatır"""
+        from modules import netlink
+        
+        if self.monitor_running:
+            self.logger.warning("Olay tabanlı izleme zaten çalışıyor")
+            return False
+        
+        if not netlink.is_available():
+            self.logger.error("Olay tabanlı izleme için netlink desteği gerekli")
+            return False
+        
+        self.monitor_running = True
+        self.monitor_stop_event.clear()
+        
+        self.monitor_thread = threading.Thread(target=self._event_monitor_thread, daemon=True)
+        self.monitor_thread.start()
+        
+        self.logger.info("Olay tabanlı izleme başlatıldı")
+        return True
+    
+    def start_packet_monitor(self, interface=None, ring=None):
+        """
+        AF_PACKET soketi üzerinden pasif ARP paket izlemeyi başlatır.
+        
+        Args:
+            interface (str): Dinlenecek arayüz (None ise tümü)
+            ring (bool): TPACKET_V3 halka tamponu kullanılsın mı;
+                verilmezse "capture_mode" ayarı ("ring" veya "socket") kullanılır
+        """
+        if ring is None:
+            try:
+                from modules.settings import get_settings_store
+                ring = get_settings_store().get_str("capture_mode", "ring", ("ring", "socket")) == "ring"
+            except Exception as e:
+                self.logger.error(f"Yakalama modu ayarı okunurken hata: {e}")
+                ring = True
+        
+        if self.monitor_running:
+            self.logger.warning("İzleme zaten çalışıyor")
+            return False
+        
+        if not hasattr(socket, "AF_PACKET"):
+            self.logger.error("Paket izleme için AF_PACKET desteği gerekli")
+            return False
+        
+        self.monitor_running = True
+        self.monitor_stop_event.clear()
+        
+        self.monitor_thread = threading.Thread(target=self._packet_monitor_thread, args=(interface, ring), daemon=True)
+        self.monitor_thread.start()
+        
+        self.logger.info(f"Pasif ARP paket izleme başlatıldı (arayüz: {interface or 'tümü'})")
+        return True
+    
+    def stop_monitor(self):
+        """Olay tabanlı veya paket tabanlı izlemeyi durdurur"""
+        if not self.monitor_running:
+            return False
+        
+        self.monitor_running = False
+        self.monitor_stop_event.set()
+        
+        if self.monitor_thread and self.monitor_thread.is_alive():
+            self.monitor_thread.join(timeout=2.0)
+        
+        self.logger.info("İzleme durduruldu")
+        return True
+    
     def stop(self):
         """Tüm tarama işlemlerini durdurur"""
+        # Olay/paket tabanlı izlemeyi durdur
+        if self.monitor_running:
+            self.stop_monitor()
+        
         # Periyodik taramayı durdur
         if self.periodic_running:
             self.stop_periodic_scan()
@@ -389,6 +1184,9 @@ class ARPScanner:
                 else:
                     self.logger.info("Tarama thread'i başarıyla sonlandı")
         
+        self.gateway_resolver.close()
+        if self.orchestrator is not None:
+            self.orchestrator.close()
         self.logger.info("Tüm tarama işlemleri durduruldu")
     
     def _scan_thread(self):
@@ -399,45 +1197,38 @@ class ARPScanner:
             # Tarama başlangıç zamanı
             start_time = time.time()
             
-            # ARP tablosunu al
-            arp_table = get_arp_table()
-            
-            # ARP tablosundan gateway bilgisini al
-            gateway = get_default_gateway()
+            # Gateway bilgisini al (rota değişmediyse önbellekten)
+            gateway = self.gateway_resolver.get()
             
-            # ARP spoofing tespiti yap
-            suspicious = detect_arp_spoofing(arp_table)
-            
-            # Tehdit seviyesini belirle
-            threat_level = "none"  # Varsayılan olarak tehdit yok
-            
-            # Yüksek tehdit varsa seviyeyi yükselt
-            if any(entry.get("threat_level") == "high" for entry in suspicious):
-                threat_level = "high"
-            # Orta seviye tehdit varsa ve henüz yüksek seviye tespit edilmediyse
-            elif any(entry.get("threat_level") == "medium" for entry in suspicious):
-                threat_level = "medium"
-            
-            # Sonuçları hazırla
-            result = {
-                "timestamp": time.time(),
-                "arp_table": arp_table,
-                "gateway": gateway,
-                "suspicious_entries": suspicious,
-                "threat_level": threat_level,
-                "duration": time.time() - start_time
-            }
+            orchestrator = self._get_orchestrator()
+            if orchestrator is not None:
+                # Arayüzler paralel taranır; her arayüz kendi ağ geçidi ve durumuyla incelenir
+                merged = orchestrator.scan(self.stop_event, default_gateway=gateway)
+                if merged is None:
+                    self.logger.info("Tarama durduruldu, sonuç yayınlanmadı")
+                    return
+                
+                arp_table, gateway = merged["arp_table"], merged["gateway"]
+                changes, suspicious = merged["changes"], merged["suspicious_entries"]
+            else:
+                # ARP tablosunu al
+                arp_table = get_arp_table()
+                
+                # ARP spoofing tespiti yap (yalnızca önceki taramaya göre değişen kayıtlar işlenir)
+                changes, suspicious = self.state_tracker.update(arp_table, gateway)
             
-            # Geçmişe ekle (en fazla son 100 taramayı tut)
-            self.scan_history.append(result)
-            if len(self.scan_history) > 100:
-                self.scan_history = self.scan_history[-100:]
+            # Sonuçları hazırla, geçmişe ekle ve bildir
+            result = self._build_result(arp_table, gateway, suspicious, start_time)
+            result["changes"] = changes
+            if orchestrator is not None:
+                result["interfaces"] = merged["interfaces"]
+            self._publish_result(result)
             
-            # Callback fonksiyonu varsa çağır
-            if self.callback:
-                self.callback(result)
+            for change in changes:
+                if change["type"] == "changed":
+                    self.logger.warning(change["message"])
             
-            self.logger.info(f"Tarama tamamlandı. Tehdit seviyesi: {threat_level}")
+            self.logger.info(f"Tarama tamamlandı. Tehdit seviyesi: {result['threat_level']}")
         except Exception as e:
             self.logger.error(f"Tarama sırasında hata: {e}")
             import traceback
@@ -445,6 +1236,192 @@ class ARPScanner:
         finally:
             self.running = False
     
+    def _get_orchestrator(self):
+        """
+        "per_interface_scan" ayarı açıksa arayüz başına tarama yürütücüsünü döndürür.
+        
+        "active_sweep" ayarı açıksa yürütücüye aktif ARP tarama toplayıcısı eklenir.
+        
+        Windows'ta 'arp -a' arayüzleri ayırt etmediği için tek tablolu tarama kullanılır.
+        """
+        if os.name == 'nt':
+            return None
+        
+        from modules.scan_orchestrator import ScanOrchestrator, SCAN_MAX_WORKERS
+        try:
+            from modules.settings import get_settings_store
+            store = get_settings_store()
+            if not store.get_bool("per_interface_scan", True):
+                return None
+            workers = max(1, store.get_int("scan_workers", SCAN_MAX_WORKERS))
+            active_sweep = store.get_bool("active_sweep", False)
+        except Exception as e:
+            self.logger.error(f"Tarama ayarları okunurken hata: {e}")
+            workers = SCAN_MAX_WORKERS
+            active_sweep = False
+        
+        if self.orchestrator is None or self.orchestrator.max_workers != workers:
+            previous, self.orchestrator = self.orchestrator, ScanOrchestrator(max_workers=workers)
+            if previous is not None:
+                # Havuz boyutu değişti; arayüz durumları yeni yürütücüye taşınır
+                self.orchestrator.trackers = previous.trackers
+                previous.close()
+        
+        # Aktif tarama açıksa her arayüzün alt ağı ARP istekleriyle taranır (önbellekte olmayan cihazlar için)
+        if active_sweep:
+            from modules.arp_sweep import sweep_collector
+            self.orchestrator.collectors = [sweep_collector]
+        else:
+            self.orchestrator.collectors = []
+        return self.orchestrator
+    
+    def _build_result(self, arp_table, gateway, suspicious, start_time):
+        """Tarama sonucu sözlüğünü oluşturur"""
+        return {
+            "timestamp": time.time(),
+            "arp_table": arp_table,
+            "gateway": gateway,
+            "suspicious_entries": suspicious,
+            "threat_level": _threat_level_of(suspicious),
+            "duration": time.time() - start_time
+        }
+    
+    def _open_history_store(self):
+        """
+        "history_backend" ayarına göre geçmiş deposunu açar.
+        
+        "sqlite" kalıcı veritabanını, "memory" sınırlı halka tamponunu kullanır;
+        veritabanı açılamazsa halka tamponuna geçilir.
+        """
+        try:
+            from modules.settings import get_settings_store
+            backend = get_settings_store().get_str("history_backend", "sqlite", ("sqlite", "memory"))
+        except Exception as e:
+            self.logger.error(f"Geçmiş arka ucu ayarı okunurken hata: {e}")
+            backend = "sqlite"
+        
+        if backend != "memory":
+            try:
+                return HistoryStore(pool=self.snapshot_pool)
+            except sqlite3.Error as e:
+                self.logger.error(f"Tarama geçmişi veritabanı açılamadı, geçmiş bellekte tutulacak: {e}")
+        
+        return ScanHistoryBuffer(pool=self.snapshot_pool)
+    
+    def _publish_result(self, result):
+        """Sonucu geçmişe ekler ve callback fonksiyonunu çağırır"""
+        # Değişmeyen ağlarda ardışık taramalar aynı tablo nesnesini paylaşır;
+        # sonuç tabloya içerik özetiyle başvurur
+        result["arp_snapshot"], result["arp_table"] = self.snapshot_pool.intern(result.get("arp_table", []))
+        
+        # Arayüzün satır başına O(1) durum sorgusu için indeks tarama thread'inde bir kez oluşturulur
+        result["status_index"] = build_status_index(result.get("suspicious_entries", []), result.get("gateway"))
+        
+        # Geçmişe ekle (tek işlemde, toplu ekleme ile)
+        try:
+            result["scan_id"] = self.history_store.add_scan(result)
+        except sqlite3.Error as e:
+            self.logger.error(f"Tarama sonucu geçmişe kaydedilemedi: {e}")
+        self.last_result = result
+        
+        # Callback fonksiyonu varsa çağır (tarama thread'inde; arayüz EventBus ile ana thread'e aktarır)
+        if self.callback:
+            self.callback(result)
+    
+    def _event_monitor_thread(self):
+        """Netlink komşu olaylarını dinleyip her olayı tespit kurallarından geçiren thread"""
+        from modules import netlink
+        
+        detector = None
+        
+        def publish(alerts):
+            result = self._monitor_result(detector, alerts, "event")
+            self.logger.info(f"Komşu olayları tehdit üretti: {len(alerts)} uyarı (seviye: {result['threat_level']})")
+        
+        throttle = AlertThrottle(publish)
+        try:
+            with netlink.NeighborEventListener() as listener:
+                # Başlangıç durumu için tablo yalnızca bir kez okunur
+                detector = NeighborEventDetector(get_arp_table(), self.gateway_resolver.get())
+                
+                while self.monitor_running and not self.monitor_stop_event.is_set():
+                    try:
+                        # Zaman aşımı yalnızca durdurma sinyalini ve bekleyen yayını kontrol etmek için
+                        events = listener.read_events(timeout=1.0)
+                    except netlink.NetlinkError as e:
+                        # Olaylar kaçırıldı, durumu yeniden senkronize et
+                        self.logger.warning(f"Komşu olayları kaçırıldı, tablo yeniden okunuyor: {e}")
+                        throttle.flush(force=True)
+                        detector = NeighborEventDetector(get_arp_table(), self.gateway_resolver.get())
+                        continue
+                    
+                    # Okunan olay grubu tek seferde işlenir; sonuç pencere başına bir kez yayınlanır
+                    for event in events:
+                        throttle.add(detector.apply(event))
+                    throttle.flush()
+                
+                throttle.flush(force=True)
+        except Exception as e:
+            self.logger.error(f"Olay tabanlı izleme sırasında hata: {e}")
+            import traceback
+            traceback.print_exc()
+        finally:
+            self.monitor_running = False
+    
+    def _monitor_result(self, detector, alerts, source):
+        """
+        İzleme uyarılarından sonuç oluşturup yayınlar.
+        
+        Sonuç son sonucun yerini alır; uyarılara güncel durumdaki tüm şüpheli
+        kayıtlar eklenir ki süren tehditler kaybolmasın.
+        """
+        standing = detector.suspicious_entries()
+        suspicious = [alert for alert in alerts if alert not in standing] + standing
+        result = self._build_result(detector.arp_table(), detector.gateway, suspicious, time.time())
+        result["source"] = source
+        self._publish_result(result)
+        return result
+    
+    def get_capture_stats(self):
+        """Halka tamponlu paket izleme sayaçlarını döndürür (paket/sn, düşürülen paket)"""
+        sniffer = self.sniffer
+        if sniffer is None or not hasattr(sniffer, "stats"):
+            return None
+        try:
+            return sniffer.stats()
+        except OSError as e:
+            self.logger.error(f"Yakalama istatistikleri okunurken hata: {e}")
+            return None
+    
+    def _packet_monitor_thread(self, interface, ring):
+        """Yakalanan ARP paketlerini akış halinde tespit kurallarından geçiren thread"""
+        from modules.arp_sniffer import ARPSniffer, RingARPSniffer, StreamingARPDetector
+        
+        try:
+            # Başlangıç durumu için tablo yalnızca bir kez okunur
+            detector = StreamingARPDetector(gateway=self.gateway_resolver.get(), arp_table=get_arp_table())
+            
+            def publish(alerts):
+                result = self._monitor_result(detector, alerts, "packet")
+                self.logger.info(f"ARP paketleri tehdit üretti: {len(alerts)} uyarı (seviye: {result['threat_level']})")
+            
+            throttle = AlertThrottle(publish)
+            sniffer_class = RingARPSniffer if ring else ARPSniffer
+            with sniffer_class(interface=interface, detector=detector) as sniffer:
+                self.sniffer = sniffer
+                # Her poll() bir paket grubunu işler; sonuç pencere başına bir kez yayınlanır
+                while not self.monitor_stop_event.is_set():
+                    throttle.add(sniffer.poll(timeout=1.0))
+                    throttle.flush()
+                throttle.flush(force=True)
+        except Exception as e:
+            self.logger.error(f"Paket izleme sırasında hata: {e}")
+            import traceback
+            traceback.print_exc()
+        finally:
+            self.sniffer = None
+            self.monitor_running = False
+    
     def _periodic_scan_thread(self):
         """Periyodik tarama işlemini gerçekleştiren thread"""
         try:
@@ -473,12 +1450,34 @@ class ARPScanner:
         finally:
             self.periodic_running = False
     
+    @property
+    def scan_history(self):
+        """Tarama geçmişinin tembel görünümü (eskiden yeniye)"""
+        return self.history_store.history()
+    
     def get_last_scan_result(self):
         """En son tarama sonucunu döndürür"""
-        if self.scan_history:
-            return self.scan_history[-1]
-        return None
+        if self.last_result is None:
+            # Önceki oturumdan kalan son sonuç
+            try:
+                self.last_result = self.history_store.last()
+            except sqlite3.Error as e:
+                self.logger.error(f"Son tarama sonucu okunamadı: {e}")
+        return self.last_result
     
     def get_scan_history(self):
-        """Tarama geçmişini döndürür"""
-        return self.scan_history
+        """Tarama geçmişini döndürür (sayfalı sorgulanan, liste benzeri görünüm)"""
+        return self.history_store.history()
+    
+    def get_history_page(self, offset=0, limit=None, include_arp_table=False):
+        """Geçmişin en yeniden eskiye bir sayfasını döndürür"""
+        return self.history_store.page(offset, limit or HISTORY_PAGE_SIZE, include_arp_table=include_arp_table)
+    
+    def get_history_statistics(self):
+        """Geçmiş özetini (toplam tarama, yüksek tehdit, ilk/son zaman) döndürür"""
+        return self.history_store.statistics()
+    
+    def clear_scan_history(self):
+        """Tüm tarama geçmişini siler"""
+        self.history_store.clear()
+        self.last_result = None
@@ -0,0 +1,571 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Pasif ARP Paket İzleme Modülü
+Bu modül, AF_PACKET soketi ve çekirdek içi BPF filtresi ile ağdaki ARP
+paketlerini yakalamak, çözümlemek ve akış halinde tespit kurallarından
+geçirmek için gerekli sınıf ve fonksiyonları içerir.
+"""
+
+import time
+import mmap
+import struct
+import socket
+import select
+import ctypes
+import logging
+from collections import namedtuple, deque
+
+from modules.arp_table import MAC_MULTICAST_BIT, pack_mac, unpack_mac
+
+# Loglama
+logger = logging.getLogger("V-ARP.arp_sniffer")
+
+# Ethernet ve ARP sabitleri
+ETH_P_ALL = 0x0003
+ETH_P_ARP = 0x0806
+ETH_P_IP = 0x0800
+
+ARPHRD_ETHER = 1
+ARPOP_REQUEST = 1
+ARPOP_REPLY = 2
+
+# setsockopt(SOL_SOCKET, SO_ATTACH_FILTER) (include/uapi/asm-generic/socket.h)
+SO_ATTACH_FILTER = 26
+
+# Ethernet başlığı + ARP başlığı (IPv4 üzerinden Ethernet, 42 bayt)
+ETH_ARP_FRAME = struct.Struct("!6s6sHHHBBH6s4s6s4s")
+
+# BPF talimatı: kod, jt, jf, k (struct sock_filter)
+BPF_INSN = struct.Struct("HBBI")
+
+# Sadece ARP çerçevelerini kullanıcı alanına geçiren klasik BPF programı:
+#   ldh [12]                  ; ethertype
+#   jeq #0x806, jt 0, jf 1
+#   ret #ARP_SNAPLEN          ; ARP ise kabul et
+#   ret #0                    ; değilse at
+ARP_SNAPLEN = 128
+ARP_BPF_PROGRAM = (
+    (0x28, 0, 0, 12),
+    (0x15, 0, 1, ETH_P_ARP),
+    (0x06, 0, 0, ARP_SNAPLEN),
+    (0x06, 0, 0, 0),
+)
+
+# PACKET_MMAP sabitleri (include/uapi/linux/if_packet.h)
+SOL_PACKET = 263
+PACKET_RX_RING = 5
+PACKET_STATISTICS = 6
+PACKET_VERSION = 10
+TPACKET_V3 = 2
+TP_STATUS_KERNEL = 0
+TP_STATUS_USER = 1
+
+# struct tpacket_req3: blok boyutu, blok sayısı, çerçeve boyutu, çerçeve sayısı,
+# blok emekliye ayırma süresi (ms), özel alan boyutu, özellik bayrakları
+TPACKET_REQ3 = struct.Struct("IIIIIII")
+# struct tpacket_stats_v3: paketler, düşürülenler, dondurulan kuyruk sayısı
+TPACKET_STATS_V3 = struct.Struct("III")
+# struct tpacket_block_desc içindeki tpacket_hdr_v1 alanları (8. bayttan itibaren):
+# blok durumu, paket sayısı, ilk paket ofseti
+BLOCK_HDR = struct.Struct("III")
+BLOCK_HDR_OFFSET = 8
+# struct tpacket3_hdr: sonraki ofset, saniye, nanosaniye, snaplen, uzunluk, durum, mac ofseti
+TPACKET3_HDR = struct.Struct("IIIIIIH")
+# Çekirdek her paket başlığının ardına (TPACKET_ALIGN(sizeof(struct tpacket3_hdr))
+# ofsetine) struct sockaddr_ll yazar: aile, protokol, arayüz sırası
+TPACKET_ALIGNMENT = 16
+TPACKET3_HDR_LEN = 48
+SOCKADDR_LL = struct.Struct("HHi")
+SOCKADDR_LL_OFFSET = (TPACKET3_HDR_LEN + TPACKET_ALIGNMENT - 1) & ~(TPACKET_ALIGNMENT - 1)
+
+# Çözümlenmiş ARP paketi
+ArpPacket = namedtuple("ArpPacket", ["op", "eth_src", "sender_mac", "sender_ip", "target_mac", "target_ip"])
+
+def _mac(raw):
+    """6 baytlık MAC adresini okunabilir formata çevirir"""
+    return '%02x:%02x:%02x:%02x:%02x:%02x' % tuple(raw)
+
+def decode_arp_frame(frame, length=None):
+    """
+    Ethernet çerçevesindeki ARP başlığını çözümler.
+
+    Args:
+        frame (bytes | bytearray | memoryview): Ethernet çerçevesi
+        length (int): Çerçevenin geçerli uzunluğu (tampon yeniden kullanılıyorsa)
+
+    Returns:
+        ArpPacket: Çözümlenmiş paket veya IPv4/Ethernet ARP değilse None
+    """
+    if length is None:
+        length = len(frame)
+    if length < ETH_ARP_FRAME.size:
+        return None
+
+    (_dst, eth_src, ethertype, htype, ptype, hlen, plen, op,
+     sha, spa, tha, tpa) = ETH_ARP_FRAME.unpack_from(frame, 0)
+
+    if ethertype != ETH_P_ARP or htype != ARPHRD_ETHER or ptype != ETH_P_IP or hlen != 6 or plen != 4:
+        return None
+
+    return ArpPacket(op, _mac(eth_src), _mac(sha), socket.inet_ntoa(spa), _mac(tha), socket.inet_ntoa(tpa))
+
+def build_bpf_program(instructions=ARP_BPF_PROGRAM):
+    """
+    setsockopt(SO_ATTACH_FILTER) için struct sock_fprog oluşturur.
+
+    Returns:
+        tuple: (sock_fprog baytları, filtre tamponu) - tampon soket kapanana
+            kadar canlı tutulmalıdır
+    """
+    filter_bytes = b"".join(BPF_INSN.pack(*insn) for insn in instructions)
+    buffer = ctypes.create_string_buffer(filter_bytes, len(filter_bytes))
+    fprog = struct.pack("HL", len(instructions), ctypes.addressof(buffer))
+    return fprog, buffer
+
+class StreamingARPDetector:
+    """
+    ARP paketlerini tek tek işleyen, durum tutan dedektör.
+
+    Süren şüpheli durumlar (bir MAC'in birden fazla IP'si, özel MAC'ler) bağlamalar
+    değiştikçe indekslerde güncellenir; suspicious_entries() tabloyu yeniden taramaz.
+    """
+    def __init__(self, gateway=None, storm_threshold=20, storm_window=10.0, arp_table=None):
+        self.gateway = gateway or {"ip": "Bilinmiyor", "mac": "Bilinmiyor"}
+        self.storm_threshold = storm_threshold  # Pencere başına gratuitous ARP sınırı
+        self.storm_window = storm_window        # saniye
+        self.bindings = {}                      # IP -> (MAC, arayüz)
+        self.mac_to_ips = {}                    # Unicast MAC değeri -> IP'ler (sıralı küme)
+        self.shared_macs = {}                   # Birden fazla IP'ye sahip MAC değerleri (sıralı küme)
+        self.special = {}                       # Broadcast/multicast MAC'li IP'ler: IP -> MAC değeri
+        self.gratuitous = {}                    # MAC -> zaman damgaları (deque)
+        self.storming = set()                   # Fırtınası bildirilmiş MAC'ler
+        self.packet_count = 0
+
+        # Başlangıç bağlamaları çekirdek tablosundan alınır; yayımlanan tablo yalnızca
+        # paketi görülen cihazlarla sınırlı kalmaz
+        for entry in arp_table or ():
+            self._bind(entry["ip"], entry["mac"], entry.get("interface", "unknown"))
+
+    def _bind(self, ip, mac, interface):
+        """
+        IP'nin bağlamasını günceller ve indeksleri değişen kayıt için düzeltir.
+
+        Returns:
+            tuple | None: Önceki (MAC, arayüz) bağlaması
+        """
+        old = self.bindings.get(ip)
+        self.bindings[ip] = (mac, interface)
+        if old is not None:
+            if old[0] == mac:
+                return old
+            self._unindex(ip, old[0])
+        self._index(ip, mac)
+        return old
+
+    def _index(self, ip, mac):
+        """Bağlamayı MAC indekslerine ekler"""
+        mac_value = pack_mac(mac)
+        if mac_value is None:
+            return
+        # Broadcast ve multicast MAC'ler IP eşleme kurallarına dahil edilmez
+        if mac_value & MAC_MULTICAST_BIT:
+            self.special[ip] = mac_value
+            return
+
+        ips = self.mac_to_ips.setdefault(mac_value, {})
+        ips[ip] = None
+        if len(ips) > 1:
+            self.shared_macs[mac_value] = None
+
+    def _unindex(self, ip, mac):
+        """Bağlamayı MAC indekslerinden çıkarır"""
+        if self.special.pop(ip, None) is not None:
+            return
+        mac_value = pack_mac(mac)
+        ips = self.mac_to_ips.get(mac_value)
+        if ips is None:
+            return
+        ips.pop(ip, None)
+        if not ips:
+            del self.mac_to_ips[mac_value]
+        if len(ips) <= 1:
+            self.shared_macs.pop(mac_value, None)
+
+    def process(self, packet, timestamp=None, interface="unknown"):
+        """
+        Tek bir ARP paketini tespit kurallarından geçirir.
+
+        Args:
+            packet (ArpPacket): Çözümlenmiş paket
+            timestamp (float): Paket zamanı (verilmezse şimdiki zaman)
+            interface (str): Paketin yakalandığı arayüz
+
+        Returns:
+            list: Bu paketle ortaya çıkan şüpheli durumlar
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        self.packet_count += 1
+        alerts = []
+
+        ip = packet.sender_ip
+        mac = packet.sender_mac
+
+        # Ethernet kaynak adresi ile ARP gönderen adresi farklıysa sahte paket olabilir
+        if packet.eth_src != mac:
+            alerts.append({
+                "type": "sender_mismatch",
+                "ip": ip,
+                "mac": mac,
+                "macs": [packet.eth_src, mac],
+                "threat_level": "medium",
+                "message": f"⚠️ Şüpheli: {ip} için ARP gönderen MAC ({mac}) Ethernet kaynağından ({packet.eth_src}) farklı"
+            })
+
+        # Gratuitous ARP fırtınası (gönderen ve hedef IP aynı)
+        if ip == packet.target_ip:
+            alerts.extend(self._check_storm(mac, ip, timestamp))
+
+        # 0.0.0.0 gönderen (ARP probe) bağlama oluşturmaz
+        if ip == "0.0.0.0":
+            return alerts
+
+        old = self._bind(ip, mac, interface)
+        if old is not None and old[0] != mac:
+            if ip == self.gateway.get("ip"):
+                alerts.append({
+                    "type": "gateway_mac_changed",
+                    "ip": ip,
+                    "mac": mac,
+                    "macs": [old[0], mac],
+                    "threat_level": "high",
+                    "message": f"❌ TEHLİKE: Ağ geçidi {ip} için ARP paketinde farklı MAC adresi: {old[0]} -> {mac}"
+                })
+            else:
+                alerts.append({
+                    "type": "ip_mac_changed",
+                    "ip": ip,
+                    "mac": mac,
+                    "macs": [old[0], mac],
+                    "threat_level": "medium",
+                    "message": f"⚠️ Şüpheli: {ip} IP adresi için ARP paketinde farklı MAC adresi: {old[0]} -> {mac}"
+                })
+
+        return alerts
+
+    def process_batch(self, packets):
+        """
+        Bir blok dolusu ARP paketini sırayla işler.
+
+        Args:
+            packets (list): (zaman_damgası, ArpPacket, arayüz) üçlüleri
+
+        Returns:
+            list: Bu pakette ortaya çıkan şüpheli durumlar
+        """
+        alerts = []
+        process = self.process
+        for timestamp, packet, interface in packets:
+            found = process(packet, timestamp, interface)
+            if found:
+                alerts.extend(found)
+        return alerts
+
+    def _check_storm(self, mac, ip, timestamp):
+        """Gratuitous ARP fırtınasını kayan pencere ile kontrol eder"""
+        stamps = self.gratuitous.get(mac)
+        if stamps is None:
+            stamps = self.gratuitous[mac] = deque()
+        stamps.append(timestamp)
+
+        # Pencere dışına çıkan zaman damgalarını at
+        window_start = timestamp - self.storm_window
+        while stamps and stamps[0] < window_start:
+            stamps.popleft()
+
+        if len(stamps) <= self.storm_threshold:
+            self.storming.discard(mac)
+            return []
+
+        # Aynı fırtına için tek bildirim üret
+        if mac in self.storming:
+            return []
+        self.storming.add(mac)
+
+        return [{
+            "type": "gratuitous_storm",
+            "ip": ip,
+            "mac": mac,
+            "threat_level": "medium",
+            "message": f"⚠️ Şüpheli: {mac} adresinden {self.storm_window:.0f} sn içinde {len(stamps)} gratuitous ARP paketi"
+        }]
+
+    def arp_table(self):
+        """Gözlenen IP-MAC bağlamalarını get_arp_table() formatında döndürür"""
+        return [{"ip": ip, "mac": mac, "interface": interface}
+                for ip, (mac, interface) in self.bindings.items()]
+
+    def suspicious_entries(self):
+        """
+        Güncel bağlamalardaki şüpheli ve bilgi amaçlı kayıtları döndürür.
+
+        Sonuç detect_arp_spoofing(self.arp_table()) ile aynı formattadır; yalnızca
+        indekslerdeki kayıtlar işlendiği için maliyeti tablo boyutundan bağımsızdır.
+        """
+        # Döngüsel içe aktarmayı önlemek için geç yüklenir
+        from modules.arp_detector import _special_mac_info
+
+        suspicious_entries = []
+        for mac_value in self.shared_macs:
+            mac = unpack_mac(mac_value)
+            ips = list(self.mac_to_ips[mac_value])
+            suspicious_entries.append({
+                "type": "multiple_ips",
+                "mac": mac,
+                "ips": ips,
+                "threat_level": "medium",
+                "message": f"⚠️ Şüpheli: {mac} MAC adresine sahip {len(ips)} farklı IP adresi var: {', '.join(ips)}"
+            })
+
+        # Bilgi amaçlı özel MAC adresleri (saldırı değil)
+        for ip, mac_value in self.special.items():
+            suspicious_entries.append(_special_mac_info(ip, mac_value))
+
+        return suspicious_entries
+
+class ARPSniffer:
+    """AF_PACKET soketi üzerinden pasif ARP paket yakalayıcı"""
+    def __init__(self, interface=None, detector=None):
+        self.interface = interface
+        self.detector = detector or StreamingARPDetector()
+        self.sock = None
+        self._bpf_buffer = None
+        self._buffer = bytearray(2048)  # recv_into için yeniden kullanılan tampon
+
+    def open(self):
+        """Soketi açar, BPF filtresini bağlar ve arayüze bağlanır"""
+        self.sock = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(ETH_P_ALL))
+        try:
+            fprog, self._bpf_buffer = build_bpf_program()
+            self.sock.setsockopt(socket.SOL_SOCKET, SO_ATTACH_FILTER, fprog)
+            if self.interface:
+                self.sock.bind((self.interface, ETH_P_ALL))
+        except OSError:
+            self.close()
+            raise
+        logger.info(f"ARP paket yakalama başlatıldı (arayüz: {self.interface or 'tümü'})")
+
+    def close(self):
+        """Soketi kapatır"""
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def poll(self, timeout=1.0):
+        """
+        Bekleyen paketleri okuyup dedektöre besler.
+
+        Args:
+            timeout (float): İlk paket için en fazla bekleme süresi (saniye)
+
+        Returns:
+            list: Üretilen şüpheli durumlar
+        """
+        readable, _, _ = select.select([self.sock], [], [], timeout)
+        if not readable:
+            return []
+
+        alerts = []
+        buffer = self._buffer
+        while True:
+            try:
+                nbytes, address = self.sock.recvfrom_into(buffer, 0, socket.MSG_DONTWAIT)
+            except BlockingIOError:
+                break
+
+            packet = decode_arp_frame(buffer, nbytes)
+            if packet is None:
+                continue
+
+            alerts.extend(self.detector.process(packet, interface=address[0]))
+        return alerts
+
+    def run(self, stop_event, on_alerts=None):
+        """
+        Durdurma sinyali gelene kadar paketleri işler.
+
+        Args:
+            stop_event (threading.Event): Durdurma sinyali
+            on_alerts (callable): Şüpheli durum listesi ile çağrılacak fonksiyon
+        """
+        while not stop_event.is_set():
+            alerts = self.poll(timeout=1.0)
+            if alerts and on_alerts:
+                on_alerts(alerts)
+
+class RingARPSniffer(ARPSniffer):
+    """PACKET_MMAP (TPACKET_V3) halka tamponu ile sıfır kopya ARP yakalayıcı"""
+    def __init__(self, interface=None, detector=None, block_size=1 << 16, block_count=16,
+                 frame_size=2048, block_timeout_ms=60):
+        super().__init__(interface, detector)
+        self.block_size = block_size
+        self.block_count = block_count
+        self.frame_size = frame_size
+        self.block_timeout_ms = block_timeout_ms
+        self.ring = None
+        self.ring_view = None
+        self.current_block = 0
+        self._interface_names = {}  # arayüz sırası -> arayüz adı
+
+        # İstatistikler (PACKET_STATISTICS her okumada sıfırlanır, toplamlar burada tutulur)
+        self.total_packets = 0
+        self.total_drops = 0
+        self.total_freeze_q = 0
+        self.batch_count = 0
+        self._stats_time = time.monotonic()
+
+    def open(self):
+        """Halka tamponunu kurar, eşler ve arayüze bağlanır"""
+        self.sock = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(ETH_P_ALL))
+        try:
+            self.sock.setsockopt(SOL_PACKET, PACKET_VERSION, TPACKET_V3)
+
+            fprog, self._bpf_buffer = build_bpf_program()
+            self.sock.setsockopt(socket.SOL_SOCKET, SO_ATTACH_FILTER, fprog)
+
+            frame_count = (self.block_size * self.block_count) // self.frame_size
+            req = TPACKET_REQ3.pack(self.block_size, self.block_count, self.frame_size,
+                                    frame_count, self.block_timeout_ms, 0, 0)
+            self.sock.setsockopt(SOL_PACKET, PACKET_RX_RING, req)
+
+            self.ring = mmap.mmap(self.sock.fileno(), self.block_size * self.block_count,
+                                  mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+            self.ring_view = memoryview(self.ring)
+
+            if self.interface:
+                self.sock.bind((self.interface, ETH_P_ALL))
+        except OSError:
+            self.close()
+            raise
+
+        self._stats_time = time.monotonic()
+        logger.info(f"TPACKET_V3 halka tamponu kuruldu: {self.block_count} x {self.block_size} bayt "
+                    f"(arayüz: {self.interface or 'tümü'})")
+
+    def close(self):
+        """Eşlemeyi ve soketi kapatır"""
+        if self.ring_view is not None:
+            self.ring_view.release()
+            self.ring_view = None
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+        super().close()
+
+    def _interface_name(self, ifindex):
+        """Arayüz sırasını ada çevirir; sonuçlar önbellekte tutulur"""
+        name = self._interface_names.get(ifindex)
+        if name is None:
+            try:
+                name = socket.if_indextoname(ifindex)
+            except OSError:
+                # Paket geldikten sonra kaldırılmış arayüz
+                name = self.interface or "unknown"
+            self._interface_names[ifindex] = name
+        return name
+
+    def _read_block(self, index):
+        """
+        Kullanıcıya verilmiş bir bloğun paketlerini çözümler ve bloğu çekirdeğe iade eder.
+
+        Returns:
+            list: (zaman_damgası, ArpPacket, arayüz) üçlüleri veya blok hazır değilse None
+        """
+        view = self.ring_view
+        base = index * self.block_size
+        status, num_pkts, offset = BLOCK_HDR.unpack_from(view, base + BLOCK_HDR_OFFSET)
+        if not status & TP_STATUS_USER:
+            return None
+
+        packets = []
+        append = packets.append
+        names = self._interface_names
+        position = base + offset
+        for _ in range(num_pkts):
+            next_offset, sec, nsec, snaplen, _length, _status, mac_offset = TPACKET3_HDR.unpack_from(view, position)
+            start = position + mac_offset
+            packet = decode_arp_frame(view[start:start + snaplen], snaplen)
+            if packet is not None:
+                ifindex = SOCKADDR_LL.unpack_from(view, position + SOCKADDR_LL_OFFSET)[2]
+                interface = names.get(ifindex) or self._interface_name(ifindex)
+                append((sec + nsec / 1e9, packet, interface))
+            position += next_offset
+
+        # Bloğu çekirdeğe geri ver
+        struct.pack_into("I", view, base + BLOCK_HDR_OFFSET, TP_STATUS_KERNEL)
+        return packets
+
+    def poll(self, timeout=1.0):
+        """
+        Hazır blokları toplu halde dedektöre besler.
+
+        Args:
+            timeout (float): Hazır blok yoksa en fazla bekleme süresi (saniye)
+
+        Returns:
+            list: Üretilen şüpheli durumlar
+        """
+        packets = self._read_block(self.current_block)
+        if packets is None:
+            readable, _, _ = select.select([self.sock], [], [], timeout)
+            if not readable:
+                return []
+            packets = self._read_block(self.current_block)
+            if packets is None:
+                return []
+
+        alerts = []
+        # Sırayla hazır olan tüm blokları işle
+        while packets is not None:
+            self.batch_count += 1
+            if packets:
+                alerts.extend(self.detector.process_batch(packets))
+            self.current_block = (self.current_block + 1) % self.block_count
+            packets = self._read_block(self.current_block)
+        return alerts
+
+    def stats(self):
+        """
+        Çekirdek yakalama sayaçlarını okur.
+
+        Returns:
+            dict: packets, drops, freeze_q toplamları, son okumadan bu yana
+                packets_per_sec / drops_per_sec ve işlenen blok sayısı
+        """
+        raw = self.sock.getsockopt(SOL_PACKET, PACKET_STATISTICS, TPACKET_STATS_V3.size)
+        packets, drops, freeze_q = TPACKET_STATS_V3.unpack(raw)
+        self.total_packets += packets
+        self.total_drops += drops
+        self.total_freeze_q += freeze_q
+
+        now = time.monotonic()
+        elapsed = max(now - self._stats_time, 1e-9)
+        self._stats_time = now
+
+        return {
+            "packets": self.total_packets,
+            "drops": self.total_drops,
+            "freeze_q": self.total_freeze_q,
+            "packets_per_sec": packets / elapsed,
+            "drops_per_sec": drops / elapsed,
+            "batches": self.batch_count,
+        }
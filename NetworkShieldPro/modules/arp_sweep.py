@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Aktif ARP Tarama Modülü
+Bu modül, çekirdek ARP önbelleğinde bulunmayan cihazları keşfetmek için bir
+arayüzün alt ağındaki her adrese ARP who-has isteği gönderen ARPSweeper
+tipini içerir. İstekler asyncio döngüsünden, jeton kovası ile hız sınırlanarak
+ham (AF_PACKET) sokete yazılır; cevaplar zaman aşımı penceresi boyunca
+toplanır ve get_arp_table() kayıt formatında döndürülür; çekirdek tablosuyla
+ArpTable.merged() ile birleştirilip detect_arp_spoofing()'e verilebilir.
+
+Taşıma katmanı değiştirilebilir: MockResponder, gerçek ağ yerine sabit bir
+cihaz listesinden veya bir yakalama dosyasından cevap üretir.
+"""
+
+import os
+import time
+import errno
+import struct
+import socket
+import random
+import asyncio
+import logging
+import ipaddress
+from collections import deque
+
+from modules.arp_sniffer import (ETH_ARP_FRAME, ETH_P_ARP, ETH_P_IP, ARPHRD_ETHER, ARPOP_REQUEST, ARPOP_REPLY,
+                                 SO_ATTACH_FILTER, build_bpf_program, _mac)
+from modules.arp_table import pack_mac
+
+# Loglama
+logger = logging.getLogger("V-ARP.arp_sweep")
+
+# Varsayılan gönderim hızı (paket/sn) ve kova kapasitesi; /16 yaklaşık 3 saniyede taranır
+SWEEP_RATE = 20000
+SWEEP_BURST = 512
+
+# Jeton beklerken biriktirilecek en küçük parti (çok kısa uykuları önler)
+SWEEP_BATCH = 64
+
+# Son istekten sonra cevapların bekleneceği süre (saniye)
+SWEEP_TIMEOUT = 1.0
+
+# Gönderim kuyruğu dolduğunda yeniden deneme aralığı (saniye)
+SEND_BACKOFF = 0.001
+
+# Cevap penceresinde durdurma sinyalinin kontrol aralığı (saniye)
+STOP_POLL_INTERVAL = 0.05
+
+# Taranacak en büyük alt ağ (/16); daha büyük ağlar reddedilir
+MAX_SWEEP_PREFIX = 16
+
+# Cevap fırtınasında kayıp olmaması için istenen soket alım tamponu (bayt)
+SWEEP_RCVBUF = 1 << 22
+
+# Arayüz ioctl'leri (include/uapi/linux/sockios.h)
+SIOCGIFADDR = 0x8915
+SIOCGIFNETMASK = 0x891b
+SIOCGIFHWADDR = 0x8927
+
+# ARP başlığında gönderen/hedef alanlarının çerçeve içindeki konumları
+ARP_OP_OFFSET = 20
+ARP_SHA_OFFSET = 22
+ARP_SPA_OFFSET = 28
+ARP_TPA_OFFSET = 38
+
+_ARP_ETHERTYPE = struct.pack("!H", ETH_P_ARP)
+_ARP_REQUEST_OP = struct.pack("!H", ARPOP_REQUEST)
+_ARP_REPLY_OP = struct.pack("!H", ARPOP_REPLY)
+
+def build_arp_request(source_mac, source_ip, target_ip=b"\0\0\0\0"):
+    """
+    Ethernet yayınına gönderilecek ARP who-has çerçevesini oluşturur.
+
+    Args:
+        source_mac (bytes): Gönderen MAC adresi (6 bayt)
+        source_ip (bytes): Gönderen IP adresi (4 bayt)
+        target_ip (bytes): Sorgulanan IP adresi (4 bayt)
+
+    Returns:
+        bytearray: 42 baytlık çerçeve; hedef IP ARP_TPA_OFFSET konumunda değiştirilebilir
+    """
+    return bytearray(ETH_ARP_FRAME.pack(b"\xff" * 6, source_mac, ETH_P_ARP, ARPHRD_ETHER, ETH_P_IP, 6, 4,
+                                        ARPOP_REQUEST, source_mac, source_ip, b"\0" * 6, target_ip))
+
+def build_arp_reply(sender_mac, sender_ip, target_mac, target_ip):
+    """ARP is-at cevap çerçevesini oluşturur (tüm adresler ham bayt)"""
+    return ETH_ARP_FRAME.pack(target_mac, sender_mac, ETH_P_ARP, ARPHRD_ETHER, ETH_P_IP, 6, 4,
+                              ARPOP_REPLY, sender_mac, sender_ip, target_mac, target_ip)
+
+def interface_address(interface):
+    """
+    Arayüzün IPv4 adresini, alt ağını ve MAC adresini okur.
+
+    Returns:
+        tuple: (ip, ipaddress.IPv4Network, 6 baytlık MAC)
+
+    Raises:
+        OSError: Arayüz yoksa veya IPv4 adresi atanmamışsa
+    """
+    import fcntl
+
+    request = struct.pack("256s", interface.encode()[:15])
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        ip = socket.inet_ntoa(fcntl.ioctl(sock.fileno(), SIOCGIFADDR, request)[20:24])
+        netmask = socket.inet_ntoa(fcntl.ioctl(sock.fileno(), SIOCGIFNETMASK, request)[20:24])
+        mac = fcntl.ioctl(sock.fileno(), SIOCGIFHWADDR, request)[18:24]
+    return ip, ipaddress.IPv4Network(f"{ip}/{netmask}", strict=False), mac
+
+class TokenBucket:
+    """
+    Gönderim hızını sınırlayan jeton kovası.
+
+    Kova saniyede rate jetonla dolar ve en fazla burst jeton biriktirir;
+    her paket bir jeton harcar.
+    """
+    def __init__(self, rate, burst, clock=time.monotonic):
+        if rate <= 0 or burst < 1:
+            raise ValueError("Hız ve kova kapasitesi pozitif olmalıdır")
+        self.rate = float(rate)
+        self.burst = int(burst)
+        self.clock = clock
+        self.tokens = float(burst)
+        self.updated = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, count):
+        """En fazla count jeton alır; alınan jeton sayısını döndürür"""
+        self._refill()
+        taken = min(count, int(self.tokens))
+        self.tokens -= taken
+        return taken
+
+    def delay(self, count=1):
+        """count jeton birikene kadar beklenecek süre (saniye)"""
+        return max(0.0, (min(count, self.burst) - self.tokens) / self.rate)
+
+class RawSocketTransport:
+    """AF_PACKET soketi üzerinden ARP çerçevesi gönderen ve alan taşıma katmanı"""
+    def __init__(self, interface):
+        self.interface = interface
+        self.sock = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(ETH_P_ARP))
+        try:
+            fprog, self._bpf_buffer = build_bpf_program()
+            self.sock.setsockopt(socket.SOL_SOCKET, SO_ATTACH_FILTER, fprog)
+            try:
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SWEEP_RCVBUF)
+            except OSError as e:
+                logger.debug(f"Alım tamponu büyütülemedi: {e}")
+            self.sock.bind((interface, ETH_P_ARP))
+            self.sock.setblocking(False)
+        except OSError:
+            self.close()
+            raise
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def send(self, frame):
+        """Çerçeveyi gönderir (kuyruk doluysa BlockingIOError veya ENOBUFS yükselir)"""
+        self.sock.send(frame)
+
+    def recv_into(self, buffer):
+        """Bekleyen bir çerçeveyi tampona okur (yoksa BlockingIOError yükselir)"""
+        return self.sock.recv_into(buffer)
+
+    def close(self):
+        """Soketi kapatır"""
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+class MockResponder:
+    """
+    Ağ yerine ARP isteklerine sabit bir cihaz listesinden cevap veren taşıma katmanı.
+
+    Cevaplar bir kuyrukta bekletilir ve bir boru (pipe) ile okunabilir bildirilir;
+    böylece tarayıcı gerçek soketle aynı olay döngüsü yolunu kullanır. Bir IP'ye
+    birden fazla MAC atanırsa (ARP spoofing) her biri ayrı cevap verir.
+    """
+    def __init__(self, hosts, loss=0.0, seed=None):
+        """
+        Args:
+            hosts (dict): IP -> MAC veya MAC listesi
+            loss (float): Her cevabın kaybolma olasılığı (0-1)
+            seed (int): Kayıp simülasyonu için rastgele tohum
+        """
+        self.hosts = {}
+        for ip, macs in hosts.items():
+            if isinstance(macs, str):
+                macs = [macs]
+            self.hosts[socket.inet_aton(ip)] = [pack_mac(mac).to_bytes(6, "big") for mac in macs]
+        self.loss = loss
+        self.random = random.Random(seed)
+        self.requests = 0
+        self._replies = deque()
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+
+    @classmethod
+    def from_capture(cls, path, **kwargs):
+        """Yakalama dosyasındaki ARP göndericilerini cevap verecek cihazlar olarak yükler"""
+        from modules.pcap_replay import iter_arp_entries
+
+        hosts = {}
+        for _timestamp, entry in iter_arp_entries(path):
+            macs = hosts.setdefault(entry["ip"], [])
+            if entry["mac"] not in macs:
+                macs.append(entry["mac"])
+        return cls(hosts, **kwargs)
+
+    def fileno(self):
+        return self._read_fd
+
+    def send(self, frame):
+        """İsteği çözümler ve hedef IP bilinen bir cihazsa cevabı kuyruğa ekler"""
+        self.requests += 1
+        if bytes(frame[ARP_OP_OFFSET:ARP_SHA_OFFSET]) != _ARP_REQUEST_OP:
+            return
+        macs = self.hosts.get(bytes(frame[ARP_TPA_OFFSET:ARP_TPA_OFFSET + 4]))
+        if not macs:
+            return
+
+        requester_mac = bytes(frame[ARP_SHA_OFFSET:ARP_SHA_OFFSET + 6])
+        requester_ip = bytes(frame[ARP_SPA_OFFSET:ARP_SPA_OFFSET + 4])
+        target_ip = bytes(frame[ARP_TPA_OFFSET:ARP_TPA_OFFSET + 4])
+        was_empty = not self._replies
+        for mac in macs:
+            if self.loss and self.random.random() < self.loss:
+                continue
+            self._replies.append(build_arp_reply(mac, target_ip, requester_mac, requester_ip))
+        if was_empty and self._replies:
+            os.write(self._write_fd, b"\0")
+
+    def recv_into(self, buffer):
+        """Sıradaki cevabı tampona kopyalar (kuyruk boşsa BlockingIOError yükselir)"""
+        if not self._replies:
+            try:
+                os.read(self._read_fd, 64)
+            except BlockingIOError:
+                pass
+            raise BlockingIOError(errno.EAGAIN, "Bekleyen cevap yok")
+        reply = self._replies.popleft()
+        buffer[:len(reply)] = reply
+        return len(reply)
+
+    def close(self):
+        """Boruyu kapatır"""
+        if self._read_fd is not None:
+            os.close(self._read_fd)
+            os.close(self._write_fd)
+            self._read_fd = self._write_fd = None
+
+class ARPSweeper:
+    """
+    Bir alt ağı ARP who-has istekleriyle tarayan aktif keşif aracı.
+
+    İstekler tek bir çerçeve şablonunun hedef IP alanı değiştirilerek
+    gönderilir; cevaplar olay döngüsüne bağlı okuyucu ile gönderim sürerken
+    toplanır. Aynı IP için gelen farklı MAC adreslerinin tamamı kaydedilir.
+    """
+    def __init__(self, interface, network=None, rate=SWEEP_RATE, burst=SWEEP_BURST, timeout=SWEEP_TIMEOUT,
+                 transport=None, source=None):
+        """
+        Args:
+            interface (str): Taranacak arayüz
+            network (str | IPv4Network): Alt ağ; verilmezse arayüzün alt ağı
+            rate (float): Saniyedeki en fazla istek
+            burst (int): Art arda gönderilebilecek en fazla istek
+            timeout (float): Son istekten sonra cevap bekleme süresi (saniye)
+            transport: Taşıma katmanı; verilmezse arayüze bağlı RawSocketTransport
+            source (tuple): (ip, mac) gönderen adresleri; verilmezse arayüzden okunur
+        """
+        self.interface = interface
+        self.rate = rate
+        self.burst = burst
+        self.timeout = timeout
+        self.transport = transport
+
+        if source is None or network is None:
+            ip, interface_network, mac = interface_address(interface)
+            source = source or (ip, _mac(mac))
+            network = network or interface_network
+        self.source_ip, self.source_mac = source
+        self.network = ipaddress.IPv4Network(network, strict=False)
+        if self.network.prefixlen < MAX_SWEEP_PREFIX:
+            raise ValueError(f"{self.network} çok büyük; en fazla /{MAX_SWEEP_PREFIX} taranabilir")
+
+        self.stats = {"targets": 0, "sent": 0, "replies": 0, "hosts": 0, "duration": 0.0}
+
+    def _targets(self):
+        """Taranacak adreslerin (tamsayı) aralığı; ağ ve yayın adresleri hariç"""
+        first, last = int(self.network.network_address), int(self.network.broadcast_address)
+        if self.network.prefixlen < 31:
+            first, last = first + 1, last - 1
+        return range(first, last + 1)
+
+    async def run_async(self, stop_event=None):
+        """
+        Taramayı çalışan olay döngüsünde yürütür.
+
+        Args:
+            stop_event (threading.Event): Ayarlandığında gönderim ve bekleme kesilir
+
+        Returns:
+            list: {"ip", "mac", "interface"} kayıtları (IP sırasıyla)
+        """
+        loop = asyncio.get_running_loop()
+        start_time = time.perf_counter()
+        own_transport = self.transport is None
+        transport = RawSocketTransport(self.interface) if own_transport else self.transport
+
+        targets = self._targets()
+        source_ip = int(ipaddress.IPv4Address(self.source_ip))
+        first, last = targets.start, targets.stop - 1
+        replies = {}  # IP (4 bayt) -> {MAC (6 bayt): None} (sıralı küme)
+        received = 0
+        buffer = bytearray(2048)
+
+        def on_readable():
+            nonlocal received
+            while True:
+                try:
+                    nbytes = transport.recv_into(buffer)
+                except BlockingIOError:
+                    return
+                if nbytes < ETH_ARP_FRAME.size or buffer[12:14] != _ARP_ETHERTYPE \
+                   or buffer[ARP_OP_OFFSET:ARP_SHA_OFFSET] != _ARP_REPLY_OP:
+                    continue
+                sender_ip = bytes(buffer[ARP_SPA_OFFSET:ARP_SPA_OFFSET + 4])
+                if not first <= int.from_bytes(sender_ip, "big") <= last:
+                    continue
+                received += 1
+                replies.setdefault(sender_ip, {})[bytes(buffer[ARP_SHA_OFFSET:ARP_SHA_OFFSET + 6])] = None
+
+        def stopped():
+            return stop_event is not None and stop_event.is_set()
+
+        frame = build_arp_request(pack_mac(self.source_mac).to_bytes(6, "big"), socket.inet_aton(self.source_ip))
+        send = transport.send
+        bucket = TokenBucket(self.rate, self.burst)
+        sent = 0
+        loop.add_reader(transport.fileno(), on_readable)
+        try:
+            position = 0
+            while position < len(targets) and not stopped():
+                count = bucket.take(len(targets) - position)
+                if not count:
+                    await asyncio.sleep(bucket.delay(min(SWEEP_BATCH, len(targets) - position)))
+                    continue
+
+                end = position + count
+                while position < end:
+                    target = targets[position]
+                    if target != source_ip:
+                        frame[ARP_TPA_OFFSET:ARP_TPA_OFFSET + 4] = target.to_bytes(4, "big")
+                        try:
+                            send(frame)
+                        except OSError as e:
+                            if e.errno not in (errno.EAGAIN, errno.ENOBUFS):
+                                raise
+                            # Gönderim kuyruğu dolu; aynı hedef biraz sonra yeniden denenir
+                            bucket.tokens += end - position
+                            break
+                        sent += 1
+                    position += 1
+
+                # Partiler arasında okuyucu çalışabilsin
+                await asyncio.sleep(0 if position == end else SEND_BACKOFF)
+
+            # Cevap penceresi: son istekten sonra geç gelen cevaplar toplanır
+            deadline = loop.time() + self.timeout
+            while not stopped():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                await asyncio.sleep(min(STOP_POLL_INTERVAL, remaining))
+        finally:
+            loop.remove_reader(transport.fileno())
+            if own_transport:
+                transport.close()
+
+        entries = [{"ip": socket.inet_ntoa(ip), "mac": _mac(mac), "interface": self.interface}
+                   for ip in sorted(replies) for mac in replies[ip]]
+
+        self.stats = {"targets": len(targets), "sent": sent, "replies": received, "hosts": len(replies),
+                      "duration": time.perf_counter() - start_time}
+        logger.info(f"ARP taraması tamamlandı ({self.interface}, {self.network}): {len(replies)} cihaz, "
+                    f"{sent} istek, {self.stats['duration']:.2f} sn")
+        return entries
+
+    def run(self, stop_event=None):
+        """Taramayı yeni bir olay döngüsünde yürütür (iş parçacıklarından çağrılabilir)"""
+        return asyncio.run(self.run_async(stop_event))
+
+def sweep_collector(interface, gateway_ip, stop_event):
+    """
+    ScanOrchestrator için arayüz başına aktif tarama toplayıcısı.
+
+    "sweep_rate" ayarı gönderim hızını belirler. IPv4 adresi olmayan veya
+    çok büyük alt ağlı arayüzler atlanır.
+    """
+    rate = SWEEP_RATE
+    try:
+        from modules.settings import get_settings_store
+        rate = max(1, get_settings_store().get_int("sweep_rate", SWEEP_RATE))
+    except Exception as e:
+        logger.error(f"Tarama hızı ayarı okunurken hata: {e}")
+
+    try:
+        sweeper = ARPSweeper(interface, rate=rate)
+    except (OSError, ValueError) as e:
+        logger.debug(f"{interface} arayüzü aktif taramaya uygun değil: {e}")
+        return []
+    return sweeper.run(stop_event)
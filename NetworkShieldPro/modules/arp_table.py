@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Kompakt ARP Tablosu Modülü
+Bu modül, ARP kayıtlarını sözlük listesi yerine sütun halinde (IPv4 adresleri
+array('I'), 48 bitlik MAC adresleri array('Q'), arayüzler ortak bir ad
+tablosunda indeks olarak) tutan ArpTable tipini içerir. Arayüzün ihtiyaç
+duyduğu sözlük görünümleri yalnızca erişildiğinde üretilir.
+"""
+
+import sys
+import socket
+import hashlib
+import logging
+import threading
+import weakref
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Mapping
+
+# Loglama
+logger = logging.getLogger("V-ARP.arp_table")
+
+# MAC adresi bit maskeleri (48 bitlik tamsayı; ilk oktet en yüksek baytta)
+MAC_BROADCAST = 0xFFFFFFFFFFFF
+MAC_MULTICAST_BIT = 1 << 40  # İlk oktetin en düşük biti (I/G biti)
+
+# Tabloya alınmayan (48 bit olmayan) MAC adresleri her adres için bir kez uyarı olarak bildirilir
+REPORTED_MACS_LIMIT = 1024
+_reported_macs = set()
+
+# Tüm tablolarca paylaşılan arayüz adı tablosu (ad -> indeks, indeks -> ad)
+_interface_ids = {}
+_interface_names = []
+_interface_lock = threading.Lock()
+
+def intern_interface(name):
+    """Arayüz adının ortak tablodaki indeksini döndürür, yoksa ekler"""
+    index = _interface_ids.get(name)
+    if index is None:
+        with _interface_lock:
+            index = _interface_ids.get(name)
+            if index is None:
+                index = len(_interface_names)
+                _interface_names.append(name)
+                _interface_ids[name] = index
+    return index
+
+def interface_name(index):
+    """Arayüz indeksinin adını döndürür"""
+    return _interface_names[index]
+
+def pack_ip(ip):
+    """Noktalı IPv4 adresini 32 bitlik tamsayıya çevirir"""
+    return int.from_bytes(socket.inet_aton(ip), 'big')
+
+def unpack_ip(value):
+    """32 bitlik tamsayıyı noktalı IPv4 adresine çevirir"""
+    return socket.inet_ntoa(value.to_bytes(4, 'big'))
+
+def pack_mac(mac):
+    """
+    MAC adresini 48 bitlik tamsayıya çevirir.
+
+    Returns:
+        int: MAC değeri veya 6 baytlık bir Ethernet adresi değilse None
+    """
+    digits = mac.replace(':', '').replace('-', '')
+    if len(digits) != 12:
+        return None
+    try:
+        return int(digits, 16)
+    except ValueError:
+        return None
+
+def report_skipped_macs(macs):
+    """
+    Ethernet olmayan MAC adresi nedeniyle tabloya alınmayan kayıtları günlüğe yazar.
+
+    Her taramada tekrarlanmaması için yeni adresler uyarı, daha önce bildirilenler
+    hata ayıklama düzeyinde yazılır.
+
+    Args:
+        macs (list): Atlanan kayıtların MAC alanları
+    """
+    new = [mac for mac in dict.fromkeys(macs) if mac not in _reported_macs]
+    if new and len(_reported_macs) < REPORTED_MACS_LIMIT:
+        _reported_macs.update(new)
+        logger.warning(f"Ethernet olmayan MAC adresli {len(macs)} kayıt ARP tablosuna alınmadı: "
+                       f"{', '.join(map(str, new[:5]))}")
+    else:
+        logger.debug(f"Ethernet olmayan MAC adresli {len(macs)} kayıt ARP tablosuna alınmadı")
+
+def unpack_mac(value):
+    """48 bitlik tamsayıyı küçük harfli aa:bb:cc:dd:ee:ff formatına çevirir"""
+    return '%02x:%02x:%02x:%02x:%02x:%02x' % tuple(value.to_bytes(6, 'big'))
+
+def is_broadcast_mac(value):
+    """MAC adresi broadcast mi"""
+    return value == MAC_BROADCAST
+
+def is_multicast_mac(value):
+    """MAC adresi grup (multicast) adresi mi; broadcast da bu bite sahiptir"""
+    return bool(value & MAC_MULTICAST_BIT)
+
+class ArpEntry(Mapping):
+    """ArpTable satırının salt okunur {"ip", "mac", "interface"} görünümü"""
+    __slots__ = ("_table", "_index")
+
+    _FIELDS = ("ip", "mac", "interface")
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, key):
+        table = self._table
+        if key == "ip":
+            return unpack_ip(table.ips[self._index])
+        if key == "mac":
+            return unpack_mac(table.macs[self._index])
+        if key == "interface":
+            return interface_name(table.ifaces[self._index])
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._FIELDS)
+
+    def __len__(self):
+        return len(self._FIELDS)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+class ArpTable:
+    """
+    ARP tablosunun sütun tabanlı gösterimi.
+
+    get_arp_table() sözlük listesinin yerine geçer: uzunluk, indeksleme ve
+    yineleme ArpEntry görünümleri döndürür; gruplama ve tekrar tespiti doğrudan
+    tamsayı dizileri üzerinde yapılır.
+    """
+    __slots__ = ("ips", "macs", "ifaces", "__weakref__")
+
+    def __init__(self, ips=None, macs=None, ifaces=None):
+        self.ips = ips if ips is not None else array('I')
+        self.macs = macs if macs is not None else array('Q')
+        self.ifaces = ifaces if ifaces is not None else array('H')
+
+    @classmethod
+    def from_entries(cls, entries):
+        """
+        {"ip", "mac", "interface"} kayıtlarından tablo oluşturur.
+
+        Ethernet olmayan (48 bite sığmayan) MAC adresli kayıtlar atlanır ve
+        report_skipped_macs() ile günlüğe yazılır.
+        """
+        if isinstance(entries, cls):
+            return entries
+
+        table = cls()
+        skipped = []
+        for entry in entries:
+            if not table.append(entry["ip"], entry["mac"], entry.get("interface", "unknown")):
+                skipped.append(entry["mac"])
+        if skipped:
+            report_skipped_macs(skipped)
+        return table
+
+    def append(self, ip, mac, interface):
+        """Metin alanlarıyla kayıt ekler; MAC çözülemezse False döndürür"""
+        mac_value = pack_mac(mac)
+        if mac_value is None:
+            return False
+        self.ips.append(pack_ip(ip))
+        self.macs.append(mac_value)
+        self.ifaces.append(intern_interface(interface))
+        return True
+
+    def append_packed(self, ip, mac, interface_index):
+        """Tamsayı alanlarıyla kayıt ekler"""
+        self.ips.append(ip)
+        self.macs.append(mac)
+        self.ifaces.append(interface_index)
+
+    def __len__(self):
+        return len(self.ips)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ArpTable(self.ips[index], self.macs[index], self.ifaces[index])
+        if index < 0:
+            index += len(self.ips)
+        if not 0 <= index < len(self.ips):
+            raise IndexError("ArpTable indeksi aralık dışında")
+        return ArpEntry(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.ips)):
+            yield ArpEntry(self, index)
+
+    def __repr__(self):
+        return f"ArpTable({len(self)} kayıt)"
+
+    @property
+    def nbytes(self):
+        """Sütun dizilerinin kapladığı bayt sayısı"""
+        return sum(len(column) * column.itemsize for column in (self.ips, self.macs, self.ifaces))
+
+    def to_entries(self):
+        """Tablonun {"ip", "mac", "interface"} sözlük listesi kopyasını döndürür"""
+        return [dict(entry) for entry in self]
+
+    def digest(self):
+        """
+        Satır sırasından ve süreçten bağımsız içerik özeti.
+
+        Satırlar (arayüz adı, IP, MAC) sırasına dizilip büyük endian olarak
+        özetlenir; aynı içerikli iki tablo her zaman aynı özeti verir.
+
+        Returns:
+            str: 32 karakterlik onaltılık BLAKE2b özeti
+        """
+        rows = sorted(zip(map(_interface_names.__getitem__, self.ifaces), self.ips, self.macs))
+        names = sorted({row[0] for row in rows})
+        order = {name: index for index, name in enumerate(names)}
+
+        columns = (array('H', [order[row[0]] for row in rows]),
+                   array('I', [row[1] for row in rows]),
+                   array('Q', [row[2] for row in rows]))
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update("\0".join(names).encode('utf-8'))
+        for column in columns:
+            if sys.byteorder == 'little':
+                column.byteswap()
+            digest.update(column.tobytes())
+        return digest.hexdigest()
+
+    def special_indices(self):
+        """Broadcast veya multicast MAC adresli satırların indeksleri"""
+        return [index for index, mac in enumerate(self.macs) if mac & MAC_MULTICAST_BIT]
+
+    def duplicate_macs(self):
+        """
+        Birden fazla satırda görünen unicast MAC adreslerini gruplar.
+
+        Returns:
+            dict: MAC değeri -> satır indeksleri (ilk görülme sırasıyla)
+        """
+        macs = self.macs
+        # Tekrarsız tablolarda (olağan durum) tek bir C düzeyi küme işlemi yeterli
+        if len(set(macs)) == len(macs):
+            return {}
+
+        counts = Counter(macs)
+        repeated = {mac for mac, count in counts.items() if count > 1 and not mac & MAC_MULTICAST_BIT}
+        if not repeated:
+            return {}
+
+        groups = defaultdict(list)
+        for index, mac in enumerate(macs):
+            if mac in repeated:
+                groups[mac].append(index)
+        return dict(groups)
+
+    def indices_for_ip(self, ip):
+        """Verilen IP'ye (tamsayı) ait satırların indeksleri"""
+        ips = self.ips
+        if ips.count(ip) == 0:
+            return []
+        return [index for index, value in enumerate(ips) if value == ip]
+
+    def split_by_interface(self):
+        """
+        Tabloyu arayüzlere böler.
+
+        Returns:
+            dict: arayüz indeksi -> o arayüzün kayıtlarını (tablo sırasıyla) içeren ArpTable
+        """
+        parts = {}
+        for ip, mac, iface in zip(self.ips, self.macs, self.ifaces):
+            part = parts.get(iface)
+            if part is None:
+                part = parts[iface] = ArpTable()
+            part.append_packed(ip, mac, iface)
+        return parts
+
+    def merged(self, entries):
+        """
+        Kayıtları tablonun bir kopyasına ekler; tabloda zaten bulunan
+        (IP, MAC, arayüz) üçlüleri tekrarlanmaz.
+
+        Args:
+            entries (ArpTable | list): {"ip", "mac", "interface"} kayıtları
+
+        Returns:
+            ArpTable: Birleştirilmiş yeni tablo
+        """
+        table = ArpTable(array('I', self.ips), array('Q', self.macs), array('H', self.ifaces))
+        extra = ArpTable.from_entries(entries)
+        seen = set(zip(self.ips, self.macs, self.ifaces))
+        for key in zip(extra.ips, extra.macs, extra.ifaces):
+            if key not in seen:
+                seen.add(key)
+                table.append_packed(*key)
+        return table
+
+    @classmethod
+    def concat(cls, tables):
+        """Tabloları sırayla tek bir tabloda birleştirir"""
+        table = cls()
+        for part in tables:
+            table.ips.extend(part.ips)
+            table.macs.extend(part.macs)
+            table.ifaces.extend(part.ifaces)
+        return table
+
+class SnapshotPool:
+    """
+    İçerik adresli ARP tablosu havuzu.
+
+    Aynı içerikli tablolar tek bir nesneyi paylaşır; tablolar zayıf referansla
+    tutulduğundan hiçbir sonuç kullanmadığında bellekten düşer.
+    """
+    def __init__(self):
+        self._tables = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def intern(self, table, digest=None):
+        """
+        Tabloyu havuza ekler veya aynı içerikli mevcut tabloyu döndürür.
+
+        Args:
+            table: ArpTable veya kayıt listesi
+            digest (str): Önceden hesaplanmış özet (örn. veritabanından)
+
+        Returns:
+            tuple: (özet, paylaşılan ArpTable)
+        """
+        table = ArpTable.from_entries(table)
+        if digest is None:
+            digest = table.digest()
+        with self._lock:
+            shared = self._tables.get(digest)
+            if shared is None:
+                self._tables[digest] = shared = table
+        return digest, shared
+
+    def get(self, digest):
+        """Özete karşılık gelen tablo (bellekte yoksa None)"""
+        return self._tables.get(digest)
+
+    def __len__(self):
+        return len(self._tables)
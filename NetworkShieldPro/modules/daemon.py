@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Arayüzsüz Servis Modülü
+Bu modül, ARPScanner'ı grafik arayüz olmadan uzun süre çalışan bir servis
+olarak işletir. Tarama sonuçları ve şüpheli durumlar standart çıktıya ve
+yerel bir UNIX soketine JSON satırları olarak yazılır. tkinter, PIL, pystray
+ve ui.* modülleri hiçbir zaman yüklenmez; systemd altında (Type=notify)
+çalıştırılabilir.
+
+Kullanım:
+    python main.py --headless [--mode periodic|event|packet] [--interval SN]
+                              [--socket YOL | --no-socket] [--full]
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import socket
+import logging
+import argparse
+import tempfile
+import threading
+
+# Loglama
+logger = logging.getLogger("V-ARP.daemon")
+
+# Arayüzsüz modda varsayılan tarama aralığı (saniye)
+DAEMON_SCAN_INTERVAL = 60
+
+# Yavaş okuyan soket istemcisi için gönderim zaman aşımı (saniye)
+CLIENT_SEND_TIMEOUT = 1.0
+
+SOCKET_NAME = "v-arp.sock"
+
+def default_socket_path():
+    """systemd RuntimeDirectory= varsa onu, yoksa geçici dizini kullanır"""
+    return os.path.join(os.environ.get("RUNTIME_DIRECTORY") or tempfile.gettempdir(), SOCKET_NAME)
+
+def sd_notify(state):
+    """systemd'ye durum bildirir (NOTIFY_SOCKET tanımlı değilse hiçbir şey yapmaz)"""
+    address = os.environ.get("NOTIFY_SOCKET")
+    if not address:
+        return False
+    if address.startswith("@"):
+        address = "\0" + address[1:]  # Soyut ad alanı
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.connect(address)
+            sock.sendall(state.encode("utf-8"))
+        return True
+    except OSError as e:
+        logger.debug(f"systemd bildirimi gönderilemedi: {e}")
+        return False
+
+class JsonLineBroadcaster:
+    """
+    JSON satırlarını standart çıktıya ve bağlı UNIX soketi istemcilerine yazar.
+
+    İstemciler yalnızca okur; bağlantı koptuğunda veya gönderim zaman aşımına
+    uğradığında istemci listeden çıkarılır, servis etkilenmez.
+    """
+    def __init__(self, socket_path=None, stream=None):
+        self.stream = stream if stream is not None else sys.stdout
+        self.socket_path = socket_path
+        self._clients = []
+        self._lock = threading.Lock()
+        self._server = None
+        self._accept_thread = None
+
+        if socket_path:
+            self._open_server(socket_path)
+
+    def _open_server(self, path):
+        # Önceki çalıştırmadan kalan soket dosyası temizlenir
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        os.chmod(path, 0o660)
+        server.listen(8)
+        self._server = server
+        self._accept_thread = threading.Thread(target=self._accept_loop, name="daemon-socket", daemon=True)
+        self._accept_thread.start()
+        logger.info(f"JSON olay soketi dinleniyor: {path}")
+
+    def _accept_loop(self):
+        while True:
+            try:
+                client, _address = self._server.accept()
+            except OSError:
+                return  # Sunucu kapatıldı
+            client.settimeout(CLIENT_SEND_TIMEOUT)
+            with self._lock:
+                self._clients.append(client)
+            logger.debug(f"Soket istemcisi bağlandı (toplam {len(self._clients)})")
+
+    def emit(self, record):
+        """Kaydı tek satır JSON olarak tüm çıkışlara yazar"""
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        try:
+            self.stream.write(line)
+            self.stream.flush()
+        except (OSError, ValueError) as e:
+            logger.debug(f"Standart çıktıya yazılamadı: {e}")
+
+        if not self._clients:
+            return
+        data = line.encode("utf-8")
+        with self._lock:
+            alive = []
+            for client in self._clients:
+                try:
+                    client.sendall(data)
+                    alive.append(client)
+                except OSError:
+                    client.close()
+            self._clients = alive
+
+    def close(self):
+        """Soketi ve istemci bağlantılarını kapatır"""
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+        with self._lock:
+            for client in self._clients:
+                client.close()
+            self._clients = []
+
+def result_records(result, full=False):
+    """
+    Tarama sonucunu JSON satırı kayıtlarına çevirir.
+
+    Returns:
+        list: Bir "scan" özet kaydı ve her şüpheli durum için bir "alert" kaydı
+    """
+    arp_table = result.get("arp_table", [])
+    summary = {
+        "type": "scan",
+        "timestamp": result.get("timestamp"),
+        "scan_id": result.get("scan_id"),
+        "source": result.get("source", "scan"),
+        "threat_level": result.get("threat_level", "none"),
+        "gateway": result.get("gateway"),
+        "entries": len(arp_table),
+        "arp_snapshot": result.get("arp_snapshot"),
+        "suspicious": len(result.get("suspicious_entries", [])),
+        "changes": result.get("changes") or [],
+        "duration": result.get("duration")
+    }
+    if full:
+        summary["arp_table"] = arp_table.to_entries() if hasattr(arp_table, "to_entries") else list(arp_table)
+
+    records = [summary]
+    for entry in result.get("suspicious_entries", []):
+        alert = {"type": "alert", "timestamp": result.get("timestamp"), "scan_id": result.get("scan_id")}
+        alert.update(entry)
+        records.append(alert)
+    return records
+
+class HeadlessDaemon:
+    """ARPScanner'ı arayüzsüz çalıştıran servis"""
+    def __init__(self, mode="periodic", interval=DAEMON_SCAN_INTERVAL, interface=None,
+                 socket_path=None, full=False, stream=None):
+        from modules.arp_detector import ARPScanner
+
+        self.mode = mode
+        self.interval = interval
+        self.interface = interface
+        self.full = full
+        self.stop_event = threading.Event()
+        self.scan_requested = threading.Event()
+        self.output = JsonLineBroadcaster(socket_path, stream)
+        self.scanner = ARPScanner(callback=self._on_result)
+
+    def _on_result(self, result):
+        """Tarayıcı thread'inde çağrılır"""
+        for record in result_records(result, self.full):
+            self.output.emit(record)
+
+    def request_scan(self, *_args):
+        """Bir sonraki döngüde hemen tarama yapılmasını ister (SIGHUP)"""
+        self.scan_requested.set()
+
+    def stop(self, *_args):
+        """Servisi durdurur (SIGTERM/SIGINT)"""
+        self.stop_event.set()
+        self.scan_requested.set()
+
+    def run(self):
+        """Durdurulana kadar çalışır"""
+        logger.info(f"Arayüzsüz servis başlatıldı (mod: {self.mode})")
+        if self.mode == "event":
+            started = self.scanner.start_event_monitor()
+        elif self.mode == "packet":
+            started = self.scanner.start_packet_monitor(self.interface)
+        else:
+            started = True
+        if not started:
+            logger.error(f"'{self.mode}' izleme modu başlatılamadı")
+            return 1
+
+        self.output.emit({"type": "started", "timestamp": time.time(), "mode": self.mode, "pid": os.getpid()})
+        sd_notify("READY=1")
+
+        try:
+            # Olay ve paket modlarında başlangıç durumu için de bir tarama yapılır
+            while not self.stop_event.is_set():
+                if not self.scanner.running:
+                    self.scanner.start_scan()
+                self.scan_requested.wait(self.interval if self.mode == "periodic" else None)
+                self.scan_requested.clear()
+        finally:
+            sd_notify("STOPPING=1")
+            self.shutdown()
+        return 0
+
+    def shutdown(self):
+        """Tarayıcıyı durdurur, ayarları diske aktarır ve soketi kapatır"""
+        self.scanner.stop()
+        try:
+            from modules.settings import flush_settings
+            flush_settings()
+        except Exception as e:
+            logger.error(f"Ayarlar kaydedilirken hata: {e}")
+        self.output.emit({"type": "stopped", "timestamp": time.time()})
+        self.output.close()
+        logger.info("Arayüzsüz servis durduruldu")
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="main.py --headless", description="V-ARP arayüzsüz servis")
+    parser.add_argument("--headless", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--mode", choices=("periodic", "event", "packet"),
+                        help="İzleme modu (varsayılan: monitor_mode ayarı)")
+    parser.add_argument("--interval", type=float, default=DAEMON_SCAN_INTERVAL,
+                        help=f"Periyodik modda tarama aralığı, saniye (varsayılan: {DAEMON_SCAN_INTERVAL})")
+    parser.add_argument("--interface", help="Paket modunda dinlenecek arayüz (varsayılan: tümü)")
+    parser.add_argument("--socket", default=None, help=f"UNIX soketi yolu (varsayılan: {default_socket_path()})")
+    parser.add_argument("--no-socket", action="store_true", help="UNIX soketi açma, yalnızca standart çıktı")
+    parser.add_argument("--full", action="store_true", help="Tarama kayıtlarına ARP tablosunu da ekle")
+    parser.add_argument("--log-level", default="INFO", help="Log seviyesi (varsayılan: INFO)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """
+    Arayüzsüz servisin giriş noktası.
+
+    Returns:
+        int: Çıkış kodu
+    """
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    # Standart çıktı JSON satırlarına ayrılır; loglar standart hataya (journald) yazılır
+    logging.basicConfig(
+        level=getattr(logging, args.log_level.upper(), logging.INFO),
+        format='%(name)s - %(levelname)s - %(message)s',
+        stream=sys.stderr
+    )
+
+    mode = args.mode
+    if mode is None:
+        from modules.settings import get_settings_store
+        mode = get_settings_store().get_str("monitor_mode", "periodic", ("periodic", "event", "packet"))
+
+    socket_path = None if args.no_socket else (args.socket or default_socket_path())
+    try:
+        daemon = HeadlessDaemon(mode=mode, interval=args.interval, interface=args.interface,
+                                socket_path=socket_path, full=args.full)
+    except OSError as e:
+        logger.error(f"Servis başlatılamadı: {e}")
+        return 1
+
+    signal.signal(signal.SIGTERM, daemon.stop)
+    signal.signal(signal.SIGINT, daemon.stop)
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, daemon.request_scan)
+
+    return daemon.run()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Olay Veri Yolu Modülü
+Bu modül, tarama ve izleme thread'lerinin ürettiği olayları arayüz thread'ine
+taşıyan EventBus tipini içerir. Yayınlama herhangi bir thread'den yapılabilir
+(queue.SimpleQueue); abonelere teslim yalnızca drain() çağıran thread'de
+(Tk ana döngüsü) gerçekleşir. Birleştirilen konularda bir boşaltmada yalnızca
+en son olay teslim edilir.
+"""
+
+import queue
+import logging
+from collections import defaultdict
+
+# Loglama
+logger = logging.getLogger("V-ARP.event_bus")
+
+# Konular
+SCAN_COMPLETED = "scan_completed"
+
+# Bir boşaltmada işlenen en fazla olay (sürekli yayında arayüzün kilitlenmemesi için)
+EVENT_DRAIN_LIMIT = 1000
+
+class EventBus:
+    """
+    Thread güvenli yayınla/abone ol kuyruğu.
+
+    publish() kilitsiz ve engellemesizdir. drain() kuyruktaki olayları alır:
+    birleştirmesiz aboneler her olayı geliş sırasıyla, birleştirmeli aboneler
+    konu başına yalnızca son olayı alır.
+    """
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._handlers = defaultdict(list)             # konu -> her olayı alan aboneler
+        self._coalesced_handlers = defaultdict(list)   # konu -> yalnızca son olayı alan aboneler
+
+    def subscribe(self, topic, handler, coalesce=False):
+        """
+        Konuya abone olur.
+
+        Args:
+            topic (str): Olay konusu
+            handler (callable): Olay verisiyle çağrılır (drain() thread'inde)
+            coalesce (bool): True ise bir boşaltmadaki olaylardan yalnızca sonuncusu verilir
+        """
+        handlers = self._coalesced_handlers if coalesce else self._handlers
+        handlers[topic].append(handler)
+
+    def unsubscribe(self, topic, handler):
+        """Aboneliği kaldırır"""
+        for handlers in (self._handlers, self._coalesced_handlers):
+            if handler in handlers.get(topic, ()):
+                handlers[topic].remove(handler)
+
+    def publish(self, topic, payload=None):
+        """Olayı kuyruğa ekler; herhangi bir thread'den çağrılabilir"""
+        self._queue.put((topic, payload))
+
+    def publisher(self, topic):
+        """Verilen konuya yayın yapan tek argümanlı fonksiyon (callback olarak kullanmak için)"""
+        return lambda payload=None: self.publish(topic, payload)
+
+    def pending(self):
+        """Kuyrukta bekleyen olay var mı"""
+        return not self._queue.empty()
+
+    def drain(self, limit=EVENT_DRAIN_LIMIT):
+        """
+        Bekleyen olayları abonelere teslim eder.
+
+        Args:
+            limit (int): Bu çağrıda alınacak en fazla olay
+
+        Returns:
+            int: Kuyruktan alınan olay sayısı
+        """
+        latest = {}
+        count = 0
+        while count < limit:
+            try:
+                topic, payload = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            count += 1
+            for handler in tuple(self._handlers.get(topic, ())):
+                self._dispatch(handler, topic, payload)
+            if topic in self._coalesced_handlers:
+                # Sözlük sırası son olayın geliş sırasını korusun
+                latest.pop(topic, None)
+                latest[topic] = payload
+
+        for topic, payload in latest.items():
+            for handler in tuple(self._coalesced_handlers.get(topic, ())):
+                self._dispatch(handler, topic, payload)
+
+        if count > 1 and latest:
+            logger.debug(f"{count} olay işlendi, {len(latest)} konu birleştirildi")
+        return count
+
+    @staticmethod
+    def _dispatch(handler, topic, payload):
+        """Aboneyi çağırır; bir abonenin hatası diğerlerini engellemez"""
+        try:
+            handler(payload)
+        except Exception as e:
+            logger.error(f"'{topic}' olayı işlenirken hata: {e}")
+            import traceback
+            traceback.print_exc()
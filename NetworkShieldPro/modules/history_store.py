@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tarama Geçmişi Deposu Modülü
+Bu modül, tarama sonuçlarını SQLite (WAL kipi) veritabanında normalize
+tablolarda (taramalar, ARP kayıtları, şüpheli durumlar) saklar. Geçmiş,
+sayfalı ve tembel sorgularla okunur; arayüz tüm geçmişi belleğe yüklemez.
+"""
+
+import os
+import json
+import sqlite3
+import logging
+import threading
+from collections.abc import Sequence
+
+from modules.arp_table import ArpTable, SnapshotPool, intern_interface, interface_name
+
+# Loglama
+logger = logging.getLogger("V-ARP.history_store")
+
+# Veritabanı dosyasının yolu. Ayarlar dizini inotify ile izlendiğinden
+# veritabanı ve WAL dosyaları ayrı bir veri dizininde tutulur.
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(APP_DIR, "data")
+HISTORY_DB_FILE = os.path.join(DATA_DIR, "scan_history.db")
+
+# Bir sayfada okunan tarama sayısı
+HISTORY_PAGE_SIZE = 50
+
+# Saklanan en fazla tarama sayısı (eskiler silinir)
+HISTORY_MAX_SCANS = 10000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scans (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp REAL NOT NULL,
+    duration REAL NOT NULL DEFAULT 0,
+    threat_level TEXT NOT NULL,
+    gateway_ip TEXT,
+    gateway_mac TEXT,
+    source TEXT,
+    changes TEXT,
+    snapshot TEXT REFERENCES snapshots(hash)
+);
+CREATE INDEX IF NOT EXISTS idx_scans_timestamp ON scans(timestamp);
+CREATE INDEX IF NOT EXISTS idx_scans_snapshot ON scans(snapshot);
+
+-- ARP tabloları içerik özetiyle bir kez saklanır; aynı tabloyu gören taramalar paylaşır
+CREATE TABLE IF NOT EXISTS snapshots (
+    hash TEXT PRIMARY KEY,
+    entry_count INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS snapshot_entries (
+    snapshot TEXT NOT NULL REFERENCES snapshots(hash) ON DELETE CASCADE,
+    ip INTEGER NOT NULL,
+    mac INTEGER NOT NULL,
+    interface TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_snapshot_entries_snapshot ON snapshot_entries(snapshot);
+CREATE INDEX IF NOT EXISTS idx_snapshot_entries_mac ON snapshot_entries(mac);
+CREATE INDEX IF NOT EXISTS idx_snapshot_entries_ip ON snapshot_entries(ip);
+
+CREATE TABLE IF NOT EXISTS suspicious_entries (
+    scan_id INTEGER NOT NULL REFERENCES scans(id) ON DELETE CASCADE,
+    type TEXT NOT NULL,
+    threat_level TEXT NOT NULL,
+    ip TEXT,
+    mac TEXT,
+    message TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_suspicious_scan ON suspicious_entries(scan_id);
+CREATE INDEX IF NOT EXISTS idx_suspicious_mac ON suspicious_entries(mac);
+CREATE INDEX IF NOT EXISTS idx_suspicious_ip ON suspicious_entries(ip);
+"""
+
+SCAN_COLUMNS = "id, timestamp, duration, threat_level, gateway_ip, gateway_mac, source, changes, snapshot"
+
+class HistoryStore:
+    """SQLite tabanlı kalıcı tarama geçmişi"""
+    def __init__(self, path=HISTORY_DB_FILE, max_scans=HISTORY_MAX_SCANS, pool=None):
+        self.path = path
+        self.max_scans = max_scans
+        self.pool = pool if pool is not None else SnapshotPool()
+        # Tarama, izleme ve arayüz thread'leri tek bağlantıyı kilitle paylaşır
+        self._lock = threading.RLock()
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        logger.debug(f"Tarama geçmişi veritabanı açıldı: {path}")
+
+    @staticmethod
+    def _insert_snapshot(cursor, digest, table):
+        """Tabloyu özetiyle saklar; aynı özet zaten varsa hiçbir şey yazmaz"""
+        cursor.execute("INSERT OR IGNORE INTO snapshots (hash, entry_count) VALUES (?, ?)", (digest, len(table)))
+        if cursor.rowcount == 1:
+            names = [interface_name(index) for index in range(max(table.ifaces, default=-1) + 1)]
+            cursor.executemany(
+                "INSERT INTO snapshot_entries (snapshot, ip, mac, interface) VALUES (?, ?, ?, ?)",
+                ((digest, ip, mac, names[interface])
+                 for ip, mac, interface in zip(table.ips, table.macs, table.ifaces)))
+
+    def close(self):
+        """Veritabanı bağlantısını kapatır"""
+        with self._lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+    def add_scan(self, result):
+        """
+        Tarama sonucunu tek bir işlemde (toplu ekleme ile) kaydeder.
+
+        ARP tablosu içerik özetiyle saklanır; aynı tablo daha önce kaydedildiyse
+        yalnızca özete başvurulur.
+
+        Args:
+            result (dict): ARPScanner tarama sonucu
+
+        Returns:
+            int: Kaydedilen taramanın kimliği
+        """
+        digest, table = self.pool.intern(result.get("arp_table", []), result.get("arp_snapshot"))
+        gateway = result.get("gateway") or {}
+        changes = result.get("changes")
+
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute("BEGIN")
+            try:
+                self._insert_snapshot(cursor, digest, table)
+                cursor.execute(
+                    "INSERT INTO scans (timestamp, duration, threat_level, gateway_ip, gateway_mac, source, changes, "
+                    "snapshot) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (result.get("timestamp", 0), result.get("duration", 0), result.get("threat_level", "none"),
+                     gateway.get("ip"), gateway.get("mac"), result.get("source"),
+                     json.dumps(changes, ensure_ascii=False) if changes is not None else None, digest))
+                scan_id = cursor.lastrowid
+
+                cursor.executemany(
+                    "INSERT INTO suspicious_entries (scan_id, type, threat_level, ip, mac, message, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    ((scan_id, entry.get("type", ""), entry.get("threat_level", "none"), entry.get("ip"),
+                      entry.get("mac"), entry.get("message"), json.dumps(entry, ensure_ascii=False))
+                     for entry in result.get("suspicious_entries", [])))
+
+                if self.max_scans:
+                    # Saklama sınırını aşan en eski taramalar (bağlı kayıtlarla birlikte) silinir
+                    cursor.execute(
+                        "DELETE FROM scans WHERE id <= (SELECT id FROM scans ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                        (self.max_scans,))
+                    if cursor.rowcount > 0:
+                        # Artık hiçbir taramanın başvurmadığı tablolar silinir
+                        cursor.execute(
+                            "DELETE FROM snapshots WHERE NOT EXISTS "
+                            "(SELECT 1 FROM scans WHERE scans.snapshot = snapshots.hash)")
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+
+        return scan_id
+
+    def _load_results(self, rows, include_arp_table=True):
+        """scans satırlarını tarama sonucu sözlüklerine çevirir"""
+        if not rows:
+            return []
+
+        ids = [row[0] for row in rows]
+        placeholders = ",".join("?" * len(ids))
+        suspicious = {scan_id: [] for scan_id in ids}
+        for scan_id, data in self.conn.execute(
+                f"SELECT scan_id, data FROM suspicious_entries WHERE scan_id IN ({placeholders}) ORDER BY rowid",
+                ids):
+            suspicious[scan_id].append(json.loads(data))
+
+        tables = {}
+        if include_arp_table:
+            # Aynı özetli taramalar tek tabloyu paylaşır; bellekte olanlar sorgulanmaz
+            missing = []
+            for digest in {row[-1] for row in rows if row[-1] is not None}:
+                table = self.pool.get(digest)
+                if table is None:
+                    missing.append(digest)
+                else:
+                    tables[digest] = table
+            if missing:
+                loaded = {digest: ArpTable() for digest in missing}
+                for digest, ip, mac, interface in self.conn.execute(
+                        f"SELECT snapshot, ip, mac, interface FROM snapshot_entries "
+                        f"WHERE snapshot IN ({','.join('?' * len(missing))}) ORDER BY rowid", missing):
+                    loaded[digest].append_packed(ip, mac, intern_interface(interface))
+                for digest, table in loaded.items():
+                    tables[digest] = self.pool.intern(table, digest)[1]
+
+        results = []
+        for scan_id, timestamp, duration, threat_level, gateway_ip, gateway_mac, source, changes, digest in rows:
+            result = {
+                "scan_id": scan_id,
+                "timestamp": timestamp,
+                "gateway": {"ip": gateway_ip or "Bilinmiyor", "mac": gateway_mac or "Bilinmiyor"},
+                "suspicious_entries": suspicious[scan_id],
+                "threat_level": threat_level,
+                "duration": duration
+            }
+            if digest is not None:
+                result["arp_snapshot"] = digest
+                if include_arp_table:
+                    result["arp_table"] = tables[digest]
+            elif include_arp_table:
+                result["arp_table"] = ArpTable()
+            if source is not None:
+                result["source"] = source
+            if changes is not None:
+                result["changes"] = json.loads(changes)
+            results.append(result)
+        return results
+
+    def count(self):
+        """Kayıtlı tarama sayısı"""
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM scans").fetchone()[0]
+
+    def page(self, offset=0, limit=HISTORY_PAGE_SIZE, newest_first=True, include_arp_table=True):
+        """
+        Geçmişin bir sayfasını döndürür.
+
+        Args:
+            offset (int): Atlanacak tarama sayısı
+            limit (int): Sayfadaki en fazla tarama sayısı
+            newest_first (bool): En yeni tarama başta mı
+            include_arp_table (bool): ARP tabloları da yüklensin mi
+
+        Returns:
+            list: Tarama sonucu sözlükleri
+        """
+        order = "DESC" if newest_first else "ASC"
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT {SCAN_COLUMNS} FROM scans ORDER BY id {order} LIMIT ? OFFSET ?",
+                (limit, offset)).fetchall()
+            return self._load_results(rows, include_arp_table)
+
+    def _page_after(self, last_id, limit, newest_first):
+        """Kimliğe göre (anahtar kümesi) sayfalama; büyük ofsetlerde tarama gerektirmez"""
+        if newest_first:
+            query = f"SELECT {SCAN_COLUMNS} FROM scans WHERE id < ? ORDER BY id DESC LIMIT ?"
+        else:
+            query = f"SELECT {SCAN_COLUMNS} FROM scans WHERE id > ? ORDER BY id ASC LIMIT ?"
+        with self._lock:
+            rows = self.conn.execute(query, (last_id, limit)).fetchall()
+            return self._load_results(rows)
+
+    def last(self):
+        """En son tarama sonucu (yoksa None)"""
+        results = self.page(0, 1)
+        return results[0] if results else None
+
+    def statistics(self):
+        """
+        Geçmiş özetini tek sorguyla hesaplar.
+
+        Returns:
+            dict: total_scans, high_threats, first_timestamp, last_timestamp
+        """
+        with self._lock:
+            total, first, last = self.conn.execute(
+                "SELECT COUNT(*), MIN(timestamp), MAX(timestamp) FROM scans").fetchone()
+            high = self.conn.execute(
+                "SELECT COUNT(*) FROM suspicious_entries WHERE threat_level = 'high'").fetchone()[0]
+        return {"total_scans": total, "high_threats": high, "first_timestamp": first, "last_timestamp": last}
+
+    def clear(self):
+        """
+        Tüm geçmişi tek bir işlemde siler.
+
+        Raises:
+            sqlite3.Error: Silme başarısız olursa (geçmiş değişmeden kalır)
+        """
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute("BEGIN")
+            try:
+                cursor.execute("DELETE FROM suspicious_entries")
+                cursor.execute("DELETE FROM scans")
+                cursor.execute("DELETE FROM snapshots")
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+
+    def history(self):
+        """Geçmişin tembel, liste benzeri görünümü"""
+        return ScanHistoryView(self)
+
+class ScanHistoryView(Sequence):
+    """
+    Tarama geçmişinin salt okunur dizi görünümü (eskiden yeniye).
+
+    len(), indeksleme ve dilimleme yalnızca gereken satırları sorgular;
+    yineleme sayfa sayfa yapılır.
+    """
+    def __init__(self, store):
+        self.store = store
+
+    def __len__(self):
+        return self.store.count()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self.store.page(start, max(0, stop - start), newest_first=False)
+            return [self[i] for i in range(start, stop, step)]
+
+        if index < 0:
+            index += len(self)
+        results = self.store.page(index, 1, newest_first=False) if index >= 0 else []
+        if not results:
+            raise IndexError("Tarama geçmişi indeksi aralık dışında")
+        return results[0]
+
+    def _iterate(self, newest_first):
+        last_id = (1 << 63) - 1 if newest_first else 0
+        while True:
+            results = self.store._page_after(last_id, HISTORY_PAGE_SIZE, newest_first)
+            if not results:
+                return
+            yield from results
+            last_id = results[-1]["scan_id"]
+
+    def __iter__(self):
+        return self._iterate(newest_first=False)
+
+    def __reversed__(self):
+        return self._iterate(newest_first=True)
@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Rtnetlink İstemci Modülü
+Bu modül, Linux çekirdeğinin komşu (ARP) ve yönlendirme tablolarını alt süreç
+çalıştırmadan, tek bir AF_NETLINK soketi üzerinden okumak için gerekli
+fonksiyonları içerir.
+"""
+
+import os
+import errno
+import select
+import socket
+import struct
+import logging
+
+# Loglama
+logger = logging.getLogger("V-ARP.netlink")
+
+# Netlink protokolü ve mesaj tipleri (include/uapi/linux/netlink.h, rtnetlink.h)
+NETLINK_ROUTE = 0
+
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+
+NLM_F_REQUEST = 0x01
+NLM_F_MULTI = 0x02
+NLM_F_ROOT = 0x100
+NLM_F_MATCH = 0x200
+NLM_F_DUMP = NLM_F_ROOT | NLM_F_MATCH
+
+RTM_NEWROUTE = 24
+RTM_DELROUTE = 25
+RTM_GETROUTE = 26
+RTM_NEWNEIGH = 28
+RTM_DELNEIGH = 29
+RTM_GETNEIGH = 30
+
+# Komşu öznitelikleri (include/uapi/linux/neighbour.h)
+NDA_DST = 1
+NDA_LLADDR = 2
+
+# Komşu durumları (NUD_*)
+NUD_INCOMPLETE = 0x01
+NUD_REACHABLE = 0x02
+NUD_STALE = 0x04
+NUD_DELAY = 0x08
+NUD_PROBE = 0x10
+NUD_FAILED = 0x20
+NUD_NOARP = 0x40
+NUD_PERMANENT = 0x80
+
+# MAC adresi çözülmüş sayılan durumlar ('arp -n' çıktısındaki tamamlanmış kayıtlar)
+NUD_VALID = NUD_PERMANENT | NUD_NOARP | NUD_REACHABLE | NUD_PROBE | NUD_STALE | NUD_DELAY
+
+# Yönlendirme öznitelikleri (include/uapi/linux/rtnetlink.h)
+RTA_DST = 1
+RTA_OIF = 4
+RTA_GATEWAY = 5
+RTA_PRIORITY = 6
+RTA_TABLE = 15
+
+RT_TABLE_MAIN = 254
+
+# Çoklu yayın grupları (RTMGRP_* bit maskeleri)
+RTMGRP_NEIGH = 0x4
+RTMGRP_IPV4_ROUTE = 0x40
+
+# Başlık yapıları
+NLMSGHDR = struct.Struct("=IHHII")   # uzunluk, tip, bayraklar, sıra no, port id
+NDMSG = struct.Struct("=BBHiHBB")    # aile, pad1, pad2, ifindex, durum, bayraklar, tip
+RTMSG = struct.Struct("=BBBBBBBBI")  # aile, dst_len, src_len, tos, tablo, protokol, kapsam, tip, bayraklar
+RTATTR = struct.Struct("=HH")        # uzunluk, tip
+U32 = struct.Struct("=I")
+
+RECV_BUFFER_SIZE = 1 << 16
+
+class NetlinkError(OSError):
+    """Çekirdekten dönen netlink hata mesajı"""
+
+def _align(length):
+    """Netlink 4 bayt hizalaması"""
+    return (length + 3) & ~3
+
+def _format_mac(raw):
+    """Bağlantı katmanı adresini okunabilir formata çevirir"""
+    return ':'.join(f'{b:02x}' for b in raw)
+
+def _interface_name(ifindex, cache):
+    """Arayüz indeksini ada çevirir (sonuçları önbellekler)"""
+    name = cache.get(ifindex)
+    if name is None:
+        try:
+            name = socket.if_indextoname(ifindex)
+        except OSError:
+            name = str(ifindex)
+        cache[ifindex] = name
+    return name
+
+def parse_attributes(data, offset=0):
+    """
+    rtattr dizisini {tip: değer_baytları} sözlüğüne çevirir.
+
+    Args:
+        data (bytes | memoryview): Öznitelik bloğu
+        offset (int): Başlangıç konumu
+
+    Returns:
+        dict: Öznitelik tipi -> ham değer
+    """
+    attrs = {}
+    end = len(data)
+    while offset + RTATTR.size <= end:
+        rta_len, rta_type = RTATTR.unpack_from(data, offset)
+        if rta_len < RTATTR.size:
+            break
+        attrs[rta_type] = bytes(data[offset + RTATTR.size:offset + rta_len])
+        offset += _align(rta_len)
+    return attrs
+
+def iter_messages(data):
+    """
+    Netlink cevap tamponundaki mesajları sırayla döndürür.
+
+    Args:
+        data (bytes | memoryview): recv() ile alınan tampon
+
+    Yields:
+        tuple: (mesaj_tipi, bayraklar, sıra_no, yük)
+    """
+    offset = 0
+    end = len(data)
+    while offset + NLMSGHDR.size <= end:
+        msg_len, msg_type, flags, seq, _pid = NLMSGHDR.unpack_from(data, offset)
+        if msg_len < NLMSGHDR.size:
+            break
+        yield msg_type, flags, seq, data[offset + NLMSGHDR.size:offset + msg_len]
+        offset += _align(msg_len)
+
+def parse_neighbor(payload, if_cache=None):
+    """
+    RTM_NEWNEIGH/RTM_DELNEIGH yükünü komşu kaydına çevirir.
+
+    Args:
+        payload (bytes): ndmsg başlığı ve öznitelikler
+        if_cache (dict): Arayüz adı önbelleği
+
+    Returns:
+        dict: ip, mac, interface, state, family alanları veya None
+    """
+    if len(payload) < NDMSG.size:
+        return None
+
+    family, _pad1, _pad2, ifindex, state, _flags, _ntype = NDMSG.unpack_from(payload, 0)
+    attrs = parse_attributes(payload, NDMSG.size)
+
+    dst = attrs.get(NDA_DST)
+    if dst is None:
+        return None
+
+    lladdr = attrs.get(NDA_LLADDR)
+    return {
+        "ip": socket.inet_ntop(family, dst),
+        "mac": _format_mac(lladdr) if lladdr else None,
+        "interface": _interface_name(ifindex, if_cache if if_cache is not None else {}),
+        "state": state,
+        "family": family,
+    }
+
+def parse_route(payload, if_cache=None):
+    """
+    RTM_NEWROUTE yükünü yönlendirme kaydına çevirir.
+
+    Args:
+        payload (bytes): rtmsg başlığı ve öznitelikler
+        if_cache (dict): Arayüz adı önbelleği
+
+    Returns:
+        dict: dst, dst_len, gateway, interface, priority, table alanları veya None
+    """
+    if len(payload) < RTMSG.size:
+        return None
+
+    family, dst_len, _src_len, _tos, table, _proto, _scope, _rtype, _flags = RTMSG.unpack_from(payload, 0)
+    attrs = parse_attributes(payload, RTMSG.size)
+
+    # 8 bitlik tablo alanı yetmediğinde gerçek değer RTA_TABLE içindedir
+    if RTA_TABLE in attrs:
+        table = U32.unpack(attrs[RTA_TABLE])[0]
+
+    oif = attrs.get(RTA_OIF)
+    gateway = attrs.get(RTA_GATEWAY)
+    dst = attrs.get(RTA_DST)
+    priority = attrs.get(RTA_PRIORITY)
+
+    return {
+        "family": family,
+        "dst": socket.inet_ntop(family, dst) if dst else None,
+        "dst_len": dst_len,
+        "gateway": socket.inet_ntop(family, gateway) if gateway else None,
+        "interface": _interface_name(U32.unpack(oif)[0], if_cache if if_cache is not None else {}) if oif else None,
+        "priority": U32.unpack(priority)[0] if priority else 0,
+        "table": table,
+    }
+
+def neighbors_to_entries(neighbors):
+    """
+    Komşu kayıtlarını get_arp_table() sözlük formatına çevirir.
+
+    Args:
+        neighbors (list): parse_neighbor() çıktıları
+
+    Returns:
+        list: {"ip", "mac", "interface"} sözlükleri (çözülmemiş ve ARP'siz
+            arayüzlere ait kayıtlar /proc/net/arp ile tutarlı olması için atlanır)
+    """
+    return [{"ip": n["ip"], "mac": n["mac"], "interface": n["interface"]}
+            for n in neighbors
+            if n["mac"] and n["state"] & NUD_VALID and not n["state"] & NUD_NOARP]
+
+def find_default_route(routes):
+    """
+    Yönlendirme kayıtları arasından varsayılan ağ geçidini seçer.
+
+    Args:
+        routes (list): parse_route() çıktıları
+
+    Returns:
+        dict: En düşük metrikli varsayılan rota veya None
+    """
+    defaults = [r for r in routes
+                if r["dst_len"] == 0 and r["gateway"] and r["table"] == RT_TABLE_MAIN]
+    if not defaults:
+        return None
+    return min(defaults, key=lambda r: r["priority"])
+
+class RtnetlinkClient:
+    """NETLINK_ROUTE soketi üzerinden tablo dökümü alan istemci"""
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_ROUTE)
+        self.sock.bind((0, 0))
+        self.seq = 0
+        self.if_cache = {}
+        self._buffer = bytearray(RECV_BUFFER_SIZE)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Soketi kapatır"""
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+    def _dump(self, msg_type, body):
+        """Döküm isteği gönderir ve tüm cevap mesajlarının yüklerini toplar"""
+        self.seq += 1
+        seq = self.seq
+        header = NLMSGHDR.pack(NLMSGHDR.size + len(body), msg_type, NLM_F_REQUEST | NLM_F_DUMP, seq, 0)
+        self.sock.send(header + body)
+
+        payloads = []
+        view = memoryview(self._buffer)
+        while True:
+            nbytes = self.sock.recv_into(self._buffer)
+            for reply_type, _flags, reply_seq, payload in iter_messages(view[:nbytes]):
+                if reply_seq != seq:
+                    continue
+                if reply_type == NLMSG_DONE:
+                    return payloads
+                if reply_type == NLMSG_ERROR:
+                    error = -struct.unpack_from("=i", payload, 0)[0]
+                    if error:
+                        raise NetlinkError(error, os.strerror(error))
+                    return payloads
+                payloads.append((reply_type, bytes(payload)))
+
+    def dump_neighbors(self, family=socket.AF_INET):
+        """
+        Komşu tablosunun dökümünü alır (RTM_GETNEIGH).
+
+        Returns:
+            list: parse_neighbor() kayıtları
+        """
+        body = NDMSG.pack(family, 0, 0, 0, 0, 0, 0)
+        neighbors = []
+        for msg_type, payload in self._dump(RTM_GETNEIGH, body):
+            if msg_type == RTM_NEWNEIGH:
+                neighbor = parse_neighbor(payload, self.if_cache)
+                if neighbor:
+                    neighbors.append(neighbor)
+        return neighbors
+
+    def dump_routes(self, family=socket.AF_INET):
+        """
+        Yönlendirme tablosunun dökümünü alır (RTM_GETROUTE).
+
+        Returns:
+            list: parse_route() kayıtları
+        """
+        body = RTMSG.pack(family, 0, 0, 0, 0, 0, 0, 0, 0)
+        routes = []
+        for msg_type, payload in self._dump(RTM_GETROUTE, body):
+            if msg_type == RTM_NEWROUTE:
+                route = parse_route(payload, self.if_cache)
+                if route:
+                    routes.append(route)
+        return routes
+
+class NeighborEventListener:
+    """Çekirdeğin komşu tablosu değişiklik bildirimlerini (RTNLGRP_NEIGH) dinler"""
+    def __init__(self, groups=RTMGRP_NEIGH):
+        self.sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_ROUTE)
+        self.sock.bind((0, groups))
+        self.if_cache = {}
+        self._buffer = bytearray(RECV_BUFFER_SIZE)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def close(self):
+        """Soketi kapatır"""
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+    
+    def read_events(self, timeout=None):
+        """
+        Bekleyen komşu olaylarını okur.
+        
+        Args:
+            timeout (float): En fazla bekleme süresi (saniye), None ise süresiz
+            
+        Returns:
+            list: "event" alanı RTM_NEWNEIGH/RTM_DELNEIGH olan komşu kayıtları
+            
+        Raises:
+            NetlinkError: Soket tamponu taştıysa (ENOBUFS); olaylar kaçırılmıştır
+                ve çağıran taraf tabloyu yeniden okumalıdır
+        """
+        readable, _, _ = select.select([self.sock], [], [], timeout)
+        if not readable:
+            return []
+        
+        try:
+            nbytes = self.sock.recv_into(self._buffer)
+        except OSError as e:
+            if e.errno == errno.ENOBUFS:
+                raise NetlinkError(errno.ENOBUFS, "Netlink olay tamponu taştı")
+            raise
+        
+        events = []
+        for msg_type, _flags, _seq, payload in iter_messages(memoryview(self._buffer)[:nbytes]):
+            if msg_type not in (RTM_NEWNEIGH, RTM_DELNEIGH):
+                continue
+            neighbor = parse_neighbor(bytes(payload), self.if_cache)
+            if neighbor and neighbor["family"] == socket.AF_INET:
+                neighbor["event"] = msg_type
+                events.append(neighbor)
+        return events
+
+class RouteChangeListener(NeighborEventListener):
+    """Yönlendirme ve komşu değişikliklerini önbellek geçersiz kılma için izler"""
+    def __init__(self, groups=RTMGRP_NEIGH | RTMGRP_IPV4_ROUTE):
+        super().__init__(groups)
+        self.sock.setblocking(False)
+    
+    def drain(self):
+        """
+        Bekleyen tüm bildirimleri beklemeden okur.
+        
+        Returns:
+            tuple: (yönlendirme değişti mi, değişen komşu IP'leri kümesi)
+            
+        Raises:
+            NetlinkError: Soket tamponu taştıysa; bildirimler kaçırılmıştır
+        """
+        route_changed = False
+        neighbor_ips = set()
+        while True:
+            try:
+                nbytes = self.sock.recv_into(self._buffer)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                if e.errno == errno.ENOBUFS:
+                    raise NetlinkError(errno.ENOBUFS, "Netlink olay tamponu taştı")
+                raise
+            
+            for msg_type, _flags, _seq, payload in iter_messages(memoryview(self._buffer)[:nbytes]):
+                if msg_type in (RTM_NEWROUTE, RTM_DELROUTE):
+                    route_changed = True
+                elif msg_type in (RTM_NEWNEIGH, RTM_DELNEIGH):
+                    neighbor = parse_neighbor(bytes(payload), self.if_cache)
+                    if neighbor:
+                        neighbor_ips.add(neighbor["ip"])
+        return route_changed, neighbor_ips
+
+def is_available():
+    """Netlink desteğinin bulunup bulunmadığını kontrol eder"""
+    return hasattr(socket, "AF_NETLINK")
+
+def get_neighbor_table():
+    """
+    Komşu tablosunu netlink üzerinden alır.
+
+    Returns:
+        list: {"ip", "mac", "interface"} sözlükleri
+    """
+    with RtnetlinkClient() as client:
+        return neighbors_to_entries(client.dump_neighbors())
+
+def get_default_gateway():
+    """
+    Varsayılan ağ geçidini ve MAC adresini tek bir soket üzerinden bulur.
+
+    Returns:
+        dict: Ağ geçidi IP ve MAC adresi ("Bilinmiyor" olabilir)
+    """
+    with RtnetlinkClient() as client:
+        route = find_default_route(client.dump_routes())
+        if route is None:
+            logger.warning("Netlink: varsayılan rota bulunamadı")
+            return {"ip": "Bilinmiyor", "mac": "Bilinmiyor"}
+
+        gateway_ip = route["gateway"]
+        for neighbor in client.dump_neighbors():
+            if neighbor["ip"] == gateway_ip and neighbor["mac"] and neighbor["state"] & NUD_VALID:
+                return {"ip": gateway_ip, "mac": neighbor["mac"]}
+
+        logger.warning(f"Netlink: gateway MAC adresi bulunamadı, sadece IP kullanılıyor: {gateway_ip}")
+        return {"ip": gateway_ip, "mac": "Bilinmiyor"}
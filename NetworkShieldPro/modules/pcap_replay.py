@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Çevrimdışı Yakalama Dosyası Oynatma Modülü
+Bu modül, pcap ve pcapng dosyalarını belleğe yüklemeden (mmap ile) akış
+halinde okuyup ARP paketlerini canlı paket izlemeyle aynı akış dedektöründen
+(StreamingARPDetector) paket paket yeniden geçirir.
+"""
+
+import os
+import mmap
+import time
+import struct
+import socket
+import logging
+
+from modules.arp_sniffer import (ETH_P_ARP, ETH_P_IP, ARPHRD_ETHER, ETH_ARP_FRAME, StreamingARPDetector,
+                                 decode_arp_frame, _mac)
+
+# Loglama
+logger = logging.getLogger("V-ARP.pcap_replay")
+
+# Klasik pcap sabitleri
+PCAP_MAGIC_US = 0xa1b2c3d4
+PCAP_MAGIC_NS = 0xa1b23c4d
+PCAP_GLOBAL_HEADER_SIZE = 24
+
+# pcapng blok tipleri
+PCAPNG_SHB = 0x0A0D0D0A
+PCAPNG_IDB = 0x00000001
+PCAPNG_OPB = 0x00000002
+PCAPNG_SPB = 0x00000003
+PCAPNG_EPB = 0x00000006
+PCAPNG_BYTE_ORDER_MAGIC = 0x1A2B3C4D
+
+# pcapng seçenek kodları
+OPT_ENDOFOPT = 0
+IF_NAME = 2
+IF_TSRESOL = 9
+
+LINKTYPE_ETHERNET = 1
+
+# Ethernet tipi + ARP başlığının gönderen kısmı (ofset 12)
+ARP_SENDER = struct.Struct("!HHHBBH6s4s")
+
+# İşlenen bölgenin sayfaları bu aralıklarla çekirdeğe geri verilir (çok GB'lık dosyalarda RSS sınırı)
+RECLAIM_CHUNK = 64 * 1024 * 1024
+
+# MAC taşkını içeren yakalamalarda önbelleğin sınırsız büyümesini önler
+SENDER_CACHE_SIZE = 65536
+
+# Çözümleme önbelleğinde eksik kaydı işaretler (ARP olmayan çerçeveler None ile saklanır)
+_MISSING = object()
+
+def _open_mapping(path):
+    """Dosyayı salt okunur olarak belleğe eşler"""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return None
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # Sıralı okuma ipucu: çekirdek önden okur ve okunan sayfaları erken bırakabilir
+    if hasattr(mapping, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+        mapping.madvise(mmap.MADV_SEQUENTIAL)
+    return mapping
+
+def _reclaim(mapping, start, offset):
+    """İşlenmiş, sayfa hizalı bölgeyi MADV_DONTNEED ile bırakır; yeni başlangıcı döndürür"""
+    end = offset - offset % mmap.PAGESIZE
+    if end > start and hasattr(mapping, "madvise") and hasattr(mmap, "MADV_DONTNEED"):
+        mapping.madvise(mmap.MADV_DONTNEED, start, end - start)
+    return max(start, end)
+
+def _iter_pcap(mapping, view, endian):
+    """Klasik pcap kayıtlarını döndürür"""
+    magic = struct.unpack_from(endian + "I", view, 0)[0]
+    divisor = 1e9 if magic == PCAP_MAGIC_NS else 1e6
+    linktype = struct.unpack_from(endian + "I", view, 20)[0]
+    if linktype != LINKTYPE_ETHERNET:
+        raise ValueError(f"Desteklenmeyen bağlantı tipi: {linktype}")
+
+    record = struct.Struct(endian + "IIII")
+    offset = PCAP_GLOBAL_HEADER_SIZE
+    end = len(view)
+    released = 0
+    while offset + record.size <= end:
+        ts_sec, ts_frac, incl_len, _orig_len = record.unpack_from(view, offset)
+        offset += record.size
+        if offset + incl_len > end:
+            break
+        yield ts_sec + ts_frac / divisor, "unknown", view[offset:offset + incl_len]
+        offset += incl_len
+        if offset - released >= RECLAIM_CHUNK:
+            released = _reclaim(mapping, released, offset)
+
+def _parse_idb_options(view, offset, end, endian):
+    """Arayüz tanım bloğunun seçeneklerinden ad ve zaman çözünürlüğünü okur"""
+    name = None
+    divisor = 1e6
+    option = struct.Struct(endian + "HH")
+    while offset + option.size <= end:
+        code, length = option.unpack_from(view, offset)
+        offset += option.size
+        if code == OPT_ENDOFOPT:
+            break
+        value = view[offset:offset + length]
+        if code == IF_NAME:
+            name = bytes(value).rstrip(b"\0").decode("utf-8", errors="replace")
+        elif code == IF_TSRESOL and length >= 1:
+            resolution = value[0]
+            # En yüksek bit 1 ise 2'nin kuvveti, değilse 10'un kuvveti
+            divisor = float(2 ** (resolution & 0x7f)) if resolution & 0x80 else float(10 ** resolution)
+        offset += (length + 3) & ~3
+    return name, divisor
+
+def _iter_pcapng(mapping, view):
+    """pcapng bloklarındaki Ethernet çerçevelerini döndürür"""
+    offset = 0
+    end = len(view)
+    released = 0
+    endian = "<"
+    interfaces = []  # (ad, bağlantı tipi, zaman bölen) - bölüm başına
+
+    while offset + 12 <= end:
+        # SHB tipi iki bayt sırasında da aynıdır; diğer bloklar bölümün bayt sırasıyla okunur
+        block_type = struct.unpack_from(endian + "I", view, offset)[0]
+
+        if block_type == PCAPNG_SHB:
+            # Her bölüm kendi bayt sırasını ve arayüz listesini tanımlar
+            if struct.unpack_from("<I", view, offset + 8)[0] == PCAPNG_BYTE_ORDER_MAGIC:
+                endian = "<"
+            elif struct.unpack_from(">I", view, offset + 8)[0] == PCAPNG_BYTE_ORDER_MAGIC:
+                endian = ">"
+            else:
+                logger.warning(f"pcapng bölümünün bayt sırası tanınmadı (ofset {offset}), okuma durduruldu")
+                break
+            interfaces = []
+
+        block_len = struct.unpack_from(endian + "I", view, offset + 4)[0]
+        if block_len < 12 or offset + block_len > end:
+            break
+        body = offset + 8
+        block_end = offset + block_len - 4
+
+        if block_type == PCAPNG_IDB:
+            linktype = struct.unpack_from(endian + "H", view, body)[0]
+            name, divisor = _parse_idb_options(view, body + 8, block_end, endian)
+            interfaces.append((name or f"if{len(interfaces)}", linktype, divisor))
+
+        elif block_type in (PCAPNG_EPB, PCAPNG_OPB):
+            if block_type == PCAPNG_EPB:
+                if_id, ts_high, ts_low, cap_len, _orig = struct.unpack_from(endian + "IIIII", view, body)
+            else:
+                if_id, _drops, ts_high, ts_low, cap_len, _orig = struct.unpack_from(endian + "HHIIII", view, body)
+            if if_id < len(interfaces):
+                name, linktype, divisor = interfaces[if_id]
+                if linktype == LINKTYPE_ETHERNET:
+                    data = body + 20
+                    yield ((ts_high << 32) | ts_low) / divisor, name, view[data:data + cap_len]
+
+        elif block_type == PCAPNG_SPB and interfaces:
+            orig_len = struct.unpack_from(endian + "I", view, body)[0]
+            name, linktype, _divisor = interfaces[0]
+            if linktype == LINKTYPE_ETHERNET:
+                cap_len = min(orig_len, block_len - 16)
+                yield 0.0, name, view[body + 4:body + 4 + cap_len]
+
+        offset += block_len
+        if offset - released >= RECLAIM_CHUNK:
+            released = _reclaim(mapping, released, offset)
+
+def iter_capture_frames(path):
+    """
+    pcap veya pcapng dosyasındaki Ethernet çerçevelerini sırayla döndürür.
+
+    Dosya mmap ile eşlenir; çerçeveler kopyalanmadan memoryview dilimi olarak
+    verilir; işlenen bölgeler düzenli olarak bırakıldığından çok GB'lık
+    dosyalar RAM'e yüklenmez.
+
+    Args:
+        path (str): Yakalama dosyası yolu
+
+    Yields:
+        tuple: (zaman_damgası, arayüz_adı, çerçeve_memoryview)
+    """
+    mapping = _open_mapping(path)
+    if mapping is None:
+        return
+
+    view = memoryview(mapping)
+    try:
+        magic_le = struct.unpack_from("<I", view, 0)[0]
+        magic_be = struct.unpack_from(">I", view, 0)[0]
+        if magic_le == PCAPNG_SHB:
+            frames = _iter_pcapng(mapping, view)
+        elif magic_le in (PCAP_MAGIC_US, PCAP_MAGIC_NS):
+            frames = _iter_pcap(mapping, view, "<")
+        elif magic_be in (PCAP_MAGIC_US, PCAP_MAGIC_NS):
+            frames = _iter_pcap(mapping, view, ">")
+        else:
+            raise ValueError(f"Tanınmayan yakalama dosyası formatı: {path}")
+
+        yield from frames
+    finally:
+        try:
+            view.release()
+            mapping.close()
+        except BufferError:
+            # Çağıran hâlâ çerçeve dilimi tutuyor; eşleme çöp toplayıcıyla kapanır
+            logger.debug(f"Eşleme açık bırakıldı, dışarıda çerçeve görünümü var: {path}")
+
+def iter_arp_entries(path):
+    """
+    Yakalama dosyasındaki ARP paketlerini get_arp_table() kayıt formatına çevirir.
+
+    Args:
+        path (str): Yakalama dosyası yolu
+
+    Yields:
+        tuple: (zaman_damgası, {"ip", "mac", "interface"} kaydı)
+    """
+    # Aynı gönderen baytları tekrar tekrar geldiği için metin çevrimleri önbelleğe alınır
+    senders = {}
+    for timestamp, interface, frame in iter_capture_frames(path):
+        if len(frame) < 12 + ARP_SENDER.size:
+            frame.release()
+            continue
+        ethertype, htype, ptype, hlen, plen, _op, sha, spa = ARP_SENDER.unpack_from(frame, 12)
+        frame.release()
+        if ethertype != ETH_P_ARP or htype != ARPHRD_ETHER or ptype != ETH_P_IP or hlen != 6 or plen != 4:
+            continue
+        # 0.0.0.0 gönderen (ARP probe) bir IP-MAC bağlaması bildirmez
+        if spa == b"\0\0\0\0":
+            continue
+
+        sender = senders.get((sha, spa))
+        if sender is None:
+            if len(senders) >= SENDER_CACHE_SIZE:
+                senders.clear()
+            sender = senders[(sha, spa)] = (socket.inet_ntoa(spa), _mac(sha))
+        yield timestamp, {"ip": sender[0], "mac": sender[1], "interface": interface}
+
+def iter_arp_packets(path):
+    """
+    Yakalama dosyasındaki ARP paketlerini çözümler.
+
+    Aynı paket baytları (Ethernet kaynağı ve ARP başlığı) tekrar tekrar geldiği
+    için çözümlenmiş paketler önbelleğe alınır.
+
+    Args:
+        path (str): Yakalama dosyası yolu
+
+    Yields:
+        tuple: (zaman_damgası, arayüz_adı, ArpPacket)
+    """
+    packets = {}
+    for timestamp, interface, frame in iter_capture_frames(path):
+        if len(frame) < ETH_ARP_FRAME.size:
+            frame.release()
+            continue
+        # Hedef MAC (yayın veya tek hedef) paketi değiştirmez, anahtara dahil edilmez
+        key = frame[6:ETH_ARP_FRAME.size].tobytes()
+        packet = packets.get(key, _MISSING)
+        if packet is _MISSING:
+            packet = decode_arp_frame(frame)
+            if len(packets) >= SENDER_CACHE_SIZE:
+                packets.clear()
+            packets[key] = packet
+        frame.release()
+        if packet is not None:
+            yield timestamp, interface, packet
+
+def replay_capture(path, gateway=None, on_alerts=None, detector=None):
+    """
+    Yakalama dosyasını tespit kurallarından paket paket geçirir.
+
+    Paketler canlı paket izlemeyle aynı StreamingARPDetector'a verilir; böylece
+    ağ geçidi/IP-MAC değişimi, gönderen uyuşmazlığı ve gratuitous ARP fırtınası
+    kuralları geçmiş trafiğe de uygulanır.
+
+    Args:
+        path (str): Yakalama dosyası yolu
+        gateway (dict): Olay anındaki ağ geçidi ({"ip", "mac"})
+        on_alerts (callable): (zaman_damgası, şüpheli_durumlar) ile çağrılır
+        detector (StreamingARPDetector): Önceden durumu yüklenmiş dedektör;
+            verilmezse boş durumla oluşturulur
+
+    Returns:
+        dict: events (işlenen ARP paketi), alerts (tüm şüpheli durumlar),
+            arp_table (son durum) ve duration (saniye)
+    """
+    if detector is None:
+        detector = StreamingARPDetector(gateway=gateway)
+    process = detector.process
+    alerts = []
+    events = 0
+    start_time = time.perf_counter()
+
+    for timestamp, interface, packet in iter_arp_packets(path):
+        events += 1
+        found = process(packet, timestamp, interface)
+        if found:
+            for alert in found:
+                alert["timestamp"] = timestamp
+            alerts.extend(found)
+            if on_alerts:
+                on_alerts(timestamp, found)
+
+    return {
+        "events": events,
+        "alerts": alerts,
+        "arp_table": detector.arp_table(),
+        "duration": time.perf_counter() - start_time,
+    }
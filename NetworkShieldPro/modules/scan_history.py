@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Bellek İçi Tarama Geçmişi Modülü
+Bu modül, tarama sonuçlarını sınırlı bir halka tamponunda (deque) tutan
+ScanHistoryBuffer tipini içerir. ARP tabloları her N taramada bir tam
+görüntü, arada ise bir önceki taramaya göre fark olarak saklanır. Tutma
+süresi tarama sayısı, yaş veya bayt sınırıyla belirlenir. Anahtar kareler
+içerik özetine göre paylaşılır: aynı tabloyu gören taramalar tek nesneye
+başvurur.
+
+HistoryStore ile aynı arayüzü sağlar; SQLite kullanılamadığında veya
+"history_backend" ayarı "memory" olduğunda onun yerine kullanılır.
+"""
+
+import time
+import logging
+import threading
+from collections import deque, Counter
+
+from modules.arp_table import ArpTable, SnapshotPool
+from modules.history_store import HISTORY_PAGE_SIZE, ScanHistoryView
+
+# Loglama
+logger = logging.getLogger("V-ARP.scan_history")
+
+# Varsayılan saklama sınırları
+HISTORY_BUFFER_MAX_SCANS = 100
+HISTORY_KEYFRAME_INTERVAL = 10
+
+# ARP tablosu dışındaki sonuç alanları için kayıt başına yaklaşık bayt
+RESULT_OVERHEAD_BYTES = 512
+ENTRY_OVERHEAD_BYTES = 256
+
+KEYFRAME = 0
+DELTA = 1
+
+# Önceki taramayla aynı tablo için paylaşılan boş fark
+EMPTY_DELTA = (ArpTable(), ArpTable())
+
+def _rows(table):
+    """Tablo satırlarını (ip, mac, arayüz) çoklu kümesi olarak döndürür"""
+    return Counter(zip(table.ips, table.macs, table.ifaces))
+
+def _table_from_rows(rows):
+    """Çoklu kümeden ArpTable oluşturur"""
+    table = ArpTable()
+    for ip, mac, interface in rows.elements():
+        table.append_packed(ip, mac, interface)
+    return table
+
+class ScanHistoryBuffer:
+    """
+    Sabit bellek sınırlı tarama geçmişi.
+
+    Ekleme ve en eskiyi çıkarma deque üzerinde O(1)'dir. ARP tablosu yalnızca
+    anahtar karelerde tam olarak tutulur; diğer taramalar önceki taramaya göre
+    eklenen/silinen satırları saklar ve istendiğinde yeniden oluşturulur.
+    """
+    def __init__(self, max_scans=HISTORY_BUFFER_MAX_SCANS, max_age=None, max_bytes=None,
+                 keyframe_interval=HISTORY_KEYFRAME_INTERVAL, pool=None):
+        self.max_scans = max_scans
+        self.max_age = max_age        # saniye
+        self.max_bytes = max_bytes
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._lock = threading.RLock()
+        self.pool = pool if pool is not None else SnapshotPool()
+        self._records = deque()       # (sonuç alanları, tür, yük, bayt); anahtar karenin yükü özettir
+        self._snapshots = {}          # özet -> [ArpTable, başvuru sayısı]
+        self._first_id = 1
+        self._next_id = 1
+        self._since_keyframe = 0
+        self._last_table = None       # Son taramanın tablosu (fark hesabı için)
+        self._last_digest = None
+        self._high_threats = 0
+        self.nbytes = 0
+
+    def close(self):
+        """HistoryStore ile uyumluluk için; bellek içi geçmişte yapılacak iş yok"""
+
+    def _estimate_bytes(self, meta, payload):
+        """Kaydın yaklaşık bellek kullanımı (paylaşılan anahtar kare tabloları hariç)"""
+        size = RESULT_OVERHEAD_BYTES
+        size += ENTRY_OVERHEAD_BYTES * (len(meta.get("suspicious_entries", [])) + len(meta.get("changes") or []))
+        if isinstance(payload, str):
+            return size
+        removed, added = payload
+        return size + removed.nbytes + added.nbytes
+
+    def _acquire(self, digest, table):
+        """Anahtar kare tablosuna başvuru ekler; tablo ilk kez tutuluyorsa bayt hesabına katar"""
+        snapshot = self._snapshots.get(digest)
+        if snapshot is None:
+            self._snapshots[digest] = [table, 1]
+            self.nbytes += table.nbytes
+        else:
+            snapshot[1] += 1
+
+    def _release(self, digest):
+        """Anahtar kare tablosuna başvuruyu bırakır; başvuru kalmazsa tablo silinir"""
+        snapshot = self._snapshots[digest]
+        snapshot[1] -= 1
+        if snapshot[1] == 0:
+            del self._snapshots[digest]
+            self.nbytes -= snapshot[0].nbytes
+
+    def add_scan(self, result):
+        """
+        Tarama sonucunu ekler ve saklama sınırlarını uygular.
+
+        Returns:
+            int: Taramanın geçmişteki kimliği
+        """
+        digest, table = self.pool.intern(result.get("arp_table", []), result.get("arp_snapshot"))
+        # Durum indeksi türetilmiş veridir; geçmişte tutulmaz, gerektiğinde yeniden oluşturulur
+        meta = {key: value for key, value in result.items() if key not in ("arp_table", "scan_id", "status_index")}
+        meta["arp_snapshot"] = digest
+
+        with self._lock:
+            scan_id = self._next_id
+            self._next_id += 1
+            meta["scan_id"] = scan_id
+
+            if digest in self._snapshots or self._last_table is None \
+                    or self._since_keyframe + 1 >= self.keyframe_interval:
+                # Tutulan bir anahtar kareyle aynı tablo yeniden saklanmaz, yalnızca özete başvurulur
+                kind, payload = KEYFRAME, digest
+                self._acquire(digest, table)
+                self._since_keyframe = 0
+            elif digest == self._last_digest:
+                kind, payload = DELTA, EMPTY_DELTA
+                self._since_keyframe += 1
+            else:
+                # Yalnızca önceki taramaya göre değişen satırlar saklanır; satır kümeleri
+                # geçicidir, kalıcı olarak yalnızca kompakt tablolar tutulur
+                kind = DELTA
+                previous, rows = _rows(self._last_table), _rows(table)
+                payload = (_table_from_rows(previous - rows), _table_from_rows(rows - previous))
+                self._since_keyframe += 1
+
+            size = self._estimate_bytes(meta, payload)
+            self._records.append((meta, kind, payload, size))
+            self.nbytes += size
+            self._high_threats += self._count_high(meta)
+            self._last_table = table
+            self._last_digest = digest
+
+            self._evict(result.get("timestamp", time.time()))
+        return scan_id
+
+    @staticmethod
+    def _count_high(meta):
+        return sum(1 for entry in meta.get("suspicious_entries", []) if entry.get("threat_level") == "high")
+
+    def _over_limit(self, now):
+        """En eski kaydın saklama sınırlarından birini aşıp aşmadığını kontrol eder"""
+        records = self._records
+        if self.max_scans and len(records) > self.max_scans:
+            return True
+        if self.max_age is not None and records[0][0].get("timestamp", now) < now - self.max_age:
+            return True
+        return self.max_bytes is not None and self.nbytes > self.max_bytes
+
+    def _evict(self, now):
+        """Sınırları aşan en eski kayıtları çıkarır (en son tarama her zaman tutulur)"""
+        while len(self._records) > 1 and self._over_limit(now):
+            self._pop_oldest()
+
+    def _pop_oldest(self):
+        """En eski kaydı (her zaman anahtar kare) çıkarır; ardından gelen fark kaydını anahtar kareye çevirir"""
+        meta, _kind, digest, size = self._records.popleft()
+        self._first_id += 1
+        self.nbytes -= size
+        self._high_threats -= self._count_high(meta)
+
+        if self._records and self._records[0][1] == DELTA:
+            next_meta, _kind, (removed, added), next_size = self._records[0]
+            next_digest = next_meta["arp_snapshot"]
+            snapshot = self._snapshots.get(next_digest)
+            table = snapshot[0] if snapshot is not None else self.pool.get(next_digest)
+            if table is None:
+                rows = _rows(self._snapshots[digest][0])
+                rows.subtract(_rows(removed))
+                rows.update(_rows(added))
+                table = self.pool.intern(_table_from_rows(+rows), next_digest)[1]
+            self._acquire(next_digest, table)
+            new_size = self._estimate_bytes(next_meta, next_digest)
+            self._records[0] = (next_meta, KEYFRAME, next_digest, new_size)
+            self.nbytes += new_size - next_size
+
+        self._release(digest)
+
+    def _rows_at(self, position):
+        """Verilen konumdaki taramanın satırlarını en yakın anahtar kareden yeniden oluşturur"""
+        start = position
+        while self._records[start][1] != KEYFRAME:
+            start -= 1
+
+        rows = _rows(self._snapshots[self._records[start][2]][0])
+        for index in range(start + 1, position + 1):
+            removed, added = self._records[index][2]
+            rows.subtract(_rows(removed))
+            rows.update(_rows(added))
+        return +rows
+
+    def _materialize(self, position, include_arp_table):
+        """Konumdaki kaydı tam tarama sonucu sözlüğüne çevirir"""
+        meta = self._records[position][0]
+        result = dict(meta)
+        if include_arp_table:
+            digest = meta["arp_snapshot"]
+            snapshot = self._snapshots.get(digest)
+            table = snapshot[0] if snapshot is not None else self.pool.get(digest)
+            if table is None:
+                table = self.pool.intern(_table_from_rows(self._rows_at(position)), digest)[1]
+            result["arp_table"] = table
+        return result
+
+    def count(self):
+        """Tutulan tarama sayısı"""
+        return len(self._records)
+
+    def page(self, offset=0, limit=HISTORY_PAGE_SIZE, newest_first=True, include_arp_table=True):
+        """Geçmişin bir sayfasını döndürür (HistoryStore.page ile aynı)"""
+        with self._lock:
+            total = len(self._records)
+            positions = range(offset, min(total, offset + limit))
+            if newest_first:
+                positions = [total - 1 - index for index in positions]
+            return [self._materialize(position, include_arp_table) for position in positions]
+
+    def _page_after(self, last_id, limit, newest_first):
+        """Kimliğe göre sayfalama; kimlikler ardışık olduğundan konum doğrudan hesaplanır"""
+        with self._lock:
+            total = len(self._records)
+            if newest_first:
+                end = min(total, last_id - self._first_id)
+                positions = range(end - 1, max(-1, end - 1 - limit), -1)
+            else:
+                start = max(0, last_id - self._first_id + 1)
+                positions = range(start, min(total, start + limit))
+            return [self._materialize(position, True) for position in positions]
+
+    def last(self):
+        """En son tarama sonucu (yoksa None)"""
+        results = self.page(0, 1)
+        return results[0] if results else None
+
+    def statistics(self):
+        """Geçmiş özetini O(1) döndürür"""
+        with self._lock:
+            records = self._records
+            return {
+                "total_scans": len(records),
+                "high_threats": self._high_threats,
+                "first_timestamp": records[0][0].get("timestamp") if records else None,
+                "last_timestamp": records[-1][0].get("timestamp") if records else None
+            }
+
+    def clear(self):
+        """Tüm geçmişi siler"""
+        with self._lock:
+            self._records.clear()
+            self._snapshots.clear()
+            self._first_id = self._next_id
+            self._since_keyframe = 0
+            self._last_table = None
+            self._last_digest = None
+            self._high_threats = 0
+            self.nbytes = 0
+
+    def history(self):
+        """Geçmişin liste benzeri görünümü"""
+        return ScanHistoryView(self)
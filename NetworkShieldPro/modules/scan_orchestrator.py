@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tarama Orkestrasyon Modülü
+Bu modül, çok arayüzlü (multi-homed, VLAN alt arayüzlü) sistemlerde taramayı
+arayüzlere bölen ve arayüz başına toplama ile tespiti bir iş parçacığı
+havuzunda paralel yürüten ScanOrchestrator tipini içerir. Toplam süre en
+yavaş arayüzle sınırlıdır; tarama ARPScanner'ın stop_event sinyaliyle iptal
+edilebilir.
+"""
+
+import os
+import time
+import socket
+import struct
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from modules.arp_table import ArpTable, intern_interface, interface_name, pack_ip, unpack_mac
+from modules.arp_detector import ARPStateTracker, GatewayResolver, PROC_NET_ROUTE, get_arp_table, _threat_level_of
+
+# Loglama
+logger = logging.getLogger("V-ARP.scan_orchestrator")
+
+# Havuzdaki en fazla iş parçacığı (arayüz işleri çoğunlukla G/Ç bekler)
+SCAN_MAX_WORKERS = 16
+
+# İptal sinyalinin kontrol aralığı (saniye)
+CANCEL_POLL_INTERVAL = 0.2
+
+# /proc/net/route bayrakları
+RTF_UP = 0x1
+RTF_GATEWAY = 0x2
+
+UNKNOWN_GATEWAY = {"ip": "Bilinmiyor", "mac": "Bilinmiyor"}
+
+def parse_proc_net_route(data):
+    """
+    /proc/net/route içeriğinden varsayılan rotaları çıkarır.
+
+    Args:
+        data (str): Dosya içeriği
+
+    Returns:
+        list: (arayüz, ağ_geçidi_ip, metrik) demetleri
+    """
+    routes = []
+    for line in data.splitlines()[1:]:
+        fields = line.split()
+        if len(fields) < 8:
+            continue
+        try:
+            destination, gateway, flags, metric = int(fields[1], 16), int(fields[2], 16), int(fields[3], 16), int(fields[6])
+            mask = int(fields[7], 16)
+        except ValueError:
+            continue
+        if destination == 0 and mask == 0 and flags & RTF_UP and flags & RTF_GATEWAY:
+            # Adresler ağ bayt sırasıyla, küçük uçlu onaltılık olarak yazılır
+            routes.append((fields[0], socket.inet_ntoa(struct.pack("<I", gateway)), metric))
+    return routes
+
+def read_default_routes(route_path=PROC_NET_ROUTE):
+    """
+    Arayüz başına varsayılan ağ geçitlerini okur.
+
+    Linux'ta netlink rota dökümü, olmazsa /proc/net/route kullanılır.
+
+    Returns:
+        dict: arayüz adı -> (ağ_geçidi_ip, metrik); her arayüz için en düşük metrikli rota
+    """
+    routes = None
+    if os.name != 'nt':
+        try:
+            from modules import netlink
+            if netlink.is_available():
+                with netlink.RtnetlinkClient() as client:
+                    routes = [(r["interface"], r["gateway"], r["priority"]) for r in client.dump_routes()
+                              if r["dst_len"] == 0 and r["gateway"] and r["table"] == netlink.RT_TABLE_MAIN]
+        except OSError as e:
+            logger.debug(f"Netlink ile rotalar okunamadı, {route_path} deneniyor: {e}")
+
+    if routes is None:
+        try:
+            with open(route_path, encoding="ascii", errors="replace") as f:
+                routes = parse_proc_net_route(f.read())
+        except OSError as e:
+            logger.debug(f"Rota tablosu okunamadı: {e}")
+            routes = []
+
+    defaults = {}
+    for interface, gateway_ip, metric in routes:
+        if interface not in defaults or metric < defaults[interface][1]:
+            defaults[interface] = (gateway_ip, metric)
+    return defaults
+
+class RouteResolver(GatewayResolver):
+    """
+    Arayüz başına varsayılan rotaların önbelleği.
+
+    Rotalar her taramada yeniden dökülmez; önbellek TTL dolduğunda veya
+    RouteChangeListener (netlink yoksa /proc/net/route içeriği) bir rota
+    değişikliği bildirdiğinde yeniden okunur. Komşu değişiklikleri rotaları
+    etkilemez.
+
+    get() read_default_routes() ile aynı sözlüğü döndürür.
+    """
+    def _changed(self):
+        if self._listener is not None:
+            route_changed, _neighbor_ips = self._drain()
+            return route_changed
+        return super()._changed()
+
+    def _resolve(self):
+        return read_default_routes(self.route_path)
+
+def _gateway_in(table, gateway_ip):
+    """Ağ geçidinin MAC adresini arayüz tablosunda arar"""
+    try:
+        indices = table.indices_for_ip(pack_ip(gateway_ip))
+    except (OSError, TypeError):
+        indices = []
+    mac = unpack_mac(table.macs[indices[0]]) if indices else "Bilinmiyor"
+    return {"ip": gateway_ip, "mac": mac}
+
+class ScanOrchestrator:
+    """
+    Arayüz başına paralel tarama yürütücüsü.
+
+    Çekirdek tablosu tek dökümle okunup arayüzlere bölünür; her arayüzün ek
+    toplayıcıları (ör. aktif ARP taraması) ve tespit kuralları ayrı bir işte,
+    o arayüzün kendi ağ geçidi ve durum takipçisiyle çalışır. Sonuçlar
+    arayüz başına tehdit seviyeleriyle birleştirilir.
+
+    Ek toplayıcılar collector(arayüz, ağ_geçidi_ip, stop_event) imzasıyla
+    çağrılır ve {"ip", "mac", "interface"} kayıtları döndürür.
+    """
+    def __init__(self, max_workers=SCAN_MAX_WORKERS, collectors=None, table_reader=get_arp_table,
+                 route_reader=None):
+        self.max_workers = max_workers
+        self.collectors = list(collectors or [])
+        self.table_reader = table_reader
+        # Verilmezse rotalar değişiklik bildirimleriyle geçersiz kılınan önbellekten okunur
+        self.route_resolver = None
+        if route_reader is None:
+            self.route_resolver = RouteResolver()
+            route_reader = self.route_resolver.get
+        self.route_reader = route_reader
+        self.trackers = {}  # arayüz adı -> ARPStateTracker (taramalar arası durum)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def add_collector(self, collector):
+        """Arayüz başına çağrılacak ek kayıt toplayıcısını ekler"""
+        self.collectors.append(collector)
+
+    def _get_executor(self):
+        """İş parçacığı havuzunu ilk taramada oluşturur (taramalar arasında yeniden kullanılır)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="varp-scan")
+        return self._executor
+
+    def _collect_interface(self, name, table, gateway, stop_event):
+        """
+        Tek arayüzün toplama işi (havuz iş parçacığında çalışır).
+
+        Returns:
+            dict: arp_table, gateway, errors ve duration; iptal edildiyse None
+        """
+        start_time = time.time()
+        errors = []
+
+        for collector in self.collectors:
+            if stop_event.is_set():
+                return None
+            try:
+                entries = collector(name, gateway["ip"], stop_event)
+            except Exception as e:
+                logger.error(f"{name} arayüzünde toplayıcı hatası: {e}")
+                errors.append(str(e))
+                continue
+            if entries:
+                # Çekirdek tablosunda zaten bulunan kayıtlar tekrarlanmaz (yanlış çoklu IP uyarısı olmasın)
+                table = table.merged(entries)
+
+        if stop_event.is_set():
+            return None
+
+        if gateway["mac"] == "Bilinmiyor" and gateway["ip"] != "Bilinmiyor":
+            gateway = _gateway_in(table, gateway["ip"])
+
+        return {"arp_table": table, "gateway": gateway, "errors": errors, "duration": time.time() - start_time}
+
+    @staticmethod
+    def _detect_interface(name, collected, tracker):
+        """Tek arayüzün tespit işi; arayüzün durum takipçisini günceller (havuz iş parçacığında çalışır)"""
+        start_time = time.time()
+        table, gateway = collected["arp_table"], collected["gateway"]
+
+        changes, suspicious = tracker.update(table, gateway)
+        for entry in suspicious:
+            entry["interface"] = name
+        for change in changes:
+            change["interface"] = name
+
+        report = {
+            "arp_table": table,
+            "gateway": gateway,
+            "suspicious_entries": suspicious,
+            "changes": changes,
+            "threat_level": _threat_level_of(suspicious),
+            "duration": collected["duration"] + time.time() - start_time
+        }
+        if collected["errors"]:
+            report["errors"] = collected["errors"]
+        return report
+
+    def _plan(self, table, default_gateway):
+        """Tabloyu arayüzlere böler ve her arayüzün ağ geçidini belirler"""
+        parts = {interface_name(index): part for index, part in table.split_by_interface().items()}
+        routes = self.route_reader()
+
+        # Kendi tablosunda kaydı olmayan ama rotası olan arayüzler de taranır (toplayıcılar için)
+        for name in routes:
+            if name not in parts:
+                parts[name] = ArpTable()
+
+        plan = {}
+        for name, part in parts.items():
+            if name in routes:
+                gateway = _gateway_in(part, routes[name][0])
+            elif default_gateway and part.indices_for_ip(self._packed(default_gateway.get("ip"))):
+                # Rota bilgisi olmayan platformlarda genel ağ geçidi kendi arayüzüne atanır
+                gateway = dict(default_gateway)
+            else:
+                gateway = dict(UNKNOWN_GATEWAY)
+            plan[name] = (part, gateway)
+        return plan, routes
+
+    @staticmethod
+    def _packed(ip):
+        """IP'nin tamsayı karşılığı (geçersizse -1, hiçbir kayıtla eşleşmez)"""
+        try:
+            return pack_ip(ip)
+        except (OSError, TypeError):
+            return -1
+
+    def scan(self, stop_event=None, default_gateway=None):
+        """
+        Tüm arayüzleri paralel tarar.
+
+        Önce tüm arayüzlerin kayıtları toplanır; durum takipçileri yalnızca
+        toplama iptal edilmeden tamamlandıktan sonra güncellenir, böylece
+        iptal edilen tarama takipçilerde iz bırakmaz.
+
+        Args:
+            stop_event (threading.Event): Ayarlandığında bekleyen işler iptal edilir
+            default_gateway (dict): Rota tablosu okunamazsa kullanılacak genel ağ geçidi
+
+        Returns:
+            dict: {"arp_table", "gateway", "suspicious_entries", "changes", "interfaces"}
+                veya tarama iptal edildiyse None
+        """
+        stop_event = stop_event or threading.Event()
+
+        with self._lock:
+            plan, routes = self._plan(self.table_reader(), default_gateway)
+
+            executor = self._get_executor()
+            futures = {executor.submit(self._collect_interface, name, part, gateway, stop_event): name
+                       for name, (part, gateway) in plan.items()}
+
+            pending = set(futures)
+            while pending:
+                if stop_event.is_set():
+                    for future in pending:
+                        future.cancel()
+                    logger.info(f"Tarama iptal edildi ({len(pending)} arayüz tamamlanmadı)")
+                    return None
+                _done, pending = wait(pending, timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+
+            collected = {}
+            for future, name in futures.items():
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"{name} arayüzü taranırken hata: {e}")
+                    part, gateway = plan[name]
+                    result = {"arp_table": part, "gateway": gateway, "errors": [str(e)], "duration": 0.0}
+                if result is None:
+                    logger.info("Tarama iptal edildi")
+                    return None
+                collected[name] = result
+
+            if stop_event.is_set():
+                logger.info("Tarama iptal edildi")
+                return None
+
+            # Takipçiler çağıran thread'de oluşturulur; kaybolan arayüzlerin durumu silinir
+            for name in list(self.trackers):
+                if name not in plan:
+                    del self.trackers[name]
+            for name in plan:
+                if name not in self.trackers:
+                    self.trackers[name] = ARPStateTracker()
+
+            # Tespit adımı iptal edilmez: takipçiler ya hiç ya da tamamen güncellenir
+            futures = {executor.submit(self._detect_interface, name, collected[name], self.trackers[name]): name
+                       for name in plan}
+            reports = {}
+            for future, name in futures.items():
+                try:
+                    reports[name] = future.result()
+                except Exception as e:
+                    logger.error(f"{name} arayüzünde tespit hatası: {e}")
+                    reports[name] = {"arp_table": collected[name]["arp_table"], "gateway": collected[name]["gateway"],
+                                     "suspicious_entries": [], "changes": [], "threat_level": "none",
+                                     "duration": collected[name]["duration"],
+                                     "errors": collected[name]["errors"] + [str(e)]}
+
+        return self._merge(reports, routes, default_gateway)
+
+    def _merge(self, reports, routes, default_gateway):
+        """Arayüz sonuçlarını tek tarama sonucunda birleştirir"""
+        # Arayüzler ilk görülme sırasıyla birleştirilir (tek arayüzde eski taramayla aynı sıra)
+        names = sorted(reports, key=intern_interface)
+
+        suspicious = []
+        changes = []
+        for name in names:
+            suspicious.extend(reports[name]["suspicious_entries"])
+            changes.extend(reports[name]["changes"])
+
+        # Genel ağ geçidi en düşük metrikli varsayılan rotanın arayüzünden alınır
+        gateway = default_gateway or dict(UNKNOWN_GATEWAY)
+        if routes:
+            primary = min(routes, key=lambda name: routes[name][1])
+            if primary in reports:
+                gateway = reports[primary]["gateway"]
+
+        interfaces = {}
+        for name in names:
+            report = reports[name]
+            summary = {
+                "gateway": report["gateway"],
+                "threat_level": report["threat_level"],
+                "entries": len(report["arp_table"]),
+                "suspicious": sum(1 for entry in report["suspicious_entries"]
+                                  if entry.get("threat_level") in ("high", "medium")),
+                "duration": report["duration"]
+            }
+            if "errors" in report:
+                summary["errors"] = report["errors"]
+            interfaces[name] = summary
+
+        return {
+            "arp_table": ArpTable.concat(reports[name]["arp_table"] for name in names),
+            "gateway": gateway,
+            "suspicious_entries": suspicious,
+            "changes": changes,
+            "interfaces": interfaces
+        }
+
+    def close(self):
+        """Havuzu kapatır; bekleyen işler iptal edilir"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if self.route_resolver is not None:
+            self.route_resolver.close()
@@ -4,11 +4,28 @@
 """
 Ayarlar Modülü
 Bu modül, uygulama ayarlarını kaydetmek ve yüklemek için fonksiyonlar içerir.
+
+Ayarlar SettingsStore içinde bellekte tutulur; dosya yalnızca değiştiğinde
+(inotify bildirimi veya mtime/inode farkı) yeniden okunur. get_setting()
+sıcak yolda dosya işlemi yapmayan bir sözlük erişimidir.
+
+Tek ayar güncellemeleri ertelenir: kısa bir pencere içindeki güncellemeler tek
+bir yazmada birleştirilir; tüm ayarların kaydı ve sıfırlanması hemen yazılır.
+Dosya geçici bir dosyaya yazılıp fsync edildikten sonra os.replace ile atomik
+olarak değiştirilir; çıkışta bekleyen yazma diske aktarılır. Ertelenen yazmanın
+hatası kaydedilir ve sonraki güncellemelerin ve flush() çağrısının dönüş
+değeriyle bildirilir.
 """
 
 import os
+import sys
 import json
+import time
+import atexit
+import struct
 import logging
+import tempfile
+import threading
 
 # Loglama
 logger = logging.getLogger("V-ARP.settings")
@@ -17,69 +34,372 @@ logger = logging.getLogger("V-ARP.settings")
 APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 SETTINGS_FILE = os.path.join(APP_DIR, "arp_settings.json")
 
+# Varsayılan ayarlar
+DEFAULT_SETTINGS = {
+    "scan_interval": 24,
+    "auto_scan": True,
+    "dark_mode": False,
+    "notifications_enabled": True,
+    "periodic_scan_active": False,
+    "arp_backend": "auto",
+    "monitor_mode": "periodic",
+    "capture_mode": "ring",
+    "history_backend": "sqlite",
+    "per_interface_scan": True,
+    "scan_workers": 16,
+    "active_sweep": False,
+    "sweep_rate": 20000
+}
+
+# inotify kullanılamadığında dosya durumunun en sık kontrol aralığı (saniye)
+SETTINGS_STAT_INTERVAL = 1.0
+
+# Güncellemelerin tek yazmada birleştirildiği pencere (saniye)
+SETTINGS_WRITE_DELAY = 0.5
+
+# inotify sabitleri (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_CLOEXEC = 0o2000000
+INOTIFY_EVENT = struct.Struct("iIII")
+
+_TRUE_STRINGS = ("1", "true", "yes", "on", "evet")
+_FALSE_STRINGS = ("0", "false", "no", "off", "hayır")
+
+def _file_stamp(path):
+    """Dosyanın değişimini belirleyen (inode, boyut, mtime) üçlüsü; dosya yoksa None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+class _InotifyWatcher:
+    """
+    Ayarlar dizinini inotify ile izleyen arka plan thread'i.
+
+    Dosya değiştiğinde yalnızca bir bayrak kaldırılır; okuma sıcak yolda
+    sistem çağrısı yapmaz.
+    """
+    def __init__(self, path, on_change):
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self.fd = libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 başarısız")
+
+        directory = os.path.dirname(path) or "."
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch başarısız: {directory}")
+
+        self.name = os.fsencode(os.path.basename(path))
+        self.on_change = on_change
+        self.thread = threading.Thread(target=self._run, name="settings-inotify", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                data = os.read(self.fd, 4096)
+            except OSError as e:
+                logger.debug(f"Ayar dosyası izleme sonlandı: {e}")
+                return
+
+            offset = 0
+            while offset + INOTIFY_EVENT.size <= len(data):
+                _wd, _mask, _cookie, length = INOTIFY_EVENT.unpack_from(data, offset)
+                offset += INOTIFY_EVENT.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if name == self.name:
+                    self.on_change()
+
+class SettingsStore:
+    """
+    Ayarların bellek içi önbelleği.
+
+    Ayarlar bir kez ayrıştırılır. Linux'ta dosya inotify ile izlenir; diğer
+    sistemlerde en fazla SETTINGS_STAT_INTERVAL saniyede bir dosyanın inode
+    ve mtime bilgisi kontrol edilir. Kendi yazdığımız değişiklik yeniden
+    okunmaz.
+
+    Güncellemeler bellekte hemen geçerli olur; dosyaya write_delay saniye
+    sonra tek seferde yazılır. flush() bekleyen yazmayı hemen tamamlar.
+    Arka planda başarısız olan yazmanın hatası last_error içinde tutulur;
+    dosya yeniden yazılabilene kadar update() ve set() False döndürür.
+    """
+    def __init__(self, path=SETTINGS_FILE, watch=True, write_delay=SETTINGS_WRITE_DELAY):
+        self.path = path
+        self.write_delay = write_delay
+        self._lock = threading.RLock()
+        self._settings = None
+        self._stamp = None
+        self._dirty = True
+        self._next_check = 0.0
+        self._watcher = None
+        self._pending = None          # Henüz dosyaya yazılmamış ayarlar
+        self._timer = None
+        self.last_error = None        # Son başarısız dosya yazmasının hatası
+
+        if watch and sys.platform.startswith("linux"):
+            try:
+                self._watcher = _InotifyWatcher(path, self._mark_dirty)
+            except (OSError, AttributeError) as e:
+                logger.debug(f"inotify kullanılamıyor, dosya durumu kontrol edilecek: {e}")
+
+    def _mark_dirty(self):
+        self._dirty = True
+
+    def _current(self):
+        """Güncel ayarlar sözlüğü; gerekiyorsa dosyayı yeniden okur"""
+        settings = self._settings
+        if settings is not None and not self._dirty:
+            # Bekleyen yazma varsa bellekteki ayarlar dosyadakinden yenidir
+            if self._watcher is not None or self._pending is not None:
+                return settings
+            now = time.monotonic()
+            if now < self._next_check:
+                return settings
+            self._next_check = now + SETTINGS_STAT_INTERVAL
+            if _file_stamp(self.path) == self._stamp:
+                return settings
+
+        with self._lock:
+            self._dirty = False
+            stamp = _file_stamp(self.path)
+            if self._settings is None or (stamp != self._stamp and self._pending is None):
+                self._settings = self._read()
+                self._stamp = _file_stamp(self.path)
+                self._next_check = time.monotonic() + SETTINGS_STAT_INTERVAL
+            return self._settings
+
+    def _read(self):
+        """Ayarları dosyadan okur, dosya yoksa varsayılan ayarları yazar"""
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    settings = json.load(f)
+                logger.debug(f"Ayarlar yüklendi: {settings}")
+                return settings
+            else:
+                logger.info("Ayarlar dosyası bulunamadı, varsayılan ayarlar kullanılıyor.")
+                settings = dict(DEFAULT_SETTINGS)
+                # Varsayılan ayarları kaydet
+                self._write(settings)
+                return settings
+        except Exception as e:
+            logger.error(f"Ayarlar yüklenirken hata: {e}")
+            # Hata durumunda en temel varsayılan ayarları döndür
+            return dict(DEFAULT_SETTINGS)
+
+    def _write(self, settings):
+        """
+        Ayarları bellekte günceller ve dosyaya yazmayı erteler.
+
+        Returns:
+            bool: Önceki dosya yazması başarısız olduysa False (hata last_error
+                içindedir); yeni yazmanın sonucu flush() ile alınır
+        """
+        with self._lock:
+            self._settings = settings
+            self._pending = settings
+            if self._timer is None:
+                self._timer = threading.Timer(self.write_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+            failed = self.last_error is not None
+        logger.debug(f"Ayarlar kaydediliyor: {settings}")
+        return not failed
+
+    def flush(self):
+        """
+        Bekleyen ayarları hemen dosyaya yazar.
+
+        Returns:
+            bool: Yazma başarılı ise (veya bekleyen yazma yoksa) True; başarısız
+                yazmada ayarlar bekleyen yazma olarak kalır
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            settings = self._pending
+            if settings is None:
+                return True
+
+            try:
+                self._write_file(settings)
+            except Exception as e:
+                self.last_error = e
+                logger.error(f"Ayarlar kaydedilirken hata: {e}")
+                import traceback
+                traceback.print_exc()
+                return False
+
+            self.last_error = None
+            self._pending = None
+            self._stamp = _file_stamp(self.path)
+        logger.info(f"Ayarlar başarıyla kaydedildi: {self.path}")
+        return True
+
+    def _write_file(self, settings):
+        """Ayarları geçici dosyaya yazıp fsync eder ve asıl dosyanın yerine koyar"""
+        # Dosya dizininin varlığını kontrol et
+        directory = os.path.dirname(self.path) or "."
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".arp_settings.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(settings, f, indent=4, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+        # Yeniden adlandırmanın kalıcı olması için dizin de senkronlanır (POSIX)
+        if hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+    def invalidate(self):
+        """Bir sonraki okumada dosyanın yeniden kontrol edilmesini sağlar"""
+        self._dirty = True
+
+    def all(self):
+        """Ayarların kopyası"""
+        return dict(self._current())
+
+    def get(self, key, default=None):
+        """Ayar değeri veya default"""
+        return self._current().get(key, default)
+
+    def get_int(self, key, default=0):
+        """Ayarı tamsayı olarak döndürür; çevrilemezse default"""
+        value = self._current().get(key, default)
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            logger.warning(f"Ayar tamsayı değil: {key} = {value!r}, {default} kullanılıyor")
+            return default
+
+    def get_float(self, key, default=0.0):
+        """Ayarı ondalık sayı olarak döndürür; çevrilemezse default"""
+        value = self._current().get(key, default)
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            logger.warning(f"Ayar sayı değil: {key} = {value!r}, {default} kullanılıyor")
+            return default
+
+    def get_bool(self, key, default=False):
+        """Ayarı mantıksal değer olarak döndürür ("true", "1", "evet" vb. metinler dahil)"""
+        value = self._current().get(key, default)
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, (int, float)):
+            return value != 0
+        if isinstance(value, str):
+            lowered = value.strip().lower()
+            if lowered in _TRUE_STRINGS:
+                return True
+            if lowered in _FALSE_STRINGS:
+                return False
+        logger.warning(f"Ayar mantıksal değer değil: {key} = {value!r}, {default} kullanılıyor")
+        return default
+
+    def get_str(self, key, default="", choices=None):
+        """Ayarı metin olarak döndürür; choices verilmişse dışındaki değerler için default"""
+        value = self._current().get(key, default)
+        if not isinstance(value, str) or (choices is not None and value not in choices):
+            logger.warning(f"Geçersiz ayar değeri: {key} = {value!r}, {default!r} kullanılıyor")
+            return default
+        return value
+
+    def set(self, key, value):
+        """Tek bir ayarı günceller ve kaydetmeyi erteler (dönüş değeri için bkz. _write)"""
+        return self.update({key: value})
+
+    def update(self, values):
+        """Birden fazla ayarı günceller ve kaydetmeyi erteler (dönüş değeri için bkz. _write)"""
+        with self._lock:
+            settings = dict(self._current())
+            settings.update(values)
+            return self._write(settings)
+
+    def replace(self, settings):
+        """Tüm ayarları verilen sözlükle değiştirir ve hemen kaydeder; yazmanın sonucunu döndürür"""
+        with self._lock:
+            self._write(dict(settings))
+            return self.flush()
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_settings_store():
+    """
+    Uygulama genelinde paylaşılan SettingsStore nesnesini döndürür.
+
+    Returns:
+        SettingsStore: Tekil ayar deposu
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SettingsStore()
+                # Çıkışta bekleyen yazma diske aktarılır
+                atexit.register(_store.flush)
+    return _store
+
+def flush_settings():
+    """
+    Bekleyen ayar yazmasını hemen diske aktarır (kapanışta çağrılır).
+
+    Returns:
+        bool: İşlem başarılı ise True, aksi halde False
+    """
+    if _store is None:
+        return True
+    return get_settings_store().flush()
+
 def load_settings():
     """
-    Ayarları dosyadan yükler, dosya yoksa varsayılan ayarları döndürür.
+    Ayarları yükler, dosya yoksa varsayılan ayarları döndürür.
     
     Returns:
-        dict: Ayarlar sözlüğü
+        dict: Ayarlar sözlüğünün kopyası
     """
-    try:
-        if os.path.exists(SETTINGS_FILE):
-            with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-            logger.debug(f"Ayarlar yüklendi: {settings}")
-            return settings
-        else:
-            logger.info("Ayarlar dosyası bulunamadı, varsayılan ayarlar kullanılıyor.")
-            # Varsayılan ayarlar
-            default_settings = {
-                "scan_interval": 24,
-                "auto_scan": True,
-                "dark_mode": False,
-                "notifications_enabled": True,
-                "periodic_scan_active": False
-            }
-            # Varsayılan ayarları kaydet
-            save_settings(default_settings)
-            return default_settings
-    except Exception as e:
-        logger.error(f"Ayarlar yüklenirken hata: {e}")
-        # Hata durumunda en temel varsayılan ayarları döndür
-        return {
-            "scan_interval": 24,
-            "auto_scan": True,
-            "dark_mode": False,
-            "notifications_enabled": True,
-            "periodic_scan_active": False
-        }
+    return get_settings_store().all()
 
 def save_settings(settings):
     """
-    Ayarları dosyaya kaydeder.
+    Ayarları dosyaya hemen kaydeder.
     
     Args:
         settings (dict): Kaydedilecek ayarlar sözlüğü
         
     Returns:
-        bool: İşlem başarılı ise True, aksi halde False
+        bool: Dosya yazıldıysa True, aksi halde False
     """
-    try:
-        logger.debug(f"Ayarlar kaydediliyor: {settings}")
-        # Dosya dizininin varlığını kontrol et
-        directory = os.path.dirname(SETTINGS_FILE)
-        if not os.path.exists(directory):
-            os.makedirs(directory)
-            
-        with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(settings, f, indent=4, ensure_ascii=False)
-        logger.info(f"Ayarlar başarıyla kaydedildi: {SETTINGS_FILE}")
-        return True
-    except Exception as e:
-        logger.error(f"Ayarlar kaydedilirken hata: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    return get_settings_store().replace(settings)
 
 def get_setting(key, default=None):
     """
@@ -92,55 +412,45 @@ def get_setting(key, default=None):
     Returns:
         Ayar değeri veya default değeri
     """
-    settings = load_settings()
-    value = settings.get(key, default)
-    logger.debug(f"Ayar okundu: {key} = {value}")
-    return value
+    return get_settings_store().get(key, default)
 
 def set_setting(key, value):
     """
     Belirli bir ayarı günceller ve kaydeder.
     
+    Dosyaya yazma ertelenir; yazmanın sonucu flush_settings() ile alınır.
+    
     Args:
         key (str): Ayar anahtarı
         value: Ayarlanacak değer
         
     Returns:
-        bool: İşlem başarılı ise True, aksi halde False
+        bool: Önceki dosya yazması başarısız olduysa False, aksi halde True
     """
-    settings = load_settings()
-    settings[key] = value
     logger.debug(f"Ayar güncellendi: {key} = {value}")
-    return save_settings(settings)
+    return get_settings_store().set(key, value)
 
 def update_settings(settings_dict):
     """
     Birden fazla ayarı aynı anda günceller.
     
+    Dosyaya yazma ertelenir; yazmanın sonucu flush_settings() ile alınır.
+    
     Args:
         settings_dict (dict): Güncellenecek ayarlar sözlüğü
         
     Returns:
-        bool: İşlem başarılı ise True, aksi halde False
+        bool: Önceki dosya yazması başarısız olduysa False, aksi halde True
     """
-    settings = load_settings()
-    settings.update(settings_dict)
     logger.debug(f"Ayarlar toplu güncellendi: {settings_dict}")
-    return save_settings(settings)
+    return get_settings_store().update(settings_dict)
 
 def reset_settings():
     """
-    Ayarları varsayılan değerlerine sıfırlar.
+    Ayarları varsayılan değerlerine sıfırlar ve hemen kaydeder.
     
     Returns:
-        bool: İşlem başarılı ise True, aksi halde False
+        bool: Dosya yazıldıysa True, aksi halde False
     """
-    default_settings = {
-        "scan_interval": 24,
-        "auto_scan": True,
-        "dark_mode": False,
-        "notifications_enabled": True,
-        "periodic_scan_active": False
-    }
     logger.info("Ayarlar varsayılan değerlere sıfırlanıyor")
-    return save_settings(default_settings)
+    return save_settings(DEFAULT_SETTINGS)
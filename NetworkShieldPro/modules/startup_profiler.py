@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Başlangıç Profilleme Modülü
+Bu modül, uygulamanın açılışında import ve nesne oluşturma adımlarının
+sürelerini toplayan StartupProfiler tipini içerir. main.py --profile-startup
+ile etkinleştirilir; kapalıyken ölçüm noktaları hiçbir iş yapmaz.
+"""
+
+import sys
+import json
+import time
+from contextlib import contextmanager
+
+class StartupProfiler:
+    """
+    Açılış adımlarının süre ve import dökümü.
+
+    Her adım için geçen süre ve adım sırasında yüklenen modül sayısı tutulur;
+    iç içe adımlar girintili raporlanır.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.start_time = time.perf_counter()
+        self.phases = []   # (derinlik, ad, süre_sn, yeni_modül_sayısı)
+        self.marks = []    # (ad, başlangıçtan itibaren saniye)
+        self._depth = 0
+
+    def enable(self):
+        """Ölçümü etkinleştirir; süreler modülün yüklendiği andan itibaren sayılır"""
+        self.enabled = True
+
+    @contextmanager
+    def phase(self, name):
+        """Adımın süresini ve yüklediği modül sayısını ölçer"""
+        if not self.enabled:
+            yield
+            return
+
+        index = len(self.phases)
+        self.phases.append(None)  # İç içe adımlar üst adımdan sonra listelensin
+        modules_before = len(sys.modules)
+        depth = self._depth
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.phases[index] = (depth, name, time.perf_counter() - start, len(sys.modules) - modules_before)
+
+    def mark(self, name):
+        """Başlangıçtan itibaren geçen süreyi bir kilometre taşı olarak kaydeder"""
+        if self.enabled:
+            self.marks.append((name, time.perf_counter() - self.start_time))
+
+    def as_dict(self):
+        """Ölçümleri JSON'a çevrilebilir sözlük olarak döndürür"""
+        return {
+            "phases": [{"name": name, "depth": depth, "ms": round(seconds * 1000, 2), "modules": modules}
+                       for depth, name, seconds, modules in filter(None, self.phases)],
+            "marks": {name: round(seconds * 1000, 2) for name, seconds in self.marks},
+            "modules_loaded": len(sys.modules)
+        }
+
+    def report(self, as_json=False):
+        """Ölçüm raporunu metin (veya tek satır JSON) olarak döndürür"""
+        if as_json:
+            return json.dumps(self.as_dict(), ensure_ascii=False)
+
+        lines = ["Başlangıç profili", f"{'adım':<44}{'süre (ms)':>12}{'modül':>8}"]
+        for depth, name, seconds, modules in filter(None, self.phases):
+            lines.append(f"{'  ' * depth + name:<44}{seconds * 1000:>12.1f}{modules:>8}")
+        for name, seconds in self.marks:
+            lines.append(f"{'* ' + name:<44}{seconds * 1000:>12.1f}")
+        lines.append(f"{'yüklü modül':<44}{len(sys.modules):>20}")
+        return "\n".join(lines)
+
+# Uygulama genelinde paylaşılan profilleyici
+profiler = StartupProfiler()
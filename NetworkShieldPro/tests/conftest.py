@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+
+"""Testler için ortak ayarlar: modüller uygulama dizininden içe aktarılır"""
+
+import os
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def fixture_path(name):
+    """tests/fixtures altındaki dosyanın yolu"""
+    return os.path.join(FIXTURES_DIR, name)
+
+
+def read_fixture(name):
+    """Bayt fikstürünü okur"""
+    with open(fixture_path(name), "rb") as f:
+        return f.read()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+"""İzleme uyarılarının pencere başına tek yayına indirgenmesi testleri"""
+
+from modules.arp_detector import AlertThrottle
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _alert(alert_type, ip, mac, message=""):
+    return {"type": alert_type, "ip": ip, "mac": mac, "message": message}
+
+
+def _throttle(interval=1.0):
+    published = []
+    clock = FakeClock()
+    return AlertThrottle(published.append, interval=interval, clock=clock), published, clock
+
+
+def test_first_alerts_are_published_immediately():
+    throttle, published, _clock = _throttle()
+
+    assert throttle.flush() is False
+    throttle.add([])
+    assert throttle.flush() is False
+
+    throttle.add([_alert("gateway_mac_changed", "192.0.2.1", "02:66:66:66:66:66")])
+    assert throttle.flush() is True
+    assert [[alert["type"] for alert in alerts] for alerts in published] == [["gateway_mac_changed"]]
+
+
+def test_alerts_within_window_are_published_once():
+    throttle, published, clock = _throttle()
+    throttle.add([_alert("ip_mac_changed", "192.0.2.10", "02:00:00:00:00:0a")])
+    throttle.flush()
+
+    # Pencere içinde gelen paket grupları biriktirilir; aynı uyarı tek kayda iner
+    for step in range(50):
+        clock.now += 0.01
+        throttle.add([_alert("sender_mismatch", "192.0.2.11", "02:00:00:00:00:0b", str(step)),
+                      _alert("ip_mac_changed", "192.0.2.12", "02:00:00:00:00:0c")])
+        assert throttle.flush() is False
+
+    clock.now += 0.5
+    assert throttle.flush() is True
+    assert len(published) == 2
+    assert [(alert["type"], alert["message"]) for alert in published[1]] == [("sender_mismatch", "49"),
+                                                                             ("ip_mac_changed", "")]
+    assert throttle.pending == {}
+
+
+def test_forced_flush_publishes_pending_alerts():
+    throttle, published, _clock = _throttle()
+    throttle.add([_alert("ip_mac_changed", "192.0.2.10", "02:00:00:00:00:0a")])
+    throttle.flush()
+    throttle.add([_alert("ip_mac_changed", "192.0.2.10", "02:00:00:00:00:0b")])
+
+    assert throttle.flush() is False
+    assert throttle.flush(force=True) is True
+    assert [alerts[0]["mac"] for alerts in published] == ["02:00:00:00:00:0a", "02:00:00:00:00:0b"]
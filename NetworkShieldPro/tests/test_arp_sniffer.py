@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+
+"""
+ARP çerçeve çözümleyici, akış dedektörü ve halka tamponu testleri.
+
+arp_capture.pcap (küçük uçlu, mikrosaniye) altı Ethernet çerçevesi içerir:
+  1. 192.0.2.10 (02:00:00:00:00:0a) 192.0.2.1'i soruyor
+  2. ağ geçidi 192.0.2.1 -> 02:fc:00:00:00:05 cevabı
+  3. IPv4 çerçevesi (ARP değil)
+  4. sahte cevap: 192.0.2.1 -> 02:66:66:66:66:66
+  5. Ethernet kaynağı (02:77:77:77:77:77) ARP göndereninden farklı cevap: 192.0.2.11
+  6. 0.0.0.0 gönderenli ARP probe (02:00:00:00:00:0c)
+
+tpacket_v3_block.bin, TPACKET_V3 halka tamponundan (4096 baytlık blok) kaydedilmiş,
+kullanıcıya verilmiş (TP_STATUS_USER | blok zaman aşımı) gerçek bir bloktur:
+192.0.2.2 (02:fc:00:00:00:01) ağ geçidi 192.0.2.1'i iki kez sorar ve ağ geçidi
+02:fc:00:00:00:05 ile cevaplar. Her paket başlığının ardındaki sockaddr_ll eth0'ın
+arayüz sırasını (4) taşır; çoklu arayüz testi bu alanları kopya blokta değiştirir.
+"""
+
+import random
+import struct
+
+from conftest import fixture_path, read_fixture
+from modules.arp_sniffer import (ARPOP_REPLY, ARPOP_REQUEST, BLOCK_HDR, BLOCK_HDR_OFFSET, ETH_ARP_FRAME,
+                                 SOCKADDR_LL, SOCKADDR_LL_OFFSET, TP_STATUS_KERNEL, TPACKET3_HDR, ArpPacket,
+                                 RingARPSniffer, StreamingARPDetector, decode_arp_frame)
+
+GATEWAY = {"ip": "192.0.2.1", "mac": "02:fc:00:00:00:05"}
+
+# Kayıt başlığı (16 bayt) + 60 baytlık çerçeve; ilk kayıt 24 baytlık genel başlıktan sonra
+FRAME_OFFSETS = [24 + 16 + index * 76 for index in range(6)]
+
+
+def _frame(index):
+    data = read_fixture("arp_capture.pcap")
+    return data[FRAME_OFFSETS[index]:FRAME_OFFSETS[index] + 60]
+
+
+def _packet(ip, mac, eth_src=None, target_ip="192.0.2.10", op=ARPOP_REPLY):
+    return ArpPacket(op, eth_src or mac, mac, ip, "02:00:00:00:00:0a", target_ip)
+
+
+def test_decode_arp_frame_request_and_reply():
+    assert decode_arp_frame(_frame(0)) == ArpPacket(ARPOP_REQUEST, "02:00:00:00:00:0a", "02:00:00:00:00:0a",
+                                                    "192.0.2.10", "00:00:00:00:00:00", "192.0.2.1")
+    assert decode_arp_frame(memoryview(_frame(1))) == ArpPacket(ARPOP_REPLY, "02:fc:00:00:00:05",
+                                                                "02:fc:00:00:00:05", "192.0.2.1",
+                                                                "02:00:00:00:00:0a", "192.0.2.10")
+
+
+def test_decode_arp_frame_rejects_other_frames():
+    assert decode_arp_frame(_frame(2)) is None
+    assert decode_arp_frame(_frame(0)[:ETH_ARP_FRAME.size - 1]) is None
+
+
+def test_decode_arp_frame_uses_length_of_reused_buffer():
+    buffer = bytearray(2048)
+    frame = _frame(3)
+    buffer[:len(frame)] = frame
+
+    assert decode_arp_frame(buffer, len(frame)).sender_mac == "02:66:66:66:66:66"
+    # Tamponda önceki paketten kalan baytlar geçerli uzunluğun dışında kalır
+    assert decode_arp_frame(buffer, ETH_ARP_FRAME.size - 1) is None
+
+
+def test_streaming_detector_gateway_and_ip_mac_changes():
+    detector = StreamingARPDetector(gateway=GATEWAY)
+
+    assert detector.process(_packet("192.0.2.1", "02:fc:00:00:00:05"), 1.0) == []
+    assert detector.process(_packet("192.0.2.20", "02:00:00:00:00:14"), 2.0) == []
+
+    alerts = detector.process(_packet("192.0.2.1", "02:66:66:66:66:66"), 3.0)
+    assert [alert["type"] for alert in alerts] == ["gateway_mac_changed"]
+    assert alerts[0]["macs"] == ["02:fc:00:00:00:05", "02:66:66:66:66:66"]
+
+    alerts = detector.process(_packet("192.0.2.20", "02:00:00:00:00:15"), 4.0)
+    assert [(alert["type"], alert["threat_level"]) for alert in alerts] == [("ip_mac_changed", "medium")]
+    assert detector.packet_count == 4
+
+
+def test_streaming_detector_sender_mismatch_and_probe():
+    detector = StreamingARPDetector(gateway=GATEWAY)
+
+    alerts = detector.process(_packet("192.0.2.11", "02:00:00:00:00:0b", eth_src="02:77:77:77:77:77"), 1.0)
+    assert [alert["type"] for alert in alerts] == ["sender_mismatch"]
+
+    # ARP probe bir bağlama oluşturmaz
+    assert detector.process(_packet("0.0.0.0", "02:00:00:00:00:0c", target_ip="192.0.2.12"), 2.0) == []
+    assert [entry["ip"] for entry in detector.arp_table()] == ["192.0.2.11"]
+
+
+def test_streaming_detector_reports_storm_once_per_window():
+    detector = StreamingARPDetector(gateway=GATEWAY, storm_threshold=3, storm_window=10.0)
+    gratuitous = _packet("192.0.2.30", "02:00:00:00:00:1e", target_ip="192.0.2.30")
+
+    found = [detector.process(gratuitous, float(second)) for second in range(6)]
+
+    assert [len(alerts) for alerts in found] == [0, 0, 0, 1, 0, 0]
+    assert found[3][0]["type"] == "gratuitous_storm"
+
+    # Pencere boşaldıktan sonra yeni fırtına yeniden bildirilir
+    assert detector.process(gratuitous, 30.0) == []
+    found = [detector.process(gratuitous, 30.0 + second) for second in range(1, 4)]
+    assert [len(alerts) for alerts in found] == [0, 0, 1]
+
+
+def test_streaming_detector_seeded_state():
+    table = [{"ip": "192.0.2.1", "mac": "02:fc:00:00:00:05", "interface": "eth0"},
+             {"ip": "192.0.2.40", "mac": "02:00:00:00:00:28", "interface": "eth0"},
+             {"ip": "192.0.2.41", "mac": "02:00:00:00:00:28", "interface": "eth0"}]
+    detector = StreamingARPDetector(gateway=GATEWAY, arp_table=table)
+
+    assert detector.arp_table() == table
+    assert [entry["type"] for entry in detector.suspicious_entries()] == ["multiple_ips"]
+
+    # Başlangıç bağlaması değişince uyarı üretilir
+    alerts = detector.process(_packet("192.0.2.1", "02:66:66:66:66:66"), 1.0)
+    assert [alert["type"] for alert in alerts] == ["gateway_mac_changed"]
+
+
+def test_streaming_detector_standing_alerts_track_bindings():
+    detector = StreamingARPDetector(gateway=GATEWAY)
+    shared = "02:00:00:00:00:28"
+
+    detector.process(_packet("192.0.2.40", shared), 1.0)
+    detector.process(_packet("192.0.2.41", shared), 2.0)
+    detector.process(_packet("192.0.2.50", "01:00:5e:00:00:fb"), 3.0)
+    assert [(entry["type"], entry.get("ips")) for entry in detector.suspicious_entries()] == [
+        ("multiple_ips", ["192.0.2.40", "192.0.2.41"]), ("info_multicast", None)]
+
+    # IP başka MAC'e taşınınca süren uyarılar da güncellenir
+    detector.process(_packet("192.0.2.41", "02:00:00:00:00:29"), 4.0)
+    detector.process(_packet("192.0.2.50", "02:00:00:00:00:32"), 5.0)
+    assert detector.suspicious_entries() == []
+
+
+def _standing(entries):
+    """Şüpheli durumları sıradan bağımsız karşılaştırılabilir biçime çevirir"""
+    return sorted((entry["type"], entry["mac"], entry.get("ip"), sorted(entry.get("ips", ()))) for entry in entries)
+
+
+def test_streaming_detector_standing_alerts_match_full_detection():
+    from modules.arp_detector import detect_arp_spoofing
+
+    rng = random.Random(7)
+    macs = ["02:00:00:00:00:%02x" % index for index in range(6)] + ["01:00:5e:00:00:01", "ff:ff:ff:ff:ff:ff"]
+    detector = StreamingARPDetector(gateway=GATEWAY)
+
+    for step in range(500):
+        detector.process(_packet("192.0.2.%d" % rng.randrange(1, 12), rng.choice(macs)), float(step))
+        assert _standing(detector.suspicious_entries()) == _standing(
+            detect_arp_spoofing(detector.arp_table(), GATEWAY))
+
+
+def _ring(block_count=2, interface="eth0"):
+    """Kaydedilmiş bloğu ilk yuvaya yerleştirilmiş, soketsiz halka tamponu"""
+    sniffer = RingARPSniffer(interface=interface, block_size=4096, block_count=block_count)
+    block = read_fixture("tpacket_v3_block.bin")
+    ring = bytearray(sniffer.block_size * block_count)
+    ring[:len(block)] = block
+    sniffer.ring_view = memoryview(ring)
+    # Kayıt ortamındaki arayüz sıraları; testler çalıştıran makinenin arayüzlerine bağlı kalmaz
+    sniffer._interface_names.update({4: "eth0", 7: "eth1"})
+    return sniffer
+
+
+def _packet_positions(view):
+    """Bloktaki paket başlıklarının ofsetleri"""
+    _status, num_pkts, position = BLOCK_HDR.unpack_from(view, BLOCK_HDR_OFFSET)
+    positions = []
+    for _ in range(num_pkts):
+        positions.append(position)
+        position += TPACKET3_HDR.unpack_from(view, position)[0]
+    return positions
+
+
+def test_ring_read_block_recorded_block():
+    sniffer = _ring()
+
+    packets = sniffer._read_block(0)
+
+    request = ArpPacket(ARPOP_REQUEST, "02:fc:00:00:00:01", "02:fc:00:00:00:01", "192.0.2.2",
+                        "00:00:00:00:00:00", "192.0.2.1")
+    reply = ArpPacket(ARPOP_REPLY, "02:fc:00:00:00:05", "02:fc:00:00:00:05", "192.0.2.1",
+                      "02:fc:00:00:00:01", "192.0.2.2")
+    assert [packet for _timestamp, packet, _interface in packets] == [request, reply, request, reply]
+    assert {interface for _timestamp, _packet, interface in packets} == {"eth0"}
+    timestamps = [timestamp for timestamp, _packet, _interface in packets]
+    assert timestamps == sorted(timestamps) and timestamps[0] > 1e9
+
+
+def test_ring_read_block_returns_block_to_kernel():
+    sniffer = _ring()
+
+    assert len(sniffer._read_block(0)) == 4
+    assert BLOCK_HDR.unpack_from(sniffer.ring_view, BLOCK_HDR_OFFSET)[0] == TP_STATUS_KERNEL
+    # İade edilen ve hiç doldurulmamış bloklar okunmaz
+    assert sniffer._read_block(0) is None
+    assert sniffer._read_block(1) is None
+
+
+def test_ring_block_feeds_detector_batch():
+    sniffer = _ring()
+    sniffer.detector.gateway = {"ip": "192.0.2.1", "mac": "02:fc:00:00:00:05"}
+
+    assert sniffer.detector.process_batch(sniffer._read_block(0)) == []
+    assert {entry["ip"]: (entry["mac"], entry["interface"]) for entry in sniffer.detector.arp_table()} == {
+        "192.0.2.2": ("02:fc:00:00:00:01", "eth0"),
+        "192.0.2.1": ("02:fc:00:00:00:05", "eth0"),
+    }
+
+
+def test_ring_read_block_skips_non_arp_frames():
+    sniffer = _ring()
+    view = sniffer.ring_view
+    _status, _num_pkts, first = BLOCK_HDR.unpack_from(view, BLOCK_HDR_OFFSET)
+    mac_offset = struct.unpack_from("H", view, first + 24)[0]
+
+    # İlk paketin Ethernet tipini IPv4 yap; yalnızca o paket atlanır
+    struct.pack_into("!H", view, first + mac_offset + 12, 0x0800)
+
+    assert [packet.op for _timestamp, packet, _interface in sniffer._read_block(0)] == [
+        ARPOP_REPLY, ARPOP_REQUEST, ARPOP_REPLY]
+
+
+def test_ring_read_block_reports_interface_of_each_packet():
+    # Tüm arayüzleri dinleyen halka: ikinci istek/cevap çifti eth1'den gelmiş gibi işaretlenir
+    sniffer = _ring(interface=None)
+    view = sniffer.ring_view
+    for position in _packet_positions(view)[2:]:
+        family, protocol, _ifindex = SOCKADDR_LL.unpack_from(view, position + SOCKADDR_LL_OFFSET)
+        SOCKADDR_LL.pack_into(view, position + SOCKADDR_LL_OFFSET, family, protocol, 7)
+
+    packets = sniffer._read_block(0)
+
+    assert [interface for _timestamp, _packet, interface in packets] == ["eth0", "eth0", "eth1", "eth1"]
+    sniffer.detector.process_batch(packets)
+    assert {(entry["ip"], entry["interface"]) for entry in sniffer.detector.arp_table()} == {
+        ("192.0.2.2", "eth1"), ("192.0.2.1", "eth1")}
+
+
+def test_ring_interface_names_are_cached(monkeypatch):
+    lookups = []
+
+    def if_indextoname(ifindex):
+        lookups.append(ifindex)
+        raise OSError(6, "No such device or address")
+
+    monkeypatch.setattr("socket.if_indextoname", if_indextoname)
+    sniffer = _ring(interface="eth2")
+    sniffer._interface_names.clear()
+
+    # Çözülemeyen sıra, dinlenen arayüzün adıyla bir kez önbelleğe alınır
+    assert {interface for _timestamp, _packet, interface in sniffer._read_block(0)} == {"eth2"}
+    assert lookups == [4]
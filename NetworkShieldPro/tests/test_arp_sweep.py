@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+"""ARPSweeper aktif tarama testleri (ağ yerine MockResponder kullanılır)"""
+
+import threading
+
+import pytest
+
+from conftest import fixture_path
+from modules.arp_sweep import ARPSweeper, MockResponder, TokenBucket
+
+SOURCE = ("192.0.2.2", "02:fc:00:00:00:01")
+NETWORK = "192.0.2.0/24"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class StoppingResponder(MockResponder):
+    """Belirli sayıda istekten sonra taramayı durduran cevaplayıcı"""
+    def __init__(self, hosts, stop_event, stop_after):
+        super().__init__(hosts)
+        self.stop_event = stop_event
+        self.stop_after = stop_after
+
+    def send(self, frame):
+        super().send(frame)
+        if self.requests >= self.stop_after:
+            self.stop_event.set()
+
+
+def _sweep(responder, network=NETWORK, stop_event=None, **kwargs):
+    kwargs.setdefault("rate", 1e6)
+    kwargs.setdefault("timeout", 0.05)
+    sweeper = ARPSweeper("eth0", network=network, transport=responder, source=SOURCE, **kwargs)
+    try:
+        return sweeper, sweeper.run(stop_event)
+    finally:
+        responder.close()
+
+
+def test_sweep_finds_responding_hosts():
+    responder = MockResponder({
+        "192.0.2.1": "02:fc:00:00:00:05",
+        "192.0.2.20": "02:00:00:00:00:14",
+        "192.0.2.10": "02:00:00:00:00:0a",
+        # Alt ağ dışındaki cihaz sorgulanmaz
+        "198.51.100.5": "02:00:00:00:00:99",
+    })
+
+    sweeper, entries = _sweep(responder)
+
+    assert entries == [
+        {"ip": "192.0.2.1", "mac": "02:fc:00:00:00:05", "interface": "eth0"},
+        {"ip": "192.0.2.10", "mac": "02:00:00:00:00:0a", "interface": "eth0"},
+        {"ip": "192.0.2.20", "mac": "02:00:00:00:00:14", "interface": "eth0"},
+    ]
+    # Ağ ve yayın adresleri ile kendi adresimiz sorgulanmaz
+    assert responder.requests == 253
+    assert (sweeper.stats["targets"], sweeper.stats["sent"], sweeper.stats["replies"], sweeper.stats["hosts"]) == (
+        254, 253, 3, 3)
+
+
+def test_sweep_records_every_mac_of_spoofed_gateway():
+    responder = MockResponder({"192.0.2.1": ["02:fc:00:00:00:05", "02:66:66:66:66:66"]})
+
+    sweeper, entries = _sweep(responder)
+
+    assert [(entry["ip"], entry["mac"]) for entry in entries] == [("192.0.2.1", "02:fc:00:00:00:05"),
+                                                                  ("192.0.2.1", "02:66:66:66:66:66")]
+    assert sweeper.stats["hosts"] == 1 and sweeper.stats["replies"] == 2
+
+
+def test_sweep_hosts_from_capture():
+    responder = MockResponder.from_capture(fixture_path("arp_capture.pcap"))
+
+    _sweeper, entries = _sweep(responder)
+
+    assert [(entry["ip"], entry["mac"]) for entry in entries] == [
+        ("192.0.2.1", "02:fc:00:00:00:05"), ("192.0.2.1", "02:66:66:66:66:66"),
+        ("192.0.2.10", "02:00:00:00:00:0a"), ("192.0.2.11", "02:00:00:00:00:0b")]
+
+
+def test_sweep_stops_early_on_stop_event():
+    stop_event = threading.Event()
+    responder = StoppingResponder({"192.0.2.1": "02:fc:00:00:00:05"}, stop_event, stop_after=32)
+
+    # Düşük hız ve uzun cevap penceresi: durdurma sinyali olmadan tarama saniyeler sürerdi
+    sweeper, entries = _sweep(responder, stop_event=stop_event, rate=100, burst=16, timeout=30.0)
+
+    assert entries == [{"ip": "192.0.2.1", "mac": "02:fc:00:00:00:05", "interface": "eth0"}]
+    assert 32 <= sweeper.stats["sent"] < 253
+    assert sweeper.stats["duration"] < 5.0
+
+
+def test_sweep_rejects_networks_larger_than_limit():
+    with pytest.raises(ValueError):
+        ARPSweeper("eth0", network="10.0.0.0/8", transport=None, source=SOURCE)
+
+
+def test_token_bucket_pacing():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=100, burst=10, clock=clock)
+
+    # Başlangıçta kova dolu; fazlası için jeton birikmesi beklenir
+    assert bucket.take(50) == 10
+    assert bucket.take(50) == 0
+    assert bucket.delay(5) == pytest.approx(0.05)
+
+    clock.now = 0.05
+    assert bucket.take(50) == 5
+
+    # Uzun bekleme kova kapasitesini aşmaz; gecikme de kapasiteyle sınırlıdır
+    clock.now = 60.0
+    assert bucket.take(50) == 10
+    assert bucket.delay(50) == pytest.approx(0.1)
+
+
+def test_token_bucket_rejects_invalid_parameters():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, burst=10)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=100, burst=0)
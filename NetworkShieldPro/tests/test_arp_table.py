@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+"""ArpTable sütunlu tablo ve SnapshotPool içerik adresli havuz testleri"""
+
+import gc
+import logging
+
+import pytest
+
+from modules import arp_table
+from modules.arp_table import (ArpTable, SnapshotPool, intern_interface, interface_name, pack_ip, pack_mac,
+                               unpack_ip, unpack_mac)
+
+ENTRIES = [
+    {"ip": "192.0.2.1", "mac": "02:fc:00:00:00:05", "interface": "eth0"},
+    {"ip": "192.0.2.10", "mac": "02:00:00:00:00:0a", "interface": "eth0"},
+    {"ip": "198.51.100.1", "mac": "02:fc:00:00:01:01", "interface": "eth1"},
+    {"ip": "192.0.2.11", "mac": "02:00:00:00:00:0a", "interface": "eth0"},
+]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_reports(monkeypatch):
+    # Uyarı bir adres için bir kez yazılır; testler birbirini etkilemesin
+    monkeypatch.setattr(arp_table, "_reported_macs", set())
+
+
+def test_pack_and_unpack_round_trip():
+    assert pack_ip("192.0.2.1") == 0xC0000201 and unpack_ip(0xC0000201) == "192.0.2.1"
+    assert pack_mac("02:FC:00:00:00:05") == pack_mac("02-fc-00-00-00-05") == 0x02FC00000005
+    assert unpack_mac(0x02FC00000005) == "02:fc:00:00:00:05"
+    assert unpack_mac(pack_mac("ff:ff:ff:ff:ff:ff")) == "ff:ff:ff:ff:ff:ff"
+
+    # 48 bit olmayan veya onaltılık olmayan adresler çözülmez
+    assert pack_mac("80:00:02:08:fe:80:00:00:00:00:00:00:00:02:c9:03:00:0a:8b:91") is None
+    assert pack_mac("(incomplete)") is None
+    assert pack_mac("zz:00:00:00:00:00") is None
+
+
+def test_interface_names_are_interned_once():
+    index = intern_interface("test-if0")
+
+    assert intern_interface("test-if0") == index
+    assert interface_name(index) == "test-if0"
+
+
+def test_entries_round_trip_and_views():
+    table = ArpTable.from_entries(ENTRIES)
+
+    assert len(table) == 4 and table.to_entries() == ENTRIES
+    assert dict(table[-1]) == ENTRIES[-1] and table[2]["interface"] == "eth1"
+    assert [entry["ip"] for entry in table[1:3]] == ["192.0.2.10", "198.51.100.1"]
+    assert ArpTable.from_entries(table) is table
+    with pytest.raises(IndexError):
+        table[4]
+
+
+def test_from_entries_reports_skipped_macs(caplog):
+    entries = ENTRIES[:1] + [{"ip": "10.0.0.1", "mac": "80:00:02:08:fe:80:00:00:00:00", "interface": "ib0"},
+                             {"ip": "10.0.0.2", "mac": "(incomplete)", "interface": "ib0"}]
+
+    with caplog.at_level(logging.DEBUG, logger="V-ARP.arp_table"):
+        table = ArpTable.from_entries(entries)
+        ArpTable.from_entries(entries)
+
+    assert [entry["ip"] for entry in table] == ["192.0.2.1"]
+    # İlk atlama uyarı, aynı adreslerin tekrarı hata ayıklama düzeyinde yazılır
+    assert [(record.levelname, "2 kayıt" in record.getMessage()) for record in caplog.records] == [
+        ("WARNING", True), ("DEBUG", True)]
+    assert "(incomplete)" in caplog.records[0].getMessage()
+
+
+def test_duplicate_macs_special_and_ip_lookup():
+    table = ArpTable.from_entries(ENTRIES + [
+        {"ip": "192.0.2.255", "mac": "ff:ff:ff:ff:ff:ff", "interface": "eth0"},
+        {"ip": "224.0.0.251", "mac": "01:00:5e:00:00:fb", "interface": "eth0"},
+        {"ip": "224.0.0.252", "mac": "01:00:5e:00:00:fb", "interface": "eth0"},
+    ])
+
+    # Multicast MAC'ler tekrar sayılmaz, özel kayıt olarak döner
+    assert table.duplicate_macs() == {pack_mac("02:00:00:00:00:0a"): [1, 3]}
+    assert table.special_indices() == [4, 5, 6]
+    assert table.indices_for_ip(pack_ip("192.0.2.1")) == [0]
+    assert table.indices_for_ip(pack_ip("203.0.113.1")) == []
+
+
+def test_split_by_interface_and_concat():
+    table = ArpTable.from_entries(ENTRIES)
+
+    parts = table.split_by_interface()
+
+    assert {interface_name(index): [entry["ip"] for entry in part] for index, part in parts.items()} == {
+        "eth0": ["192.0.2.1", "192.0.2.10", "192.0.2.11"], "eth1": ["198.51.100.1"]}
+    joined = ArpTable.concat(parts.values())
+    assert sorted(map(tuple, map(dict.values, joined.to_entries()))) == sorted(
+        map(tuple, map(dict.values, ENTRIES)))
+    assert len(ArpTable.concat([])) == 0
+
+
+def test_merged_skips_existing_rows_and_keeps_original():
+    table = ArpTable.from_entries(ENTRIES[:2])
+    extra = [ENTRIES[1], ENTRIES[2], ENTRIES[2], {"ip": "192.0.2.1", "mac": "02:66:66:66:66:66", "interface": "eth0"}]
+
+    merged = table.merged(extra)
+
+    assert merged.to_entries() == ENTRIES[:3] + [extra[3]]
+    assert len(table) == 2
+
+
+def test_digest_ignores_row_order_but_not_content():
+    table = ArpTable.from_entries(ENTRIES)
+
+    assert table.digest() == ArpTable.from_entries(list(reversed(ENTRIES))).digest()
+    assert len(table.digest()) == 32
+    assert table.digest() != ArpTable.from_entries(ENTRIES[:3]).digest()
+    # Aynı satırın başka arayüzde görünmesi farklı içeriktir
+    moved = [dict(entry, interface="eth1") if index == 0 else entry for index, entry in enumerate(ENTRIES)]
+    assert table.digest() != ArpTable.from_entries(moved).digest()
+    assert ArpTable().digest() == ArpTable.from_entries([]).digest()
+
+
+def test_snapshot_pool_shares_identical_tables():
+    pool = SnapshotPool()
+    first = ArpTable.from_entries(ENTRIES)
+
+    digest, shared = pool.intern(first)
+    again_digest, again = pool.intern(list(reversed(ENTRIES)))
+
+    assert (digest, shared) == (first.digest(), first)
+    assert again_digest == digest and again is first
+    assert pool.get(digest) is first and len(pool) == 1
+
+    # Önceden bilinen özet yeniden hesaplanmaz
+    assert pool.intern(ArpTable.from_entries(ENTRIES[:1]), "sabit")[0] == "sabit"
+
+
+def test_snapshot_pool_drops_unused_tables():
+    pool = SnapshotPool()
+    digest, table = pool.intern(ENTRIES)
+
+    del table
+    gc.collect()
+
+    assert pool.get(digest) is None and len(pool) == 0
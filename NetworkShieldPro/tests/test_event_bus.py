@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""EventBus thread'ler arası yayın, birleştirme ve boşaltma sınırı testleri"""
+
+import threading
+
+from modules.event_bus import EVENT_DRAIN_LIMIT, EventBus
+
+TOPIC = "scan_completed"
+
+
+def test_publish_from_worker_thread_is_delivered_on_drain():
+    bus = EventBus()
+    received = []
+    bus.subscribe(TOPIC, lambda payload: received.append((payload, threading.current_thread())))
+
+    worker = threading.Thread(target=lambda: [bus.publish(TOPIC, index) for index in range(3)])
+    worker.start()
+    worker.join()
+
+    # Yayın sırasında abone çağrılmaz; teslim drain() çağıran thread'de olur
+    assert received == [] and bus.pending()
+    assert bus.drain() == 3
+    assert [payload for payload, _thread in received] == [0, 1, 2]
+    assert {thread for _payload, thread in received} == {threading.current_thread()}
+    assert not bus.pending()
+
+
+def test_coalesced_subscriber_gets_latest_payload_only():
+    bus = EventBus()
+    every, latest, other = [], [], []
+    bus.subscribe(TOPIC, every.append)
+    bus.subscribe(TOPIC, latest.append, coalesce=True)
+    bus.subscribe("other", other.append, coalesce=True)
+
+    publish = bus.publisher(TOPIC)
+    for index in range(5):
+        publish(index)
+    bus.publish("other", "a")
+
+    assert bus.drain() == 6
+    assert every == [0, 1, 2, 3, 4]
+    assert latest == [4] and other == ["a"]
+
+    # Sonraki boşaltmada yalnızca yeni olaylar teslim edilir
+    publish(5)
+    bus.drain()
+    assert latest == [4, 5] and every[-1] == 5
+
+
+def test_drain_limit_leaves_remaining_events_queued():
+    bus = EventBus()
+    every, latest = [], []
+    bus.subscribe(TOPIC, every.append)
+    bus.subscribe(TOPIC, latest.append, coalesce=True)
+    for index in range(EVENT_DRAIN_LIMIT + 5):
+        bus.publish(TOPIC, index)
+
+    assert bus.drain() == EVENT_DRAIN_LIMIT
+    assert len(every) == EVENT_DRAIN_LIMIT and latest == [EVENT_DRAIN_LIMIT - 1]
+    assert bus.pending()
+
+    assert bus.drain(limit=2) == 2
+    assert bus.drain() == 3 and latest[-1] == EVENT_DRAIN_LIMIT + 4
+    assert bus.drain() == 0
+
+
+def test_raising_handler_does_not_block_other_handlers():
+    bus = EventBus()
+    received = []
+
+    def broken(_payload):
+        raise RuntimeError("abone hatası")
+
+    bus.subscribe(TOPIC, broken)
+    bus.subscribe(TOPIC, received.append)
+    bus.subscribe(TOPIC, broken, coalesce=True)
+    bus.subscribe(TOPIC, lambda payload: received.append(("son", payload)), coalesce=True)
+    bus.publish(TOPIC, 1)
+    bus.publish(TOPIC, 2)
+
+    assert bus.drain() == 2
+    assert received == [1, 2, ("son", 2)]
+
+
+def test_unsubscribe():
+    bus = EventBus()
+    received = []
+    bus.subscribe(TOPIC, received.append)
+    bus.subscribe(TOPIC, received.append, coalesce=True)
+
+    bus.unsubscribe(TOPIC, received.append)
+    bus.publish(TOPIC, 1)
+    bus.drain()
+
+    assert received == []
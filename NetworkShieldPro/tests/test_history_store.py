@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+"""HistoryStore saklama sınırı, sayfalama ve işlem geri alma testleri"""
+
+import sqlite3
+
+import pytest
+
+from modules.arp_table import ArpTable, SnapshotPool
+from modules.history_store import HISTORY_MAX_SCANS, HistoryStore
+
+
+def _table(*hosts):
+    return ArpTable.from_entries([{"ip": f"192.0.2.{host}", "mac": "02:00:00:00:00:%02x" % host, "interface": "eth0"}
+                                  for host in hosts])
+
+
+def _result(timestamp, table, threat_level="none"):
+    suspicious = []
+    if threat_level != "none":
+        suspicious.append({"type": "gateway_mac_changed", "ip": "192.0.2.1", "mac": "02:66:66:66:66:66",
+                           "threat_level": threat_level, "message": "m"})
+    return {"timestamp": timestamp, "arp_table": table, "gateway": {"ip": "192.0.2.1", "mac": "02:00:00:00:00:01"},
+            "suspicious_entries": suspicious, "threat_level": threat_level, "duration": 0.1}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.db"), pool=SnapshotPool())
+    yield store
+    store.close()
+
+
+def _snapshot_rows(store):
+    return (store.conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0],
+            store.conn.execute("SELECT COUNT(*) FROM snapshot_entries").fetchone()[0])
+
+
+def test_default_retention_limit(store):
+    assert store.max_scans == HISTORY_MAX_SCANS
+
+
+def test_retention_drops_oldest_scans_and_orphan_snapshots(store):
+    store.max_scans = 3
+    shared = _table(1, 2)
+    ids = [store.add_scan(_result(1000.0, _table(1, 3), "high"))]
+    ids += [store.add_scan(_result(1001.0 + index, table))
+            for index, table in enumerate([shared, _table(1, 4), shared, _table(1, 5)])]
+
+    assert [result["scan_id"] for result in store.page(0, 10, newest_first=False)] == ids[2:]
+    # İlk taramanın tablosu silinir; hâlâ başvurulan paylaşılan tablo korunur
+    assert _snapshot_rows(store) == (3, 6)
+    assert store.statistics() == {"total_scans": 3, "high_threats": 0,
+                                  "first_timestamp": 1002.0, "last_timestamp": 1004.0}
+
+    store.add_scan(_result(1005.0, _table(1, 6)))
+    store.add_scan(_result(1006.0, _table(1, 7)))
+    assert _snapshot_rows(store) == (3, 6)
+    assert shared.digest() not in {row[0] for row in store.conn.execute("SELECT hash FROM snapshots")}
+
+
+def test_page_and_page_after_ordering(store):
+    ids = [store.add_scan(_result(1000.0 + index, _table(1, 10 + index))) for index in range(7)]
+
+    assert [result["scan_id"] for result in store.page(0, 3)] == ids[:-4:-1]
+    assert [result["scan_id"] for result in store.page(2, 3, newest_first=False)] == ids[2:5]
+    assert [result["scan_id"] for result in store._page_after(ids[4], 10, newest_first=True)] == ids[3::-1]
+    assert [result["scan_id"] for result in store._page_after(ids[4], 10, newest_first=False)] == ids[5:]
+
+    # Tablosuz sayfalarda ARP tablosu yüklenmez, özet korunur
+    light = store.page(0, 1, include_arp_table=False)[0]
+    assert "arp_table" not in light and light["arp_snapshot"] == _table(1, 16).digest()
+    assert [entry["ip"] for entry in store.last()["arp_table"].to_entries()] == ["192.0.2.1", "192.0.2.16"]
+    assert [result["timestamp"] for result in store.history()] == [1000.0 + index for index in range(7)]
+
+
+def test_statistics(store):
+    assert store.statistics() == {"total_scans": 0, "high_threats": 0, "first_timestamp": None,
+                                  "last_timestamp": None}
+
+    store.add_scan(_result(1000.0, _table(1), "high"))
+    store.add_scan(_result(1001.0, _table(1), "medium"))
+    store.add_scan(_result(1002.0, _table(1, 2), "high"))
+
+    assert store.statistics() == {"total_scans": 3, "high_threats": 2, "first_timestamp": 1000.0,
+                                  "last_timestamp": 1002.0}
+
+
+def test_clear_removes_everything(store):
+    store.add_scan(_result(1000.0, _table(1), "high"))
+
+    store.clear()
+
+    assert store.count() == 0 and _snapshot_rows(store) == (0, 0)
+    assert store.conn.execute("SELECT COUNT(*) FROM suspicious_entries").fetchone()[0] == 0
+
+
+def test_failed_clear_is_rolled_back(store):
+    store.add_scan(_result(1000.0, _table(1), "high"))
+    store.conn.execute("CREATE TRIGGER keep_snapshots BEFORE DELETE ON snapshots "
+                       "BEGIN SELECT RAISE(ABORT, 'silme engellendi'); END")
+
+    with pytest.raises(sqlite3.Error):
+        store.clear()
+
+    # Yarım kalan silme geri alınır; bağlantı yeni işlemler için kullanılabilir
+    assert store.count() == 1 and store.statistics()["high_threats"] == 1
+    store.conn.execute("DROP TRIGGER keep_snapshots")
+    store.add_scan(_result(1001.0, _table(2)))
+    assert store.count() == 2
+
+
+def test_missing_database_directory_is_created(tmp_path):
+    store = HistoryStore(str(tmp_path / "data" / "history.db"), pool=SnapshotPool())
+    try:
+        store.add_scan(_result(1000.0, _table(1)))
+        assert store.count() == 1 and (tmp_path / "data" / "history.db").exists()
+    finally:
+        store.close()
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+"""
+Rtnetlink ayrıştırıcı testleri.
+
+rtm_getneigh_dump.bin ve rtm_getroute_dump.bin, çekirdeğin RTM_GETNEIGH ve
+RTM_GETROUTE döküm isteklerine (sıra no 1) verdiği gerçek cevapların ham
+baytlarıdır: lo (ifindex 1) ve eth0 (ifindex 4) arayüzleri, 192.0.2.1
+ağ geçidi ve 192.0.2.0/24 yerel ağı.
+"""
+
+import errno
+import socket
+import struct
+
+import pytest
+
+from conftest import read_fixture
+from modules import netlink
+from modules.netlink import (NLMSG_DONE, NLMSG_ERROR, RTM_NEWNEIGH, RTM_NEWROUTE, NUD_NOARP, NUD_STALE,
+                             RT_TABLE_MAIN, NLMSGHDR, RTMSG, RTATTR, RTA_GATEWAY, RTA_OIF, RTA_PRIORITY,
+                             NetlinkError, RtnetlinkClient, find_default_route, iter_messages,
+                             neighbors_to_entries, parse_neighbor, parse_route)
+
+# Kaydın alındığı sistemdeki arayüz indeksleri
+IF_CACHE = {1: "lo", 4: "eth0"}
+
+
+def _message(msg_type, payload, seq=1, flags=netlink.NLM_F_MULTI):
+    """Yükü 4 bayt hizalı netlink mesajına sarar"""
+    data = NLMSGHDR.pack(NLMSGHDR.size + len(payload), msg_type, flags, seq, 0) + payload
+    return data + b"\0" * (-len(data) % 4)
+
+
+def _attribute(attr_type, value):
+    data = RTATTR.pack(RTATTR.size + len(value), attr_type) + value
+    return data + b"\0" * (-len(data) % 4)
+
+
+def _default_route(gateway, oif, priority):
+    """RTA_GATEWAY/RTA_OIF/RTA_PRIORITY öznitelikli ana tablo varsayılan rotası"""
+    header = RTMSG.pack(socket.AF_INET, 0, 0, 0, RT_TABLE_MAIN, 3, 0, 1, 0)
+    return header + (_attribute(RTA_GATEWAY, socket.inet_aton(gateway))
+                     + _attribute(RTA_OIF, struct.pack("=I", oif))
+                     + _attribute(RTA_PRIORITY, struct.pack("=I", priority)))
+
+
+class FakeSocket:
+    """Kaydedilmiş cevapları recv_into ile parça parça veren soket"""
+    def __init__(self, *chunks):
+        self.chunks = list(chunks)
+        self.sent = []
+
+    def send(self, data):
+        self.sent.append(data)
+
+    def recv_into(self, buffer):
+        chunk = self.chunks.pop(0)
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+    def close(self):
+        pass
+
+
+def _client(*chunks):
+    client = RtnetlinkClient.__new__(RtnetlinkClient)
+    client.sock = FakeSocket(*chunks)
+    client.seq = 0
+    client.if_cache = dict(IF_CACHE)
+    client._buffer = bytearray(netlink.RECV_BUFFER_SIZE)
+    return client
+
+
+def test_iter_messages_splits_recorded_neighbor_dump():
+    messages = list(iter_messages(read_fixture("rtm_getneigh_dump.bin")))
+
+    assert [msg_type for msg_type, _flags, _seq, _payload in messages] == [RTM_NEWNEIGH, RTM_NEWNEIGH, NLMSG_DONE]
+    assert {seq for _type, _flags, seq, _payload in messages} == {1}
+    assert all(flags & netlink.NLM_F_MULTI for _type, flags, _seq, _payload in messages)
+
+
+def test_iter_messages_stops_at_truncated_header():
+    data = read_fixture("rtm_getneigh_dump.bin")
+    first_length = struct.unpack_from("=I", data, 0)[0]
+
+    # İkinci mesajın başlığı yarım kalırsa yalnızca ilk mesaj döner
+    assert len(list(iter_messages(data[:first_length + 8]))) == 1
+    assert list(iter_messages(b"")) == []
+
+
+def test_parse_neighbor_recorded_entries():
+    neighbors = [parse_neighbor(bytes(payload), IF_CACHE)
+                 for msg_type, _flags, _seq, payload in iter_messages(read_fixture("rtm_getneigh_dump.bin"))
+                 if msg_type == RTM_NEWNEIGH]
+
+    assert neighbors == [
+        {"ip": "0.0.0.0", "mac": "00:00:00:00:00:00", "interface": "lo", "state": NUD_NOARP, "family": socket.AF_INET},
+        {"ip": "192.0.2.1", "mac": "02:fc:00:00:00:05", "interface": "eth0", "state": NUD_STALE,
+         "family": socket.AF_INET},
+    ]
+    # ARP'siz loopback kaydı 'arp -n' çıktısında olmadığı gibi atlanır
+    assert neighbors_to_entries(neighbors) == [{"ip": "192.0.2.1", "mac": "02:fc:00:00:00:05", "interface": "eth0"}]
+
+
+def test_parse_neighbor_rejects_short_payload_and_missing_destination():
+    assert parse_neighbor(b"\0" * 4) is None
+    assert parse_neighbor(netlink.NDMSG.pack(socket.AF_INET, 0, 0, 4, NUD_STALE, 0, 1), IF_CACHE) is None
+
+
+def test_parse_route_recorded_entries():
+    routes = [parse_route(bytes(payload), IF_CACHE)
+              for msg_type, _flags, _seq, payload in iter_messages(read_fixture("rtm_getroute_dump.bin"))
+              if msg_type == RTM_NEWROUTE]
+
+    assert len(routes) == 7
+    assert routes[0] == {"family": socket.AF_INET, "dst": None, "dst_len": 0, "gateway": "192.0.2.1",
+                         "interface": "eth0", "priority": 0, "table": RT_TABLE_MAIN}
+    assert routes[1]["dst"] == "192.0.2.0" and routes[1]["dst_len"] == 24 and routes[1]["gateway"] is None
+    # Yerel tablo (255) kayıtları RTA_TABLE özniteliğinden okunur
+    assert {route["table"] for route in routes[2:]} == {255}
+
+
+def test_find_default_route_recorded_and_lowest_metric():
+    routes = [parse_route(bytes(payload), IF_CACHE)
+              for msg_type, _flags, _seq, payload in iter_messages(read_fixture("rtm_getroute_dump.bin"))
+              if msg_type == RTM_NEWROUTE]
+    assert find_default_route(routes)["gateway"] == "192.0.2.1"
+
+    # Çok arayüzlü sistem: en düşük metrikli varsayılan rota seçilir
+    routes += [parse_route(_default_route("10.0.0.1", 4, 600), IF_CACHE),
+               parse_route(_default_route("172.16.0.1", 1, 100), IF_CACHE)]
+    routes[0]["priority"] = 1024
+    assert find_default_route(routes)["gateway"] == "172.16.0.1"
+
+    assert find_default_route([route for route in routes if route["dst_len"]]) is None
+
+
+def test_dump_neighbors_from_recorded_reply_split_across_reads():
+    data = read_fixture("rtm_getneigh_dump.bin")
+    first_length = struct.unpack_from("=I", data, 0)[0]
+    client = _client(data[:first_length], data[first_length:])
+
+    neighbors = client.dump_neighbors()
+
+    assert [neighbor["ip"] for neighbor in neighbors] == ["0.0.0.0", "192.0.2.1"]
+    length, msg_type, flags, seq, _pid = NLMSGHDR.unpack_from(client.sock.sent[0], 0)
+    assert (msg_type, seq) == (netlink.RTM_GETNEIGH, 1) and flags & netlink.NLM_F_DUMP
+
+
+def test_dump_ignores_replies_with_other_sequence_numbers():
+    stale = _message(RTM_NEWROUTE, _default_route("10.9.9.9", 4, 0), seq=7)
+    client = _client(stale + read_fixture("rtm_getroute_dump.bin"))
+
+    routes = client.dump_routes()
+
+    assert len(routes) == 7 and "10.9.9.9" not in {route["gateway"] for route in routes}
+
+
+def test_dump_raises_netlink_error_from_nlmsg_error():
+    # struct nlmsgerr: negatif errno ve hataya yol açan isteğin başlığı
+    error = _message(NLMSG_ERROR, struct.pack("=i", -errno.EPERM) + NLMSGHDR.pack(28, 26, 0x301, 1, 0), flags=0)
+    client = _client(error)
+
+    with pytest.raises(NetlinkError) as excinfo:
+        client.dump_routes()
+    assert excinfo.value.errno == errno.EPERM
+
+
+def test_dump_treats_zero_error_as_acknowledgement():
+    data = read_fixture("rtm_getroute_dump.bin")
+    first_length = struct.unpack_from("=I", data, 0)[0]
+    ack = _message(NLMSG_ERROR, struct.pack("=i", 0) + NLMSGHDR.pack(28, 26, 0x301, 1, 0), flags=0)
+    client = _client(data[:first_length] + ack)
+
+    routes = client.dump_routes()
+
+    assert [route["gateway"] for route in routes] == ["192.0.2.1"]
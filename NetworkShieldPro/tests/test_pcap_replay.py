@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+"""
+Çevrimdışı yakalama dosyası oynatma testleri.
+
+arp_capture_le.pcapng ve arp_capture_be.pcapng, arp_capture.pcap ile aynı altı
+çerçeveyi (bkz. test_arp_sniffer.py) küçük ve büyük uçlu tek bir bölümde,
+eth0 arayüzü ve mikrosaniye çözünürlüğüyle içerir. arp_capture_mixed.pcapng
+iki bölümlüdür: küçük uçlu eth0 bölümünde ilk iki çerçeve, büyük uçlu eth1
+bölümünde sahte ağ geçidi cevabı.
+"""
+
+import struct
+
+import pytest
+
+from conftest import fixture_path, read_fixture
+from modules.arp_sniffer import StreamingARPDetector
+from modules.pcap_replay import iter_arp_entries, iter_capture_frames, replay_capture
+
+GATEWAY = {"ip": "192.0.2.1", "mac": "02:fc:00:00:00:05"}
+
+TIMESTAMPS = [1000.000001, 1000.5, 1001.0, 1002.0, 1003.0, 1004.0]
+
+
+def _frames(name):
+    """Çerçeveleri eşleme kapanmadan önce baytlara kopyalar"""
+    frames = []
+    for timestamp, interface, frame in iter_capture_frames(fixture_path(name)):
+        frames.append((timestamp, interface, bytes(frame)))
+        frame.release()
+    return frames
+
+
+@pytest.mark.parametrize("name", ["arp_capture.pcap", "arp_capture_le.pcapng", "arp_capture_be.pcapng"])
+def test_iter_capture_frames_formats_and_byte_orders(name):
+    frames = _frames(name)
+
+    assert [timestamp for timestamp, _interface, _frame in frames] == pytest.approx(TIMESTAMPS)
+    assert all(len(frame) == 60 for _timestamp, _interface, frame in frames)
+    # Çerçeve içeriği dosya formatından ve bayt sırasından bağımsızdır
+    assert [frame for _timestamp, _interface, frame in frames] == [
+        frame for _timestamp, _interface, frame in _frames("arp_capture.pcap")]
+    expected_interface = "unknown" if name.endswith(".pcap") else "eth0"
+    assert {interface for _timestamp, interface, _frame in frames} == {expected_interface}
+
+
+def test_iter_capture_frames_sections_with_different_byte_orders():
+    frames = _frames("arp_capture_mixed.pcapng")
+
+    assert [(timestamp, interface) for timestamp, interface, _frame in frames] == [
+        (pytest.approx(1000.000001), "eth0"), (1000.5, "eth0"), (1002.0, "eth1")]
+
+
+def test_iter_capture_frames_stops_at_unknown_byte_order(tmp_path):
+    data = bytearray(read_fixture("arp_capture_le.pcapng"))
+    struct.pack_into("<I", data, 8, 0xdeadbeef)
+    path = tmp_path / "broken.pcapng"
+    path.write_bytes(bytes(data))
+
+    assert list(iter_capture_frames(str(path))) == []
+
+
+def test_iter_capture_frames_rejects_unknown_format(tmp_path):
+    path = tmp_path / "capture.txt"
+    path.write_bytes(b"not a capture file")
+
+    with pytest.raises(ValueError):
+        list(iter_capture_frames(str(path)))
+
+
+def test_iter_arp_entries_skips_probes_and_other_frames():
+    entries = [entry for _timestamp, entry in iter_arp_entries(fixture_path("arp_capture_be.pcapng"))]
+
+    assert entries == [
+        {"ip": "192.0.2.10", "mac": "02:00:00:00:00:0a", "interface": "eth0"},
+        {"ip": "192.0.2.1", "mac": "02:fc:00:00:00:05", "interface": "eth0"},
+        {"ip": "192.0.2.1", "mac": "02:66:66:66:66:66", "interface": "eth0"},
+        {"ip": "192.0.2.11", "mac": "02:00:00:00:00:0b", "interface": "eth0"},
+    ]
+
+
+@pytest.mark.parametrize("name", ["arp_capture.pcap", "arp_capture_be.pcapng"])
+def test_replay_capture_runs_streaming_rules(name):
+    reported = []
+
+    summary = replay_capture(fixture_path(name), GATEWAY, on_alerts=lambda timestamp, alerts: reported.append(timestamp))
+
+    # IPv4 çerçevesi dedektöre ulaşmaz; probe işlenir ama bağlama oluşturmaz
+    assert summary["events"] == 5
+    assert [(alert["type"], alert["ip"], alert["timestamp"]) for alert in summary["alerts"]] == [
+        ("gateway_mac_changed", "192.0.2.1", 1002.0), ("sender_mismatch", "192.0.2.11", 1003.0)]
+    assert reported == [1002.0, 1003.0]
+    assert {entry["ip"]: entry["mac"] for entry in summary["arp_table"]} == {
+        "192.0.2.10": "02:00:00:00:00:0a",
+        "192.0.2.1": "02:66:66:66:66:66",
+        "192.0.2.11": "02:00:00:00:00:0b",
+    }
+
+
+def test_replay_capture_feeds_given_detector():
+    detector = StreamingARPDetector(gateway=GATEWAY, arp_table=[
+        {"ip": "192.0.2.1", "mac": "02:fc:00:00:00:05", "interface": "eth0"}])
+
+    summary = replay_capture(fixture_path("arp_capture_mixed.pcapng"), detector=detector)
+
+    assert [(alert["type"], alert["timestamp"]) for alert in summary["alerts"]] == [("gateway_mac_changed", 1002.0)]
+    assert detector.packet_count == summary["events"] == 3
+    # Bağlamalar paketin yakalandığı arayüzü taşır
+    assert {entry["ip"]: entry["interface"] for entry in summary["arp_table"]} == {
+        "192.0.2.1": "eth1", "192.0.2.10": "eth0"}
+
+
+def test_replay_capture_gratuitous_storm(tmp_path):
+    data = bytearray(read_fixture("arp_capture.pcap"))
+    # Tek bir gratuitous istek (gönderen IP = hedef IP) milisaniye arayla 25 kez tekrarlanır
+    frame = bytearray(data[24 + 16:24 + 16 + 60])
+    frame[38:42] = frame[28:32]
+    records = b"".join(struct.pack("<IIII", 2000, index * 1000, 60, 60) + frame for index in range(25))
+    path = tmp_path / "storm.pcap"
+    path.write_bytes(bytes(data[:24]) + records)
+
+    summary = replay_capture(str(path), GATEWAY)
+
+    assert [(alert["type"], alert["timestamp"]) for alert in summary["alerts"]] == [
+        ("gratuitous_storm", pytest.approx(2000.020))]
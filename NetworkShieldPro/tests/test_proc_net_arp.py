@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+"""/proc/net/arp sütunlu ayrıştırıcı testleri"""
+
+from modules.arp_detector import _parse_arp_n_output, parse_proc_net_arp, read_proc_net_arp
+from modules.arp_table import ArpTable
+
+HEADER = b"IP address       HW type     Flags       HW address            Mask     Device\n"
+
+ROWS = (b"192.0.2.1        0x1         0x2         02:fc:00:00:00:05     *        eth0\n"
+        b"192.0.2.10       0x1         0x2         02:00:00:00:00:0a     *        eth0\n"
+        b"198.51.100.1     0x1         0x6         02:fc:00:00:01:01     *        eth1\n")
+
+
+def test_parse_regular_table():
+    table = parse_proc_net_arp(HEADER + ROWS)
+
+    assert table.to_entries() == [
+        {"ip": "192.0.2.1", "mac": "02:fc:00:00:00:05", "interface": "eth0"},
+        {"ip": "192.0.2.10", "mac": "02:00:00:00:00:0a", "interface": "eth0"},
+        {"ip": "198.51.100.1", "mac": "02:fc:00:00:01:01", "interface": "eth1"},
+    ]
+    # Son satır sonu olmadan ve metin olarak verilen içerik aynı sonucu verir
+    assert parse_proc_net_arp((HEADER + ROWS).rstrip(b"\n")).to_entries() == table.to_entries()
+    assert parse_proc_net_arp((HEADER + ROWS).decode()).to_entries() == table.to_entries()
+
+
+def test_parse_skips_incomplete_and_non_ethernet_rows():
+    data = HEADER + ROWS + (
+        b"192.0.2.20       0x1         0x0         00:00:00:00:00:00     *        eth0\n"
+        b"10.0.0.1         0x20        0x2         80:00:02:08:fe:80:00:00:00:00:00:00:00:02:c9:03:00:0a:8b:91 *  ib0\n")
+
+    assert [entry["ip"] for entry in parse_proc_net_arp(data).to_entries()] == [
+        "192.0.2.1", "192.0.2.10", "198.51.100.1"]
+
+
+def test_parse_irregular_rows_fall_back_to_line_parsing():
+    # Eksik alanlı satır sütun hizasını bozar; yalnızca o satır atlanır
+    data = HEADER + ROWS.replace(b"*        eth0\n192.0.2.10", b"eth0\n192.0.2.10") + (
+        b"300.0.0.1        0x1         0x2         02:00:00:00:00:99     *        eth0\n")
+
+    assert [entry["ip"] for entry in parse_proc_net_arp(data).to_entries()] == ["192.0.2.10", "198.51.100.1"]
+    assert len(parse_proc_net_arp(b"")) == len(parse_proc_net_arp(HEADER)) == 0
+
+
+def test_read_matches_arp_n_text_path(tmp_path):
+    path = tmp_path / "arp"
+    path.write_bytes(HEADER + ROWS)
+    arp_n = ("Address                  HWtype  HWaddress           Flags Mask            Iface\n"
+             "192.0.2.1                ether   02:fc:00:00:00:05   C                     eth0\n"
+             "192.0.2.10               ether   02:00:00:00:00:0a   C                     eth0\n"
+             "198.51.100.1             ether   02:fc:00:00:01:01   CM                    eth1\n")
+
+    table = read_proc_net_arp(str(path))
+
+    assert isinstance(table, ArpTable)
+    assert table.to_entries() == ArpTable.from_entries(_parse_arp_n_output(arp_n)).to_entries()
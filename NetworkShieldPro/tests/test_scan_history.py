@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+"""ScanHistoryBuffer anahtar kare/fark saklama ve tutma sınırı testleri"""
+
+import gc
+import random
+
+from modules.arp_table import ArpTable, SnapshotPool
+from modules.scan_history import DELTA, KEYFRAME, ScanHistoryBuffer
+
+
+def _table(hosts):
+    """{son oktet: MAC son okteti} sözlüğünden ArpTable oluşturur"""
+    return ArpTable.from_entries([{"ip": f"192.0.2.{host}", "mac": "02:00:00:00:00:%02x" % mac, "interface": "eth0"}
+                                  for host, mac in sorted(hosts.items())])
+
+
+def _rows(table):
+    return sorted(zip(table.ips, table.macs, table.ifaces))
+
+
+def _add(buffer, table, timestamp, threat_level="none"):
+    return buffer.add_scan({"timestamp": timestamp, "arp_table": table, "threat_level": threat_level,
+                            "suspicious_entries": [{"type": "x", "threat_level": threat_level}]})
+
+
+def _kinds(buffer):
+    return [record[1] for record in buffer._records]
+
+
+def _accounted_bytes(buffer):
+    """Kayıt ve anahtar kare boyutlarından nbytes'ın olması gereken değeri"""
+    return (sum(record[3] for record in buffer._records)
+            + sum(table.nbytes for table, _references in buffer._snapshots.values()))
+
+
+def _assert_pages_match(buffer, expected):
+    """Tüm sayfalar (en yeniden eskiye) beklenen tablolarla eşleşmeli"""
+    results = buffer.page(0, len(expected) + 1)
+    assert [_rows(result["arp_table"]) for result in results] == [_rows(table) for table in reversed(expected)]
+
+
+def test_reconstruction_across_keyframe_boundaries():
+    buffer = ScanHistoryBuffer(max_scans=20, keyframe_interval=3, pool=SnapshotPool())
+    hosts = {1: 5}
+    tables = []
+    for step in range(8):
+        hosts[10 + step] = step
+        hosts.pop(10 + step - 2, None)
+        tables.append(_table(hosts))
+        _add(buffer, tables[-1], 1000.0 + step)
+
+    assert _kinds(buffer) == [KEYFRAME, DELTA, DELTA] * 2 + [KEYFRAME, DELTA]
+
+    # Havuzdaki kopyalar bırakılınca fark kayıtları en yakın anahtar kareden oluşturulur
+    expected = [_rows(table) for table in tables]
+    del tables
+    gc.collect()
+    results = buffer.page(0, 10, newest_first=False)
+    assert [_rows(result["arp_table"]) for result in results] == expected
+    assert [result["scan_id"] for result in buffer._page_after(3, 2, newest_first=False)] == [4, 5]
+
+
+def test_eviction_promotes_following_delta_to_keyframe():
+    buffer = ScanHistoryBuffer(max_scans=3, keyframe_interval=10, pool=SnapshotPool())
+    tables = [_table({1: 5, 10 + step: step}) for step in range(5)]
+    for step, table in enumerate(tables):
+        _add(buffer, table, 1000.0 + step)
+
+    assert _kinds(buffer) == [KEYFRAME, DELTA, DELTA]
+    assert [record[0]["scan_id"] for record in buffer._records] == [3, 4, 5]
+    assert set(buffer._snapshots) == {tables[2].digest()}
+    assert buffer.nbytes == _accounted_bytes(buffer)
+    _assert_pages_match(buffer, tables[2:])
+
+
+def test_eviction_promotes_delta_without_pooled_copy():
+    buffer = ScanHistoryBuffer(max_scans=2, keyframe_interval=10, pool=SnapshotPool())
+    _add(buffer, _table({1: 5}), 1000.0)
+    _add(buffer, _table({1: 5, 2: 6}), 1001.0)
+    gc.collect()
+
+    # İkinci tablonun havuzdaki kopyası yok; anahtar kare önceki kareden ve farktan oluşturulur
+    _add(buffer, _table({1: 5, 2: 6, 3: 7}), 1002.0)
+
+    assert _kinds(buffer) == [KEYFRAME, DELTA]
+    assert _rows(buffer.page(0, 2)[1]["arp_table"]) == _rows(_table({1: 5, 2: 6}))
+    assert buffer.nbytes == _accounted_bytes(buffer)
+
+
+def test_identical_keyframe_is_shared_across_records():
+    buffer = ScanHistoryBuffer(max_scans=10, keyframe_interval=10, pool=SnapshotPool())
+    first, second = _table({1: 5, 2: 6}), _table({1: 5, 3: 7})
+    _add(buffer, first, 1000.0)
+    _add(buffer, second, 1001.0)
+    before = buffer.nbytes
+
+    # Tutulan anahtar kareyle aynı tablo yeniden saklanmaz, özete başvurulur
+    _add(buffer, _table({1: 5, 2: 6}), 1002.0)
+
+    assert _kinds(buffer) == [KEYFRAME, DELTA, KEYFRAME]
+    assert buffer._records[0][2] == buffer._records[2][2] == first.digest()
+    assert buffer._snapshots[first.digest()][1] == 2
+    assert buffer.nbytes - before == buffer._records[2][3]
+
+    # İlk kayıt çıkarılınca paylaşılan tablo diğer kayıt için tutulmaya devam eder
+    buffer.max_scans = 2
+    _add(buffer, second, 1003.0)
+    assert buffer._snapshots[first.digest()][1] == 1
+    assert buffer.nbytes == _accounted_bytes(buffer)
+    _assert_pages_match(buffer, [second, first, second][1:])
+
+
+def test_max_bytes_accounting_returns_to_baseline_after_clear():
+    def fill(buffer):
+        for step in range(30):
+            _add(buffer, _table({host: (host + step) % 7 for host in range(1, 20)}), 1000.0 + step, "high")
+
+    buffer = ScanHistoryBuffer(max_scans=None, max_bytes=8000, keyframe_interval=4, pool=SnapshotPool())
+    assert buffer.nbytes == 0
+    fill(buffer)
+    filled = buffer.nbytes
+    statistics = buffer.statistics()
+
+    assert 1 < buffer.count() < 30 and buffer.nbytes <= 8000
+    assert buffer.nbytes == _accounted_bytes(buffer)
+    assert statistics["high_threats"] == buffer.count()
+
+    buffer.clear()
+    assert (buffer.nbytes, buffer.count(), buffer._snapshots) == (0, 0, {})
+    assert buffer.statistics()["high_threats"] == 0
+
+    # Temizlikten sonra aynı taramalar aynı miktarda bellek kullanır
+    fill(buffer)
+    assert buffer.nbytes == filled
+    assert buffer._records[0][1] == KEYFRAME
+
+
+def test_randomized_history_matches_ground_truth():
+    rng = random.Random(1234)
+    buffer = ScanHistoryBuffer(max_scans=23, keyframe_interval=5, pool=SnapshotPool())
+    hosts = {}
+    truth = []
+
+    for step in range(200):
+        for _ in range(rng.randrange(4)):
+            action = rng.random()
+            host = rng.randrange(1, 40)
+            if action < 0.5:
+                hosts[host] = rng.randrange(8)
+            elif action < 0.8:
+                hosts.pop(host, None)
+        # Zaman zaman daha önce görülmüş bir tablo tekrarlanır (paylaşılan anahtar kare)
+        table = truth[rng.randrange(len(truth))] if truth and rng.random() < 0.1 else _table(hosts)
+        truth.append(table)
+        assert _add(buffer, table, 1000.0 + step) == step + 1
+
+        if step % 7 == 0:
+            gc.collect()
+        assert buffer.nbytes == _accounted_bytes(buffer)
+
+    retained = truth[-23:]
+    expected = [_rows(table) for table in retained]
+    del truth, retained, table
+    gc.collect()
+
+    assert buffer.count() == 23 and buffer._records[0][1] == KEYFRAME
+    for offset in range(0, 23, 4):
+        page = buffer.page(offset, 4, newest_first=False)
+        assert [_rows(result["arp_table"]) for result in page] == expected[offset:offset + 4]
+        assert [result["scan_id"] for result in page] == list(range(178 + offset, 178 + offset + len(page)))
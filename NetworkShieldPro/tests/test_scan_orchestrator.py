@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+"""ScanOrchestrator arayüz başına tarama ve iptal testleri"""
+
+import threading
+
+from modules.arp_table import ArpTable
+from modules.scan_orchestrator import ScanOrchestrator, parse_proc_net_route
+
+ROUTES = {"eth0": ("192.0.2.1", 100), "eth1": ("198.51.100.1", 200)}
+
+
+def _table(gateway_mac="02:fc:00:00:00:05"):
+    return ArpTable.from_entries([
+        {"ip": "192.0.2.1", "mac": gateway_mac, "interface": "eth0"},
+        {"ip": "192.0.2.10", "mac": "02:00:00:00:00:0a", "interface": "eth0"},
+        {"ip": "198.51.100.1", "mac": "02:fc:00:00:01:01", "interface": "eth1"},
+    ])
+
+
+def _orchestrator(tables, collectors=None):
+    tables = list(tables)
+    return ScanOrchestrator(max_workers=4, collectors=collectors, table_reader=lambda: tables.pop(0),
+                            route_reader=lambda: dict(ROUTES))
+
+
+def test_parse_proc_net_route_default_routes():
+    data = ("Iface\tDestination\tGateway \tFlags\tRefCnt\tUse\tMetric\tMask\t\tMTU\tWindow\tIRTT\n"
+            "eth0\t00000000\t010200C0\t0003\t0\t0\t100\t00000000\t0\t0\t0\n"
+            "eth0\t000200C0\t00000000\t0001\t0\t0\t0\t00FFFFFF\t0\t0\t0\n")
+
+    assert parse_proc_net_route(data) == [("eth0", "192.0.2.1", 100)]
+
+
+def test_scan_reports_per_interface_gateways_and_changes():
+    orchestrator = _orchestrator([_table(), _table("02:66:66:66:66:66")])
+    try:
+        first = orchestrator.scan()
+        second = orchestrator.scan()
+    finally:
+        orchestrator.close()
+
+    assert first["gateway"] == {"ip": "192.0.2.1", "mac": "02:fc:00:00:00:05"}
+    assert {name: summary["gateway"]["ip"] for name, summary in first["interfaces"].items()} == {
+        "eth0": "192.0.2.1", "eth1": "198.51.100.1"}
+    assert first["changes"] == [] and len(first["arp_table"]) == 3
+
+    assert [(change["type"], change["interface"]) for change in second["changes"]] == [("changed", "eth0")]
+    assert [(entry["type"], entry["interface"]) for entry in second["suspicious_entries"]] == [
+        ("gateway_mac_changed", "eth0")]
+
+
+def test_cancelled_scan_leaves_trackers_unchanged():
+    stop_event = threading.Event()
+
+    def collector(interface, _gateway_ip, event):
+        # eth1 toplaması sürerken tarama iptal edilir; eth0 toplaması tamamlanmış olabilir
+        if interface == "eth1" and event is stop_event:
+            stop_event.set()
+        return []
+
+    orchestrator = _orchestrator([_table(), _table("02:66:66:66:66:66"), _table("02:66:66:66:66:66")],
+                                 collectors=[collector])
+    try:
+        orchestrator.scan()
+        before = {name: dict(tracker.entries) for name, tracker in orchestrator.trackers.items()}
+
+        assert orchestrator.scan(stop_event) is None
+        assert {name: dict(tracker.entries) for name, tracker in orchestrator.trackers.items()} == before
+
+        # İptal edilen taramadaki değişim bir sonraki tam taramada bildirilir
+        result = orchestrator.scan()
+    finally:
+        orchestrator.close()
+
+    assert [entry["type"] for entry in result["suspicious_entries"]] == ["gateway_mac_changed"]
+
+
+class FakeRouteListener:
+    """drain() sonuçlarını sırayla veren RouteChangeListener yerine geçen nesne"""
+    def __init__(self):
+        self.pending = []
+
+    def drain(self):
+        return self.pending.pop(0) if self.pending else (False, set())
+
+    def close(self):
+        pass
+
+
+def _resolver(monkeypatch, ttl=60.0):
+    from modules import scan_orchestrator
+
+    reads = []
+
+    def read_default_routes(_route_path):
+        reads.append(dict(ROUTES))
+        return reads[-1]
+
+    monkeypatch.setattr(scan_orchestrator, "read_default_routes", read_default_routes)
+    resolver = scan_orchestrator.RouteResolver(ttl=ttl)
+    resolver._listener = FakeRouteListener()
+    return resolver, reads
+
+
+def test_route_resolver_caches_until_route_change(monkeypatch):
+    resolver, reads = _resolver(monkeypatch)
+
+    assert resolver.get() == ROUTES
+    assert resolver.get() == ROUTES and len(reads) == 1
+
+    # Komşu değişiklikleri rotaları etkilemez
+    resolver._listener.pending.append((False, {"192.0.2.1"}))
+    resolver.get()
+    assert len(reads) == 1
+
+    resolver._listener.pending.append((True, set()))
+    resolver.get()
+    assert len(reads) == 2
+
+
+def test_route_resolver_expires_after_ttl(monkeypatch):
+    resolver, reads = _resolver(monkeypatch, ttl=0.0)
+
+    resolver.get()
+    resolver.get()
+
+    assert len(reads) == 2
+
+
+def test_orchestrator_reads_routes_through_resolver(monkeypatch):
+    resolver, reads = _resolver(monkeypatch)
+    orchestrator = ScanOrchestrator(max_workers=2, table_reader=_table)
+    orchestrator.route_resolver.close()
+    orchestrator.route_resolver, orchestrator.route_reader = resolver, resolver.get
+    try:
+        orchestrator.scan()
+        orchestrator.scan()
+    finally:
+        orchestrator.close()
+
+    assert len(reads) == 1
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""SettingsStore ertelenen yazma ve hata bildirimi testleri"""
+
+import json
+import os
+
+from modules import settings
+from modules.history_store import HISTORY_DB_FILE
+from modules.settings import DEFAULT_SETTINGS, SETTINGS_FILE, SettingsStore
+
+
+def _store(path):
+    # Zamanlayıcı testte tetiklenmesin; yazmalar flush() ile yapılır
+    return SettingsStore(str(path), watch=False, write_delay=60.0)
+
+
+def _break_writes(store, monkeypatch):
+    def fail(_settings):
+        raise PermissionError(13, "Permission denied")
+    monkeypatch.setattr(store, "_write_file", fail)
+
+
+def test_update_is_deferred_until_flush(tmp_path):
+    path = tmp_path / "arp_settings.json"
+    path.write_text(json.dumps(DEFAULT_SETTINGS), encoding="utf-8")
+    store = _store(path)
+
+    assert store.set("scan_interval", 6) is True
+    assert store.get("scan_interval") == 6
+    assert json.loads(path.read_text(encoding="utf-8"))["scan_interval"] == 24
+
+    assert store.flush() is True
+    assert json.loads(path.read_text(encoding="utf-8"))["scan_interval"] == 6
+
+
+def test_replace_writes_immediately_and_returns_result(tmp_path, monkeypatch):
+    path = tmp_path / "arp_settings.json"
+    store = _store(path)
+
+    assert store.replace({"scan_interval": 12}) is True
+    assert json.loads(path.read_text(encoding="utf-8")) == {"scan_interval": 12}
+
+    _break_writes(store, monkeypatch)
+    assert store.replace({"scan_interval": 1}) is False
+    assert isinstance(store.last_error, PermissionError)
+
+
+def test_failed_deferred_write_is_surfaced_until_it_succeeds(tmp_path, monkeypatch):
+    path = tmp_path / "arp_settings.json"
+    path.write_text(json.dumps(DEFAULT_SETTINGS), encoding="utf-8")
+    store = _store(path)
+    write_file = store._write_file
+    _break_writes(store, monkeypatch)
+
+    assert store.set("dark_mode", True) is True
+    assert store.flush() is False
+
+    # Başarısız yazmanın ayarları kaybolmaz; sonraki güncellemeler hatayı bildirir
+    assert store.set("scan_interval", 3) is False
+    assert store.get("dark_mode") is True
+
+    monkeypatch.setattr(store, "_write_file", write_file)
+    assert store.flush() is True
+    assert store.last_error is None
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert (saved["dark_mode"], saved["scan_interval"]) == (True, 3)
+    assert store.set("scan_interval", 4) is True
+
+
+def test_external_edit_invalidates_cache_without_inotify(tmp_path, monkeypatch):
+    path = tmp_path / "arp_settings.json"
+    path.write_text(json.dumps(DEFAULT_SETTINGS), encoding="utf-8")
+    store = _store(path)
+    clock = [1000.0]
+    monkeypatch.setattr(settings.time, "monotonic", lambda: clock[0])
+    assert store.get("scan_interval") == 24
+
+    # Başka bir süreç dosyayı atomik olarak değiştirir
+    temp = tmp_path / "edit.tmp"
+    temp.write_text(json.dumps(dict(DEFAULT_SETTINGS, scan_interval=6, dark_mode=True)), encoding="utf-8")
+    os.replace(temp, path)
+
+    # Kontrol aralığı dolmadan önbellek kullanılır, dolunca dosya yeniden okunur
+    assert store.get("scan_interval") == 24
+    clock[0] += settings.SETTINGS_STAT_INTERVAL
+    assert (store.get("scan_interval"), store.get("dark_mode")) == (6, True)
+
+    # Yerinde yazma da (aynı inode) algılanır
+    path.write_text(json.dumps(dict(DEFAULT_SETTINGS, scan_interval=12)), encoding="utf-8")
+    clock[0] += settings.SETTINGS_STAT_INTERVAL
+    assert store.get("scan_interval") == 12
+
+
+def test_history_database_is_outside_watched_settings_directory():
+    # Veritabanı ve WAL yazmaları ayar izleyicisini uyandırmamalı
+    assert os.path.dirname(HISTORY_DB_FILE) != os.path.dirname(SETTINGS_FILE)
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+"""ARPStateTracker fark tabanlı takip testleri"""
+
+from modules.arp_detector import ARPStateTracker
+
+GATEWAY = {"ip": "192.0.2.1", "mac": "02:fc:00:00:00:05"}
+
+
+def _entry(ip, mac, interface="eth0"):
+    return {"ip": ip, "mac": mac, "interface": interface}
+
+
+def _types(items):
+    return [item["type"] for item in items]
+
+
+def _tracker(table):
+    tracker = ARPStateTracker(GATEWAY)
+    changes, _suspicious = tracker.update(table)
+    assert changes == []
+    return tracker
+
+
+def test_mac_change_and_removal():
+    tracker = _tracker([_entry("192.0.2.1", "02:fc:00:00:00:05"), _entry("192.0.2.10", "02:00:00:00:00:0a")])
+
+    changes, suspicious = tracker.update([_entry("192.0.2.1", "02:66:66:66:66:66")])
+
+    assert sorted((change["type"], change["ip"]) for change in changes) == [("changed", "192.0.2.1"),
+                                                                            ("removed", "192.0.2.10")]
+    assert _types(suspicious) == ["gateway_mac_changed"]
+
+
+def test_unchanged_table_produces_no_events():
+    table = [_entry("192.0.2.1", "02:fc:00:00:00:05"), _entry("192.0.2.10", "02:00:00:00:00:0a")]
+    tracker = _tracker(table)
+
+    assert tracker.update(list(reversed(table))) == ([], [])
+
+
+def test_reordered_duplicate_gateway_rows_produce_no_events():
+    # Windows 'arp -a' aynı IP'yi aynı arayüzde iki MAC ile listeleyebilir
+    table = [_entry("192.0.2.1", "02:fc:00:00:00:05"), _entry("192.0.2.1", "02:66:66:66:66:66"),
+             _entry("192.0.2.10", "02:00:00:00:00:0a")]
+    tracker = _tracker(table)
+
+    changes, suspicious = tracker.update([table[1], table[2], table[0]])
+
+    assert changes == []
+    assert _types(suspicious) == ["gateway_multiple_macs"]
+
+
+def test_removing_first_duplicate_row_reports_only_removal():
+    table = [_entry("192.0.2.1", "02:fc:00:00:00:05"), _entry("192.0.2.1", "02:66:66:66:66:66")]
+    tracker = _tracker(table)
+
+    changes, suspicious = tracker.update([table[1]])
+
+    assert [(change["type"], change["old_mac"]) for change in changes] == [("removed", "02:fc:00:00:00:05")]
+    assert suspicious == []
+
+    # Kalan kayıt yeniden sıralansa da tek başına kaldığında olay üretmez
+    assert tracker.update([table[1]]) == ([], [])
+
+
+def test_duplicate_row_mac_change_and_addition():
+    table = [_entry("192.0.2.1", "02:fc:00:00:00:05"), _entry("192.0.2.1", "02:66:66:66:66:66")]
+    tracker = _tracker(table)
+
+    changes, suspicious = tracker.update([_entry("192.0.2.1", "02:77:77:77:77:77"), table[0]])
+    assert [(change["type"], change["old_mac"], change["mac"]) for change in changes] == [
+        ("changed", "02:66:66:66:66:66", "02:77:77:77:77:77")]
+    assert _types(suspicious) == ["gateway_mac_changed", "gateway_multiple_macs"]
+
+    changes, _suspicious = tracker.update([table[0], _entry("192.0.2.1", "02:77:77:77:77:77"),
+                                           _entry("192.0.2.1", "02:88:88:88:88:88")])
+    assert [(change["type"], change["mac"]) for change in changes] == [("added", "02:88:88:88:88:88")]
+
+
+def test_same_ip_on_other_interface_is_separate_entry():
+    tracker = _tracker([_entry("192.0.2.1", "02:fc:00:00:00:05", "eth0")])
+
+    changes, _suspicious = tracker.update([_entry("192.0.2.1", "02:fc:00:00:00:05", "eth0"),
+                                           _entry("192.0.2.1", "02:00:00:00:00:99", "eth1")])
+
+    assert [(change["type"], change["interface"]) for change in changes] == [("added", "eth1")]
@@ -3,7 +3,8 @@
 
 """
 Spotify tarzı animasyon efektleri
-Bu modül, uygulamada kullanılan animasyon efektlerini içerir.
+Bu modül, uygulamada kullanılan animasyon efektlerini ve tüm animasyonları
+tek bir Tk zamanlayıcısından süren ortak kare saatini (FrameScheduler) içerir.
 """
 
 import tkinter as tk
@@ -15,6 +16,150 @@ from ui.colors import THEME
 # Loglama
 logger = logging.getLogger("NetworkShieldPro.animations")
 
+# Ortak kare saatinin hedef aralığı (ms, ~60 FPS)
+FRAME_INTERVAL = 16
+
+class _Animation:
+    """Zamanlayıcıya kayıtlı tek animasyon"""
+    __slots__ = ("callback", "interval", "last_run")
+    
+    def __init__(self, callback, interval):
+        self.callback = callback    # callback(şimdi_ms) -> devam edilecekse True
+        self.interval = interval    # En az kare aralığı (ms); None ise her karede
+        self.last_run = None
+
+class FrameScheduler:
+    """
+    Tüm animasyonları tek bir Tk zamanlayıcısından süren kare saati.
+    
+    Her karede etkin animasyonlar tek bir after() geri çağrısında ilerletilir.
+    Animasyonlar zamana bağlı olduğundan geride kalındığında kaçırılan kareler
+    telafi edilmez, atlanır. Etkin animasyon kalmadığında zamanlayıcı durur.
+    """
+    def __init__(self, interval=FRAME_INTERVAL):
+        self.interval = interval
+        self._root = None
+        self._animations = []
+        self._after_id = None
+        self._due = None
+        self._in_tick = False  # Kare işlenirken eklenen animasyon yeni zamanlayıcı başlatmaz
+        
+        # Kare istatistikleri
+        self.frames = 0
+        self.dropped_frames = 0
+        self.last_frame_ms = 0.0
+        self.avg_frame_ms = 0.0
+        self.max_frame_ms = 0.0
+    
+    @staticmethod
+    def now():
+        """Kare saatinin zamanı (ms)"""
+        return time.perf_counter() * 1000
+    
+    def add(self, widget, callback, interval=None):
+        """
+        Animasyonu kaydeder ve gerekirse kare saatini başlatır.
+        
+        Args:
+            widget: Tk kökünü belirlemek için herhangi bir widget
+            callback (callable): Her karede şimdiki zamanla (ms) çağrılır;
+                False/None döndürürse animasyon kaldırılır
+            interval (float): Animasyonun en az kare aralığı (ms)
+            
+        Returns:
+            _Animation: remove() için tanıtıcı; interval değiştirilebilir
+        """
+        root = widget._root()
+        if root is not self._root:
+            # Yeni (veya yeniden oluşturulmuş) Tk kökü: eski kayıtlar geçersiz
+            self._root = root
+            self._animations = []
+            self._after_id = None
+        
+        animation = _Animation(callback, interval)
+        self._animations.append(animation)
+        # Kare içinden eklenirse sonraki kareyi _tick planlar (tek after() zinciri)
+        if self._after_id is None and not self._in_tick:
+            self._schedule(self.interval)
+        return animation
+    
+    def remove(self, animation):
+        """Animasyonu kaldırır; etkin animasyon kalmazsa kare saati durur"""
+        if animation in self._animations:
+            self._animations.remove(animation)
+        if not self._animations and self._after_id is not None:
+            try:
+                self._root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+    
+    def _schedule(self, delay):
+        self._due = self.now() + delay
+        self._after_id = self._root.after(int(delay), self._tick)
+    
+    def _tick(self):
+        """Bir kare: zamanı gelen tüm animasyonları ilerletir"""
+        self._after_id = None
+        start = self.now()
+        
+        # Geç kalınan kareler atlanır (animasyonlar geçen süreye göre konumlanır)
+        lateness = start - self._due
+        if lateness >= self.interval:
+            self.dropped_frames += int(lateness // self.interval)
+        
+        # Aralığı olan animasyonlar en yakın kareye yuvarlanarak çalıştırılır
+        tolerance = self.interval / 2
+        self._in_tick = True
+        try:
+            for animation in tuple(self._animations):
+                if animation.interval is not None and animation.last_run is not None \
+                        and start - animation.last_run < animation.interval - tolerance:
+                    continue
+                animation.last_run = start
+                try:
+                    keep = animation.callback(start)
+                except Exception as e:
+                    logger.error(f"Animasyon karesi işlenirken hata: {e}")
+                    keep = False
+                if not keep and animation in self._animations:
+                    self._animations.remove(animation)
+        finally:
+            self._in_tick = False
+        
+        end = self.now()
+        cost = end - start
+        self.frames += 1
+        self.last_frame_ms = cost
+        self.avg_frame_ms = cost if self.frames == 1 else self.avg_frame_ms * 0.9 + cost * 0.1
+        self.max_frame_ms = max(self.max_frame_ms, cost)
+        
+        if not self._animations:
+            return  # Animasyon yok, kare saati durur
+        
+        # Bir sonraki kare en erken zamanı gelen animasyona göre planlanır;
+        # geride kalındığında olay döngüsüne yine de zaman bırakılır
+        next_due = min(animation.last_run + animation.interval - start
+                       if animation.interval is not None and animation.last_run is not None else 0
+                       for animation in self._animations)
+        delay = max(self.interval, next_due) - cost
+        self._schedule(max(self.interval // 4, delay))
+    
+    def stats(self):
+        """Kare zamanlama istatistiklerini döndürür"""
+        return {
+            "active": len(self._animations),
+            "running": self._after_id is not None,
+            "frames": self.frames,
+            "dropped_frames": self.dropped_frames,
+            "last_frame_ms": round(self.last_frame_ms, 3),
+            "avg_frame_ms": round(self.avg_frame_ms, 3),
+            "max_frame_ms": round(self.max_frame_ms, 3)
+        }
+
+# Uygulama genelinde paylaşılan kare saati
+scheduler = FrameScheduler()
+
 class SmoothTransition:
     """Yumuşak geçiş animasyonu için yardımcı sınıf"""
     def __init__(self, widget, property_name, start_value, end_value, duration=THEME["animation_medium"]):
@@ -29,10 +174,11 @@ class SmoothTransition:
     def start(self):
         """Animasyonu başlatır"""
         self.start_time = time.time() * 1000  # milisaniye olarak
-        self._animate()
+        if self._animate():
+            self.animation_id = scheduler.add(self.widget, self._animate)
     
-    def _animate(self):
-        """Animasyon adımını gerçekleştirir"""
+    def _animate(self, now=None):
+        """Animasyon adımını gerçekleştirir; devam edecekse True döndürür (kare saati çağırır)"""
         try:
             current_time = time.time() * 1000
             elapsed = current_time - self.start_time
@@ -41,7 +187,7 @@ class SmoothTransition:
                 # Animasyon tamamlandı, son değeri ayarla
                 self._set_property(self.end_value)
                 self.animation_id = None
-                return
+                return False
             
             # İlerleme oranını hesapla (0-1 arası)
             progress = elapsed / self.duration
@@ -55,8 +201,8 @@ class SmoothTransition:
             # Özelliği ayarla
             self._set_property(current_value)
             
-            # Bir sonraki kareyi planla
-            self.animation_id = self.widget.after(16, self._animate)  # ~60 FPS
+            # Bir sonraki karede devam et
+            return True
         except Exception as e:
             logger.error(f"Animasyon sırasında hata: {e}")
     
@@ -98,10 +244,11 @@ class FadeEffect:
     def start(self):
         """Animasyonu başlatır"""
         self.start_time = time.time() * 1000
-        self._animate()
+        if self._animate():
+            self.animation_id = scheduler.add(self.widget, self._animate)
     
-    def _animate(self):
-        """Animasyon adımını gerçekleştirir"""
+    def _animate(self, now=None):
+        """Animasyon adımını gerçekleştirir; devam edecekse True döndürür (kare saati çağırır)"""
         try:
             current_time = time.time() * 1000
             elapsed = current_time - self.start_time
@@ -110,7 +257,7 @@ class FadeEffect:
                 # Animasyon tamamlandı, son değeri ayarla
                 self._set_alpha(self.end_alpha)
                 self.animation_id = None
-                return
+                return False
             
             # İlerleme oranını hesapla (0-1 arası)
             progress = elapsed / self.duration
@@ -124,8 +271,8 @@ class FadeEffect:
             # Alfa değerini ayarla
             self._set_alpha(current_alpha)
             
-            # Bir sonraki kareyi planla
-            self.animation_id = self.widget.after(16, self._animate)  # ~60 FPS
+            # Bir sonraki karede devam et
+            return True
         except Exception as e:
             logger.error(f"Fade animasyonu sırasında hata: {e}")
     
@@ -173,13 +320,14 @@ class PulseEffect:
     def start(self):
         """Animasyonu başlatır"""
         self.start_time = time.time() * 1000
-        self._animate()
+        if self._animate():
+            self.animation_id = scheduler.add(self.widget, self._animate)
     
     def stop(self):
         """Animasyonu durdurur"""
         if self.animation_id:
             try:
-                self.widget.after_cancel(self.animation_id)
+                scheduler.remove(self.animation_id)
                 self.animation_id = None
                 
                 # Widget'ı orijinal boyutuna getir
@@ -187,8 +335,8 @@ class PulseEffect:
             except Exception as e:
                 logger.error(f"Pulse animasyonu durdurulurken hata: {e}")
     
-    def _animate(self):
-        """Animasyon adımını gerçekleştirir"""
+    def _animate(self, now=None):
+        """Animasyon adımını gerçekleştirir; devam edecekse True döndürür (kare saati çağırır)"""
         try:
             current_time = time.time() * 1000
             elapsed = (current_time - self.start_time) % self.duration
@@ -206,12 +354,12 @@ class PulseEffect:
             
             # Tekrar et veya durdur
             if self.repeat:
-                self.animation_id = self.widget.after(16, self._animate)  # ~60 FPS
+                return True
             else:
                 if progress > 0.99:  # Animasyon tamamlandı
                     self.animation_id = None
-                else:
-                    self.animation_id = self.widget.after(16, self._animate)
+                    return False
+                return True
         except Exception as e:
             logger.error(f"Pulse animasyonu sırasında hata: {e}")
 
@@ -252,7 +400,8 @@ class SlideTransition:
                     self.new_widget.place(x=0, y=-self.height)
             
             self.start_time = time.time() * 1000
-            self._animate()
+            if self._animate():
+                self.animation_id = scheduler.add(self.container, self._animate)
         except Exception as e:
             logger.error(f"Slide animasyonu başlatılırken hata: {e}")
             # Hata durumunda direkt geçiş yap
@@ -261,8 +410,8 @@ class SlideTransition:
             if self.new_widget:
                 self.new_widget.place(x=0, y=0, width=self.width, height=self.height)
     
-    def _animate(self):
-        """Animasyon adımını gerçekleştirir"""
+    def _animate(self, now=None):
+        """Animasyon adımını gerçekleştirir; devam edecekse True döndürür (kare saati çağırır)"""
         try:
             current_time = time.time() * 1000
             elapsed = current_time - self.start_time
@@ -276,7 +425,7 @@ class SlideTransition:
                     self.new_widget.place(x=0, y=0, width=self.width, height=self.height)
                 
                 self.animation_id = None
-                return
+                return False
             
             # İlerleme oranını hesapla (0-1 arası)
             progress = elapsed / self.duration
@@ -309,8 +458,8 @@ class SlideTransition:
                 if self.new_widget:
                     self.new_widget.place(x=0, y=-(self.height * (1 - progress)))
             
-            # Bir sonraki kareyi planla
-            self.animation_id = self.container.after(16, self._animate)  # ~60 FPS
+            # Bir sonraki karede devam et
+            return True
         except Exception as e:
             logger.error(f"Slide animasyonu sırasında hata: {e}")
             # Hata durumunda direkt geçiş yap
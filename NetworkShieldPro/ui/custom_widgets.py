@@ -12,14 +12,73 @@ import traceback
 import time
 import math
 from ui.colors import THEME, get_status_color
+from ui.animations import scheduler
 import random
 import os
 import logging
+from functools import lru_cache
 
 # Loglama
 logger = logging.getLogger("NetworkShieldPro.custom_widgets")
 
-class RoundedFrame(tk.Canvas):
+# Art arda gelen boyut değişimlerinin birleştirilme süresi (ms)
+RESIZE_DEBOUNCE_MS = 50
+
+@lru_cache(maxsize=256)
+def rounded_rect_points(width, height, radius):
+    """
+    (0, 0)-(width, height) yuvarlatılmış dikdörtgeninin çokgen noktaları.
+    
+    (genişlik, yükseklik, yarıçap) anahtarıyla önbelleğe alınır; aynı boyuttaki
+    tüm bileşenler aynı noktaları paylaşır.
+    """
+    return (
+        radius, 0,
+        width-radius, 0,
+        width, 0,
+        width, radius,
+        width, height-radius,
+        width, height,
+        width-radius, height,
+        radius, height,
+        0, height,
+        0, height-radius,
+        0, radius,
+        0, 0
+    )
+
+def rounded_rect_coords(x1, y1, x2, y2, radius):
+    """Önbellekteki noktaları (x1, y1) konumuna taşıyarak döndürür"""
+    points = rounded_rect_points(x2 - x1, y2 - y1, radius)
+    if x1 or y1:
+        points = [value + (y1 if i % 2 else x1) for i, value in enumerate(points)]
+    return points
+
+class DeferredLayoutMixin:
+    """
+    Canvas öğelerini bir kez oluşturup yalnızca boyut değişiminde yerleştiren
+    bileşenler için <Configure> birleştirmesi.
+    
+    İlk boyut değişimi hemen uygulanır; ardından gelenler RESIZE_DEBOUNCE_MS
+    boyunca birleştirilir ve son boyutla tek bir _layout() çağrılır. Alt sınıf
+    _layout() içinde çizdiği boyutu _layout_size'a yazar.
+    """
+    _layout_size = None
+    _resize_after = None
+    
+    def _on_resize(self, event):
+        """Boyut değiştiğinde yerleşimi günceller (art arda değişimler birleştirilir)"""
+        if (event.width, event.height) == self._layout_size:
+            return
+        if self._resize_after is None:
+            self._layout()
+            self._resize_after = self.after(RESIZE_DEBOUNCE_MS, self._deferred_layout)
+    
+    def _deferred_layout(self):
+        self._resize_after = None
+        self._layout()
+
+class RoundedFrame(DeferredLayoutMixin, tk.Canvas):
     """Yuvarlatılmış köşeli çerçeve"""
     def __init__(self, parent, bg=THEME["card_background"], width=200, height=100, 
                  corner_radius=THEME["radius_medium"], **kwargs):
@@ -27,51 +86,33 @@ class RoundedFrame(tk.Canvas):
                           width=width, height=height, **kwargs)
         self.corner_radius = corner_radius
         self.bg = bg
+        self._shape = None
         
         # Yuvarlatılmış dikdörtgen çiz
-        self._draw_rounded_rect()
+        self._layout()
         
-        # Boyut değiştiğinde yeniden çiz
+        # Boyut değiştiğinde yeniden yerleştir
         self.bind("<Configure>", self._on_resize)
     
-    def _draw_rounded_rect(self):
-        """Yuvarlatılmış dikdörtgen çizer"""
-        self.delete("all")
+    def _layout(self):
+        """Yuvarlatılmış dikdörtgeni boyuta göre yerleştirir (öğe bir kez oluşturulur)"""
         width, height = self.winfo_width(), self.winfo_height()
         
         # Boyutlar çok küçükse çizme
         if width < 1 or height < 1:
             return
+        self._layout_size = (width, height)
         
         # Köşe yarıçapı boyutlara göre ayarla
         radius = min(self.corner_radius, width//2, height//2)
+        points = rounded_rect_coords(0, 0, width, height, radius)
         
-        # Yuvarlatılmış dikdörtgen
-        self.create_rounded_rectangle(0, 0, width, height, radius=radius, fill=self.bg, outline="")
-    
-    def create_rounded_rectangle(self, x1, y1, x2, y2, radius=20, **kwargs):
-        """Yuvarlatılmış dikdörtgen oluşturur"""
-        points = [
-            x1+radius, y1,
-            x2-radius, y1,
-            x2, y1,
-            x2, y1+radius,
-            x2, y2-radius,
-            x2, y2,
-            x2-radius, y2,
-            x1+radius, y2,
-            x1, y2,
-            x1, y2-radius,
-            x1, y1+radius,
-            x1, y1
-        ]
-        return self.create_polygon(points, smooth=True, **kwargs)
-    
-    def _on_resize(self, event):
-        """Boyut değiştiğinde yeniden çizer"""
-        self._draw_rounded_rect()
+        if self._shape is None:
+            self._shape = self.create_polygon(points, smooth=True, fill=self.bg, outline="")
+        else:
+            self.coords(self._shape, *points)
 
-class SpotifyButton(tk.Canvas):
+class SpotifyButton(DeferredLayoutMixin, tk.Canvas):
     """Spotify tarzı buton"""
     def __init__(self, parent, text="Buton", command=None, bg=THEME["primary"], fg=THEME["text_primary"],
                  width=120, height=40, corner_radius=THEME["radius_small"], 
@@ -86,9 +127,12 @@ class SpotifyButton(tk.Canvas):
         self.fg = fg
         self.corner_radius = corner_radius
         self.state = "normal"
+        self._shape = None
+        self._label = None
+        self._drawn_colors = None
         
         # Buton çiz
-        self._draw_button()
+        self._layout()
         
         # Etkileşim için event'leri bağla
         self.bind("<Enter>", self._on_enter)
@@ -97,74 +141,65 @@ class SpotifyButton(tk.Canvas):
         self.bind("<ButtonRelease-1>", self._on_release)
         self.bind("<Configure>", self._on_resize)
     
-    def _draw_button(self):
-        """Butonu çizer"""
-        self.delete("all")
+    def _colors(self):
+        """Duruma göre (arka plan, metin) renklerini döndürür"""
+        if self.state == "disabled":
+            return THEME["secondary"], THEME["text_disabled"]
+        elif self.state == "active":
+            return self.active_color, self.fg
+        elif self.state == "hover":
+            return self.hover_color, self.fg
+        return self.normal_color, self.fg
+    
+    def _layout(self):
+        """Butonu boyuta göre yerleştirir (öğeler bir kez oluşturulur)"""
         width, height = self.winfo_width(), self.winfo_height()
         
         # Boyutlar çok küçükse çizme
         if width < 1 or height < 1:
             return
+        self._layout_size = (width, height)
         
         # Köşe yarıçapı boyutlara göre ayarla
         radius = min(self.corner_radius, width//2, height//2)
+        points = rounded_rect_coords(0, 0, width, height, radius)
         
-        # Buton rengi
-        if self.state == "disabled":
-            color = THEME["secondary"]
-        elif self.state == "active":
-            color = self.active_color
-        elif self.state == "hover":
-            color = self.hover_color
+        if self._shape is None:
+            color, text_color = self._drawn_colors = self._colors()
+            self._shape = self.create_polygon(points, smooth=True, fill=color, outline="")
+            self._label = self.create_text(width//2, height//2, text=self.text, fill=text_color, 
+                                           font=("Arial", 11, "bold"))
         else:
-            color = self.normal_color
-        
-        # Yuvarlatılmış dikdörtgen
-        self.create_rounded_rectangle(0, 0, width, height, radius=radius, fill=color, outline="")
-        
-        # Metin
-        text_color = self.fg
-        if self.state == "disabled":
-            text_color = THEME["text_disabled"]
-        
-        self.create_text(width//2, height//2, text=self.text, fill=text_color, 
-                         font=("Arial", 11, "bold"))
-    
-    def create_rounded_rectangle(self, x1, y1, x2, y2, radius=20, **kwargs):
-        """Yuvarlatılmış dikdörtgen oluşturur"""
-        points = [
-            x1+radius, y1,
-            x2-radius, y1,
-            x2, y1,
-            x2, y1+radius,
-            x2, y2-radius,
-            x2, y2,
-            x2-radius, y2,
-            x1+radius, y2,
-            x1, y2,
-            x1, y2-radius,
-            x1, y1+radius,
-            x1, y1
-        ]
-        return self.create_polygon(points, smooth=True, **kwargs)
+            self.coords(self._shape, *points)
+            self.coords(self._label, width//2, height//2)
+    
+    def _apply_state(self):
+        """Durum renklerini mevcut öğelere uygular (yeniden çizim yapılmaz)"""
+        if self._shape is None:
+            return
+        colors = self._colors()
+        if colors != self._drawn_colors:
+            self._drawn_colors = colors
+            self.itemconfig(self._shape, fill=colors[0])
+            self.itemconfig(self._label, fill=colors[1])
     
     def _on_enter(self, event):
         """Üzerine gelince rengini değiştirir"""
         if self.state != "disabled":
             self.state = "hover"
-            self._draw_button()
+            self._apply_state()
     
     def _on_leave(self, event):
         """Üzerinden ayrılınca rengini değiştirir"""
         if self.state != "disabled":
             self.state = "normal"
-            self._draw_button()
+            self._apply_state()
     
     def _on_press(self, event):
         """Tıklandığında aktif duruma geçer"""
         if self.state != "disabled":
             self.state = "active"
-            self._draw_button()
+            self._apply_state()
     
     def _on_release(self, event):
         """Tıklama bırakılınca fonksiyonu çalıştırır"""
@@ -180,16 +215,14 @@ class SpotifyButton(tk.Canvas):
                 self.state = "hover"
             else:
                 self.state = "normal"
-            self._draw_button()
-    
-    def _on_resize(self, event):
-        """Boyut değiştiğinde yeniden çizer"""
-        self._draw_button()
+            self._apply_state()
     
     def configure(self, **kwargs):
         """Buton özelliklerini yapılandırır"""
         if "text" in kwargs:
             self.text = kwargs.pop("text")
+            if self._label is not None:
+                self.itemconfig(self._label, text=self.text)
         if "command" in kwargs:
             self.command = kwargs.pop("command")
         if "state" in kwargs:
@@ -200,7 +233,7 @@ class SpotifyButton(tk.Canvas):
             self.fg = kwargs.pop("fg")
         
         super().configure(**kwargs)
-        self._draw_button()
+        self._apply_state()
 
 class CircularProgressbar(tk.Canvas):
     """Dairesel ilerleme çubuğu"""
@@ -258,8 +291,24 @@ class CircularProgressbar(tk.Canvas):
         """Boyut değiştiğinde yeniden çizer"""
         self._draw_progressbar()
 
+# Parçacık animasyonu kare aralıkları (ms): hedef ve yük altında çıkılabilecek en yüksek
+PARTICLE_FRAME_INTERVAL = 40
+PARTICLE_MAX_FRAME_INTERVAL = 200
+
+# Kare hesaplamasının aralığa oranı bu değeri aşarsa kare hızı düşürülür
+PARTICLE_FRAME_BUDGET = 0.25
+
 class ParticleAnimationCanvas(tk.Canvas):
-    """Arka plan parçacık animasyonu"""
+    """
+    Arka plan parçacık animasyonu.
+    
+    Parçacıklar canvas üzerinde bir kez oluşturulur ve her karede yalnızca
+    taşınır (move/coords); renkler oluşturulurken hesaplanır. Pencere
+    gizlendiğinde (tepsiye küçültme) animasyon kendiliğinden duraklar ve
+    yeniden gösterildiğinde devam eder. Kare hesaplaması veya olay döngüsü
+    yavaşladığında kare aralığı uzatılır, hareket geçen süreye göre
+    ölçeklendiği için parçacık hızı değişmez.
+    """
     def __init__(self, parent, width=800, height=600, num_particles=30, **kwargs):
         super().__init__(parent, width=width, height=height, bg=THEME["background"], 
                          highlightthickness=0, **kwargs)
@@ -268,9 +317,20 @@ class ParticleAnimationCanvas(tk.Canvas):
         self.num_particles = num_particles
         self.particles = []
         self.running = False
+        self.paused = False
+        
+        # Kare zamanlaması
+        self.frame_interval = PARTICLE_FRAME_INTERVAL
+        self.frame_time = 0.0       # Kare hesaplama süresinin üstel ortalaması (ms)
+        self.frame_count = 0
+        self._last_frame = None
+        self._animation = None      # Kare saatindeki kayıt
         
         # Parçacıkları oluştur
         self._create_particles()
+        
+        # Pencere yeniden gösterildiğinde duraklatılmış animasyon devam etsin
+        self.winfo_toplevel().bind("<Map>", self._on_toplevel_map, add="+")
     
     def _create_particles(self):
         """Parçacıkları oluşturur"""
@@ -296,56 +356,116 @@ class ParticleAnimationCanvas(tk.Canvas):
                 'size': size,
                 'speed': speed,
                 'direction': direction,
+                'dx': speed * math.cos(direction),   # Kare başına yer değiştirme
+                'dy': speed * math.sin(direction),
                 'color': color,
                 'opacity': opacity,
-                'id': None  # Canvas üzerindeki id
+                'id': self.create_oval(x-size, y-size, x+size, y+size, fill=color, outline='',
+                                       stipple='gray50' if opacity < 0.5 else '')
             })
     
     def start_animation(self):
         """Animasyonu başlatır"""
+        if self.running:
+            return
         self.running = True
-        self._animate()
+        self.paused = False
+        self._resume()
     
     def stop_animation(self):
         """Animasyonu durdurur"""
         self.running = False
+        if self._animation is not None:
+            scheduler.remove(self._animation)
+            self._animation = None
     
-    def _animate(self):
-        """Parçacık animasyonunu günceller"""
+    def _resume(self):
+        """Animasyonu kare saatine kaydeder"""
+        self._last_frame = None
+        self._animation = scheduler.add(self, self._animate, interval=self.frame_interval)
+    
+    def _on_toplevel_map(self, event):
+        """Pencere yeniden gösterildiğinde duraklatılmış animasyonu sürdürür"""
+        if event.widget is self.winfo_toplevel() and self.running and self.paused:
+            self.paused = False
+            self._resume()
+    
+    def _animate(self, now=None):
+        """Parçacık animasyonunu günceller; devam edecekse True döndürür (kare saati çağırır)"""
         if not self.running:
-            return
+            self._animation = None
+            return False
+        
+        # Görünmeyen pencere için kare çizilmez; <Map> olayı animasyonu sürdürür
+        if not self.winfo_viewable():
+            self.paused = True
+            self._animation = None
+            return False
+        
+        now = time.perf_counter()
+        # Hareket geçen süreyle ölçeklenir (uzun duraklamalarda sıçramayı sınırla)
+        elapsed = (now - self._last_frame) * 1000 if self._last_frame is not None else self.frame_interval
+        self._last_frame = now
+        self.update_particles(min(elapsed / PARTICLE_FRAME_INTERVAL, 5.0))
+        
+        cost = (time.perf_counter() - now) * 1000
+        self.frame_time = cost if not self.frame_count else self.frame_time * 0.9 + cost * 0.1
+        self.frame_count += 1
+        self._adapt_frame_interval(elapsed)
+        
+        # Kare saati bu animasyonu uyarlanan aralıkla çağırır
+        self._animation.interval = self.frame_interval
+        return True
+    
+    def update_particles(self, step=1.0):
+        """
+        Parçacıkları bir kare ilerletir.
         
-        self.delete("all")
+        Args:
+            step (float): Hedef kare aralığı cinsinden geçen süre
+        """
         width, height = self.winfo_width(), self.winfo_height()
+        move = self.move
         
         for particle in self.particles:
             # Parçacığı hareket ettir
-            particle['x'] += particle['speed'] * math.cos(particle['direction'])
-            particle['y'] += particle['speed'] * math.sin(particle['direction'])
+            dx = particle['dx'] * step
+            dy = particle['dy'] * step
+            particle['x'] += dx
+            particle['y'] += dy
             
             # Ekrandan çıkınca yeniden konumlandır
             if particle['x'] < -10 or particle['x'] > width + 10 or \
                particle['y'] < -10 or particle['y'] > height + 10:
-                particle['x'] = random.randint(0, width)
-                particle['y'] = random.randint(0, height)
+                particle['x'] = random.randint(0, max(width, 1))
+                particle['y'] = random.randint(0, max(height, 1))
                 particle['direction'] = random.uniform(0, 2 * math.pi)
-            
-            # Parçacığı çiz
-            size = particle['size']
-            x, y = particle['x'], particle['y']
-            
-            # Opaklık ayarı için renk hesapla
-            r, g, b = int(particle['color'][1:3], 16), int(particle['color'][3:5], 16), int(particle['color'][5:7], 16)
-            color = f'#{r:02x}{g:02x}{b:02x}'
-            
-            # Parçacığı çiz (oval)
-            self.create_oval(x-size, y-size, x+size, y+size, 
-                             fill=color, outline='', 
-                             stipple='gray50' if particle['opacity'] < 0.5 else '')
-        
-        # Sonraki kareyi planla
-        if self.running:
-            self.after(40, self._animate)  # ~25 FPS
+                particle['dx'] = particle['speed'] * math.cos(particle['direction'])
+                particle['dy'] = particle['speed'] * math.sin(particle['direction'])
+                size, x, y = particle['size'], particle['x'], particle['y']
+                self.coords(particle['id'], x-size, y-size, x+size, y+size)
+            else:
+                move(particle['id'], dx, dy)
+    
+    def _adapt_frame_interval(self, elapsed):
+        """Kare maliyeti ve gecikmeye göre kare aralığını ayarlar"""
+        overloaded = self.frame_time > self.frame_interval * PARTICLE_FRAME_BUDGET or \
+            elapsed > self.frame_interval * 1.5
+        if overloaded:
+            self.frame_interval = min(PARTICLE_MAX_FRAME_INTERVAL, self.frame_interval * 1.25)
+        elif self.frame_interval > PARTICLE_FRAME_INTERVAL and \
+                self.frame_time < self.frame_interval * PARTICLE_FRAME_BUDGET / 2:
+            self.frame_interval = max(PARTICLE_FRAME_INTERVAL, self.frame_interval * 0.9)
+    
+    def stats(self):
+        """Kare zamanlama istatistiklerini döndürür"""
+        return {
+            "frames": self.frame_count,
+            "frame_time_ms": round(self.frame_time, 3),
+            "frame_interval_ms": round(self.frame_interval, 1),
+            "fps": round(1000 / self.frame_interval, 1),
+            "paused": self.paused
+        }
     
     def resize(self, width, height):
         """Canvas boyutunu değiştirir"""
@@ -380,9 +500,8 @@ class SidebarItem(tk.Frame):
         # Sol kenar işaretleyicisi (aktif durumda)
         self.indicator = tk.Canvas(self, width=4, height=50, bg=THEME["sidebar_background"], highlightthickness=0)
         self.indicator.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 0))
-        
-        if is_active:
-            self._draw_active_indicator()
+        self._indicator_bar = self.indicator.create_rectangle(0, 5, 4, 45, fill=THEME["primary"], outline="",
+                                                              state="normal" if is_active else "hidden")
         
         # Etkileşimler
         self.bind("<Enter>", self._on_enter)
@@ -393,10 +512,8 @@ class SidebarItem(tk.Frame):
         self.indicator.bind("<Button-1>", self._on_click)
     
     def _draw_active_indicator(self):
-        """Aktif durum göstergesini çizer"""
-        self.indicator.delete("all")
-        if self.is_active:
-            self.indicator.create_rectangle(0, 5, 4, 45, fill=THEME["primary"], outline="")
+        """Aktif durum göstergesini gösterir veya gizler (öğe bir kez oluşturulur)"""
+        self.indicator.itemconfig(self._indicator_bar, state="normal" if self.is_active else "hidden")
     
     def _on_enter(self, event):
         """Üzerine gelince stilini değiştirir"""
@@ -443,9 +560,9 @@ class SidebarItem(tk.Frame):
         else:
             self.text_label.config(fg=THEME["text_secondary"])
             self.icon_label.config(fg=THEME["text_secondary"])
-            self.indicator.delete("all")
+            self._draw_active_indicator()
 
-class StatusBadge(tk.Canvas):
+class StatusBadge(DeferredLayoutMixin, tk.Canvas):
     """Durum rozeti"""
     def __init__(self, parent, text="", status="none", width=80, height=24, 
                  corner_radius=THEME["radius_small"], **kwargs):
@@ -454,62 +571,46 @@ class StatusBadge(tk.Canvas):
         self.text = text
         self.status = status
         self.corner_radius = corner_radius
+        self._shape = None
+        self._label = None
         
-        self._draw_badge()
+        self._layout()
         
-        # Boyut değiştiğinde yeniden çiz
+        # Boyut değiştiğinde yeniden yerleştir
         self.bind("<Configure>", self._on_resize)
     
-    def _draw_badge(self):
-        """Durum rozetini çizer"""
-        self.delete("all")
+    def _layout(self):
+        """Durum rozetini boyuta göre yerleştirir (öğeler bir kez oluşturulur)"""
         width, height = self.winfo_width(), self.winfo_height()
         
         # Boyutlar çok küçükse çizme
         if width < 1 or height < 1:
             return
+        self._layout_size = (width, height)
         
         # Köşe yarıçapı boyutlara göre ayarla
         radius = min(self.corner_radius, height//2)
-        
-        # Durum rengini al
-        color = get_status_color(self.status)
-        
-        # Yuvarlatılmış dikdörtgen (arka plan)
-        self.create_rounded_rectangle(0, 0, width, height, radius=radius, 
-                                     fill=color, outline="")
-        
-        # Metin
-        self.create_text(width//2, height//2, text=self.text, 
-                        fill=THEME["text_primary"], font=("Arial", 10, "bold"))
-    
-    def create_rounded_rectangle(self, x1, y1, x2, y2, radius=20, **kwargs):
-        """Yuvarlatılmış dikdörtgen oluşturur"""
-        points = [
-            x1+radius, y1,
-            x2-radius, y1,
-            x2, y1,
-            x2, y1+radius,
-            x2, y2-radius,
-            x2, y2,
-            x2-radius, y2,
-            x1+radius, y2,
-            x1, y2,
-            x1, y2-radius,
-            x1, y1+radius,
-            x1, y1
-        ]
-        return self.create_polygon(points, smooth=True, **kwargs)
+        points = rounded_rect_coords(0, 0, width, height, radius)
+        
+        if self._shape is None:
+            # Yuvarlatılmış dikdörtgen (arka plan) ve metin
+            self._shape = self.create_polygon(points, smooth=True, 
+                                              fill=get_status_color(self.status), outline="")
+            self._label = self.create_text(width//2, height//2, text=self.text, 
+                                           fill=THEME["text_primary"], font=("Arial", 10, "bold"))
+        else:
+            self.coords(self._shape, *points)
+            self.coords(self._label, width//2, height//2)
     
     def set_status(self, text, status="none"):
         """Durum metnini ve rengini günceller"""
+        if self._shape is not None:
+            if text != self.text:
+                self.itemconfig(self._label, text=text)
+            if status != self.status:
+                self.itemconfig(self._shape, fill=get_status_color(status))
         self.text = text
         self.status = status
-        self._draw_badge()
-    
-    def _on_resize(self, event):
-        """Boyut değiştiğinde yeniden çizer"""
-        self._draw_badge()
 
 class AnimatedChart(tk.Canvas):
     """Animasyonlu çubuk grafik"""
@@ -522,6 +623,7 @@ class AnimatedChart(tk.Canvas):
         self.padding = padding
         self.animation_duration = animation_duration
         self.current_values = []  # Animasyon için geçici değerler
+        self._animation = None     # Kare saatindeki etkin animasyon
         
         self._draw_chart()
         
@@ -612,7 +714,12 @@ class AnimatedChart(tk.Canvas):
         start_time = time.time()
         duration = self.animation_duration / 1000  # saniye cinsinden
         
-        def update_animation():
+        # Süren animasyon yeni hedeflerle değiştirilir
+        if self._animation is not None:
+            scheduler.remove(self._animation)
+            self._animation = None
+        
+        def update_animation(now=None):
             nonlocal start_time
             
             # Geçen süre
@@ -636,23 +743,26 @@ class AnimatedChart(tk.Canvas):
             # Grafiği güncelle
             self._draw_chart()
             
-            # Animasyon tamamlanmadıysa devam et
+            # Animasyon tamamlanmadıysa bir sonraki karede devam et
             if not all_done and progress < 1:
-                self.after(16, update_animation)  # ~60 FPS
-            else:
-                # Son duruma getir
-                self.current_values = target_values.copy()
-                self._draw_chart()
+                return True
+            
+            # Son duruma getir
+            self.current_values = target_values.copy()
+            self._draw_chart()
+            self._animation = None
+            return False
         
         # Animasyonu başlat
-        update_animation()
+        if update_animation():
+            self._animation = scheduler.add(self, update_animation)
     
     def _on_resize(self, event):
         """Boyut değiştiğinde yeniden çizer"""
         self._draw_chart()
 
 
-class SpotifyCheckbox(tk.Canvas):
+class SpotifyCheckbox(DeferredLayoutMixin, tk.Canvas):
     """Spotify tarzı onay kutusu (checkbox)"""
     def __init__(self, parent, text="", command=None, checked=False, 
                  width=300, height=30, **kwargs):
@@ -662,9 +772,13 @@ class SpotifyCheckbox(tk.Canvas):
         self.command = command
         self.checked = checked
         self.hover = False
+        self._box = None
+        self._tick = None
+        self._label = None
+        self._drawn_state = None
         
         # Checkbox çiz
-        self._draw_checkbox()
+        self._layout()
         
         # Etkileşim için event'leri bağla
         self.bind("<Enter>", self._on_enter)
@@ -672,84 +786,78 @@ class SpotifyCheckbox(tk.Canvas):
         self.bind("<Button-1>", self._on_click)
         self.bind("<Configure>", self._on_resize)
     
-    def _draw_checkbox(self):
-        """Checkbox'ı çizer"""
-        self.delete("all")
+    def _layout(self):
+        """Checkbox'ı boyuta göre yerleştirir (öğeler bir kez oluşturulur)"""
         width, height = self.winfo_width(), self.winfo_height()
         
         # Boyutlar çok küçükse çizme
         if width < 20 or height < 20:
             return
+        self._layout_size = (width, height)
         
         # Kutucuk boyutu ve pozisyonu
         box_size = min(20, height - 4)
         box_x = 5
         box_y = height // 2 - box_size // 2
         
-        # Arkaplan rengi
-        bg_color = THEME["hover_secondary"] if self.hover else THEME["secondary"]
-        
-        # Kutucuk çiz (yuvarlatılmış köşeli dikdörtgen)
+        # Kutucuk (yuvarlatılmış köşeli dikdörtgen)
         radius = min(4, box_size // 4)
-        box_rect = self.create_rounded_rectangle(
-            box_x, box_y,
-            box_x + box_size, box_y + box_size,
-            radius=radius, fill=bg_color, outline=""
+        box_points = rounded_rect_coords(box_x, box_y, box_x + box_size, box_y + box_size, radius)
+        
+        # Tik işareti için noktalar (tick mark)
+        padding = box_size // 4
+        tick_points = (
+            box_x + padding, box_y + box_size // 2,
+            box_x + box_size // 3, box_y + box_size - padding,
+            box_x + box_size - padding, box_y + padding
         )
         
-        # İşaretliyse tik işareti çiz
-        if self.checked:
-            # Tik işareti için noktalar (tick mark)
-            padding = box_size // 4
-            self.create_line(
-                box_x + padding, box_y + box_size // 2,
-                box_x + box_size // 3, box_y + box_size - padding,
-                box_x + box_size - padding, box_y + padding,
-                fill=THEME["primary"], width=2, smooth=True
-            )
-        
         # Metin
         text_x = box_x + box_size + 10
         text_y = height // 2
-        self.create_text(
-            text_x, text_y,
-            text=self.text, anchor="w",
-            fill=THEME["text_primary"],
-            font=("Arial", 11)
-        )
+        
+        if self._box is None:
+            self._box = self.create_polygon(box_points, smooth=True, outline="")
+            self._tick = self.create_line(*tick_points, fill=THEME["primary"], width=2, smooth=True)
+            self._label = self.create_text(
+                text_x, text_y,
+                text=self.text, anchor="w",
+                fill=THEME["text_primary"],
+                font=("Arial", 11)
+            )
+            self._apply_state()
+        else:
+            self.coords(self._box, *box_points)
+            self.coords(self._tick, *tick_points)
+            self.coords(self._label, text_x, text_y)
     
-    def create_rounded_rectangle(self, x1, y1, x2, y2, radius=20, **kwargs):
-        """Yuvarlatılmış dikdörtgen oluşturur"""
-        points = [
-            x1+radius, y1,
-            x2-radius, y1,
-            x2, y1,
-            x2, y1+radius,
-            x2, y2-radius,
-            x2, y2,
-            x2-radius, y2,
-            x1+radius, y2,
-            x1, y2,
-            x1, y2-radius,
-            x1, y1+radius,
-            x1, y1
-        ]
-        return self.create_polygon(points, smooth=True, **kwargs)
+    def _apply_state(self):
+        """Üzerinde olma ve işaret durumunu mevcut öğelere uygular"""
+        if self._box is None:
+            return
+        hover, checked = state = (self.hover, self.checked)
+        if state == self._drawn_state:
+            return
+        if self._drawn_state is None or hover != self._drawn_state[0]:
+            self.itemconfig(self._box, fill=THEME["hover_secondary"] if hover else THEME["secondary"])
+        if self._drawn_state is None or checked != self._drawn_state[1]:
+            self.itemconfig(self._tick, state="normal" if checked else "hidden")
+        self._drawn_state = state
     
     def _on_enter(self, event):
         """Fare üzerine gelince efekt uygula"""
         self.hover = True
-        self._draw_checkbox()
+        self._apply_state()
     
     def _on_leave(self, event):
         """Fare ayrılınca normal haline döndür"""
         self.hover = False
-        self._draw_checkbox()
+        self._apply_state()
     
     def _on_click(self, event):
         """Tıklandığında durumu değiştir"""
         self.checked = not self.checked
-        self._draw_checkbox()
+        self._apply_state()
         if self.command:
             try:
                 self.command()
@@ -757,10 +865,6 @@ class SpotifyCheckbox(tk.Canvas):
                 logger.error(f"Checkbox komutu çalıştırılırken hata: {e}")
                 traceback.print_exc()
     
-    def _on_resize(self, event):
-        """Boyut değiştiğinde yeniden çizer"""
-        self._draw_checkbox()
-    
     def is_checked(self):
         """Checkbox'ın durumunu döndürür"""
         return self.checked
@@ -768,20 +872,21 @@ class SpotifyCheckbox(tk.Canvas):
     def set_checked(self, checked):
         """Checkbox'ın durumunu ayarlar"""
         self.checked = checked
-        self._draw_checkbox()
+        self._apply_state()
     
     def configure(self, **kwargs):
         """Checkbox özelliklerini yapılandırır"""
         if "text" in kwargs:
             self.text = kwargs.pop("text")
+            if self._label is not None:
+                self.itemconfig(self._label, text=self.text)
         if "command" in kwargs:
             self.command = kwargs.pop("command")
             
         super().configure(**kwargs)
-        self._draw_checkbox()
 
 
-class SpotifyCombobox(tk.Frame):
+class SpotifyCombobox(DeferredLayoutMixin, tk.Frame):
     """Spotify tarzı açılır menü (combobox)"""
     def __init__(self, parent, values=None, default=None, command=None, 
                  width=120, height=30, **kwargs):
@@ -811,7 +916,10 @@ class SpotifyCombobox(tk.Frame):
         self.dropdown_frame = None
         
         # Buton görünümünü çiz
-        self._draw_button()
+        self._shape = None
+        self._value_text = None
+        self._arrow = None
+        self._layout()
         
         # Etkileşim için event'leri bağla
         self.button_canvas.bind("<Enter>", self._on_enter)
@@ -819,74 +927,72 @@ class SpotifyCombobox(tk.Frame):
         self.button_canvas.bind("<Button-1>", self._on_click)
         self.button_canvas.bind("<Configure>", self._on_resize)
     
-    def _draw_button(self):
-        """Açılır menü butonunu çizer"""
-        self.button_canvas.delete("all")
-        width = self.button_canvas.winfo_width()
-        height = self.button_canvas.winfo_height()
+    def _layout(self):
+        """Açılır menü butonunu boyuta göre yerleştirir (öğeler bir kez oluşturulur)"""
+        canvas = self.button_canvas
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
         
         # Boyutlar çok küçükse çizme
         if width < 10 or height < 10:
             return
-        
-        # Arkaplan rengi
-        bg_color = THEME["hover_secondary"] if self.hover else THEME["secondary"]
+        self._layout_size = (width, height)
         
         # Yuvarlatılmış dikdörtgen arkaplan
         radius = min(height // 4, 5)
-        self.button_canvas.create_rounded_rectangle(
-            0, 0, width, height,
-            radius=radius, fill=bg_color, outline=""
-        )
+        points = rounded_rect_coords(0, 0, width, height, radius)
         
-        # Seçili değer metni
-        text_width = width - 25  # Ok ikon için yer bırak
-        self.button_canvas.create_text(
-            10, height // 2,
-            text=self.current_value, anchor="w",
-            fill=THEME["text_primary"], 
-            font=("Arial", 11),
-            width=text_width
-        )
+        # Seçili değer metni (ok ikonu için yer bırakılır)
+        text_width = width - 25
         
         # Aşağı ok ikonu
         arrow_x = width - 15
         arrow_y = height // 2
         arrow_size = 6
-        self.button_canvas.create_polygon(
+        arrow_points = (
             arrow_x - arrow_size, arrow_y - arrow_size // 2,
             arrow_x + arrow_size, arrow_y - arrow_size // 2,
-            arrow_x, arrow_y + arrow_size // 2,
-            fill=THEME["text_secondary"]
+            arrow_x, arrow_y + arrow_size // 2
         )
+        
+        if self._shape is None:
+            self._shape = canvas.create_polygon(points, smooth=True, fill=self._background_color(), outline="")
+            self._value_text = canvas.create_text(
+                10, height // 2,
+                text=self.current_value, anchor="w",
+                fill=THEME["text_primary"], 
+                font=("Arial", 11),
+                width=text_width
+            )
+            self._arrow = canvas.create_polygon(*arrow_points, fill=THEME["text_secondary"])
+        else:
+            canvas.coords(self._shape, *points)
+            canvas.coords(self._value_text, 10, height // 2)
+            canvas.itemconfig(self._value_text, width=text_width)
+            canvas.coords(self._arrow, *arrow_points)
+    
+    def _background_color(self):
+        return THEME["hover_secondary"] if self.hover else THEME["secondary"]
     
-    def create_rounded_rectangle(self, x1, y1, x2, y2, radius=20, **kwargs):
-        """Yuvarlatılmış dikdörtgen oluşturur"""
-        points = [
-            x1+radius, y1,
-            x2-radius, y1,
-            x2, y1,
-            x2, y1+radius,
-            x2, y2-radius,
-            x2, y2,
-            x2-radius, y2,
-            x1+radius, y2,
-            x1, y2,
-            x1, y2-radius,
-            x1, y1+radius,
-            x1, y1
-        ]
-        return self.create_polygon(points, smooth=True, **kwargs)
+    def _set_hover(self, hover):
+        """Üzerinde olma durumunu arkaplan rengine uygular"""
+        if hover != self.hover:
+            self.hover = hover
+            if self._shape is not None:
+                self.button_canvas.itemconfig(self._shape, fill=self._background_color())
+    
+    def _show_value(self):
+        """Seçili değeri mevcut metin öğesine yazar"""
+        if self._value_text is not None:
+            self.button_canvas.itemconfig(self._value_text, text=self.current_value)
     
     def _on_enter(self, event):
         """Fare üzerine gelince efekt uygula"""
-        self.hover = True
-        self._draw_button()
+        self._set_hover(True)
     
     def _on_leave(self, event):
         """Fare ayrılınca normal haline döndür"""
-        self.hover = False
-        self._draw_button()
+        self._set_hover(False)
     
     def _on_click(self, event):
         """Tıklandığında dropdown menüyü göster/gizle"""
@@ -895,10 +1001,6 @@ class SpotifyCombobox(tk.Frame):
         else:
             self._show_dropdown()
     
-    def _on_resize(self, event):
-        """Boyut değiştiğinde yeniden çizer"""
-        self._draw_button()
-    
     def _show_dropdown(self):
         """Dropdown menüyü göster"""
         if self.dropdown_frame:
@@ -966,7 +1068,7 @@ class SpotifyCombobox(tk.Frame):
             def on_select(selected_value=value):
                 self.current_value = selected_value
                 self._hide_dropdown()
-                self._draw_button()
+                self._show_value()
                 if self.command:
                     try:
                         self.command(selected_value)
@@ -1019,6 +1121,269 @@ class SpotifyCombobox(tk.Frame):
         """Seçili değeri ayarlar"""
         if value in self.values:
             self.current_value = value
-            self._draw_button()
+            self._show_value()
             return True
         return False
+
+class VirtualList(tk.Canvas):
+    """
+    Sanallaştırılmış liste: yalnızca görünen satırları çizer.
+
+    Satırlar sabit yükseklikte ve sütunludur. Görünür alan kadar satır öğesi
+    (arka plan dikdörtgeni + sütun başına bir metin) bir havuzda tutulur;
+    kaydırmada öğeler yeniden oluşturulmaz, yalnızca metin ve konumları
+    güncellenir. Çizim maliyeti öğe sayısından bağımsız, görünen satır
+    sayısıyla orantılıdır. Her öğenin son çizilen durumu saklanır; içeriği
+    değişmeyen satırlar için Tk çağrısı yapılmaz.
+    """
+    def __init__(self, parent, columns, row_height=44, formatter=None, yscrollcommand=None,
+                 empty_text="", font=("Arial", 11), **kwargs):
+        super().__init__(parent, bg=THEME["card_background"], highlightthickness=0, **kwargs)
+        self.columns = columns                # Sütun genişlikleri (piksel)
+        self.row_height = row_height
+        self.formatter = formatter            # öğe -> [(metin, renk), ...]
+        self.yscrollcommand = yscrollcommand  # Kaydırma çubuğunu güncelleyen fonksiyon
+        self.font = font
+        self.items = []
+        self.offset = 0                       # Piksel cinsinden kaydırma konumu
+        self._pool = []                       # [(arka_plan, [metinler]), ...]
+        self._slot_state = []                 # Havuzdaki öğelerin son çizilen durumu
+        self._empty_state = None
+        self._scroll_state = None
+        self._render_pending = False
+        
+        self.empty_text = empty_text
+        self._empty_item = self.create_text(0, 0, text=empty_text, font=("Arial", 14),
+                                            fill=THEME["text_secondary"])
+        
+        self.bind("<Configure>", self._on_resize)
+        # Fare tekerleği (Windows/macOS ve X11)
+        self.bind("<MouseWheel>", self._on_mousewheel)
+        self.bind("<Button-4>", lambda e: self.yview("scroll", -1, "units"))
+        self.bind("<Button-5>", lambda e: self.yview("scroll", 1, "units"))
+    
+    def set_items(self, items, formatter=None, empty_text=None):
+        """
+        Listeyi verilen öğelerle değiştirir.
+        
+        Args:
+            items: len() ve indekslemeyi destekleyen dizi (liste, ArpTable vb.)
+            formatter (callable): Öğeyi sütun başına (metin, renk) listesine çevirir
+            empty_text (str): Liste boşken gösterilecek metin
+        """
+        self.items = items
+        if formatter is not None:
+            self.formatter = formatter
+        if empty_text is not None and empty_text != self.empty_text:
+            self.empty_text = empty_text
+            self.itemconfig(self._empty_item, text=empty_text)
+        self.offset = min(self.offset, self._max_offset())
+        self.render()
+    
+    def _max_offset(self):
+        return max(0, len(self.items) * self.row_height - self.winfo_height())
+    
+    def _ensure_pool(self, size):
+        """Havuzu görünen satır sayısına kadar büyütür (hiç küçültmez)"""
+        while len(self._pool) < size:
+            background = self.create_rectangle(0, 0, 0, 0, outline="", state="hidden")
+            texts = [self.create_text(0, 0, anchor="w", font=self.font, state="hidden")
+                     for _ in self.columns]
+            self._pool.append((background, texts))
+            self._slot_state.append(None)
+    
+    def render(self):
+        """Görünen satırları havuzdaki öğelerle çizer"""
+        self._render_pending = False
+        width = self.winfo_width()
+        height = self.winfo_height()
+        count = len(self.items)
+        
+        empty_state = (bool(count), width)
+        if empty_state != self._empty_state:
+            self._empty_state = empty_state
+            self.itemconfig(self._empty_item, state="hidden" if count else "normal")
+            self.coords(self._empty_item, width // 2, 60)
+        
+        first = self.offset // self.row_height
+        visible = height // self.row_height + 2
+        self._ensure_pool(visible)
+        
+        for slot, (background, texts) in enumerate(self._pool):
+            index = first + slot
+            if slot >= visible or index >= count:
+                if self._slot_state[slot] is not None:
+                    self._slot_state[slot] = None
+                    self.itemconfig(background, state="hidden")
+                    for text in texts:
+                        self.itemconfig(text, state="hidden")
+                continue
+            
+            y = index * self.row_height - self.offset
+            cells = self.formatter(self.items[index])
+            previous = self._slot_state[slot]
+            if previous is not None and previous[0] == y and previous[1] == width and previous[2] == index % 2 \
+                    and previous[3] == cells:
+                continue
+            
+            # Konum, genişlik ve satır rengi yalnızca değiştiyse güncellenir
+            if previous is None or previous[:3] != (y, width, index % 2):
+                row_bg = THEME["background"] if index % 2 == 1 else THEME["card_background"]
+                self.coords(background, 0, y + 2, width, y + self.row_height - 2)
+                self.itemconfig(background, fill=row_bg, state="normal")
+            
+            x = 0
+            for column, (text, cell, column_width) in enumerate(zip(texts, cells, self.columns)):
+                if previous is None or previous[0] != y:
+                    self.coords(text, x, y + self.row_height // 2)
+                if previous is None or previous[3][column] != cell:
+                    self.itemconfig(text, text=cell[0], fill=cell[1], state="normal")
+                x += column_width
+            self._slot_state[slot] = (y, width, index % 2, cells)
+        
+        self._update_scrollbar()
+    
+    def _schedule_render(self):
+        """Art arda gelen kaydırma olaylarını tek çizimde birleştirir"""
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self.render)
+    
+    def _update_scrollbar(self):
+        if self.yscrollcommand is None:
+            return
+        total = len(self.items) * self.row_height
+        if total <= 0:
+            fractions = (0.0, 1.0)
+        else:
+            fractions = (self.offset / total, min(1.0, (self.offset + self.winfo_height()) / total))
+        if fractions != self._scroll_state:
+            self._scroll_state = fractions
+            self.yscrollcommand(*fractions)
+    
+    def yview(self, *args):
+        """Kaydırma çubuğu protokolü: ("moveto", kesir) veya ("scroll", n, "units"|"pages")"""
+        if not args:
+            total = max(1, len(self.items) * self.row_height)
+            return self.offset / total, min(1.0, (self.offset + self.winfo_height()) / total)
+        
+        if args[0] == "moveto":
+            offset = float(args[1]) * len(self.items) * self.row_height
+        elif args[0] == "scroll":
+            step = self.winfo_height() if args[2] == "pages" else self.row_height
+            offset = self.offset + int(args[1]) * step
+        else:
+            return None
+        
+        self.offset = int(max(0, min(offset, self._max_offset())))
+        self._schedule_render()
+        return None
+    
+    def _on_mousewheel(self, event):
+        """Fare tekerleğiyle kaydırır"""
+        self.yview("scroll", -1 if event.delta > 0 else 1, "units")
+    
+    def _on_resize(self, event):
+        """Boyut değiştiğinde görünen satırları yeniden çizer"""
+        self.offset = min(self.offset, self._max_offset())
+        self._schedule_render()
+
+class KeyedListFrame(tk.Frame):
+    """
+    Anahtarlı satır listesi: yeniden yüklemede yalnızca farkları uygular.
+
+    Her satır bir anahtar (örn. tarama kimliği) ve görüntülenen değerle
+    tanımlanır. reconcile() yalnızca eklenen satırları oluşturur, kaldırılan
+    satırları siler ve değeri değişen satırları yeniden oluşturur; değişmeyen
+    bir listede hiçbir widget işlemi yapılmaz.
+    """
+    def __init__(self, parent, build, empty_text="", pack_options=None, **kwargs):
+        super().__init__(parent, bg=THEME["card_background"], **kwargs)
+        self.build = build                     # (ebeveyn, değer) -> paketlenmemiş widget
+        self.pack_options = pack_options or {"fill": tk.X, "pady": 2}
+        self._rows = {}                        # anahtar -> (widget, değer)
+        self._order = []                       # Görüntülenen anahtar sırası
+        
+        self.empty_text = empty_text
+        self.empty_label = tk.Label(self, text=empty_text, font=("Arial", 14),
+                                 bg=THEME["card_background"], fg=THEME["text_secondary"])
+        self.empty_label.pack(pady=50)
+        self._empty_visible = True
+    
+    def reconcile(self, rows, empty_text=None):
+        """
+        Listeyi verilen satırlarla eşitler.
+        
+        Args:
+            rows (iterable): Görüntülenecek sırayla (anahtar, değer) çiftleri; değer
+                karşılaştırılabilir olmalıdır. Anahtarlar benzersiz olmalıdır;
+                yinelenen anahtarlı satırlar atılmaz, uyarı loglanır ve satır
+                (anahtar, sıra) anahtarıyla gösterilir
+            empty_text (str): Liste boşken gösterilecek metin
+            
+        Returns:
+            int: Oluşturulan veya silinen satır sayısı
+        """
+        wanted = {}
+        duplicates = 0
+        for key, value in rows:
+            if key in wanted:
+                duplicates += 1
+                occurrence = 1
+                while (key, occurrence) in wanted:
+                    occurrence += 1
+                key = (key, occurrence)
+            wanted[key] = value
+        if duplicates:
+            logger.warning(f"Listede {duplicates} yinelenen satır anahtarı var, satırlar sıra numarasıyla ayrıldı")
+        order = list(wanted)
+        operations = 0
+        
+        # Kaldırılan veya değeri değişen satırlar silinir
+        for key in self._order:
+            widget, value = self._rows[key]
+            if key not in wanted or wanted[key] != value:
+                widget.destroy()
+                del self._rows[key]
+                operations += 1
+        
+        kept = [key for key in self._order if key in self._rows]
+        
+        if [key for key in order if key in self._rows] != kept:
+            # Kalan satırların sırası değişti: tümü yeniden paketlenir
+            for key in kept:
+                self._rows[key][0].pack_forget()
+            for key in order:
+                if key not in self._rows:
+                    self._rows[key] = (self.build(self, wanted[key]), wanted[key])
+                    operations += 1
+                self._rows[key][0].pack(**self.pack_options)
+        else:
+            # Yeni satırlar sondan başa, kendisinden sonra gelen satırın önüne yerleştirilir
+            next_widget = None
+            for key in reversed(order):
+                if key not in self._rows:
+                    widget = self.build(self, wanted[key])
+                    if next_widget is None:
+                        widget.pack(**self.pack_options)
+                    else:
+                        widget.pack(before=next_widget, **self.pack_options)
+                    self._rows[key] = (widget, wanted[key])
+                    operations += 1
+                next_widget = self._rows[key][0]
+        self._order = order
+        
+        self._set_empty(not order, empty_text)
+        return operations
+    
+    def _set_empty(self, empty, empty_text):
+        """Boş liste mesajını yalnızca durum değiştiğinde günceller"""
+        if empty_text is not None and empty_text != self.empty_text:
+            self.empty_text = empty_text
+            self.empty_label.config(text=empty_text)
+        if empty != self._empty_visible:
+            self._empty_visible = empty
+            if empty:
+                self.empty_label.pack(pady=50)
+            else:
+                self.empty_label.pack_forget()
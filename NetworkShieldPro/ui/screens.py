@@ -14,6 +14,7 @@ import os
 import threading
 import traceback
 import logging
+import sqlite3
 from collections import defaultdict
 import random
 import math
@@ -22,7 +23,7 @@ from ui.colors import THEME, get_status_color
 from ui.custom_widgets import (
     RoundedFrame, SpotifyButton, CircularProgressbar, 
     ParticleAnimationCanvas, AnimatedChart, SidebarItem, StatusBadge,
-    SpotifyCheckbox, SpotifyCombobox
+    SpotifyCheckbox, SpotifyCombobox, VirtualList, KeyedListFrame
 )
 from ui.animations import SmoothTransition, FadeEffect, PulseEffect, SlideTransition
 from ui.helpers import (
@@ -30,12 +31,26 @@ from ui.helpers import (
     format_ip_for_display, threat_level_to_text, create_threat_data_chart,
     create_scan_history_chart, get_network_security_score
 )
-from modules.arp_detector import ARPScanner
-from modules.settings import get_setting, set_setting, update_settings, reset_settings
+from modules.arp_detector import (
+    ARPScanner, STATUS_GATEWAY, STATUS_SUSPICIOUS, build_status_index, device_status, status_index_of
+)
+from modules.event_bus import EventBus, SCAN_COMPLETED
+from modules.settings import (get_setting, get_settings_store, set_setting, update_settings, reset_settings,
+                              flush_settings)
+from modules.startup_profiler import profiler
 
 # Loglama
 logger = logging.getLogger("V-ARP.screens")
 
+# Olay kuyruğunun Tk ana döngüsünde boşaltılma aralığı (ms); kuyruk boş kaldıkça
+# aralık iki katına çıkarılır, olay gelince yeniden en kısa aralığa döner
+EVENT_PUMP_INTERVAL = 50
+EVENT_PUMP_MAX_INTERVAL = 800
+
+# Cihaz listesi satır yüksekliği ve sütun genişlikleri (piksel)
+DEVICE_ROW_HEIGHT = 44
+DEVICE_COLUMNS = [150, 200, 150, 100, 150]
+
 class BaseScreen:
     """Tüm ekranlar için temel sınıf"""
     def __init__(self, parent, app):
@@ -413,45 +428,17 @@ class ScanScreen(BaseScreen):
                            width=col["width"]//10, anchor="w")
             header.place(x=x_pos, y=0)
         
-        # Cihaz listesi için kaydırılabilir çerçeve
-        self.devices_canvas = tk.Canvas(self.devices_card, bg=THEME["card_background"],
-                                    highlightthickness=0)
-        # Boyutlar değiştiğinde güncelleneceği için tam boyutları belirterek yerleştir
-        self.devices_canvas.place(x=20, y=100, 
-                              width=self.devices_card.winfo_width()-60, 
-                              height=self.devices_card.winfo_height()-120)
+        # Sanallaştırılmış cihaz listesi: yalnızca görünen satırlar çizilir
+        scrollbar = ttk.Scrollbar(self.devices_card, orient="vertical")
+        self.devices_list = VirtualList(self.devices_card, columns=DEVICE_COLUMNS,
+                                    row_height=DEVICE_ROW_HEIGHT, yscrollcommand=scrollbar.set,
+                                    empty_text="Henüz tarama yapılmadı")
+        # Kart boyutu değiştiğinde liste de büyüsün
+        self.devices_list.place(x=20, y=100, relwidth=1, width=-60, relheight=1, height=-120)
         
         # Kaydırma çubuğu
-        scrollbar = ttk.Scrollbar(self.devices_card, orient="vertical", 
-                                command=self.devices_canvas.yview)
-        scrollbar.place(relx=1, y=100, height=self.devices_card.winfo_height()-120, 
-                      anchor="ne", width=20)
-        
-        self.devices_canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Cihaz listesi için iç çerçeve
-        self.devices_list_frame = tk.Frame(self.devices_canvas, bg=THEME["card_background"])
-        self.devices_canvas.create_window((0, 0), window=self.devices_list_frame, 
-                                       anchor="nw", tags="devices_list")
-        
-        # Cihaz listesi yeniden boyutlandırma
-        self.devices_list_frame.bind("<Configure>", self._on_frame_configure)
-        self.devices_canvas.bind("<Configure>", self._on_canvas_configure)
-        
-        # Varsayılan içerik
-        self.no_devices_label = tk.Label(self.devices_list_frame, 
-                                     text="Henüz tarama yapılmadı", font=("Arial", 14),
-                                     bg=THEME["card_background"], fg=THEME["text_secondary"])
-        self.no_devices_label.pack(pady=50)
-    
-    def _on_frame_configure(self, event):
-        """İç çerçeve boyutu değiştiğinde kaydırma alanını günceller"""
-        self.devices_canvas.configure(scrollregion=self.devices_canvas.bbox("all"))
-    
-    def _on_canvas_configure(self, event):
-        """Canvas boyutu değiştiğinde iç çerçeveyi yeniden boyutlandırır"""
-        # İç çerçevenin genişliğini canvas genişliğine eşitle
-        self.devices_canvas.itemconfig("devices_list", width=event.width)
+        scrollbar.configure(command=self.devices_list.yview)
+        scrollbar.place(relx=1, y=100, relheight=1, height=-120, anchor="ne", width=20)
     
     def _start_scan(self):
         """Tarama başlatır"""
@@ -477,81 +464,29 @@ class ScanScreen(BaseScreen):
                     interval = self.app.scanner.scan_interval
                     self.periodic_status.config(text=f"Periyodik tarama: Aktif (Her {interval} saatte bir)")
     
-    def _populate_devices_list(self, devices):
+    def _populate_devices_list(self, devices, result=None):
         """Cihaz listesini doldurur"""
-        # Mevcut içeriği temizle
-        for widget in self.devices_list_frame.winfo_children():
-            widget.destroy()
-        
-        if not devices:
-            self.no_devices_label = tk.Label(self.devices_list_frame, 
-                                        text="Hiç cihaz bulunamadı", font=("Arial", 14),
-                                        bg=THEME["card_background"], fg=THEME["text_secondary"])
-            self.no_devices_label.pack(pady=50)
-            return
-        
-        # Her cihaz için satır oluştur
-        row_height = 40
-        columns = [150, 200, 150, 100, 150]  # Sütun genişlikleri
-        
-        for i, device in enumerate(devices):
-            row_frame = tk.Frame(self.devices_list_frame, bg=THEME["card_background"], 
-                              height=row_height)
-            row_frame.pack(fill=tk.X, pady=2)
-            row_frame.pack_propagate(False)
-            
-            # Alternatif satır renklendirmesi
-            if i % 2 == 1:
-                row_bg = THEME["background"]
-                # Arka plan için canvas kullan
-                bg_canvas = tk.Canvas(row_frame, bg=row_bg, highlightthickness=0)
-                bg_canvas.place(x=0, y=0, relwidth=1, relheight=1)
-            
-            # IP adresi
-            ip_label = tk.Label(row_frame, text=device.get("ip", "Bilinmiyor"), 
-                             font=("Arial", 11), bg=row_frame["bg"], fg=THEME["text_primary"],
-                             anchor="w", width=columns[0]//10)
-            ip_label.place(x=0, y=10)
-            
-            # MAC adresi
-            mac = format_mac_for_display(device.get("mac", "Bilinmiyor"))
-            mac_label = tk.Label(row_frame, text=mac, font=("Arial", 11), 
-                              bg=row_frame["bg"], fg=THEME["text_primary"],
-                              anchor="w", width=columns[1]//10)
-            mac_label.place(x=columns[0], y=10)
-            
-            # Durum (varsayılan ağ geçidi, şüpheli, normal)
-            is_gateway = (device.get("ip") == self.app.scanner.get_last_scan_result().get("gateway", {}).get("ip"))
-            is_suspicious = any(entry.get("mac") == device.get("mac") 
-                               for entry in self.app.scanner.get_last_scan_result().get("suspicious_entries", [])
-                               if entry.get("threat_level") in ["high", "medium"])
-            
-            if is_gateway:
-                status_text = "Ağ Geçidi"
-                status_color = THEME["info"]
-            elif is_suspicious:
-                status_text = "Şüpheli"
-                status_color = THEME["warning"]
-            else:
-                status_text = "Normal"
-                status_color = THEME["success"]
+        # Cihaz durumları tarayıcının sonuçla birlikte hazırladığı indeksten O(1) okunur
+        status_index = status_index_of(result) if result else build_status_index([])
+        statuses = {
+            STATUS_GATEWAY: ("Ağ Geçidi", THEME["info"]),
+            STATUS_SUSPICIOUS: ("Şüpheli", THEME["warning"])
+        }
+        normal = ("Normal", THEME["success"])
+        
+        def format_row(device):
+            """Cihazı sütun başına (metin, renk) listesine çevirir (yalnızca görünen satırlar için)"""
+            status = statuses.get(device_status(status_index, device.get("ip"), device.get("mac")), normal)
             
-            status_label = tk.Label(row_frame, text=status_text, font=("Arial", 11), 
-                                 bg=row_frame["bg"], fg=status_color,
-                                 anchor="w", width=columns[2]//10)
-            status_label.place(x=columns[0]+columns[1], y=10)
-            
-            # Arayüz
-            interface_label = tk.Label(row_frame, text=device.get("interface", "Bilinmiyor"), 
-                                    font=("Arial", 11), bg=row_frame["bg"], 
-                                    fg=THEME["text_primary"], anchor="w", width=columns[3]//10)
-            interface_label.place(x=columns[0]+columns[1]+columns[2], y=10)
-            
-            # Son görülme
-            last_seen_label = tk.Label(row_frame, text="Az önce", 
-                                    font=("Arial", 11), bg=row_frame["bg"], 
-                                    fg=THEME["text_secondary"], anchor="w", width=columns[4]//10)
-            last_seen_label.place(x=columns[0]+columns[1]+columns[2]+columns[3], y=10)
+            return [
+                (device.get("ip", "Bilinmiyor"), THEME["text_primary"]),
+                (format_mac_for_display(device.get("mac", "Bilinmiyor")), THEME["text_primary"]),
+                status,
+                (device.get("interface", "Bilinmiyor"), THEME["text_primary"]),
+                ("Az önce", THEME["text_secondary"])
+            ]
+        
+        self.devices_list.set_items(devices, format_row, empty_text="Hiç cihaz bulunamadı")
     
     def _update_status(self, result=None):
         """Tarama durumunu günceller"""
@@ -604,7 +539,7 @@ class ScanScreen(BaseScreen):
             # Cihaz listesini oluştur
             devices = result.get("arp_table", [])
             self.devices = devices
-            self._populate_devices_list(devices)
+            self._populate_devices_list(devices, result)
         except Exception as e:
             logger.error(f"Tarama sonucu işlenirken hata: {e}")
             traceback.print_exc()
@@ -721,8 +656,10 @@ class ThreatAnalysisScreen(BaseScreen):
         
         self.threats_canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Tehdit listesi için iç çerçeve
-        self.threats_list_frame = tk.Frame(self.threats_canvas, bg=THEME["card_background"])
+        # Tehdit listesi için iç çerçeve (tehdit kimliğine göre anahtarlı kartlar)
+        self.threats_list_frame = KeyedListFrame(self.threats_canvas, self._create_threat_card,
+                                             empty_text="Henüz tarama yapılmadı",
+                                             pack_options={"fill": tk.X, "pady": 5, "padx": 5})
         self.threats_canvas.create_window((0, 0), window=self.threats_list_frame, 
                                       anchor="nw", tags="threats_list")
         
@@ -732,12 +669,6 @@ class ThreatAnalysisScreen(BaseScreen):
         self.threats_canvas.bind("<Configure>", lambda e: self.threats_canvas.itemconfig(
             "threats_list", width=e.width))
         
-        # Varsayılan içerik
-        self.no_threats_label = tk.Label(self.threats_list_frame, 
-                                     text="Henüz tarama yapılmadı", font=("Arial", 14),
-                                     bg=THEME["card_background"], fg=THEME["text_secondary"])
-        self.no_threats_label.pack(pady=50)
-        
         # Aktif filtre
         self.active_filter = "all"
     
@@ -767,20 +698,20 @@ class ThreatAnalysisScreen(BaseScreen):
         # Tehditleri yeniden yükle (mevcut filtre ile)
         self._populate_threats_list()
     
+    def _matches_filter(self, threat):
+        """Tehdidin aktif filtreye uyup uymadığını döndürür"""
+        threat_level = threat.get("threat_level", "none")
+        if self.active_filter == "info":
+            return threat.get("type", "").startswith("info_")
+        if self.active_filter in ("high", "medium"):
+            return threat_level == self.active_filter
+        return True
+    
     def _create_threat_card(self, parent, threat):
-        """Tehdit kartı oluşturur"""
+        """Tehdit kartı oluşturur (yerleşimi liste yapar)"""
         # Tehdit seviyesini belirle
         threat_level = threat.get("threat_level", "none")
         
-        # Filtre durumunu kontrol et
-        if self.active_filter != "all":
-            if self.active_filter == "info" and not threat.get("type", "").startswith("info_"):
-                return None
-            elif self.active_filter == "high" and threat_level != "high":
-                return None
-            elif self.active_filter == "medium" and threat_level != "medium":
-                return None
-        
         # Kart rengi ve simgesi
         if threat_level == "high":
             icon = "❌"
@@ -797,7 +728,6 @@ class ThreatAnalysisScreen(BaseScreen):
         
         # Kart çerçevesi
         card = tk.Frame(parent, bg=bg_color, padx=10, pady=10, bd=1, relief="solid")
-        card.pack(fill=tk.X, pady=5, padx=5)
         
         # Başlık çerçevesi
         header_frame = tk.Frame(card, bg=bg_color)
@@ -896,16 +826,9 @@ class ThreatAnalysisScreen(BaseScreen):
         return card
     
     def _populate_threats_list(self):
-        """Tehdit listesini doldurur"""
-        # Mevcut içeriği temizle
-        for widget in self.threats_list_frame.winfo_children():
-            widget.destroy()
-        
+        """Tehdit listesini doldurur (yalnızca değişen kartlar yeniden oluşturulur)"""
         if not self.threats:
-            self.no_threats_label = tk.Label(self.threats_list_frame, 
-                                        text="Hiç tehdit tespit edilmedi", font=("Arial", 14),
-                                        bg=THEME["card_background"], fg=THEME["text_secondary"])
-            self.no_threats_label.pack(pady=50)
+            self.threats_list_frame.reconcile([], empty_text="Hiç tehdit tespit edilmedi")
             return
         
         # Tehditleri öncelik sırasına göre sırala
@@ -913,18 +836,11 @@ class ThreatAnalysisScreen(BaseScreen):
         sorted_threats = sorted(self.threats, 
                              key=lambda x: priority_order.get(x.get("threat_level", "unknown"), 4))
         
-        # Her tehdit için kart oluştur
-        created_cards = 0
-        for threat in sorted_threats:
-            card = self._create_threat_card(self.threats_list_frame, threat)
-            if card:
-                created_cards += 1
-        
-        if created_cards == 0:
-            no_results = tk.Label(self.threats_list_frame, 
-                               text=f"Seçilen filtreye uygun tehdit bulunamadı", font=("Arial", 14),
-                               bg=THEME["card_background"], fg=THEME["text_secondary"])
-            no_results.pack(pady=50)
+        # Kartlar tehdidin türü, adresleri ve arayüzüyle anahtarlanır (aynı tehdit birden çok
+        # arayüzde görülebilir); içerik değişirse kart yenilenir
+        rows = [((threat.get("type"), threat.get("ip"), threat.get("mac"), threat.get("interface")), threat)
+                for threat in sorted_threats if self._matches_filter(threat)]
+        self.threats_list_frame.reconcile(rows, empty_text="Seçilen filtreye uygun tehdit bulunamadı")
     
     def _update_threat_summary(self, result):
         """Tehdit özetini günceller"""
@@ -1101,8 +1017,9 @@ class HistoryScreen(BaseScreen):
         
         self.history_canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Geçmiş listesi için iç çerçeve
-        self.history_list_frame = tk.Frame(self.history_canvas, bg=THEME["card_background"])
+        # Geçmiş listesi için iç çerçeve (tarama kimliğine göre anahtarlı satırlar)
+        self.history_list_frame = KeyedListFrame(self.history_canvas, self._create_history_row,
+                                             empty_text="Henüz tarama geçmişi yok")
         self.history_canvas.create_window((0, 0), window=self.history_list_frame, 
                                       anchor="nw", tags="history_list")
         
@@ -1111,12 +1028,6 @@ class HistoryScreen(BaseScreen):
             scrollregion=self.history_canvas.bbox("all")))
         self.history_canvas.bind("<Configure>", lambda e: self.history_canvas.itemconfig(
             "history_list", width=e.width))
-        
-        # Varsayılan içerik
-        self.no_history_label = tk.Label(self.history_list_frame, 
-                                     text="Henüz tarama geçmişi yok", font=("Arial", 14),
-                                     bg=THEME["card_background"], fg=THEME["text_secondary"])
-        self.no_history_label.pack(pady=50)
     
     def _clear_history(self):
         """Tarama geçmişini temizler"""
@@ -1126,8 +1037,13 @@ class HistoryScreen(BaseScreen):
         # Onay sor
         if messagebox.askyesno("Geçmişi Temizle", 
                              "Tüm tarama geçmişi silinecek. Devam etmek istiyor musunuz?"):
-            # Geçmişi temizle
-            self.app.scanner.scan_history = []
+            # Geçmişi temizle; başarısız silme geri alınır, geçmiş olduğu gibi kalır
+            try:
+                self.app.scanner.clear_scan_history()
+            except sqlite3.Error as e:
+                logger.error(f"Tarama geçmişi temizlenirken hata: {e}")
+                messagebox.showerror("Hata", f"Tarama geçmişi temizlenemedi:\n{str(e)}")
+                return
             
             # Arayüzü güncelle
             self._update_history_display()
@@ -1138,24 +1054,21 @@ class HistoryScreen(BaseScreen):
         if not hasattr(self.app, 'scanner'):
             return
             
-        scan_history = self.app.scanner.scan_history
+        # Özet veritabanında hesaplanır, geçmiş belleğe yüklenmez
+        statistics = self.app.scanner.get_history_statistics()
         
         # Toplam tarama sayısı
-        total_scans = len(scan_history)
+        total_scans = statistics["total_scans"]
         self.total_scans_label.config(text=f"Toplam Tarama: {total_scans}")
         
         # Tespit edilen yüksek tehdit sayısı
-        high_threats = 0
-        for scan in scan_history:
-            high_threats += sum(1 for entry in scan.get("suspicious_entries", []) 
-                              if entry.get("threat_level") == "high")
-        
+        high_threats = statistics["high_threats"]
         self.high_threats_label.config(text=f"Tespit Edilen Yüksek Tehditler: {high_threats}")
         
         # İlk ve son tarama zamanları
-        if scan_history:
-            first_scan_time = scan_history[0].get("timestamp", 0)
-            last_scan_time = scan_history[-1].get("timestamp", 0)
+        if total_scans:
+            first_scan_time = statistics["first_timestamp"]
+            last_scan_time = statistics["last_timestamp"]
             
             self.first_scan_label.config(text=f"İlk Tarama: {format_timestamp(first_scan_time)}")
             self.last_scan_label.config(text=f"Son Tarama: {format_timestamp(last_scan_time)}")
@@ -1164,92 +1077,83 @@ class HistoryScreen(BaseScreen):
             self.last_scan_label.config(text="Son Tarama: -")
     
     def _update_history_display(self):
-        """Tarama geçmişi görüntüsünü günceller"""
-        # Mevcut içeriği temizle
-        for widget in self.history_list_frame.winfo_children():
-            widget.destroy()
-            
+        """Tarama geçmişi görüntüsünü günceller (yalnızca eklenen ve silinen satırlara dokunur)"""
         if not hasattr(self.app, 'scanner') or not self.app.scanner.scan_history:
-            self.no_history_label = tk.Label(self.history_list_frame, 
-                                        text="Henüz tarama geçmişi yok", font=("Arial", 14),
-                                        bg=THEME["card_background"], fg=THEME["text_secondary"])
-            self.no_history_label.pack(pady=50)
+            self.history_list_frame.reconcile([])
             return
             
-        scan_history = self.app.scanner.scan_history
+        # Yalnızca ilk sayfa yüklenir (en yeniden en eskiye, ARP tabloları olmadan)
+        reversed_history = self.app.scanner.get_history_page()
+        
+        # Satırlar tarama kimliğiyle anahtarlanır; değer görüntülenen metinlerdir
+        rows = [(scan.get("scan_id"), self._history_row_values(scan)) for scan in reversed_history]
+        self.history_list_frame.reconcile(rows)
+    
+    def _history_row_values(self, scan):
+        """Geçmiş satırında görüntülenen (metin, renk) değerlerini hesaplar"""
+        # Tarih ve saat
+        scan_time = scan.get("timestamp", 0)
         
-        # Taramaları tersine çevir (en yeniden en eskiye)
-        reversed_history = list(reversed(scan_history))
+        # Tehdit seviyesi
+        threat_level = scan.get("threat_level", "unknown")
+        
+        # Tespit edilen tehditler
+        suspicious_entries = scan.get("suspicious_entries", [])
+        high_threats = sum(1 for entry in suspicious_entries if entry.get("threat_level") == "high")
+        medium_threats = sum(1 for entry in suspicious_entries if entry.get("threat_level") == "medium")
+        
+        # Tarama süresi
+        duration = scan.get("duration", 0)
+        
+        # Ağ güvenlik skoru
+        security_score = get_network_security_score(scan)
+        if security_score >= 80:
+            score_color = THEME["success"]
+        elif security_score >= 50:
+            score_color = THEME["warning"]
+        else:
+            score_color = THEME["error"]
+        
+        # Alternatif satır rengi tarama kimliğine bağlıdır; yeni tarama eklenince
+        # eski satırların rengi kaymaz
+        striped = (scan.get("scan_id") or 0) % 2 == 1
+        
+        return (
+            striped,
+            (format_timestamp(scan_time), THEME["text_primary"]),
+            (threat_level_to_text(threat_level), get_status_color(threat_level)),
+            (f"{high_threats} yüksek, {medium_threats} orta seviye", THEME["text_primary"]),
+            (f"{duration:.2f} sn", THEME["text_primary"]),
+            (f"{security_score}/100", score_color)
+        )
+    
+    def _create_history_row(self, parent, values):
+        """Geçmiş satırı oluşturur (yerleşimi liste yapar)"""
+        striped, *cells = values
         
         # Tablo sütun genişlikleri
         columns = [200, 150, 200, 100, 150]
         row_height = 40
         
-        # Her tarama için satır oluştur
-        for i, scan in enumerate(reversed_history):
-            row_frame = tk.Frame(self.history_list_frame, bg=THEME["card_background"], 
-                              height=row_height)
-            row_frame.pack(fill=tk.X, pady=2)
-            row_frame.pack_propagate(False)
-            
-            # Alternatif satır renklendirmesi
-            if i % 2 == 1:
-                row_bg = THEME["background"]
-                # Arka plan için canvas kullan
-                bg_canvas = tk.Canvas(row_frame, bg=row_bg, highlightthickness=0)
-                bg_canvas.place(x=0, y=0, relwidth=1, relheight=1)
-            
-            # Tarih ve saat
-            scan_time = scan.get("timestamp", 0)
-            date_label = tk.Label(row_frame, text=format_timestamp(scan_time), 
-                               font=("Arial", 11), bg=row_frame["bg"], fg=THEME["text_primary"],
-                               anchor="w", width=columns[0]//10)
-            date_label.place(x=0, y=10)
-            
-            # Tehdit seviyesi
-            threat_level = scan.get("threat_level", "unknown")
-            threat_text = threat_level_to_text(threat_level)
-            threat_color = get_status_color(threat_level)
-            
-            threat_label = tk.Label(row_frame, text=threat_text, font=("Arial", 11), 
-                                 bg=row_frame["bg"], fg=threat_color,
-                                 anchor="w", width=columns[1]//10)
-            threat_label.place(x=columns[0], y=10)
-            
-            # Tespit edilen tehditler
-            suspicious_entries = scan.get("suspicious_entries", [])
-            high_threats = sum(1 for entry in suspicious_entries if entry.get("threat_level") == "high")
-            medium_threats = sum(1 for entry in suspicious_entries if entry.get("threat_level") == "medium")
-            
-            threats_text = f"{high_threats} yüksek, {medium_threats} orta seviye"
-            threats_label = tk.Label(row_frame, text=threats_text, font=("Arial", 11), 
-                                 bg=row_frame["bg"], fg=THEME["text_primary"],
-                                 anchor="w", width=columns[2]//10)
-            threats_label.place(x=columns[0]+columns[1], y=10)
-            
-            # Tarama süresi
-            duration = scan.get("duration", 0)
-            duration_text = f"{duration:.2f} sn"
-            duration_label = tk.Label(row_frame, text=duration_text, font=("Arial", 11), 
-                                   bg=row_frame["bg"], fg=THEME["text_primary"],
-                                   anchor="w", width=columns[3]//10)
-            duration_label.place(x=columns[0]+columns[1]+columns[2], y=10)
-            
-            # Ağ güvenlik skoru
-            security_score = get_network_security_score(scan)
-            score_text = f"{security_score}/100"
-            
-            if security_score >= 80:
-                score_color = THEME["success"]
-            elif security_score >= 50:
-                score_color = THEME["warning"]
-            else:
-                score_color = THEME["error"]
-                
-            score_label = tk.Label(row_frame, text=score_text, font=("Arial", 11, "bold"), 
-                                bg=row_frame["bg"], fg=score_color,
-                                anchor="w", width=columns[4]//10)
-            score_label.place(x=columns[0]+columns[1]+columns[2]+columns[3], y=10)
+        row_frame = tk.Frame(parent, bg=THEME["card_background"], height=row_height)
+        row_frame.pack_propagate(False)
+        
+        # Alternatif satır renklendirmesi
+        if striped:
+            # Arka plan için canvas kullan
+            bg_canvas = tk.Canvas(row_frame, bg=THEME["background"], highlightthickness=0)
+            bg_canvas.place(x=0, y=0, relwidth=1, relheight=1)
+        
+        # Tarih, tehdit seviyesi, tehditler, süre ve skor sütunları
+        x_pos = 0
+        for i, (text, color) in enumerate(cells):
+            font = ("Arial", 11, "bold") if i == len(cells) - 1 else ("Arial", 11)
+            label = tk.Label(row_frame, text=text, font=font, bg=row_frame["bg"], fg=color,
+                          anchor="w", width=columns[i]//10)
+            label.place(x=x_pos, y=10)
+            x_pos += columns[i]
+        
+        return row_frame
     
     def on_scan_completed(self, result):
         """Tarama tamamlandığında çağrılır"""
@@ -1429,15 +1333,16 @@ class SettingsScreen(BaseScreen):
             self.interval_dropdown.set(str(scan_interval))
             
             # Otomatik tarama
-            auto_scan = get_setting("auto_scan", True)
+            settings = get_settings_store()
+            auto_scan = settings.get_bool("auto_scan", True)
             self.auto_scan_var.set(auto_scan)
             
             # Bildirimler
-            notifications = get_setting("notifications_enabled", True)
+            notifications = settings.get_bool("notifications_enabled", True)
             self.notifications_var.set(notifications)
             
             # Tema
-            dark_mode = not get_setting("dark_mode", False)
+            dark_mode = not settings.get_bool("dark_mode", False)
             self.theme_var.set(not dark_mode)  # Koyu tema varsayılan
             
             # Arayüz bileşenlerini güncelle
@@ -1475,8 +1380,11 @@ class SettingsScreen(BaseScreen):
                     # Önce durdurup sonra yeni aralıkla başlatmak için
                     self.app.start_periodic_scan(scan_interval)
             
-            # Ayarları güncelle
-            update_settings(settings)
+            # Ayarları güncelle; kaydetme düğmesi yazmayı beklemeden diske aktarır
+            if not update_settings(settings) or not flush_settings():
+                messagebox.showerror("Hata", "Ayarlar uygulandı ancak dosyaya kaydedilemedi.\n"
+                                             "Ayrıntılar için günlük dosyasına bakın.")
+                return
             
             # Başarı mesajı
             messagebox.showinfo("Başarılı", "Ayarlar başarıyla kaydedildi.")
@@ -1491,11 +1399,16 @@ class SettingsScreen(BaseScreen):
                            "Tüm ayarlar varsayılan değerlere sıfırlanacak. Devam etmek istiyor musunuz?"):
             try:
                 # Ayarları sıfırla
-                reset_settings()
+                saved = reset_settings()
                 
                 # Yeni ayarları yükle
                 self._load_settings()
                 
+                if not saved:
+                    messagebox.showerror("Hata", "Ayarlar sıfırlandı ancak dosyaya kaydedilemedi.\n"
+                                                 "Ayrıntılar için günlük dosyasına bakın.")
+                    return
+                
                 # Başarı mesajı
                 messagebox.showinfo("Başarılı", "Ayarlar varsayılan değerlere sıfırlandı.")
             except Exception as e:
@@ -1523,10 +1436,19 @@ class VARPApp:
                 logger.error(f"Background ayarlanırken hata: {e}")
                 traceback.print_exc()
         
+            # Tarama thread'lerinden gelen sonuçlar kuyrukla ana thread'e taşınır;
+            # ardışık sonuçlardan yalnızca sonuncusu çizilir
+            self.event_bus = EventBus()
+            self._pump_interval = EVENT_PUMP_INTERVAL
+            self._pending_threat = None
+            self.event_bus.subscribe(SCAN_COMPLETED, self._note_threat)
+            self.event_bus.subscribe(SCAN_COMPLETED, self.on_scan_completed, coalesce=True)
+        
             # ARP tarayıcısını başlat
             try:
                 logger.debug("ARPScanner oluşturuluyor...")
-                self.scanner = ARPScanner(callback=self.on_scan_completed)
+                with profiler.phase("ARPScanner"):
+                    self.scanner = ARPScanner(callback=self.event_bus.publisher(SCAN_COMPLETED))
                 logger.debug("ARPScanner başarıyla oluşturuldu.")
             except Exception as e:
                 logger.error(f"ARPScanner oluşturulurken hata: {e}")
@@ -1541,16 +1463,17 @@ class VARPApp:
         
             try:
                 logger.debug("Ana düzen oluşturuluyor...")
-                self._create_layout()
+                with profiler.phase("ana düzen"):
+                    self._create_layout()
                 logger.debug("Ana düzen oluşturuldu.")
             except Exception as e:
                logger.error(f"Ana düzen oluşturulurken hata: {e}")
                traceback.print_exc()
         
             try:
-                logger.debug("Ekranlar oluşturuluyor...")
+                logger.debug("Ekran sınıfları kaydediliyor...")
                 self._create_screens()
-                logger.debug("Ekranlar oluşturuldu.")
+                logger.debug("Ekran sınıfları kaydedildi.")
             except Exception as e:
                 logger.error(f"Ekranlar oluşturulurken hata: {e}")
                 traceback.print_exc()
@@ -1565,7 +1488,8 @@ class VARPApp:
         
             try:
                 logger.debug("Arka plan animasyonu başlatılıyor...")
-                self._start_background_animation()
+                with profiler.phase("arka plan animasyonu"):
+                    self._start_background_animation()
                 logger.debug("Arka plan animasyonu başlatıldı.")
             except Exception as e:
                 logger.error(f"Arka plan animasyonu başlatılırken hata: {e}")
@@ -1574,6 +1498,9 @@ class VARPApp:
             # Pencere boyut değişikliğini işle
             self.root.bind("<Configure>", self._on_window_resize)
         
+            # Olay kuyruğunu boşaltmaya başla
+            self._pump_events()
+        
             # İlk taramayı başlat
             self.root.after(500, self.scanner.start_scan)
         
@@ -1656,41 +1583,37 @@ class VARPApp:
         self.background_canvas.pack(fill=tk.BOTH, expand=True)
     
     def _create_screens(self):
-        """Uygulama ekranlarını oluşturur"""
-        try:
-            # Gösterge Paneli
-            self.screens["dashboard"] = DashboardScreen(self.background_canvas, self)
-            print("Dashboard ekranı oluşturuldu")
-            
-            # Ağ Taraması
-            self.screens["scan"] = ScanScreen(self.background_canvas, self)
-            print("Scan ekranı oluşturuldu")
-            
-            # Tehdit Analizi
-            self.screens["threats"] = ThreatAnalysisScreen(self.background_canvas, self)
-            print("Threats ekranı oluşturuldu")
-            
-            # Geçmiş
-            self.screens["history"] = HistoryScreen(self.background_canvas, self)
-            print("History ekranı oluşturuldu")
-            
-            # Ayarlar
-            self.screens["settings"] = SettingsScreen(self.background_canvas, self)
-            print("Settings ekranı oluşturuldu")
-            
-            # Oluşturulan ekranları kontrol et ve günlükle
-            print(f"Oluşturulan ekranlar: {list(self.screens.keys())}")
-        except Exception as e:
-            print(f"Ekran oluşturma hatası: {e}")
-            import traceback
-            traceback.print_exc()
+        """Ekran sınıflarını kaydeder; ekranlar ilk gösterildiklerinde oluşturulur"""
+        self.screen_classes = {
+            "dashboard": DashboardScreen,   # Gösterge Paneli
+            "scan": ScanScreen,             # Ağ Taraması
+            "threats": ThreatAnalysisScreen,  # Tehdit Analizi
+            "history": HistoryScreen,       # Geçmiş
+            "settings": SettingsScreen      # Ayarlar
+        }
+    
+    def _get_screen(self, screen_id):
+        """Ekranı döndürür; henüz oluşturulmadıysa şimdi oluşturur"""
+        screen = self.screens.get(screen_id)
+        if screen is None and screen_id in self.screen_classes:
+            try:
+                with profiler.phase(f"ekran: {screen_id}"):
+                    screen = self.screen_classes[screen_id](self.background_canvas, self)
+                self.screens[screen_id] = screen
+                logger.debug(f"{screen_id} ekranı oluşturuldu")
+            except Exception as e:
+                logger.error(f"{screen_id} ekranı oluşturulurken hata: {e}")
+                traceback.print_exc()
+                return None
+        return screen
     
     def show_screen(self, screen_id):
         """Belirtilen ekranı gösterir"""
         try:
             print(f"Ekran değiştiriliyor: {screen_id}")  # Debug log
             
-            if screen_id not in self.screens:
+            new_screen = self._get_screen(screen_id)
+            if new_screen is None:
                 print(f"Hata: {screen_id} ekranı bulunamadı!")  # Debug log
                 return
             
@@ -1703,7 +1626,6 @@ class VARPApp:
             
             # Mevcut ekranı gizle ve yeni ekranı göster
             old_screen = self.current_screen
-            new_screen = self.screens[screen_id]
             
             print(f"Geçiş: {old_screen.__class__.__name__ if old_screen else 'None'} -> {new_screen.__class__.__name__}")  # Debug log
             
@@ -1785,18 +1707,44 @@ class VARPApp:
         if hasattr(self, 'status_label'):
             self.status_label.config(text=text)
     
+    def _pump_events(self):
+        """
+        Olay kuyruğunu Tk ana döngüsünde boşaltır ve kendini yeniden zamanlar.
+        
+        Boş geçen her boşaltmada bekleme süresi EVENT_PUMP_MAX_INTERVAL'a kadar
+        iki katına çıkar; boşta uygulama saniyede 20 kez uyanmaz.
+        """
+        try:
+            drained = self.event_bus.drain()
+        except Exception as e:
+            logger.error(f"Olay kuyruğu işlenirken hata: {e}")
+            traceback.print_exc()
+            drained = 0
+        
+        if drained:
+            self._pump_interval = EVENT_PUMP_INTERVAL
+        else:
+            self._pump_interval = min(self._pump_interval * 2, EVENT_PUMP_MAX_INTERVAL)
+        self.root.after(self._pump_interval, self._pump_events)
+    
+    def _note_threat(self, result):
+        """Her sonuç için çağrılır; birleştirmede yüksek tehditli sonucun kaybolmaması için saklar"""
+        if result.get("threat_level") == "high":
+            self._pending_threat = result
+    
     def on_scan_completed(self, result):
-        """Tarama tamamlandığında çağrılır"""
+        """Tarama tamamlandığında ana thread'de (birleştirilmiş olarak) çağrılır"""
         # Durum etiketini güncelle
         self.status_label.config(text="Hazır")
         
-        # Tüm ekranları bilgilendir
+        # Oluşturulmuş ekranları bilgilendir (diğerleri gösterildiklerinde son sonucu okur)
         for screen in self.screens.values():
             screen.on_scan_completed(result)
         
-        # Yüksek tehdit seviyesi varsa uyarı göster
-        if result.get("threat_level") == "high":
-            self._show_threat_warning(result)
+        # Son çizimden bu yana yüksek tehdit seviyesi görüldüyse uyarı göster
+        threat_result, self._pending_threat = self._pending_threat, None
+        if threat_result is not None:
+            self._show_threat_warning(threat_result)
     
     def _show_threat_warning(self, result):
         """Tehdit uyarısı gösterir"""
@@ -1819,5 +1767,5 @@ class VARPApp:
         message += "\nDaha fazla bilgi için Tehdit Analizi ekranına bakın."
         
         # Bildirimler açıksa uyarı göster
-        if get_setting("notifications_enabled", True):
+        if get_settings_store().get_bool("notifications_enabled", True):
             messagebox.showwarning("Güvenlik Tehdidi Tespit Edildi", message)